@@ -23,7 +23,7 @@ from agents._shared.validation import (
 )
 
 # Audit bridge (for advanced use)
-from agents._shared.audit_bridge import get_audit_bridge
+from agents._shared.audit_bridge import audit_correlation, get_audit_bridge
 
 __all__ = [
     # Configuration
@@ -38,4 +38,5 @@ __all__ = [
     "create_validated_agent",
     # Audit bridge
     "get_audit_bridge",
+    "audit_correlation",
 ]
@@ -12,23 +12,103 @@ Architecture:
     Agent callbacks → AuditEventBridge → SSE /run_sse_enhanced → Frontend
 
 Key Features:
-    - Session-scoped in-memory event buffering
-    - Thread-safe event recording and retrieval
-    - Explicit cleanup to prevent memory leaks
+    - Session-scoped in-memory event buffering in per-invocation ring buffers
+    - Events stored as recorded (slotted records) and serialized only when a
+      trail is read, keeping callbacks free of copying
+    - Thread-safe event recording without locks (atomic deque appends);
+      lock-striped creation, retrieval and cleanup of invocations
+    - Explicit cleanup, plus TTL eviction of abandoned invocations (e.g. SSE
+      clients that disconnect before clear_invocation) and a cap on buffered
+      invocations
+    - Optional durable sink (audit_sink.py) receiving every recorded event
+    - Push subscriptions (bounded asyncio queues) so SSE streams receive
+      events as they are recorded instead of polling get_audit_trail
+    - Context-variable correlation IDs (audit_correlation) so concurrent
+      runs, and the specialists they call, each record into their own bucket
     - Support for tool_invocation, tool_response, and tool_error event types
 
 Reference: docs/architecture/SSE-PROOF-LAYER-SPIKE.md § 2.2.A
 """
 
-from dataclasses import dataclass, asdict, field
+import asyncio
+import heapq
+import json
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from threading import Lock
 from typing import Any, Optional
-from collections import defaultdict
 
+from agents._shared.audit_sink import AuditSink, JsonlAuditSink
 
-@dataclass
-class ToolInvocationEvent:
+# Defaults for AuditEventBridge retention
+DEFAULT_LOCK_STRIPES = 16
+DEFAULT_TTL_SECONDS = 900.0
+DEFAULT_MAX_INVOCATIONS = 1_000
+# At the invocation cap, evict down to this fraction of it in one pass
+CAP_EVICT_FRACTION = 0.9
+DEFAULT_SUBSCRIPTION_QUEUE = 256
+
+# Audit key for tool callbacks in the current context (see audit_correlation)
+_correlation_id: ContextVar[Optional[str]] = ContextVar("ranger_audit_correlation_id", default=None)
+
+
+@contextmanager
+def audit_correlation(correlation_id: str) -> Iterator[str]:
+    """
+    Record audit events from tool callbacks under `correlation_id`.
+
+    The ID follows the current context into the tasks it spawns (the ADK
+    runner, parallel tool calls, AgentTool sub-runners), so concurrent
+    invocations keep separate buckets even though ADK's tool_context does not
+    carry a session_id the callbacks can rely on.
+
+    Example:
+        >>> with audit_correlation("validation-1234"):
+        ...     await runner.run_async(...)
+        >>> bridge.get_audit_trail("validation-1234")
+    """
+    token = _correlation_id.set(correlation_id)
+    try:
+        yield correlation_id
+    finally:
+        _correlation_id.reset(token)
+
+
+def get_correlation_id() -> Optional[str]:
+    """The audit correlation ID of the current context, if any."""
+    return _correlation_id.get()
+
+
+def _json_copy(value: Any) -> Any:
+    """Copy of nested dicts / lists / tuples; other values are shared."""
+    if isinstance(value, dict):
+        return {k: _json_copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_json_copy(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_json_copy(v) for v in value)
+    return value
+
+
+class _AuditRecord:
+    """Base for slotted audit events: serialization on demand."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization (containers are copied)."""
+        return {name: _json_copy(getattr(self, name)) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class ToolInvocationEvent(_AuditRecord):
     """
     Audit event for tool invocation (before execution).
 
@@ -47,13 +127,9 @@ class ToolInvocationEvent:
     session_id: str = "unknown"
     enforcement: str = "API-level mode=ANY"  # ADR-007 Tier 1
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
-
 
-@dataclass
-class ToolResponseEvent:
+@dataclass(slots=True)
+class ToolResponseEvent(_AuditRecord):
     """
     Audit event for successful tool execution (after completion).
 
@@ -78,13 +154,9 @@ class ToolResponseEvent:
     invocation_id: Optional[str] = None
     execution_time_ms: Optional[int] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
-
 
-@dataclass
-class ToolErrorEvent:
+@dataclass(slots=True)
+class ToolErrorEvent(_AuditRecord):
     """
     Audit event for tool execution failure.
 
@@ -104,9 +176,77 @@ class ToolErrorEvent:
     error_message: str = ""
     invocation_id: Optional[str] = None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+
+AuditEvent = ToolInvocationEvent | ToolResponseEvent | ToolErrorEvent
+
+
+class AuditSubscription:
+    """
+    Bounded asyncio queue of the events recorded for one invocation.
+
+    Created by AuditEventBridge.subscribe() on the event loop that consumes
+    it. Events recorded on that loop's thread are queued directly; events
+    recorded on other threads are handed over with call_soon_threadsafe().
+
+    A consumer that falls more than `max_queue` events behind loses the
+    oldest queued events; `dropped` counts them so the stream can tell the
+    client its trail has a gap (the full trail stays available through
+    get_audit_trail() and the durable sink).
+
+    Usage:
+        >>> with bridge.subscribe(session_id) as subscription:
+        ...     event = await subscription.get()
+    """
+
+    def __init__(self, bridge: "AuditEventBridge", invocation_id: str, max_queue: int):
+        self.invocation_id = invocation_id
+        self.dropped = 0
+        self._bridge = bridge
+        self._queue: asyncio.Queue[AuditEvent] = asyncio.Queue(maxsize=max(1, max_queue))
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._closed = False
+
+    async def get(self) -> AuditEvent:
+        """Wait for the next recorded event."""
+        return await self._queue.get()
+
+    def drain(self) -> list[AuditEvent]:
+        """All events queued so far, without waiting."""
+        events = []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        if not self._closed:
+            self._closed = True
+            self._bridge._unsubscribe(self)
+
+    def __enter__(self) -> "AuditSubscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _deliver(self, event: AuditEvent) -> None:
+        """Called by the bridge from whichever thread recorded the event."""
+        if threading.get_ident() == self._thread_id:
+            self._put(event)
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            pass  # consumer's loop already closed
+
+    def _put(self, event: AuditEvent) -> None:
+        if self._closed:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()  # slow consumer: drop the oldest
+            self.dropped += 1
+        self._queue.put_nowait(event)
 
 
 class AuditEventBridge:
@@ -121,12 +261,26 @@ class AuditEventBridge:
     and confidence calculations for federal compliance.
 
     Thread Safety:
-        All public methods are thread-safe using a threading.Lock.
+        All public methods are thread-safe. Recording into an existing
+        invocation is a lock-free deque append. Creating, reading and removing
+        invocations lock one of `lock_stripes` partitions, chosen by hash of
+        invocation_id, so they only contend within a stripe.
+
+    Event Storage:
+        Recorded events are kept as the objects passed in and converted with
+        to_dict() only when a trail is read, so the tool callback path does
+        no copying. Callers must not mutate an event (or the parameters,
+        data_sources and reasoning_chain it references) after recording it.
 
     Memory Management:
-        Events are buffered until explicitly cleared via clear_invocation().
         SSE middleware should call clear_invocation() after injecting events
-        into the final (partial=False) ADK event to prevent memory leaks.
+        into the final (partial=False) ADK event. As a backstop, a background
+        sweeper drops invocations idle for longer than `ttl_seconds`, and at
+        most `max_invocations` invocations are buffered, so no more than
+        max_invocations * max_events_per_invocation events are held. Crossing
+        the cap evicts the least recently updated invocations down to 90% of
+        it in one pass, so the scan runs once per many new invocations
+        rather than on each.
 
     Usage Example:
         >>> bridge = get_audit_bridge()
@@ -156,7 +310,15 @@ class AuditEventBridge:
     Reference: docs/architecture/SSE-PROOF-LAYER-SPIKE.md § 2.2.A
     """
 
-    def __init__(self, max_events_per_invocation: int = 100):
+    def __init__(
+        self,
+        max_events_per_invocation: int = 100,
+        lock_stripes: int = DEFAULT_LOCK_STRIPES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_invocations: int = DEFAULT_MAX_INVOCATIONS,
+        sweep_interval_seconds: Optional[float] = None,
+        sink: Optional[AuditSink] = None,
+    ):
         """
         Initialize the audit event bridge.
 
@@ -164,10 +326,69 @@ class AuditEventBridge:
             max_events_per_invocation: Maximum number of events to buffer per
                 invocation ID before dropping oldest events. Prevents unbounded
                 memory growth for long-running tool executions. Default: 100.
+            lock_stripes: Number of independently locked partitions.
+            ttl_seconds: Drop invocations not updated for this long
+                (0 disables TTL eviction). Default: 15 minutes.
+            max_invocations: Cap on invocations buffered at once (0 disables
+                the cap). Default: 1000.
+            sweep_interval_seconds: How often the background sweeper runs.
+                Default: ttl_seconds / 4, at most once a minute.
+            sink: Durable destination for every recorded event (e.g.
+                JsonlAuditSink). In-memory eviction never affects the sink.
         """
-        self._store: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        self._lock = Lock()
         self._max_events_per_invocation = max_events_per_invocation
+        self._stripes = [_Stripe() for _ in range(max(1, lock_stripes))]
+        self._ttl_seconds = ttl_seconds
+        self._max_invocations = max(0, max_invocations)
+        self._sweep_interval = sweep_interval_seconds or min(ttl_seconds / 4, 60.0)
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_lock = Lock()
+        self._sweeper_stop = threading.Event()
+        self._evict_lock = Lock()
+        self.evicted_ttl = 0
+        self.evicted_cap = 0
+        self.sink = sink
+        self._subscribers: dict[str, tuple[AuditSubscription, ...]] = {}
+        self._subscribe_lock = Lock()
+
+    def _stripe(self, invocation_id: str) -> "_Stripe":
+        return self._stripes[hash(invocation_id) % len(self._stripes)]
+
+    def _record(self, invocation_id: Optional[str], event: AuditEvent) -> None:
+        """Append an event to its invocation's ring buffer."""
+        key = invocation_id or "default"
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        buffer = stripe.buffers.get(key)
+        if buffer is None:
+            buffer = self._create_buffer(stripe, key)
+        # deque.append is atomic; a full deque drops its oldest event (FIFO)
+        buffer.events.append(event)
+        buffer.touched = time.monotonic()
+        with stripe.lock:
+            # sweep() or _evict_to_cap() may have dropped the buffer since the
+            # lookup; don't leave the event in an unreachable deque
+            current = stripe.buffers.get(key)
+            if current is not buffer:
+                if current is None:
+                    current = stripe.buffers[key] = _InvocationBuffer(self._max_events_per_invocation)
+                current.events.append(event)
+        if self.sink is not None:
+            self.sink.write(key, event)
+        subscribers = self._subscribers.get(key)
+        if subscribers:
+            for subscription in subscribers:
+                subscription._deliver(event)
+
+    def _create_buffer(self, stripe: "_Stripe", key: str) -> "_InvocationBuffer":
+        with stripe.lock:
+            buffer = stripe.buffers.get(key)
+            if buffer is None:
+                buffer = stripe.buffers[key] = _InvocationBuffer(self._max_events_per_invocation)
+        if self._sweeper is None and self._ttl_seconds > 0:
+            self._start_sweeper()
+        if self._max_invocations and self.get_invocation_count() > self._max_invocations:
+            self._evict_to_cap(keep=key)
+        return buffer
 
     def record_tool_invocation(self, event: ToolInvocationEvent) -> None:
         """
@@ -192,13 +413,7 @@ class AuditEventBridge:
             ... )
             >>> bridge.record_tool_invocation(event)
         """
-        with self._lock:
-            key = event.invocation_id or "default"
-            self._store[key].append(event.to_dict())
-
-            # Enforce max events per invocation to prevent unbounded growth
-            if len(self._store[key]) > self._max_events_per_invocation:
-                self._store[key].pop(0)  # Remove oldest event (FIFO)
+        self._record(event.invocation_id, event)
 
     def record_tool_response(self, event: ToolResponseEvent) -> None:
         """
@@ -230,13 +445,7 @@ class AuditEventBridge:
             ... )
             >>> bridge.record_tool_response(event)
         """
-        with self._lock:
-            key = event.invocation_id or "default"
-            self._store[key].append(event.to_dict())
-
-            # Enforce max events per invocation
-            if len(self._store[key]) > self._max_events_per_invocation:
-                self._store[key].pop(0)
+        self._record(event.invocation_id, event)
 
     def record_tool_error(self, event: ToolErrorEvent) -> None:
         """
@@ -261,13 +470,7 @@ class AuditEventBridge:
             ... )
             >>> bridge.record_tool_error(event)
         """
-        with self._lock:
-            key = event.invocation_id or "default"
-            self._store[key].append(event.to_dict())
-
-            # Enforce max events per invocation
-            if len(self._store[key]) > self._max_events_per_invocation:
-                self._store[key].pop(0)
+        self._record(event.invocation_id, event)
 
     def get_audit_trail(self, invocation_id: str) -> list[dict[str, Any]]:
         """
@@ -280,11 +483,11 @@ class AuditEventBridge:
             invocation_id: The invocation ID to retrieve audit events for.
 
         Returns:
-            A copy of all audit events for the invocation, in chronological order.
-            Returns empty list if invocation_id not found.
+            All audit events for the invocation serialized with to_dict(), in
+            chronological order. Returns empty list if invocation_id not found.
 
         Thread Safety:
-            This method is thread-safe. Returns a copy to prevent external
+            This method is thread-safe. Returns fresh dicts to prevent external
             modification of internal state.
 
         Example:
@@ -294,8 +497,7 @@ class AuditEventBridge:
             >>> #   {"event_type": "tool_response", "confidence": 0.92, ...}
             >>> # ]
         """
-        with self._lock:
-            return self._store.get(invocation_id, []).copy()
+        return [event.to_dict() for event in self._events(invocation_id)]
 
     def clear_invocation(self, invocation_id: str) -> None:
         """
@@ -318,8 +520,9 @@ class AuditEventBridge:
             ...     event._audit_metadata = audit_trail
             ...     bridge.clear_invocation(invocation_id)  # Cleanup
         """
-        with self._lock:
-            self._store.pop(invocation_id, None)
+        stripe = self._stripe(invocation_id)
+        with stripe.lock:
+            stripe.buffers.pop(invocation_id, None)
 
     def get_latest_tool_response(
         self, invocation_id: str
@@ -345,9 +548,10 @@ class AuditEventBridge:
             ...     confidence = response["confidence"]
             ...     reasoning = response["reasoning_chain"]
         """
-        events = self.get_audit_trail(invocation_id)
-        responses = [e for e in events if e.get("event_type") == "tool_response"]
-        return responses[-1] if responses else None
+        for event in reversed(self._events(invocation_id)):
+            if event.event_type == "tool_response":
+                return event.to_dict()
+        return None
 
     def get_invocation_count(self) -> int:
         """
@@ -366,8 +570,7 @@ class AuditEventBridge:
             >>> if count > 100:
             ...     logger.warning(f"High invocation count: {count}")
         """
-        with self._lock:
-            return len(self._store)
+        return sum(len(stripe.buffers) for stripe in self._stripes)
 
     def clear_all(self) -> None:
         """
@@ -384,8 +587,245 @@ class AuditEventBridge:
             >>> # In test teardown
             >>> bridge.clear_all()
         """
-        with self._lock:
-            self._store.clear()
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.buffers.clear()
+
+    def subscribe(self, invocation_id: str, max_queue: int = DEFAULT_SUBSCRIPTION_QUEUE) -> AuditSubscription:
+        """
+        Receive events for an invocation as they are recorded.
+
+        Must be called from the event loop that will consume the
+        subscription. Only events recorded after subscribing are delivered;
+        use get_audit_trail() for earlier ones.
+
+        Args:
+            invocation_id: The invocation ID to follow.
+            max_queue: Events buffered for a slow consumer before the oldest
+                are dropped (counted in AuditSubscription.dropped).
+
+        Returns:
+            The subscription; close() it (or use it as a context manager)
+            when the stream ends.
+
+        Example:
+            >>> with bridge.subscribe("session-456") as subscription:
+            ...     event = await subscription.get()
+            ...     payload = event.to_dict()
+        """
+        subscription = AuditSubscription(self, invocation_id, max_queue)
+        with self._subscribe_lock:
+            self._subscribers[invocation_id] = self._subscribers.get(invocation_id, ()) + (subscription,)
+        return subscription
+
+    def _unsubscribe(self, subscription: AuditSubscription) -> None:
+        with self._subscribe_lock:
+            remaining = tuple(s for s in self._subscribers.get(subscription.invocation_id, ()) if s is not subscription)
+            if remaining:
+                self._subscribers[subscription.invocation_id] = remaining
+            else:
+                self._subscribers.pop(subscription.invocation_id, None)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Evict invocations idle for longer than ttl_seconds.
+
+        Runs periodically on the background sweeper thread; callable directly
+        (e.g. from tests with an explicit `now` on the time.monotonic() clock).
+
+        Returns:
+            The number of invocations evicted.
+        """
+        if self._ttl_seconds <= 0:
+            return 0
+        cutoff = (time.monotonic() if now is None else now) - self._ttl_seconds
+        evicted = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                for key in [k for k, b in stripe.buffers.items() if b.touched < cutoff]:
+                    del stripe.buffers[key]
+                    evicted += 1
+        self.evicted_ttl += evicted
+        return evicted
+
+    def stats(self) -> dict[str, Any]:
+        """Buffer occupancy and eviction counters, for monitoring."""
+        return {
+            "invocations": self.get_invocation_count(),
+            "events": self._total_events(),
+            "max_invocations": self._max_invocations,
+            "lock_stripes": len(self._stripes),
+            "ttl_seconds": self._ttl_seconds,
+            "evicted_ttl": self.evicted_ttl,
+            "evicted_cap": self.evicted_cap,
+            "sweeper_running": self._sweeper is not None and self._sweeper.is_alive(),
+            "subscriptions": sum(len(s) for s in self._subscribers.values()),
+        }
+
+    def close(self) -> None:
+        """Stop the background sweeper (buffered events are kept)."""
+        self._sweeper_stop.set()
+        with self._sweeper_lock:
+            if self._sweeper is not None:
+                self._sweeper.join(timeout=5)
+            self._sweeper = None
+        self._sweeper_stop = threading.Event()
+
+    def _events(self, invocation_id: str) -> list[AuditEvent]:
+        """Snapshot of an invocation's recorded (unserialized) events."""
+        stripe = self._stripe(invocation_id)
+        with stripe.lock:
+            buffer = stripe.buffers.get(invocation_id)
+        if buffer is None:
+            return []
+        while True:
+            try:
+                return list(buffer.events)
+            except RuntimeError:
+                continue  # appended to mid-copy (only possible without the GIL); retry
+
+    def _total_events(self) -> int:
+        total = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                total += sum(len(b.events) for b in stripe.buffers.values())
+        return total
+
+    def _evict_to_cap(self, keep: str) -> None:
+        """Drop least recently updated invocations down to CAP_EVICT_FRACTION of the cap."""
+        # One thread evicts for everyone; the rest record without waiting
+        if not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            candidates = []
+            for stripe in self._stripes:
+                with stripe.lock:
+                    candidates.extend((b.touched, key, stripe) for key, b in stripe.buffers.items() if key != keep)
+            target = max(1, int(self._max_invocations * CAP_EVICT_FRACTION))
+            excess = len(candidates) + 1 - target
+            for _, key, stripe in heapq.nsmallest(max(0, excess), candidates, key=lambda c: c[0]):
+                with stripe.lock:
+                    if stripe.buffers.pop(key, None) is not None:
+                        self.evicted_cap += 1
+        finally:
+            self._evict_lock.release()
+
+    def _start_sweeper(self) -> None:
+        with self._sweeper_lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(
+                target=_sweep_loop,
+                args=(weakref.ref(self), self._sweeper_stop, self._sweep_interval),
+                name="audit-bridge-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
+
+
+class _InvocationBuffer:
+    """Ring buffer of one invocation's events plus its last-update time."""
+
+    __slots__ = ("events", "touched")
+
+    def __init__(self, maxlen: int):
+        self.events: deque[AuditEvent] = deque(maxlen=maxlen)
+        self.touched = time.monotonic()
+
+
+class _Stripe:
+    """One lock-protected partition of the bridge's invocations."""
+
+    __slots__ = ("lock", "buffers")
+
+    def __init__(self):
+        self.lock = Lock()
+        self.buffers: dict[str, _InvocationBuffer] = {}
+
+
+def _sweep_loop(bridge_ref: "weakref.ref[AuditEventBridge]", stop: threading.Event, interval: float) -> None:
+    """Sweeper thread body; exits when stopped or the bridge is garbage collected."""
+    while not stop.wait(interval):
+        bridge = bridge_ref()
+        if bridge is None:
+            return
+        bridge.sweep()
+        del bridge
+
+
+def format_audit_sse(event: AuditEvent) -> str:
+    """SSE frame for one audit event, alongside ADK's `data: {...}` frames."""
+    return f"data: {json.dumps({'type': 'audit', 'audit': event.to_dict()}, default=str)}\n\n"
+
+
+async def interleave_audit_events(
+    chunks: AsyncIterator[str],
+    subscription: AuditSubscription,
+) -> AsyncIterator[str]:
+    """
+    Merge a subscription's audit events into an SSE chunk stream.
+
+    `chunks` (e.g. the body of ADK's /run_sse response) is consumed by a
+    single producer task, so its async generator keeps one task context
+    throughout, and audit events recorded while the agent works towards its
+    next chunk are emitted immediately. The producer runs under the
+    subscription's ID as audit correlation, so every tool callback it drives
+    records into the subscribed bucket. The producer pulls the next chunk
+    only once the previous one has been yielded, so an audit event that is
+    ready together with a chunk was recorded first and is emitted first.
+
+    When the consumer has fallen behind and events were dropped, an
+    `audit_gap` frame reports how many. Any events still queued when
+    `chunks` ends are emitted before returning. The caller owns the
+    subscription and closes it afterwards.
+    """
+    pending: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=1)
+
+    async def produce() -> None:
+        _correlation_id.set(subscription.invocation_id)  # task-local context
+        try:
+            async for chunk in chunks:
+                await pending.put(chunk)
+                await pending.join()  # until the consumer has yielded it
+        finally:
+            if not pending.full():  # full only when cancelled mid-handoff
+                pending.put_nowait(None)
+
+    dropped = 0
+
+    def frames(events: list[AuditEvent]) -> list[str]:
+        nonlocal dropped
+        out = []
+        if subscription.dropped > dropped:
+            out.append(f"data: {json.dumps({'type': 'audit_gap', 'dropped': subscription.dropped - dropped})}\n\n")
+            dropped = subscription.dropped
+        out.extend(format_audit_sse(e) for e in events)
+        return out
+
+    producer = asyncio.ensure_future(produce())
+    next_chunk = asyncio.ensure_future(pending.get())
+    next_event = asyncio.ensure_future(subscription.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait({next_chunk, next_event}, return_when=asyncio.FIRST_COMPLETED)
+            if next_event in done:
+                for frame in frames([next_event.result(), *subscription.drain()]):
+                    yield frame
+                next_event = asyncio.ensure_future(subscription.get())
+            if next_chunk in done:
+                chunk = next_chunk.result()
+                if chunk is None:
+                    break
+                yield chunk
+                pending.task_done()
+                next_chunk = asyncio.ensure_future(pending.get())
+        tail = [next_event.result()] if next_event.done() else []
+        for frame in frames(tail + subscription.drain()):
+            yield frame
+        await producer  # re-raises a failure of `chunks`
+    finally:
+        for task in (next_chunk, next_event, producer):
+            task.cancel()
 
 
 # Global singleton instance
@@ -398,7 +838,9 @@ def get_audit_bridge() -> AuditEventBridge:
     Get the global audit bridge instance (singleton pattern).
 
     Creates the bridge on first access. All agent callbacks and SSE middleware
-    should use this function to access the shared bridge instance.
+    should use this function to access the shared bridge instance. When
+    AUDIT_LOG_DIR is set, the bridge also writes every event to a durable
+    JsonlAuditSink there (see audit_sink.py).
 
     Returns:
         The global AuditEventBridge singleton.
@@ -421,6 +863,6 @@ def get_audit_bridge() -> AuditEventBridge:
         with _bridge_lock:
             # Double-check locking pattern
             if _audit_bridge is None:
-                _audit_bridge = AuditEventBridge()
+                _audit_bridge = AuditEventBridge(sink=JsonlAuditSink.from_env())
 
     return _audit_bridge
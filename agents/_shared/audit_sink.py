@@ -0,0 +1,422 @@
+"""
+RANGER Audit Log Sink - durable, append-only storage for the audit trail.
+
+The AuditEventBridge only buffers events in memory for SSE streaming; a sink
+keeps every recorded event so the federal audit trail survives restarts.
+
+JsonlAuditSink hands events to a background writer thread, so tool callbacks
+only pay for a queue put. The queue is bounded: if the writer falls that far
+behind, new events are dropped and counted rather than growing memory without
+limit. I/O errors are logged and counted, never fatal to the writer, and
+flush() reports them by returning False. The writer serializes events in batches into
+segmented JSONL files, fsyncs on a configurable cadence and rotates segments
+by size. Each closed segment gets a small sidecar index of byte offsets by
+session_id and invocation_id, so read_trail() seeks straight to the matching
+lines instead of scanning the whole log.
+
+Layout:
+    <directory>/audit-000001.jsonl      one JSON event per line
+    <directory>/audit-000001.idx.json   {"session_id": {id: [offsets]}, "invocation_id": {...}}
+
+Segments are never reopened: a restarted process starts a new segment, and a
+segment left without an index (e.g. after a crash) is indexed on first read.
+
+Configuration (see get_audit_bridge):
+    AUDIT_LOG_DIR             Enables the JSONL sink in this directory
+    AUDIT_LOG_FSYNC_SECONDS   fsync cadence; 0 = every batch, -1 = never (default 1)
+    AUDIT_LOG_SEGMENT_MB      Rotate segments at this size (default 64)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger("ranger.audit_sink")
+
+AUDIT_LOG_DIR = os.environ.get("AUDIT_LOG_DIR")
+AUDIT_LOG_FSYNC_SECONDS = float(os.environ.get("AUDIT_LOG_FSYNC_SECONDS", 1.0))
+AUDIT_LOG_SEGMENT_MB = int(os.environ.get("AUDIT_LOG_SEGMENT_MB", 64))
+
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_MAX_QUEUED = 100_000
+MAX_TRACKED_INVOCATIONS = 100_000
+SEGMENT_PATTERN = re.compile(r"^audit-(\d{6})\.jsonl$")
+INDEX_KEYS = ("session_id", "invocation_id")
+
+# Writer-thread control items placed on the queue alongside events
+_CLOSE = object()
+
+
+class AuditSink:
+    """Destination for recorded audit events (see AuditEventBridge.sink)."""
+
+    def write(self, invocation_id: str, event: Any) -> None:
+        """Accept an event recorded under invocation_id. Must not block."""
+        raise NotImplementedError
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until accepted events are durable. Returns False on timeout or error."""
+        return True
+
+    def close(self) -> None:
+        """Flush and release resources."""
+
+
+class JsonlAuditSink(AuditSink):
+    """
+    Batched, segmented JSONL audit log written by a background thread.
+
+    Usage:
+        >>> sink = JsonlAuditSink("/var/log/ranger/audit", fsync_interval_seconds=1.0)
+        >>> bridge = AuditEventBridge(sink=sink)
+        >>> ...
+        >>> sink.read_trail(session_id="session-456")
+
+    Args:
+        directory: Where segments and their indexes are written
+        segment_max_bytes: Rotate to a new segment past this size
+        fsync_interval_seconds: fsync at most this often; 0 fsyncs every
+            batch, a negative value leaves flushing to the OS
+        batch_size: Maximum events serialized per write
+        max_queued: Events held for the writer before new ones are dropped
+            (counted in events_dropped)
+
+    Thread Safety:
+        write() may be called from any thread; all file I/O happens on the
+        writer thread.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        fsync_interval_seconds: float = 1.0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.batch_size = max(1, batch_size)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queued))
+        self._lock = threading.Lock()
+        self._indexes: dict[Path, dict[str, dict[str, list[int]]]] = {}
+        self._segment_number = max((n for n, _ in self._segments()), default=0)
+        self._segment: Optional[Path] = None
+        self._file = None
+        self._offset = 0
+        self._active_index: dict[str, dict[str, list[int]]] = {}
+        self._sessions: dict[str, str] = {}
+        self._last_fsync = time.monotonic()
+        self._dirty = False
+        self._closed = False
+
+        self.events_written = 0
+        self.bytes_written = 0
+        self.batches = 0
+        self.fsyncs = 0
+        self.rotations = 0
+        self.write_errors = 0
+        self.events_dropped = 0
+        self.segments_read = 0
+
+        self._writer = threading.Thread(target=self._run, name="audit-sink-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    @classmethod
+    def from_env(cls) -> Optional["JsonlAuditSink"]:
+        """Sink configured by AUDIT_LOG_* environment variables, or None."""
+        if not AUDIT_LOG_DIR:
+            return None
+        return cls(
+            AUDIT_LOG_DIR,
+            segment_max_bytes=AUDIT_LOG_SEGMENT_MB * 1024 * 1024,
+            fsync_interval_seconds=AUDIT_LOG_FSYNC_SECONDS,
+        )
+
+    def write(self, invocation_id: str, event: Any) -> None:
+        """Queue an event; it is serialized later on the writer thread."""
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait((invocation_id, event))
+        except queue.Full:
+            with self._lock:
+                self.events_dropped += 1
+                dropped = self.events_dropped
+            if dropped == 1 or dropped % 1000 == 0:
+                logger.error(f"Audit sink queue full; {dropped} events dropped so far")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every event queued so far is written and fsynced.
+
+        Returns False on timeout, if the writer thread is gone, or if any
+        write or fsync failed (or events were dropped) meanwhile.
+        """
+        if self._closed:
+            return True
+        if not self._writer.is_alive():
+            return False
+        errors, dropped = self.write_errors, self.events_dropped
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        if not done.wait(timeout):
+            return False
+        return self.write_errors == errors and self.events_dropped == dropped
+
+    def close(self) -> None:
+        """Drain the queue, close the active segment and write its index."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(_CLOSE)
+            self._writer.join()
+
+    def read_trail(
+        self,
+        session_id: Optional[str] = None,
+        invocation_id: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Durable events for a session or invocation, oldest first.
+
+        Only segments whose index contains the ID are opened, and only the
+        indexed lines are read.
+        """
+        if (session_id is None) == (invocation_id is None):
+            raise ValueError("Pass exactly one of session_id or invocation_id")
+        field, value = ("session_id", session_id) if session_id is not None else ("invocation_id", invocation_id)
+        self.flush()
+
+        events = []
+        with self._lock:
+            active = self._segment
+            active_offsets = list(self._active_index.get(field, {}).get(value, ()))
+            last = self._segment_number
+        for number, path in self._segments():
+            if number > last:
+                break  # opened after the flush; still being written
+            offsets = active_offsets if path == active else self._segment_index(path)[field].get(value)
+            if not offsets:
+                continue
+            self.segments_read += 1
+            with open(path, "rb") as f:
+                for offset in offsets:
+                    f.seek(offset)
+                    events.append(json.loads(f.readline()))
+        return events
+
+    def stats(self) -> dict[str, Any]:
+        """Writer counters, for monitoring."""
+        return {
+            "directory": str(self.directory),
+            "segment": self._segment.name if self._segment else None,
+            "queued": self._queue.qsize(),
+            "events_written": self.events_written,
+            "bytes_written": self.bytes_written,
+            "batches": self.batches,
+            "fsyncs": self.fsyncs,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+            "events_dropped": self.events_dropped,
+            "writer_alive": self._writer.is_alive(),
+        }
+
+    def _segments(self) -> list[tuple[int, Path]]:
+        found = []
+        for path in self.directory.iterdir():
+            match = SEGMENT_PATTERN.match(path.name)
+            if match:
+                found.append((int(match.group(1)), path))
+        return sorted(found)
+
+    def _segment_index(self, path: Path) -> dict[str, dict[str, list[int]]]:
+        """Index of a closed segment: cached, from its sidecar, or rebuilt by one scan."""
+        index = self._indexes.get(path)
+        if index is not None:
+            return index
+        index_path = path.with_suffix(".idx.json")
+        try:
+            index = json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            index = {key: {} for key in INDEX_KEYS}
+            offset = 0
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # torn final line from a crash
+                    _index_record(index, record, offset)
+                    offset += len(line)
+            _write_index(index_path, index)
+        self._indexes[path] = index
+        return index
+
+    def _run(self) -> None:
+        closing = False
+        while not closing:
+            try:
+                item = self._queue.get(timeout=self._fsync_wait())
+            except queue.Empty:
+                self._maybe_fsync()
+                continue
+            batch, waiters = [], []
+            while True:
+                if item is _CLOSE:
+                    closing = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if closing or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self._write_batch(batch)
+                self._maybe_fsync(force=bool(waiters or closing))
+            except Exception as e:
+                # Never let one bad batch stop the writer; the next one may succeed
+                self.write_errors += 1
+                logger.exception(f"Audit sink writer error: {e}")
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+        try:
+            self._close_segment()
+        except OSError as e:
+            self.write_errors += 1
+            logger.error(f"Audit sink failed to close segment: {e}")
+
+    def _fsync_wait(self) -> Optional[float]:
+        if self._dirty and self.fsync_interval_seconds > 0:
+            return max(0.0, self._last_fsync + self.fsync_interval_seconds - time.monotonic())
+        return None
+
+    def _write_batch(self, batch: list[tuple[str, Any]]) -> None:
+        pending = len(batch)
+        try:
+            if self._file is None:
+                self._rotate()
+            # Offsets are indexed only once their lines are appended (see _append)
+            lines, records = [], []
+            offset = self._offset
+            for invocation_id, event in batch:
+                record = event.to_dict() if hasattr(event, "to_dict") else dict(event)
+                if record.get("invocation_id") is None:
+                    record["invocation_id"] = invocation_id
+                # Response/error events carry no session_id; inherit the invocation's
+                if "session_id" in record:
+                    self._sessions[record["invocation_id"]] = record["session_id"]
+                    if len(self._sessions) > MAX_TRACKED_INVOCATIONS:
+                        del self._sessions[next(iter(self._sessions))]
+                elif record["invocation_id"] in self._sessions:
+                    record["session_id"] = self._sessions[record["invocation_id"]]
+                line = json.dumps(record, default=str).encode() + b"\n"
+                if offset >= self.segment_max_bytes and lines:
+                    self._append(lines, records, offset)
+                    pending -= len(lines)
+                    lines, records = [], []
+                    self._rotate()
+                    offset = self._offset
+                records.append((record, offset))
+                lines.append(line)
+                offset += len(line)
+            self._append(lines, records, offset)
+            self.batches += 1
+        except (OSError, TypeError, ValueError) as e:
+            self.write_errors += 1
+            logger.error(f"Audit sink dropped {pending} events: {e}")
+
+    def _append(self, lines: list[bytes], records: list[tuple[dict, int]], end: int) -> None:
+        try:
+            self._file.write(b"".join(lines))
+            self._file.flush()
+        except OSError:
+            # Part of the data may have landed; later lines must not be
+            # indexed at offsets past a torn write, so start a new segment
+            self._dirty = False
+            try:
+                self._close_segment()
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            for record, offset in records:
+                _index_record(self._active_index, record, offset)
+        self.bytes_written += end - self._offset
+        self._offset = end
+        self.events_written += len(lines)
+        self._dirty = True
+
+    def _maybe_fsync(self, force: bool = False) -> None:
+        if not self._dirty or self._file is None or self.fsync_interval_seconds < 0:
+            return
+        if force or time.monotonic() - self._last_fsync >= self.fsync_interval_seconds:
+            self._last_fsync = time.monotonic()
+            self._dirty = False
+            try:
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                # Written data may not be durable; report it through flush()
+                self.write_errors += 1
+                logger.error(f"Audit sink fsync failed on {self._segment}: {e}")
+                return
+            self.fsyncs += 1
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._close_segment()
+            self.rotations += 1
+        with self._lock:
+            self._segment_number += 1
+            self._segment = self.directory / f"audit-{self._segment_number:06d}.jsonl"
+            self._active_index = {key: {} for key in INDEX_KEYS}
+        self._file = open(self._segment, "ab")
+        self._offset = self._file.tell()
+
+    def _close_segment(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._maybe_fsync(force=True)
+            self._file.close()
+        finally:
+            self._file = None
+            with self._lock:
+                _write_index(self._segment.with_suffix(".idx.json"), self._active_index)
+                self._indexes[self._segment] = self._active_index
+                self._segment = None
+                self._active_index = {}
+
+
+def _index_record(index: dict[str, dict[str, list[int]]], record: dict[str, Any], offset: int) -> None:
+    for key in INDEX_KEYS:
+        value = record.get(key)
+        if isinstance(value, str):
+            index[key].setdefault(value, []).append(offset)
+
+
+def _write_index(path: Path, index: dict[str, dict[str, list[int]]]) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(index, separators=(",", ":")))
+    os.replace(tmp, path)
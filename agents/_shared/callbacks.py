@@ -5,7 +5,9 @@ This module provides factory functions to create standardized audit callbacks
 that integrate with the AuditEventBridge for federal compliance transparency.
 
 All callbacks record events to the shared audit_bridge singleton while also
-logging to the Python logger for operational visibility.
+logging to the Python logger for operational visibility. Events are keyed by
+the audit correlation ID of the current context (see audit_correlation),
+falling back to the tool context's session_id.
 
 Reference: docs/adr/ADR-007.1-tool-invocation-strategy.md § Tier 3
 Reference: docs/architecture/SSE-PROOF-LAYER-SPIKE.md § 2.2.A
@@ -17,6 +19,7 @@ from typing import Any, Callable, Tuple
 
 from agents._shared.audit_bridge import (
     get_audit_bridge,
+    get_correlation_id,
     ToolInvocationEvent,
     ToolResponseEvent,
     ToolErrorEvent,
@@ -73,39 +76,39 @@ def create_audit_callbacks(
             None (continue with tool execution)
 
         Note:
-            Uses session_id as the correlation key for ToolInvocationValidator.
-            The validator passes session_id to InMemoryRunner.run_async(),
-            which propagates it to tool_context for callback correlation.
+            Events are keyed by the audit correlation ID that
+            ToolInvocationValidator (and /run_sse_enhanced) set around the
+            run. ADK's tool_context doesn't carry session_id, so without one
+            events land in the shared "unknown" bucket.
         """
         tool_name = tool.name if hasattr(tool, "name") else str(tool)
         session_id = getattr(tool_context, "session_id", "unknown")
         adk_invocation_id = getattr(tool_context, "invocation_id", None)
 
         # Record to audit bridge for SSE streaming and validator correlation
-        # Note: ADK InMemoryRunner doesn't propagate session_id, so events are
-        # stored under "unknown". The validator clears/queries this key.
         event = ToolInvocationEvent(
             agent=agent_name,
             tool=tool_name,
             parameters=args,
-            invocation_id=session_id,  # Used by validator for correlation
+            invocation_id=get_correlation_id() or session_id,  # Used by validator for correlation
             session_id=session_id,
             enforcement="API-level mode=AUTO",  # ADR-007.1 Tier 1
         )
         bridge.record_tool_invocation(event)
 
-        # Log for operational visibility
-        logger.info(
-            "TOOL_INVOCATION",
-            extra={
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "agent": agent_name,
-                "tool": tool_name,
-                "parameters": args,
-                "session_id": session_id,
-                "adk_invocation_id": adk_invocation_id,
-            },
-        )
+        # Log for operational visibility (extras only built when INFO is on)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "TOOL_INVOCATION",
+                extra={
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "agent": agent_name,
+                    "tool": tool_name,
+                    "parameters": args,
+                    "session_id": session_id,
+                    "adk_invocation_id": adk_invocation_id,
+                },
+            )
 
         return None  # Continue with tool execution
 
@@ -153,7 +156,6 @@ def create_audit_callbacks(
         )
 
         # Record to audit bridge for SSE streaming and validator correlation
-        # Use session_id as the key since we control it (validator sets it)
         event = ToolResponseEvent(
             agent=agent_name,
             tool=tool_name,
@@ -161,23 +163,24 @@ def create_audit_callbacks(
             confidence=confidence,
             data_sources=data_sources,
             reasoning_chain=reasoning_chain,
-            invocation_id=session_id,  # Used by validator for correlation
+            invocation_id=get_correlation_id() or session_id,  # Used by validator for correlation
         )
         bridge.record_tool_response(event)
 
-        # Log for operational visibility
-        logger.info(
-            "TOOL_RESPONSE",
-            extra={
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "agent": agent_name,
-                "tool": tool_name,
-                "status": status,
-                "confidence": confidence,
-                "data_sources": data_sources,
-                "session_id": session_id,
-            },
-        )
+        # Log for operational visibility (extras only built when INFO is on)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "TOOL_RESPONSE",
+                extra={
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "agent": agent_name,
+                    "tool": tool_name,
+                    "status": status,
+                    "confidence": confidence,
+                    "data_sources": data_sources,
+                    "session_id": session_id,
+                },
+            )
 
         return None  # Use original response
 
@@ -201,14 +204,13 @@ def create_audit_callbacks(
         session_id = getattr(tool_context, "session_id", "unknown")
 
         # Record to audit bridge for SSE streaming and validator correlation
-        # Use session_id as the key since we control it (validator sets it)
         event = ToolErrorEvent(
             agent=agent_name,
             tool=tool_name,
             parameters=args,
             error_type=type(error).__name__,
             error_message=str(error),
-            invocation_id=session_id,  # Used by validator for correlation
+            invocation_id=get_correlation_id() or session_id,  # Used by validator for correlation
         )
         bridge.record_tool_error(event)
 
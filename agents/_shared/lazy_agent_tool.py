@@ -0,0 +1,147 @@
+"""
+Lazy AgentTool stubs for cold-start reduction.
+
+The Coordinator exposes each specialist as an AgentTool (ADR-008). Building
+those tools eagerly imports every specialist's agent.py, which in turn pushes
+skill script directories onto sys.path and imports RAG modules. On Cloud Run
+that cost is paid on every scale-out, even for requests that never reach a
+specialist.
+
+LazyAgentTool advertises the same function declaration as an AgentTool but
+only imports the specialist's module tree on its first invocation.
+
+Usage:
+    >>> burn_analyst_tool = LazyAgentTool(
+    ...     name="burn_analyst",
+    ...     module="burn_analyst.agent",
+    ...     description="Fire severity and burn analysis specialist for RANGER.",
+    ... )
+    >>> # Nothing imported yet; first run_async() loads burn_analyst.agent
+
+Reference: docs/adr/ADR-008-agent-tool-pattern.md
+"""
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+from google.adk.agents import Agent
+from google.adk.tools import AgentTool
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+
+
+logger = logging.getLogger("ranger.lazy_agents")
+
+# module path -> milliseconds spent importing it on first use
+_load_times_ms: dict[str, float] = {}
+
+
+class LazyAgentTool(BaseTool):
+    """
+    AgentTool stand-in that defers importing the wrapped agent.
+
+    The function declaration is built from a lightweight placeholder agent
+    with the same name and description, so the model sees exactly what a
+    real AgentTool would advertise. The real agent is resolved once, under
+    a lock, the first time the tool runs (or when preloaded).
+
+    Args:
+        name: Agent name (must match the wrapped agent's `name`)
+        module: Importable module path containing the agent
+        description: Agent description advertised to the model
+        attribute: Module attribute holding the agent (default: root_agent)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        module: str,
+        description: str,
+        attribute: str = "root_agent",
+    ):
+        super().__init__(name=name, description=description)
+        self.module = module
+        self.attribute = attribute
+        self._delegate: Optional[AgentTool] = None
+        self._lock = threading.Lock()
+        self._declaration_tool = AgentTool(agent=Agent(name=name, description=description))
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the wrapped agent has been imported."""
+        return self._delegate is not None
+
+    @property
+    def agent(self):
+        """The wrapped agent (imports it on first access)."""
+        return self.resolve().agent
+
+    def resolve(self) -> AgentTool:
+        """
+        Import the wrapped agent and return the real AgentTool.
+
+        Thread-safe; the import happens at most once per tool.
+
+        Raises:
+            ValueError: If the loaded agent's name does not match this tool
+        """
+        if self._delegate is None:
+            with self._lock:
+                if self._delegate is None:
+                    start = time.perf_counter()
+                    agent = getattr(importlib.import_module(self.module), self.attribute)
+                    if agent.name != self.name:
+                        raise ValueError(
+                            f"Lazy tool '{self.name}' resolved to agent '{agent.name}' "
+                            f"from {self.module}"
+                        )
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    _load_times_ms[self.module] = elapsed_ms
+                    self._delegate = AgentTool(agent=agent)
+                    logger.info(f"Loaded {self.module} on first use ({elapsed_ms:.0f}ms)")
+        return self._delegate
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        if self._delegate is not None:
+            return self._delegate._get_declaration()
+        return self._declaration_tool._get_declaration()
+
+    async def run_async(self, *, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        if self._delegate is None:
+            # First call: import off the event loop so other streams keep flowing
+            await asyncio.to_thread(self.resolve)
+        return await self._delegate.run_async(args=args, tool_context=tool_context)
+
+
+def preload_lazy_tools(tools: Iterable[Any]) -> list[str]:
+    """
+    Resolve every LazyAgentTool in `tools`.
+
+    Used by production serving to import the whole agent tree before
+    forking workers.
+
+    Args:
+        tools: Tool list (e.g. an agent's `tools`); non-lazy entries are skipped
+
+    Returns:
+        Names of the tools that were resolved
+    """
+    resolved = []
+    for tool in tools:
+        if isinstance(tool, LazyAgentTool):
+            tool.resolve()
+            resolved.append(tool.name)
+    return resolved
+
+
+def get_load_times() -> dict[str, float]:
+    """Return a copy of first-use import times (module path -> ms)."""
+    return dict(_load_times_ms)
+
+
+__all__ = ["LazyAgentTool", "preload_lazy_tools", "get_load_times"]
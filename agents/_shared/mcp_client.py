@@ -2,7 +2,23 @@
 RANGER MCP Client Utilities
 
 Provides ADK-native McpToolset factories for connecting agents to the
-MCP Fixtures Server. Uses HTTP transport in Cloud Run, stdio for local development.
+MCP Fixtures Server. Uses Streamable HTTP transport when a server URL is
+configured, stdio for local development.
+
+All toolsets in a process share MCP connections through McpSessionPool:
+each toolset borrows one of at most MCP_POOL_SIZE ADK session managers per
+server instead of opening its own, so the burn, trail, cruising and
+coordinator toolsets multiplex over a few persistent sessions (and, with
+stdio, a few server subprocesses rather than one each).
+
+List tools are called in projected form by default (PROJECTED_TOOL_ARGUMENTS):
+bulky per-item detail such as trail damage points and plot tree tallies is
+left out unless the model asks for it via `fields`.
+
+With MCP_CASSETTE set, toolsets record every MCP tool call to a cassette
+or replay one instead of connecting to the server, for deterministic
+latency benchmarks (see packages/skill-runtime/skill_runtime/cassette.py;
+needs packages/skill-runtime on PYTHONPATH).
 
 Per ADR-005: Skills-First Architecture - MCP for Connectivity, Skills for Expertise
 Reference: docs/specs/_!_PHASE4-MCP-INTEGRATION-PLAN.md
@@ -10,11 +26,23 @@ Reference: docs/specs/_!_PHASE4-MCP-INTEGRATION-PLAN.md
 Environment Variables:
     MCP_FIXTURES_URL: URL of deployed MCP fixtures server (Cloud Run)
                       If set, uses HTTP transport. If not set, uses stdio (local dev).
+                      A bare base URL gets the server's /mcp endpoint appended.
+    MCP_POOL_SIZE: Shared session managers per MCP server (default: 2)
+    MCP_CASSETTE: Path of a cassette to record to or replay from (default: none)
+    MCP_CASSETTE_MODE: "replay" (default) or "record"
+    MCP_CASSETTE_SPEED: Replay speed; 1 = recorded timing, 10 = ten times
+                        faster, 0 = no delay (default: 1)
 """
 
+import atexit
+import logging
 import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
 
 
 # Path to MCP Fixtures Server script (for local stdio)
@@ -24,16 +52,372 @@ MCP_SERVER_PATH = PROJECT_ROOT / "services" / "mcp-fixtures" / "server.py"
 # Cloud Run MCP server URL (if deployed)
 MCP_FIXTURES_URL = os.environ.get("MCP_FIXTURES_URL")
 
+# Session managers shared per MCP server
+MCP_POOL_SIZE = int(os.environ.get("MCP_POOL_SIZE", 2))
+
+# Server ID for cassette entries (the same whichever transport recorded them)
+MCP_SERVER_ID = "mcp-fixtures"
+CASSETTE_MODES = ("record", "replay")
+
+# Arguments agent toolsets send unless the model sets them (see
+# services/mcp-fixtures/projection.py). Field names cover every fixture's spelling.
+PROJECTED_TOOL_ARGUMENTS: dict[str, dict[str, Any]] = {
+    "assess_trails": {
+        "fields": [
+            "trail_name", "name", "trail_class", "total_miles", "miles_in_fire",
+            "current_status", "status", "total_estimated_cost", "priority_rank",
+            "priority_rationale",
+        ],
+        "limit": 25,
+    },
+    "get_timber_plots": {
+        "fields": [
+            "name", "sector", "stand_type", "burn_severity", "plot_summary", "priority",
+            "salvage_priority", "total_mbf_per_acre", "estimated_value_per_acre",
+            "time_sensitivity", "access_notes",
+        ],
+        "limit": 25,
+    },
+    "mtbs_classify": {
+        "fields": ["name", "severity", "severity_class", "acres", "dnbr_mean"],
+    },
+}
+
+# Arguments selecting a single item; such calls get full detail, not projection
+DETAIL_ARGUMENTS: dict[str, tuple[str, ...]] = {
+    "assess_trails": ("trail_id",),
+}
+
+
+def projected_arguments(tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge PROJECTED_TOOL_ARGUMENTS defaults under the model's own arguments.
+
+    Examples:
+        >>> projected_arguments("mtbs_classify", {"fire_id": "cc"})["fields"][0]
+        'name'
+        >>> "fields" in projected_arguments("assess_trails", {"fire_id": "cc", "trail_id": "T1"})
+        False
+    """
+    defaults = PROJECTED_TOOL_ARGUMENTS.get(tool_name)
+    if not defaults or any(args.get(key) for key in DETAIL_ARGUMENTS.get(tool_name, ())):
+        return args
+    return {**defaults, **args}
+
+
+def mcp_endpoint(url: str) -> str:
+    """
+    Streamable HTTP endpoint for a server URL.
+
+    Examples:
+        >>> mcp_endpoint("https://ranger-mcp-fixtures.run.app")
+        'https://ranger-mcp-fixtures.run.app/mcp'
+        >>> mcp_endpoint("http://localhost:8080/mcp")
+        'http://localhost:8080/mcp'
+    """
+    if urlsplit(url).path.strip("/"):
+        return url
+    return url.rstrip("/") + "/mcp"
+
+
+def connection_key(connection_params: Any) -> tuple:
+    """Hashable identity of the MCP server a set of connection params targets."""
+    url = getattr(connection_params, "url", None)
+    if url:
+        return ("http", url)
+    server_params = getattr(connection_params, "server_params", connection_params)
+    return ("stdio", server_params.command, tuple(server_params.args or ()))
+
+
+class McpSessionPool:
+    """
+    Process-wide pool of ADK MCPSessionManagers, shared across toolsets.
+
+    A session manager owns the live MCP session(s) to one server; MCP
+    multiplexes concurrent requests over a session by request ID, so
+    toolsets can share one safely. acquire() hands out the least-borrowed
+    manager for a server, creating up to `size` of them; the last release()
+    of a manager closes it.
+
+    Args:
+        size: Maximum session managers per server
+
+    Thread Safety:
+        acquire() and release() bookkeeping is lock-protected.
+    """
+
+    def __init__(self, size: int = MCP_POOL_SIZE):
+        self.size = max(1, size)
+        self._lock = threading.Lock()
+        # connection key -> [[session manager, borrow count], ...]
+        self._managers: dict[tuple, list[list]] = {}
+        self.created = 0
+
+    def acquire(self, connection_params: Any):
+        """Borrow a session manager for the server `connection_params` targets."""
+        from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager
+
+        key = connection_key(connection_params)
+        with self._lock:
+            slots = self._managers.setdefault(key, [])
+            if len(slots) < self.size:
+                slot = [MCPSessionManager(connection_params=connection_params), 0]
+                slots.append(slot)
+                self.created += 1
+            else:
+                slot = min(slots, key=lambda s: s[1])
+            slot[1] += 1
+            return slot[0]
+
+    async def release(self, manager) -> None:
+        """Return a borrowed manager, closing it once no toolset uses it."""
+        with self._lock:
+            for key, slots in self._managers.items():
+                slot = next((s for s in slots if s[0] is manager), None)
+                if slot is not None:
+                    break
+            else:
+                return
+            slot[1] -= 1
+            if slot[1] > 0:
+                return
+            slots.remove(slot)
+            if not slots:
+                del self._managers[key]
+        await _close_quietly(manager)
+
+    async def close(self) -> None:
+        """Close every pooled manager (e.g. on application shutdown)."""
+        with self._lock:
+            managers = [slot[0] for slots in self._managers.values() for slot in slots]
+            self._managers.clear()
+        for manager in managers:
+            await _close_quietly(manager)
+
+    def stats(self) -> dict[str, Any]:
+        """Borrow counts of each pooled manager, per server."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "created": self.created,
+                "servers": {
+                    key[1] if key[0] == "http" else " ".join((key[1], *key[2])): [slot[1] for slot in slots]
+                    for key, slots in self._managers.items()
+                },
+            }
+
+
+async def _close_quietly(manager) -> None:
+    try:
+        await manager.close()
+    except Exception as e:
+        # Never block shutdown on a failed close
+        logger.warning(f"Error closing pooled MCP session manager: {e}")
+
+
+_session_pool: Optional[McpSessionPool] = None
+_session_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> McpSessionPool:
+    """Process-wide MCP session pool."""
+    global _session_pool
+    if _session_pool is None:
+        with _session_pool_lock:
+            if _session_pool is None:
+                _session_pool = McpSessionPool()
+    return _session_pool
+
+
+class McpCassetteSession:
+    """
+    A cassette that agent toolsets record MCP calls to, or replay them from.
+
+    Args:
+        path: Cassette file (".gz" for gzip)
+        mode: "record" or "replay"
+        speed: Replay speed (1 = recorded timing, 0 = no delay)
+
+    Raises:
+        ValueError: If mode is unknown
+        FileNotFoundError: If replaying a cassette that doesn't exist
+        ImportError: If skill_runtime (packages/skill-runtime) isn't importable
+    """
+
+    def __init__(self, path: str | Path, mode: str = "replay", speed: float = 1.0):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}, expected one of {CASSETTE_MODES}")
+        try:
+            from skill_runtime.cassette import Cassette
+        except ImportError as e:
+            raise ImportError("MCP cassettes need packages/skill-runtime on PYTHONPATH") from e
+
+        self.path = Path(path)
+        self.mode = mode
+        self.cassette = Cassette.load(self.path) if mode == "replay" else Cassette()
+        self.player = self.cassette.player(speed) if mode == "replay" else None
+
+    def save(self) -> None:
+        """Write recorded calls to the cassette file (no-op when replaying)."""
+        if self.mode == "record":
+            self.cassette.save(self.path)
+            logger.info(f"Recorded {len(self.cassette)} MCP calls to {self.path}")
+
+
+_cassette_session: Optional[McpCassetteSession] = None
+_cassette_configured = False
+_cassette_lock = threading.Lock()
+
+
+def use_mcp_cassette(
+    path: Optional[str | Path],
+    mode: str = "replay",
+    speed: float = 1.0,
+) -> Optional[McpCassetteSession]:
+    """
+    Record or replay MCP calls of toolsets created from now on.
+
+    A recording is saved at process exit, or earlier with save(). Pass
+    path=None to go back to the live server.
+    """
+    global _cassette_session, _cassette_configured
+    session = McpCassetteSession(path, mode, speed) if path else None
+    with _cassette_lock:
+        _cassette_session, _cassette_configured = session, True
+    if session is not None and session.mode == "record":
+        atexit.register(session.save)
+    return session
+
+
+def get_mcp_cassette() -> Optional[McpCassetteSession]:
+    """The active cassette session, set up from MCP_CASSETTE* on first use."""
+    if not _cassette_configured:
+        return use_mcp_cassette(
+            os.environ.get("MCP_CASSETTE"),
+            mode=os.environ.get("MCP_CASSETTE_MODE", "replay"),
+            speed=float(os.environ.get("MCP_CASSETTE_SPEED", 1)),
+        )
+    return _cassette_session
+
+
+_PooledMcpToolset = None
+
+
+def _use_cassette(tool, session: McpCassetteSession) -> None:
+    """Make an McpTool record its calls to, or replay them from, a cassette."""
+    run_async = tool.run_async
+    tool_name = tool.raw_mcp_tool.name
+
+    if session.player is not None:
+        async def run_replayed(*, args, tool_context):
+            return await session.player.play(MCP_SERVER_ID, tool_name, args)
+
+        tool.run_async = run_replayed
+        return
+
+    async def run_recorded(*, args, tool_context):
+        return await session.cassette.record(
+            MCP_SERVER_ID, tool_name, args, lambda: run_async(args=args, tool_context=tool_context)
+        )
+
+    tool.run_async = run_recorded
+
+
+def _request_projection(tool) -> None:
+    """Make an McpTool send projected_arguments() for its MCP tool."""
+    run_async = tool.run_async
+    tool_name = tool.raw_mcp_tool.name
+
+    async def run_projected(*, args, tool_context):
+        return await run_async(args=projected_arguments(tool_name, args), tool_context=tool_context)
+
+    tool.run_async = run_projected
+
+
+def _pooled_toolset_class():
+    """PooledMcpToolset, defined on first use so importing this module stays ADK-free."""
+    global _PooledMcpToolset
+    if _PooledMcpToolset is None:
+        from google.adk.tools.mcp_tool import McpToolset
+
+        class PooledMcpToolset(McpToolset):
+            """
+            McpToolset whose MCP session manager is borrowed from a McpSessionPool.
+
+            With a replaying cassette it never connects: tools are listed from
+            the recorded schemas and calls answered from the recordings.
+            """
+
+            def __init__(
+                self,
+                *,
+                pool: McpSessionPool,
+                projected: bool = True,
+                cassette: Optional[McpCassetteSession] = None,
+                **kwargs,
+            ):
+                super().__init__(**kwargs)
+                self._pool = pool
+                self._projected = projected
+                self._cassette = cassette
+                self._replaying = cassette is not None and cassette.player is not None
+                if not self._replaying:
+                    # The manager McpToolset built is not connected yet; swap in a shared one
+                    self._mcp_session_manager = pool.acquire(self._connection_params)
+
+            async def get_tools(self, readonly_context=None):
+                if self._replaying:
+                    tools = self._recorded_tools(readonly_context)
+                else:
+                    tools = await super().get_tools(readonly_context)
+                mcp_tools = [tool for tool in tools if getattr(tool, "raw_mcp_tool", None) is not None]
+                if self._cassette is not None and not self._replaying:
+                    self._cassette.cassette.add_tools(
+                        MCP_SERVER_ID,
+                        [tool.raw_mcp_tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in mcp_tools],
+                    )
+                for tool in mcp_tools:
+                    # Cassettes see the arguments actually sent, after projection
+                    if self._cassette is not None:
+                        _use_cassette(tool, self._cassette)
+                    if self._projected:
+                        _request_projection(tool)
+                return tools
+
+            def _recorded_tools(self, readonly_context) -> list:
+                from google.adk.tools.mcp_tool.mcp_tool import McpTool
+                from mcp.types import Tool
+
+                schemas = self._cassette.cassette.tools.get(MCP_SERVER_ID, {})
+                tools = [
+                    McpTool(mcp_tool=Tool.model_validate(schema), mcp_session_manager=self._mcp_session_manager)
+                    for schema in schemas.values()
+                ]
+                return sorted(
+                    (tool for tool in tools if self._is_tool_selected(tool, readonly_context)),
+                    key=lambda tool: tool.name,
+                )
+
+            async def close(self) -> None:
+                self._tool_list_cache.clear()
+                if not self._replaying:
+                    await self._pool.release(self._mcp_session_manager)
+
+        _PooledMcpToolset = PooledMcpToolset
+    return _PooledMcpToolset
+
 
 def get_mcp_toolset(
     tool_filter: Optional[list[str]] = None,
-    tool_name_prefix: str = "mcp_"
+    tool_name_prefix: str = "mcp_",
+    projected: bool = True
 ):
     """
     Create an ADK-native McpToolset connected to the MCP Fixtures Server.
 
     Uses HTTP transport when MCP_FIXTURES_URL is set (Cloud Run deployment),
-    otherwise uses stdio for local development.
+    otherwise uses stdio for local development. The toolset's MCP session is
+    shared with other toolsets through get_session_pool().
 
     This is the recommended way to connect agents to MCP data sources.
     ADK handles connection lifecycle, retries, and tool schema management.
@@ -41,9 +425,13 @@ def get_mcp_toolset(
     Args:
         tool_filter: List of MCP tool names to expose (None = all tools)
         tool_name_prefix: Prefix for tool names in agent's tool list
+        projected: Call list tools with PROJECTED_TOOL_ARGUMENTS defaults
+
+    Tool calls are recorded to or replayed from the get_mcp_cassette()
+    session, if any.
 
     Returns:
-        McpToolset instance configured for appropriate transport
+        McpToolset (pooled) instance configured for appropriate transport
 
     Example:
         toolset = get_mcp_toolset(
@@ -52,19 +440,15 @@ def get_mcp_toolset(
         )
         # Adds mcp_get_fire_context, mcp_mtbs_classify to agent
     """
-    from google.adk.tools.mcp_tool import McpToolset
+    PooledMcpToolset = _pooled_toolset_class()
 
     # Use HTTP transport if MCP_FIXTURES_URL is set (Cloud Run)
     if MCP_FIXTURES_URL:
-        from google.adk.tools.mcp_tool.mcp_session_manager import HttpConnectionParams
+        from google.adk.tools.mcp_tool.mcp_session_manager import StreamableHTTPConnectionParams
 
-        return McpToolset(
-            connection_params=HttpConnectionParams(
-                url=MCP_FIXTURES_URL,
-                timeout=30.0
-            ),
-            tool_filter=tool_filter,
-            tool_name_prefix=tool_name_prefix
+        connection_params = StreamableHTTPConnectionParams(
+            url=mcp_endpoint(MCP_FIXTURES_URL),
+            timeout=30.0
         )
 
     # Otherwise use stdio for local development
@@ -72,19 +456,24 @@ def get_mcp_toolset(
         from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
         from mcp.client.stdio import StdioServerParameters
 
-        return McpToolset(
-            connection_params=StdioConnectionParams(
-                server_params=StdioServerParameters(
-                    command="python",
-                    args=[str(MCP_SERVER_PATH)],
-                    env=None  # Inherit parent environment
-                ),
-                timeout=30.0  # Allow time for server startup
+        connection_params = StdioConnectionParams(
+            server_params=StdioServerParameters(
+                command="python",
+                args=[str(MCP_SERVER_PATH)],
+                env=None  # Inherit parent environment
             ),
-            tool_filter=tool_filter,
-            tool_name_prefix=tool_name_prefix
+            timeout=30.0  # Allow time for server startup
         )
 
+    return PooledMcpToolset(
+        pool=get_session_pool(),
+        projected=projected,
+        cassette=get_mcp_cassette(),
+        connection_params=connection_params,
+        tool_filter=tool_filter,
+        tool_name_prefix=tool_name_prefix
+    )
+
 
 def get_burn_analyst_toolset():
     """
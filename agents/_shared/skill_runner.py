@@ -0,0 +1,90 @@
+"""
+Skill execution for agent tool wrappers.
+
+Agent tools such as assess_severity or estimate_volume used to import their
+skill script and call execute() directly, on the event loop thread that
+serves every SSE stream in the worker. run_skill() hands the call to the
+skill_runtime SkillExecutor instead, which picks the pool from the skill's
+"## Execution" section in skill.md:
+
+- "io" skills run on its thread pool
+- "cpu" skills (csv-insight, pdf-extraction, boundary-mapping,
+  portfolio-triage) run in warm worker processes
+
+Each call gets the skill's declared timeout and is cancelled with the
+request.
+
+Usage:
+    >>> async def estimate_volume(fire_id: str, ...) -> dict:
+    ...     return await run_skill(SKILLS_DIR / "volume-estimation", "estimate_volume", {...})
+
+Environment:
+    SKILL_CPU_WORKERS: Worker processes for cpu skills per server worker (1)
+"""
+
+import logging
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+# skill_runtime ships at the image root (PYTHONPATH=/app); in a checkout it
+# lives under packages/skill-runtime
+SKILL_RUNTIME_PATH = Path(__file__).resolve().parents[2] / "packages" / "skill-runtime"
+if SKILL_RUNTIME_PATH.exists() and str(SKILL_RUNTIME_PATH) not in sys.path:
+    sys.path.append(str(SKILL_RUNTIME_PATH))
+
+from skill_runtime.executor import SkillExecutor, execute_skill_async  # noqa: E402
+
+logger = logging.getLogger("ranger.skills")
+
+# One per server worker process; WEB_CONCURRENCY workers share the CPUs
+SKILL_CPU_WORKERS = int(os.environ.get("SKILL_CPU_WORKERS", 1))
+
+_executor: Optional[SkillExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_agent_skill_executor() -> SkillExecutor:
+    """
+    The SkillExecutor agent tools run on, created on first use.
+
+    Created lazily so pre-forked server workers each start their own worker
+    processes after the fork.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = SkillExecutor(cpu_workers=SKILL_CPU_WORKERS)
+            logger.info(f"Skill executor started ({SKILL_CPU_WORKERS} cpu workers)")
+        return _executor
+
+
+def shutdown_agent_skill_executor() -> None:
+    """Stop the agent SkillExecutor's worker processes and threads."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+async def run_skill(skill_path: Path, script_name: str, inputs: dict) -> dict:
+    """
+    Run a skill script's execute(inputs) off the event loop.
+
+    Args:
+        skill_path: Skill directory (the one holding skill.md)
+        script_name: Script in its scripts/ directory
+        inputs: Inputs for execute(); picklable for cpu skills
+
+    Returns:
+        The script's result
+
+    Raises:
+        TimeoutError: If the skill runs past its declared timeout
+        RuntimeError: If a cpu skill's worker process died
+        Any exception raised by the skill itself
+    """
+    return await execute_skill_async(skill_path, script_name, inputs, executor=get_agent_skill_executor())
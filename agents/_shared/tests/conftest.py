@@ -0,0 +1,15 @@
+"""
+Pytest configuration for shared agent utility tests.
+
+Puts packages/skill-runtime on the path for the MCP cassette tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Project root
+PROJECT_ROOT = Path(__file__).parents[3]
+
+SKILL_RUNTIME_DIR = PROJECT_ROOT / "packages" / "skill-runtime"
+if str(SKILL_RUNTIME_DIR) not in sys.path:
+    sys.path.insert(0, str(SKILL_RUNTIME_DIR))
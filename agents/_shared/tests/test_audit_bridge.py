@@ -8,10 +8,16 @@ Test Coverage:
     4. Event type classification (correct dataclass usage and serialization)
     5. Thread safety (concurrent event recording)
     6. Singleton pattern (get_audit_bridge)
+    7. TTL and total-cap eviction of abandoned invocations
+    8. Slotted events serialized lazily on read
+    9. Push subscriptions and SSE interleaving (bounded queues, slow consumers)
+    10. Context-variable audit correlation
 
 Reference: docs/architecture/SSE-PROOF-LAYER-SPIKE.md § 5 (Implementation Roadmap)
 """
 
+import asyncio
+import json
 import pytest
 import threading
 import time
@@ -22,7 +28,10 @@ from agents._shared.audit_bridge import (
     ToolInvocationEvent,
     ToolResponseEvent,
     ToolErrorEvent,
+    audit_correlation,
     get_audit_bridge,
+    get_correlation_id,
+    interleave_audit_events,
 )
 
 
@@ -150,6 +159,37 @@ class TestToolErrorEvent:
         assert d["error_message"] == "Missing fixture"
 
 
+class TestLazySerialization:
+    """Test suite for slotted events serialized on read."""
+
+    def test_events_are_slotted(self):
+        """Events carry no per-instance __dict__."""
+        for event in (ToolInvocationEvent(), ToolResponseEvent(), ToolErrorEvent()):
+            assert not hasattr(event, "__dict__")
+
+    def test_recorded_event_serialized_on_read(self):
+        """The bridge stores the event object and serializes it in get_audit_trail."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+        event = ToolResponseEvent(tool="t", reasoning_chain=["Step 1"], invocation_id="lazy")
+        bridge.record_tool_response(event)
+
+        assert bridge._events("lazy") == [event]
+        trail = bridge.get_audit_trail("lazy")
+        assert trail[0]["reasoning_chain"] == ["Step 1"]
+
+        # Serialized output is a copy
+        trail[0]["reasoning_chain"].append("tampered")
+        assert event.reasoning_chain == ["Step 1"]
+        assert bridge.get_audit_trail("lazy")[0]["reasoning_chain"] == ["Step 1"]
+
+    def test_to_dict_copies_nested_parameters(self):
+        """Nested parameter containers are copied, not shared."""
+        event = ToolInvocationEvent(parameters={"fire": {"sectors": ["S-1"]}})
+        d = event.to_dict()
+        d["parameters"]["fire"]["sectors"].append("S-2")
+        assert event.parameters == {"fire": {"sectors": ["S-1"]}}
+
+
 class TestAuditEventBridge:
     """Test suite for AuditEventBridge core functionality."""
 
@@ -467,6 +507,251 @@ class TestThreadSafety:
         assert len(final_trail) == num_writers * events_per_writer
 
 
+class TestEviction:
+    """Test suite for TTL sweeping and the invocation cap."""
+
+    def test_sweep_drops_idle_invocations(self):
+        """Invocations idle past ttl_seconds are swept; active ones stay."""
+        bridge = AuditEventBridge(ttl_seconds=60)
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="old", invocation_id="abandoned"))
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="new", invocation_id="active"))
+        now = time.monotonic()
+
+        assert bridge.sweep(now=now + 30) == 0
+        # "active" gets another event 40s later
+        bridge._stripe("active").buffers["active"].touched = now + 40
+
+        assert bridge.sweep(now=now + 61) == 1
+        assert bridge.get_audit_trail("abandoned") == []
+        assert len(bridge.get_audit_trail("active")) == 1
+        assert bridge.stats()["evicted_ttl"] == 1
+        bridge.close()
+
+    def test_background_sweeper_evicts(self):
+        """The sweeper thread starts on first record and applies the TTL."""
+        bridge = AuditEventBridge(ttl_seconds=0.05, sweep_interval_seconds=0.02)
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="t", invocation_id="disconnected"))
+        assert bridge.stats()["sweeper_running"]
+
+        deadline = time.monotonic() + 2
+        while bridge.get_invocation_count() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert bridge.get_invocation_count() == 0
+        bridge.close()
+        assert not bridge.stats()["sweeper_running"]
+
+    def test_ttl_zero_disables_sweeping(self):
+        """ttl_seconds=0 keeps invocations until cleared."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="t", invocation_id="kept"))
+
+        assert bridge.sweep(now=time.monotonic() + 10**6) == 0
+        assert not bridge.stats()["sweeper_running"]
+        assert bridge.get_invocation_count() == 1
+
+    def test_invocation_cap_evicts_least_recent_invocations(self):
+        """Crossing max_invocations evicts the least recently updated, down to 90% of the cap."""
+        bridge = AuditEventBridge(max_events_per_invocation=3, max_invocations=10, ttl_seconds=0)
+        for i in range(11):
+            for _ in range(3):
+                bridge.record_tool_invocation(ToolInvocationEvent(tool="t", invocation_id=f"inv-{i}"))
+
+        stats = bridge.stats()
+        assert stats["invocations"] == 9
+        assert stats["events"] == 27
+        assert stats["evicted_cap"] == 2
+        assert bridge.get_audit_trail("inv-0") == []
+        assert bridge.get_audit_trail("inv-1") == []
+        assert len(bridge.get_audit_trail("inv-10")) == 3
+
+    def test_invocation_cap_evicts_in_batches(self):
+        """Eviction runs once per batch of new invocations, not on every one."""
+        bridge = AuditEventBridge(max_invocations=100, ttl_seconds=0)
+        scans = []
+        evict = bridge._evict_to_cap
+        bridge._evict_to_cap = lambda keep: (scans.append(keep), evict(keep))
+        for i in range(300):
+            bridge.record_tool_invocation(ToolInvocationEvent(tool="t", invocation_id=f"inv-{i}"))
+
+        assert bridge.get_invocation_count() <= 100
+        assert len(scans) <= 20
+
+    def test_event_kept_when_buffer_evicted_during_record(self):
+        """An event recorded while its buffer is evicted lands in a fresh buffer."""
+
+        class EvictedAfterLookup(dict):
+            """Drops the buffer right after _record looks it up, as a sweep would."""
+
+            lookups = 0
+
+            def get(self, key, default=None):
+                buffer = super().get(key, default)
+                EvictedAfterLookup.lookups += 1
+                if EvictedAfterLookup.lookups == 1:
+                    self.pop(key, None)
+                return buffer
+
+        bridge = AuditEventBridge(ttl_seconds=0)
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="first", invocation_id="inv"))
+        stripe = bridge._stripe("inv")
+        stripe.buffers = EvictedAfterLookup(stripe.buffers)
+
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="second", invocation_id="inv"))
+
+        assert [e["tool"] for e in bridge.get_audit_trail("inv")] == ["second"]
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="third", invocation_id="inv"))
+        assert [e["tool"] for e in bridge.get_audit_trail("inv")] == ["second", "third"]
+
+    def test_event_count_tracks_ring_buffer_overflow(self):
+        """Events dropped by a full ring buffer are not counted twice."""
+        bridge = AuditEventBridge(max_events_per_invocation=5, ttl_seconds=0)
+        for _ in range(12):
+            bridge.record_tool_invocation(ToolInvocationEvent(tool="t", invocation_id="inv"))
+
+        assert bridge.stats()["events"] == 5
+        bridge.clear_invocation("inv")
+        assert bridge.stats()["events"] == 0
+
+
+class TestSubscriptions:
+    """Test suite for push subscriptions and SSE interleaving."""
+
+    async def test_delivers_events_for_invocation(self):
+        """Events recorded after subscribing arrive in order; other invocations don't."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+        with bridge.subscribe("session-1") as subscription:
+            bridge.record_tool_invocation(ToolInvocationEvent(tool="assess", invocation_id="session-1"))
+            bridge.record_tool_invocation(ToolInvocationEvent(tool="other", invocation_id="session-2"))
+            bridge.record_tool_response(ToolResponseEvent(tool="assess", invocation_id="session-1"))
+
+            first = await asyncio.wait_for(subscription.get(), 1)
+            second = await asyncio.wait_for(subscription.get(), 1)
+            assert [first.event_type, second.event_type] == ["tool_invocation", "tool_response"]
+            assert subscription.drain() == []
+
+    async def test_close_unsubscribes(self):
+        """Closed subscriptions stop receiving and are removed from the bridge."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+        subscription = bridge.subscribe("session-1")
+        assert bridge.stats()["subscriptions"] == 1
+
+        subscription.close()
+        bridge.record_tool_invocation(ToolInvocationEvent(tool="t", invocation_id="session-1"))
+        assert bridge.stats()["subscriptions"] == 0
+        assert subscription.drain() == []
+
+    async def test_slow_consumer_drops_oldest(self):
+        """A full queue drops its oldest events and counts them."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+        with bridge.subscribe("session-1", max_queue=3) as subscription:
+            for i in range(5):
+                bridge.record_tool_invocation(ToolInvocationEvent(tool=f"t{i}", invocation_id="session-1"))
+
+            assert subscription.dropped == 2
+            assert [e.tool for e in subscription.drain()] == ["t2", "t3", "t4"]
+        # The bridge's own ring buffer is unaffected
+        assert len(bridge.get_audit_trail("session-1")) == 5
+
+    async def test_delivers_from_other_threads(self):
+        """Events recorded on a worker thread are handed to the subscriber's loop."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+        with bridge.subscribe("session-1") as subscription:
+            await asyncio.to_thread(
+                bridge.record_tool_invocation, ToolInvocationEvent(tool="threaded", invocation_id="session-1")
+            )
+            event = await asyncio.wait_for(subscription.get(), 1)
+            assert event.tool == "threaded"
+
+    async def test_interleaves_events_as_recorded(self):
+        """Audit frames appear between ADK chunks when recorded, not after the stream."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+
+        async def adk_stream():
+            yield 'data: {"author": "coordinator"}\n\n'
+            # Tool callback fires while the agent is still running
+            bridge.record_tool_response(ToolResponseEvent(tool="assess", confidence=0.9, invocation_id="session-1"))
+            await asyncio.sleep(0.05)
+            yield 'data: {"author": "burn_analyst"}\n\n'
+            bridge.record_tool_invocation(ToolInvocationEvent(tool="late", invocation_id="session-1"))
+
+        with bridge.subscribe("session-1") as subscription:
+            frames = [f async for f in interleave_audit_events(adk_stream(), subscription)]
+
+        payloads = [json.loads(f[len("data: "):]) for f in frames]
+        assert [p.get("type") or p["author"] for p in payloads] == ["coordinator", "audit", "burn_analyst", "audit"]
+        assert payloads[1]["audit"]["confidence"] == 0.9
+        assert payloads[3]["audit"]["tool"] == "late"
+
+    async def test_interleave_reports_gaps(self):
+        """Dropped events surface as an audit_gap frame."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+
+        async def adk_stream():
+            for i in range(6):
+                bridge.record_tool_invocation(ToolInvocationEvent(tool=f"t{i}", invocation_id="session-1"))
+            yield 'data: {"author": "coordinator"}\n\n'
+
+        with bridge.subscribe("session-1", max_queue=2) as subscription:
+            frames = [json.loads(f[len("data: "):]) async for f in interleave_audit_events(adk_stream(), subscription)]
+
+        gaps = [f for f in frames if f.get("type") == "audit_gap"]
+        audits = [f["audit"]["tool"] for f in frames if f.get("type") == "audit"]
+        assert sum(g["dropped"] for g in gaps) == 4
+        assert audits == ["t4", "t5"]
+
+    async def test_interleave_propagates_stream_errors(self):
+        """A failing chunk stream raises after the chunks it produced."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+
+        async def adk_stream():
+            yield "data: {}\n\n"
+            raise RuntimeError("runner failed")
+
+        frames = []
+        with bridge.subscribe("session-1") as subscription:
+            with pytest.raises(RuntimeError, match="runner failed"):
+                async for frame in interleave_audit_events(adk_stream(), subscription):
+                    frames.append(frame)
+        assert frames == ["data: {}\n\n"]
+
+
+class TestAuditCorrelation:
+    """Test suite for context-variable correlation IDs."""
+
+    def test_sets_and_restores(self):
+        """audit_correlation nests and restores the previous ID."""
+        assert get_correlation_id() is None
+        with audit_correlation("outer"):
+            with audit_correlation("inner"):
+                assert get_correlation_id() == "inner"
+            assert get_correlation_id() == "outer"
+        assert get_correlation_id() is None
+
+    async def test_isolated_between_tasks(self):
+        """Concurrent tasks each see their own ID, inherited by tasks they spawn."""
+        async def run(correlation_id):
+            with audit_correlation(correlation_id):
+                await asyncio.sleep(0.01)
+                return await asyncio.create_task(asyncio.sleep(0, result=get_correlation_id()))
+
+        assert await asyncio.gather(*(run(f"c-{i}") for i in range(10))) == [f"c-{i}" for i in range(10)]
+
+    async def test_interleave_runs_stream_under_subscription_id(self):
+        """The stream producer correlates to the subscribed bucket."""
+        bridge = AuditEventBridge(ttl_seconds=0)
+        seen = []
+
+        async def adk_stream():
+            seen.append(get_correlation_id())
+            yield "data: {}\n\n"
+
+        with bridge.subscribe("session-1") as subscription:
+            [f async for f in interleave_audit_events(adk_stream(), subscription)]
+        assert seen == ["session-1"]
+        assert get_correlation_id() is None
+
+
 class TestSingletonPattern:
     """Test suite for get_audit_bridge singleton pattern."""
 
@@ -0,0 +1,258 @@
+"""
+Unit tests for JsonlAuditSink - durable, segmented audit log.
+
+Test Coverage:
+    1. Round trip by session_id and invocation_id
+    2. Response/error events inherit the invocation's session_id
+    3. Size-based rotation and per-segment sidecar indexes
+    4. Indexed reads open only the segments that contain the ID
+    5. Missing indexes rebuilt by scan; restarts start a new segment
+    6. AuditEventBridge forwards recorded events to its sink
+    7. I/O errors are counted without stopping the writer; a full queue drops
+"""
+
+import errno
+import json
+import os
+import threading
+
+import pytest
+
+from agents._shared.audit_bridge import AuditEventBridge, ToolInvocationEvent, ToolResponseEvent
+from agents._shared.audit_sink import _CLOSE, JsonlAuditSink
+
+
+@pytest.fixture
+def sink(tmp_path):
+    """Sink that rotates every few KB and fsyncs every batch."""
+    sink = JsonlAuditSink(tmp_path, segment_max_bytes=4096, fsync_interval_seconds=0)
+    yield sink
+    sink.close()
+
+
+def invocation(session_id: str, n: int) -> dict:
+    return {"event_type": "tool_invocation", "session_id": session_id, "n": n}
+
+
+def response(n: int) -> dict:
+    return {"event_type": "tool_response", "n": n}
+
+
+class TestRoundTrip:
+    """Events written are read back in order."""
+
+    def test_read_by_session(self, sink):
+        """read_trail(session_id=...) returns that session's events, oldest first."""
+        for n in range(10):
+            sink.write(f"inv-{n % 2}", invocation(f"session-{n % 2}", n))
+        trail = sink.read_trail(session_id="session-1")
+        assert [e["n"] for e in trail] == [1, 3, 5, 7, 9]
+
+    def test_read_by_invocation(self, sink):
+        """read_trail(invocation_id=...) uses the invocation the event was recorded under."""
+        sink.write("inv-1", invocation("session-1", 0))
+        sink.write("inv-1", response(1))
+        sink.write("inv-2", response(2))
+        assert [e["n"] for e in sink.read_trail(invocation_id="inv-1")] == [0, 1]
+
+    def test_responses_inherit_session_id(self, sink):
+        """Response events, which carry no session_id, are indexed under the invocation's session."""
+        sink.write("inv-1", invocation("session-1", 0))
+        sink.write("inv-1", response(1))
+        trail = sink.read_trail(session_id="session-1")
+        assert [e["event_type"] for e in trail] == ["tool_invocation", "tool_response"]
+        assert trail[1]["session_id"] == "session-1"
+
+    def test_requires_exactly_one_id(self, sink):
+        """Passing neither or both IDs is an error."""
+        with pytest.raises(ValueError):
+            sink.read_trail()
+        with pytest.raises(ValueError):
+            sink.read_trail(session_id="s", invocation_id="i")
+
+    def test_write_after_close_is_ignored(self, sink):
+        """Late events after shutdown are dropped rather than raising."""
+        sink.close()
+        sink.write("inv-1", invocation("session-1", 0))
+        assert sink.stats()["events_written"] == 0
+
+
+class TestSegments:
+    """Rotation and per-segment indexes."""
+
+    def test_rotates_by_size_with_sidecar_index(self, sink, tmp_path):
+        """Segments stay near segment_max_bytes, each with an index once closed."""
+        for n in range(500):
+            sink.write(f"inv-{n}", invocation(f"session-{n % 5}", n))
+        sink.close()
+
+        segments = sorted(tmp_path.glob("audit-*.jsonl"))
+        assert len(segments) > 3
+        assert sink.stats()["rotations"] == len(segments) - 1
+        for segment in segments:
+            assert segment.stat().st_size < 4096 + 512
+            assert segment.with_suffix(".idx.json").exists()
+
+    def test_reads_only_matching_segments(self, sink):
+        """A session confined to one segment costs one segment read."""
+        sink.write("inv-early", invocation("session-early", 0))
+        for n in range(500):
+            sink.write(f"inv-{n}", invocation("session-bulk", n))
+        sink.write("inv-late", invocation("session-late", 1))
+
+        assert len(sink.read_trail(session_id="session-early")) == 1
+        assert sink.segments_read == 1
+        assert len(sink.read_trail(session_id="session-late")) == 1
+        assert sink.segments_read == 2
+
+    def test_rebuilds_missing_index(self, tmp_path):
+        """A segment without an index (e.g. after a crash) is indexed on first read."""
+        first = JsonlAuditSink(tmp_path, fsync_interval_seconds=0)
+        first.write("inv-1", invocation("session-1", 0))
+        first.close()
+        index = tmp_path / "audit-000001.idx.json"
+        index.unlink()
+
+        second = JsonlAuditSink(tmp_path, fsync_interval_seconds=0)
+        try:
+            assert [e["n"] for e in second.read_trail(session_id="session-1")] == [0]
+            assert json.loads(index.read_text())["session_id"] == {"session-1": [0]}
+        finally:
+            second.close()
+
+    def test_restart_starts_new_segment(self, tmp_path):
+        """Segments are never reopened; trails span restarts."""
+        first = JsonlAuditSink(tmp_path, fsync_interval_seconds=0)
+        first.write("inv-1", invocation("session-1", 0))
+        first.close()
+
+        second = JsonlAuditSink(tmp_path, fsync_interval_seconds=0)
+        try:
+            second.write("inv-2", invocation("session-1", 1))
+            assert [e["n"] for e in second.read_trail(session_id="session-1")] == [0, 1]
+            assert second.stats()["segment"] == "audit-000002.jsonl"
+        finally:
+            second.close()
+
+
+class FailingFile:
+    """Segment file whose next write fails, as on a full or broken disk."""
+
+    def __init__(self, file):
+        self._file = file
+
+    def write(self, data):
+        self._file.write(data[: len(data) // 2])
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+class TestWriterFailures:
+    """I/O errors and overload."""
+
+    def test_fsync_error_keeps_writer_alive(self, sink, monkeypatch):
+        """A failed fsync is counted and reported by flush(); later events are still written."""
+        real_fsync = os.fsync
+        calls = []
+
+        def flaky_fsync(fd):
+            calls.append(fd)
+            if len(calls) == 1:
+                raise OSError(errno.EIO, "Input/output error")
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", flaky_fsync)
+        sink.write("inv-1", invocation("session-1", 0))
+        assert sink.flush(timeout=5) is False
+        assert sink.stats()["write_errors"] == 1
+
+        sink.write("inv-1", invocation("session-1", 1))
+        assert sink.flush(timeout=5) is True
+        assert sink.stats()["writer_alive"]
+        assert [e["n"] for e in sink.read_trail(session_id="session-1")] == [0, 1]
+
+    def test_flush_false_when_writer_dead(self, tmp_path):
+        """flush() does not claim durability once the writer thread is gone."""
+        sink = JsonlAuditSink(tmp_path, fsync_interval_seconds=0)
+        sink._queue.put(_CLOSE)  # Writer exits without the sink being closed
+        sink._writer.join(timeout=5)
+        try:
+            sink.write("inv-1", invocation("session-1", 0))
+            assert sink.flush(timeout=5) is False
+            assert not sink.stats()["writer_alive"]
+        finally:
+            sink.close()
+
+    def test_failed_append_not_indexed(self, sink):
+        """Events from a failed write are not indexed; the next batch starts a new segment."""
+        sink.write("inv-1", invocation("session-1", 0))
+        assert sink.flush(timeout=5)
+        sink._file = FailingFile(sink._file)
+
+        sink.write("inv-1", invocation("session-1", 1))
+        assert sink.flush(timeout=5) is False
+        sink.write("inv-1", invocation("session-1", 2))
+        assert sink.flush(timeout=5) is True
+
+        assert [e["n"] for e in sink.read_trail(session_id="session-1")] == [0, 2]
+        assert sink.stats()["write_errors"] == 1
+
+    def test_full_queue_drops_and_counts(self, tmp_path, monkeypatch):
+        """Events beyond max_queued are dropped and counted instead of queued."""
+        sink = JsonlAuditSink(tmp_path, fsync_interval_seconds=0, max_queued=2)
+        started, release = threading.Event(), threading.Event()
+        write_batch = sink._write_batch
+
+        def slow_write_batch(batch):
+            started.set()
+            release.wait(5)
+            write_batch(batch)
+
+        monkeypatch.setattr(sink, "_write_batch", slow_write_batch)
+        try:
+            sink.write("inv-1", invocation("session-1", 0))
+            assert started.wait(5)
+            for n in range(1, 6):
+                sink.write("inv-1", invocation("session-1", n))
+            assert sink.stats()["events_dropped"] == 3
+
+            release.set()
+            assert sink.flush(timeout=5) is True
+            assert [e["n"] for e in sink.read_trail(session_id="session-1")] == [0, 1, 2]
+        finally:
+            release.set()
+            sink.close()
+
+
+class TestBridgeIntegration:
+    """AuditEventBridge with a sink configured."""
+
+    def test_bridge_forwards_events(self, tmp_path):
+        """Every recorded event reaches the sink, beyond the in-memory ring buffer."""
+        sink = JsonlAuditSink(tmp_path, fsync_interval_seconds=0)
+        bridge = AuditEventBridge(max_events_per_invocation=2, sink=sink)
+        try:
+            for n in range(5):
+                bridge.record_tool_invocation(ToolInvocationEvent(
+                    agent="burn_analyst",
+                    tool="assess_severity",
+                    parameters={"n": n},
+                    invocation_id="inv-1",
+                    session_id="session-1",
+                ))
+            bridge.record_tool_response(ToolResponseEvent(
+                agent="burn_analyst",
+                tool="assess_severity",
+                status="success",
+                confidence=0.9,
+                invocation_id="inv-1",
+            ))
+            assert len(bridge.get_audit_trail("inv-1")) == 2
+            trail = sink.read_trail(session_id="session-1")
+            assert [e["event_type"] for e in trail] == ["tool_invocation"] * 5 + ["tool_response"]
+            assert [e["parameters"]["n"] for e in trail[:5]] == list(range(5))
+        finally:
+            bridge.close()
+            sink.close()
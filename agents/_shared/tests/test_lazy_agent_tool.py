@@ -0,0 +1,96 @@
+"""
+Unit tests for LazyAgentTool - deferred specialist loading.
+
+Test Coverage:
+    1. Declaration parity with a real AgentTool before the agent is imported
+    2. First-use resolution and load-time tracking
+    3. Name mismatch detection
+    4. Preloading helper
+"""
+
+import sys
+import types as pytypes
+
+import pytest
+
+from google.adk.agents import Agent
+from google.adk.tools import AgentTool
+
+from agents._shared.lazy_agent_tool import (
+    LazyAgentTool,
+    get_load_times,
+    preload_lazy_tools,
+)
+
+
+@pytest.fixture
+def fake_agent_module():
+    """Register an in-memory module exposing a root_agent."""
+    module = pytypes.ModuleType("lazy_test_specialist")
+    module.root_agent = Agent(
+        name="lazy_specialist",
+        model="gemini-2.0-flash",
+        description="Specialist used by lazy tool tests.",
+    )
+    sys.modules[module.__name__] = module
+    yield module
+    sys.modules.pop(module.__name__, None)
+
+
+def make_tool(**overrides) -> LazyAgentTool:
+    kwargs = {
+        "name": "lazy_specialist",
+        "module": "lazy_test_specialist",
+        "description": "Specialist used by lazy tool tests.",
+    }
+    kwargs.update(overrides)
+    return LazyAgentTool(**kwargs)
+
+
+class TestLazyAgentTool:
+    """Test suite for LazyAgentTool."""
+
+    def test_not_loaded_on_construction(self):
+        """Constructing the stub does not import the module."""
+        tool = make_tool(module="module_that_does_not_exist")
+
+        assert tool.is_loaded is False
+        assert tool.name == "lazy_specialist"
+
+    def test_declaration_matches_agent_tool(self, fake_agent_module):
+        """Unloaded stub advertises the same declaration as a real AgentTool."""
+        tool = make_tool()
+        expected = AgentTool(agent=fake_agent_module.root_agent)._get_declaration()
+
+        assert tool._get_declaration() == expected
+        assert tool.is_loaded is False
+
+    def test_resolve_loads_agent_once(self, fake_agent_module):
+        """resolve() imports the module and caches the delegate."""
+        tool = make_tool()
+
+        delegate = tool.resolve()
+
+        assert tool.is_loaded is True
+        assert tool.agent is fake_agent_module.root_agent
+        assert tool.resolve() is delegate
+        assert "lazy_test_specialist" in get_load_times()
+
+    def test_name_mismatch_raises(self, fake_agent_module):
+        """A stub pointing at the wrong agent fails loudly."""
+        tool = make_tool(name="other_specialist")
+
+        with pytest.raises(ValueError, match="resolved to agent 'lazy_specialist'"):
+            tool.resolve()
+
+    def test_preload_resolves_only_lazy_tools(self, fake_agent_module):
+        """preload_lazy_tools skips regular tools and resolves stubs."""
+        tool = make_tool()
+
+        def plain_tool() -> dict:
+            return {}
+
+        resolved = preload_lazy_tools([tool, plain_tool])
+
+        assert resolved == ["lazy_specialist"]
+        assert tool.is_loaded is True
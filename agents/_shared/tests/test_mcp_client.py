@@ -0,0 +1,236 @@
+"""
+Unit tests for MCP client utilities - pooled toolset sessions.
+
+Test Coverage:
+    1. Endpoint and connection key derivation
+    2. McpSessionPool sharing, balancing and release
+    3. Toolset factories borrowing from the shared pool
+    4. Projected default arguments for list tools
+    5. Recording to and replaying from MCP cassettes
+"""
+
+import types as pytypes
+
+import pytest
+
+from google.adk.tools.mcp_tool.mcp_session_manager import (
+    StdioConnectionParams,
+    StreamableHTTPConnectionParams,
+)
+from mcp.client.stdio import StdioServerParameters
+
+from skill_runtime.cassette import Cassette
+
+from agents._shared import mcp_client
+from agents._shared.mcp_client import (
+    McpCassetteSession,
+    McpSessionPool,
+    connection_key,
+    mcp_endpoint,
+    projected_arguments,
+)
+
+
+def stdio(script: str = "server.py") -> StdioConnectionParams:
+    return StdioConnectionParams(
+        server_params=StdioServerParameters(command="python", args=[script]),
+        timeout=30.0,
+    )
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch):
+    """Isolate the process-wide pool used by the toolset factories (no cassette)."""
+    pool = McpSessionPool(size=2)
+    monkeypatch.setattr(mcp_client, "_session_pool", pool)
+    monkeypatch.setattr(mcp_client, "_cassette_session", None)
+    monkeypatch.setattr(mcp_client, "_cassette_configured", True)
+    return pool
+
+
+def tool_schema(name: str) -> dict:
+    return {"name": name, "inputSchema": {"type": "object", "properties": {"fire_id": {"type": "string"}}}}
+
+
+class TestConnectionKey:
+    """Tests for endpoint normalization and server identity."""
+
+    def test_bare_url_gets_mcp_path(self):
+        assert mcp_endpoint("https://fixtures.run.app/") == "https://fixtures.run.app/mcp"
+
+    def test_explicit_path_kept(self):
+        assert mcp_endpoint("http://localhost:8080/sse") == "http://localhost:8080/sse"
+
+    def test_same_server_same_key(self):
+        assert connection_key(stdio()) == connection_key(stdio())
+        assert connection_key(stdio()) != connection_key(stdio("other.py"))
+
+    def test_http_key_uses_url(self):
+        params = StreamableHTTPConnectionParams(url="http://localhost:8080/mcp")
+        assert connection_key(params) == ("http", "http://localhost:8080/mcp")
+
+
+class TestMcpSessionPool:
+    """Tests for manager sharing and release."""
+
+    def test_managers_capped_per_server(self):
+        pool = McpSessionPool(size=2)
+        managers = [pool.acquire(stdio()) for _ in range(4)]
+
+        assert len({id(m) for m in managers}) == 2
+        assert pool.created == 2
+        assert sorted(pool.stats()["servers"]["python server.py"]) == [2, 2]
+
+    def test_servers_pooled_separately(self):
+        pool = McpSessionPool(size=1)
+        assert pool.acquire(stdio()) is not pool.acquire(stdio("other.py"))
+
+    @pytest.mark.asyncio
+    async def test_last_release_closes_manager(self):
+        pool = McpSessionPool(size=1)
+        first = pool.acquire(stdio())
+        second = pool.acquire(stdio())
+        assert first is second
+
+        await pool.release(first)
+        assert pool.stats()["servers"]["python server.py"] == [1]
+
+        await pool.release(second)
+        assert pool.stats()["servers"] == {}
+        # A new borrower gets a new manager
+        assert pool.acquire(stdio()) is not first
+
+    @pytest.mark.asyncio
+    async def test_release_unknown_manager_is_noop(self):
+        pool = McpSessionPool(size=1)
+        pool.acquire(stdio())
+        await pool.release(object())
+        assert pool.stats()["servers"]["python server.py"] == [1]
+
+
+class TestPooledToolsets:
+    """Tests for the toolset factories."""
+
+    def test_agent_toolsets_share_sessions(self, fresh_pool, monkeypatch):
+        monkeypatch.setattr(mcp_client, "MCP_FIXTURES_URL", None)
+        toolsets = [
+            mcp_client.get_burn_analyst_toolset(),
+            mcp_client.get_trail_assessor_toolset(),
+            mcp_client.get_cruising_assistant_toolset(),
+            mcp_client.get_coordinator_toolset(),
+        ]
+
+        assert len({id(t._mcp_session_manager) for t in toolsets}) == 2
+        assert fresh_pool.created == 2
+
+    def test_http_toolset_targets_mcp_endpoint(self, fresh_pool, monkeypatch):
+        monkeypatch.setattr(mcp_client, "MCP_FIXTURES_URL", "https://fixtures.run.app")
+        toolset = mcp_client.get_coordinator_toolset()
+
+        assert toolset.connection_params.url == "https://fixtures.run.app/mcp"
+
+    @pytest.mark.asyncio
+    async def test_close_returns_manager_to_pool(self, fresh_pool, monkeypatch):
+        monkeypatch.setattr(mcp_client, "MCP_FIXTURES_URL", None)
+        toolset = mcp_client.get_trail_assessor_toolset()
+
+        await toolset.close()
+        assert fresh_pool.stats()["servers"] == {}
+
+
+class TestProjectedArguments:
+    """Tests for the projection defaults sent by agent toolsets."""
+
+    def test_list_tool_gets_defaults(self):
+        args = projected_arguments("get_timber_plots", {"fire_id": "cedar-creek"})
+        assert args["fire_id"] == "cedar-creek"
+        assert "trees" not in args["fields"]
+        assert args["limit"] == 25
+
+    def test_model_arguments_win(self):
+        args = projected_arguments("assess_trails", {"fire_id": "cc", "fields": ["*"], "limit": 2})
+        assert args["fields"] == ["*"]
+        assert args["limit"] == 2
+
+    def test_single_item_request_not_projected(self):
+        args = {"fire_id": "cc", "trail_id": "waldo-lake-3536"}
+        assert projected_arguments("assess_trails", args) == args
+
+    def test_other_tools_untouched(self):
+        args = {"fire_id": "cc"}
+        assert projected_arguments("get_fire_context", args) == args
+
+    @pytest.mark.asyncio
+    async def test_tool_run_async_sends_projection(self):
+        sent = []
+
+        async def run_async(*, args, tool_context):
+            sent.append(args)
+            return {}
+
+        tool = pytypes.SimpleNamespace(
+            raw_mcp_tool=pytypes.SimpleNamespace(name="mtbs_classify"),
+            run_async=run_async,
+        )
+        mcp_client._request_projection(tool)
+        await tool.run_async(args={"fire_id": "cc"}, tool_context=None)
+
+        assert sent[0]["fields"] == mcp_client.PROJECTED_TOOL_ARGUMENTS["mtbs_classify"]["fields"]
+
+
+class TestCassettes:
+    """Tests for recording and replaying toolset calls."""
+
+    @pytest.fixture
+    def recorded(self, tmp_path):
+        """Cassette with three tool schemas and one projected mtbs_classify call."""
+        cassette = Cassette()
+        cassette.add_tools("mcp-fixtures", [
+            tool_schema(name) for name in ("get_fire_context", "mtbs_classify", "assess_trails")
+        ])
+        args = projected_arguments("mtbs_classify", {"fire_id": "cc"})
+        cassette.add("mcp-fixtures", "mtbs_classify", args, 0.004, result={"content": [{"text": "{}"}]})
+        path = tmp_path / "agents.jsonl.gz"
+        cassette.save(path)
+        return path
+
+    @pytest.mark.asyncio
+    async def test_replay_toolset_never_connects(self, fresh_pool, monkeypatch, recorded):
+        monkeypatch.setattr(mcp_client, "_cassette_session", McpCassetteSession(recorded, speed=0))
+        toolset = mcp_client.get_burn_analyst_toolset()
+
+        tools = await toolset.get_tools()
+        assert [tool.name for tool in tools] == ["get_fire_context", "mtbs_classify"]
+        result = await tools[1].run_async(args={"fire_id": "cc"}, tool_context=None)
+        assert result == {"content": [{"text": "{}"}]}
+        with pytest.raises(KeyError, match="No recorded call to mcp-fixtures/get_fire_context"):
+            await tools[0].run_async(args={"fire_id": "cc"}, tool_context=None)
+
+        await toolset.close()
+        assert fresh_pool.created == 0
+
+    @pytest.mark.asyncio
+    async def test_record_captures_sent_arguments(self, tmp_path):
+        async def run_async(*, args, tool_context):
+            return {"content": [{"text": args["fire_id"]}]}
+
+        tool = pytypes.SimpleNamespace(
+            raw_mcp_tool=pytypes.SimpleNamespace(name="mtbs_classify"),
+            run_async=run_async,
+        )
+        session = McpCassetteSession(tmp_path / "run.jsonl", mode="record")
+        mcp_client._use_cassette(tool, session)
+        mcp_client._request_projection(tool)
+
+        await tool.run_async(args={"fire_id": "cc"}, tool_context=None)
+        session.save()
+
+        [interaction] = Cassette.load(tmp_path / "run.jsonl").interactions
+        assert interaction["args"]["fields"] == mcp_client.PROJECTED_TOOL_ARGUMENTS["mtbs_classify"]["fields"]
+        assert interaction["result"] == {"content": [{"text": "cc"}]}
+
+    def test_invalid_session(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown cassette mode"):
+            McpCassetteSession(tmp_path / "run.jsonl", mode="rewind")
+        with pytest.raises(FileNotFoundError):
+            McpCassetteSession(tmp_path / "missing.jsonl")
@@ -0,0 +1,66 @@
+"""
+Tests for run_skill (agents._shared.skill_runner).
+
+Verifies agent skill calls run off the event loop: io skills on the
+executor's threads, cpu skills in its worker processes, with the same
+results as calling the script directly.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from agents._shared import skill_runner
+from agents._shared.skill_runner import run_skill
+
+TRIAGE_SKILL = Path(__file__).parents[2] / "coordinator" / "skills" / "portfolio-triage"
+
+FIRES = [
+    {"id": "cedar-creek", "name": "Cedar Creek Fire", "severity": "high", "acres": 127831, "phase": "baer_assessment"},
+    {"id": "bootleg", "name": "Bootleg Fire", "severity": "critical", "acres": 413765, "phase": "active"},
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def shutdown_executor():
+    yield
+    skill_runner.shutdown_agent_skill_executor()
+
+
+class TestRunSkill:
+    """Test dispatch of agent skill calls."""
+
+    async def test_io_skill_runs_on_thread(self, tmp_path):
+        """io skills run on a skill-io thread of this process."""
+        (tmp_path / "scripts").mkdir()
+        (tmp_path / "scripts" / "where.py").write_text(
+            "import os, threading\n"
+            "def execute(inputs):\n"
+            "    return {'pid': os.getpid(), 'thread': threading.current_thread().name, **inputs}\n"
+        )
+
+        result = await run_skill(tmp_path, "where", {"fire_id": "cedar-creek"})
+
+        assert result["pid"] == os.getpid()
+        assert result["thread"].startswith("skill-io")
+        assert result["fire_id"] == "cedar-creek"
+
+    async def test_cpu_skill_matches_direct_call(self):
+        """portfolio-triage (cpu) runs in a worker process with the same result."""
+        sys.path.insert(0, str(TRIAGE_SKILL / "scripts"))
+        try:
+            from calculate_priority import execute
+        finally:
+            sys.path.remove(str(TRIAGE_SKILL / "scripts"))
+
+        inputs = {"fires": FIRES, "top_n": 1}
+        assert skill_runner.get_agent_skill_executor().declared(TRIAGE_SKILL)[0] == "cpu"
+        assert await run_skill(TRIAGE_SKILL, "calculate_priority", inputs) == execute(inputs)
+
+    def test_executor_shared(self):
+        """Agent tools share one executor until it is shut down."""
+        executor = skill_runner.get_agent_skill_executor()
+        assert skill_runner.get_agent_skill_executor() is executor
+        assert executor.cpu_workers == skill_runner.SKILL_CPU_WORKERS
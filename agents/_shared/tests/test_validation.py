@@ -0,0 +1,188 @@
+"""
+Unit tests for ToolInvocationValidator - Tier 3 enforcement (ADR-007.1).
+
+Runs a real ADK LlmAgent through InMemoryRunner with a scripted model, so the
+audit callbacks and the validator's audit_correlation context are exercised
+end to end without a Gemini API key.
+
+Test Coverage:
+    1. Validation outcomes (PASSED, RETRY_SUCCEEDED, ESCALATED)
+    2. Per-call audit buckets (no shared "unknown" bucket)
+    3. 50 validated invocations in parallel under asyncio.gather
+    4. Pooled runners, sessions reused across retries, early abort
+"""
+
+import asyncio
+import random
+
+import pytest
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from agents._shared.audit_bridge import get_audit_bridge
+from agents._shared.callbacks import create_audit_callbacks
+from agents._shared import validation
+from agents._shared.validation import ToolInvocationValidator
+
+
+class ScriptedLlm(BaseLlm):
+    """
+    Model that calls assess_fire with the fire named in the query, then answers.
+
+    Queries containing "skip-once" answer without a tool call unless they
+    carry the validator's enforcement reminder; "never-call" never calls.
+    """
+
+    model: str = "scripted"
+    history_lengths: list[int] = []
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        self.history_lengths.append(len(llm_request.contents))
+        last = llm_request.contents[-1]
+        if any(part.function_response for part in last.parts):
+            result = last.parts[0].function_response.response
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=f"Assessed {result['fire_id']}")]))
+            return
+
+        query = last.parts[0].text
+        await asyncio.sleep(random.uniform(0, 0.005))  # interleave concurrent runs
+        skip = "never-call" in query or ("skip-once" in query and "ENFORCEMENT REMINDER" not in query)
+        if skip:
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="From memory")]))
+            return
+        call = types.FunctionCall(name="assess_fire", args={"fire_id": query.split()[0]})
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(function_call=call)]))
+
+
+async def assess_fire(fire_id: str) -> dict:
+    """Assess a fire by ID."""
+    await asyncio.sleep(random.uniform(0, 0.005))
+    return {"status": "success", "fire_id": fire_id, "confidence": 0.9, "data_sources": ["MTBS"]}
+
+
+def make_agent(completed_runs: list | None = None) -> LlmAgent:
+    """Scripted agent with the real audit callbacks; counts runs that finish."""
+    before, after, on_error = create_audit_callbacks("test_agent")
+    return LlmAgent(
+        name="test_agent",
+        model=ScriptedLlm(history_lengths=[]),
+        tools=[assess_fire],
+        before_tool_callback=before,
+        after_tool_callback=after,
+        on_tool_error_callback=on_error,
+        after_agent_callback=lambda callback_context: completed_runs.append(1) if completed_runs is not None else None,
+    )
+
+
+@pytest.fixture
+async def validator():
+    yield ToolInvocationValidator(make_agent(), max_retries=1)
+    await validation.close_runner_pool()
+
+
+class TestValidationOutcomes:
+    """Outcomes read from the call's own audit bucket."""
+
+    async def test_passes_when_tool_invoked(self, validator):
+        """A tool call on the first attempt passes, with its audit trail."""
+        result = await validator.invoke_with_enforcement("fire-1 severity?", required_tools=["assess_fire"])
+
+        assert result["validation_outcome"] == "PASSED"
+        assert result["response"] == "Assessed fire-1"
+        assert [e["event_type"] for e in result["audit_trail"]] == ["tool_invocation", "tool_response"]
+
+    async def test_retry_succeeds_after_skipped_tool(self, validator):
+        """The enforcement reminder leads to a tool call on the retry."""
+        result = await validator.invoke_with_enforcement("fire-2 skip-once", required_tools=["assess_fire"])
+
+        assert result["validation_outcome"] == "RETRY_SUCCEEDED"
+        assert result["attempts"] == 2
+
+    async def test_escalates_after_max_retries(self, validator):
+        """No tool call on any attempt escalates."""
+        result = await validator.invoke_with_enforcement("fire-3 never-call", required_tools=["assess_fire"])
+
+        assert result["validation_outcome"] == "ESCALATED"
+        assert result["tools_invoked"] == []
+
+    async def test_does_not_use_shared_bucket(self, validator):
+        """Events are not recorded under "unknown", and the call's bucket is cleared."""
+        bridge = get_audit_bridge()
+        bridge.clear_invocation("unknown")
+        before = bridge.get_invocation_count()
+
+        await validator.invoke_with_enforcement("fire-4", required_tools=["assess_fire"])
+
+        assert bridge.get_audit_trail("unknown") == []
+        assert bridge.get_invocation_count() == before
+
+
+class TestConcurrentValidation:
+    """Validations sharing one validator and bridge run in parallel."""
+
+    async def test_fifty_parallel_validations(self, validator):
+        """Each of 50 concurrent calls sees exactly its own tool events."""
+        queries = [f"fire-{i}" + (" skip-once" if i % 5 == 0 else "") for i in range(50)]
+
+        results = await asyncio.gather(*(
+            validator.invoke_with_enforcement(query, required_tools=["assess_fire"]) for query in queries
+        ))
+
+        for i, result in enumerate(results):
+            expected = "RETRY_SUCCEEDED" if i % 5 == 0 else "PASSED"
+            assert result["validation_outcome"] == expected
+            assert result["response"] == f"Assessed fire-{i}"
+            assert [e["event_type"] for e in result["audit_trail"]] == ["tool_invocation", "tool_response"]
+            assert result["audit_trail"][0]["parameters"] == {"fire_id": f"fire-{i}"}
+
+
+class TestRunnerReuse:
+    """Pooled runners, per-call sessions and early abort."""
+
+    async def test_runner_pooled_and_sessions_deleted(self, validator):
+        """Calls share one runner; each call's session is removed afterwards."""
+        await validator.invoke_with_enforcement("fire-1")
+        runner = validation._pooled_runner(validator.agent)
+        await ToolInvocationValidator(validator.agent).invoke_with_enforcement("fire-2")
+
+        assert validation._pooled_runner(validator.agent) is runner
+        sessions = await runner.session_service.list_sessions(
+            app_name=runner.app_name, user_id=validation.VALIDATION_USER_ID
+        )
+        assert sessions.sessions == []
+
+    async def test_retry_reuses_session(self, validator):
+        """The retry runs in the same session, so the model sees the skipped attempt."""
+        result = await validator.invoke_with_enforcement("fire-1 skip-once", required_tools=["assess_fire"])
+
+        assert result["validation_outcome"] == "RETRY_SUCCEEDED"
+        first_attempt, retry = validator.agent.model.history_lengths[:2]
+        assert first_attempt == 1
+        assert retry == 3  # query, skipped answer, query with reminder
+
+    @pytest.mark.parametrize("early_abort, completed", [(False, 2), (True, 1)])
+    async def test_early_abort_cancels_skipped_attempt(self, early_abort, completed):
+        """With early_abort the skipped attempt never runs to completion."""
+        completed_runs = []
+        validator = ToolInvocationValidator(make_agent(completed_runs), max_retries=1, early_abort=early_abort)
+        try:
+            result = await validator.invoke_with_enforcement("fire-1 skip-once", required_tools=["assess_fire"])
+        finally:
+            await validation.close_runner_pool()
+
+        assert result["validation_outcome"] == "RETRY_SUCCEEDED"
+        assert result["response"] == "Assessed fire-1"
+        assert len(completed_runs) == completed
+
+    async def test_early_abort_escalates_after_max_retries(self):
+        """Aborted attempts still count towards escalation."""
+        validator = ToolInvocationValidator(make_agent(), max_retries=2, early_abort=True)
+        try:
+            result = await validator.invoke_with_enforcement("fire-1 never-call", required_tools=["assess_fire"])
+        finally:
+            await validation.close_runner_pool()
+
+        assert result["validation_outcome"] == "ESCALATED"
+        assert result["attempts"] == 3
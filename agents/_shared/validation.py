@@ -12,14 +12,39 @@ Reference: docs/adr/ADR-007.1-tool-invocation-strategy.md § Tier 3
 
 import uuid
 import logging
+from contextlib import aclosing
 from typing import Any, Optional
 from datetime import datetime, timezone
 
-from agents._shared.audit_bridge import get_audit_bridge
+from agents._shared.audit_bridge import audit_correlation, get_audit_bridge
 
 
 logger = logging.getLogger("ranger.validation")
 
+VALIDATION_USER_ID = "validation_layer"
+
+# One InMemoryRunner per agent, shared by every validator of that agent.
+# Runners keep no per-request state, so concurrent sessions can share one;
+# the entry also pins the agent so its id() is never reused.
+_runner_pool: dict[int, tuple[Any, Any]] = {}
+
+
+def _pooled_runner(agent):
+    """The shared InMemoryRunner for `agent`, created on first use."""
+    entry = _runner_pool.get(id(agent))
+    if entry is None:
+        from google.adk.runners import InMemoryRunner
+        entry = _runner_pool[id(agent)] = (agent, InMemoryRunner(agent=agent))
+    return entry[1]
+
+
+async def close_runner_pool() -> None:
+    """Close and drop all pooled validation runners (e.g. at shutdown)."""
+    runners = [runner for _, runner in _runner_pool.values()]
+    _runner_pool.clear()
+    for runner in runners:
+        await runner.close()
+
 
 class ToolInvocationValidator:
     """
@@ -40,20 +65,35 @@ class ToolInvocationValidator:
         ... )
         >>> print(result["validation_outcome"])  # "PASSED" | "RETRY_SUCCEEDED" | "ESCALATED"
 
-    Thread Safety:
-        This class is not thread-safe. Create separate instances per request/session.
+    Concurrency:
+        Each invoke_with_enforcement() call records into its own audit bucket
+        (an audit_correlation ID), so calls may run concurrently, e.g. under
+        asyncio.gather, including on one shared instance.
+
+    Runners and Sessions:
+        All validators of an agent share one pooled InMemoryRunner. Each call
+        creates one session, reused by its retries (so a retry sees the
+        skipped attempt), and deletes it when done.
+
+    Early Abort:
+        With early_abort=True an attempt is cancelled as soon as the agent's
+        first model turn completes without a function call, and the retry
+        starts immediately instead of waiting for the run to wind down.
     """
 
-    def __init__(self, agent, max_retries: int = 2):
+    def __init__(self, agent, max_retries: int = 2, early_abort: bool = False):
         """
         Initialize the validator.
 
         Args:
             agent: The agent to wrap with validation enforcement
             max_retries: Maximum retry attempts if tool invocation is skipped (default: 2)
+            early_abort: Cancel an attempt whose first model turn calls no
+                tool, rather than running it to completion (default: False)
         """
         self.agent = agent
         self.max_retries = max_retries
+        self.early_abort = early_abort
         self.bridge = get_audit_bridge()
 
     async def invoke_with_enforcement(
@@ -96,10 +136,26 @@ class ToolInvocationValidator:
         # Generate a unique correlation_id for audit trail
         correlation_id = session_id or str(uuid.uuid4())
 
-        # Note: ADK InMemoryRunner does NOT propagate session_id to tool_context,
-        # so callbacks store events under "unknown". We clear before each attempt
-        # and query "unknown" after to get events from this invocation only.
-        audit_key = "unknown"
+        # ADK's tool_context doesn't carry session_id, so the callbacks key
+        # events by the audit correlation ID set around each attempt. The key
+        # is unique per call even when callers reuse a session_id, and also
+        # names the ADK session the attempts share on the pooled runner.
+        audit_key = f"validation-{correlation_id}-{uuid.uuid4().hex[:8]}"
+        runner = _pooled_runner(self.agent)
+        try:
+            return await self._run_attempts(runner, audit_key, query, required_tools)
+        finally:
+            await self._delete_session(runner, audit_key)
+
+    async def _run_attempts(
+        self,
+        runner,
+        audit_key: str,
+        query: str,
+        required_tools: Optional[list[str]],
+    ) -> dict[str, Any]:
+        """Attempt loop of invoke_with_enforcement (see there for the result)."""
+        session_ready = False
 
         for attempt in range(1, self.max_retries + 2):  # +1 for initial attempt
             # Clear stale events before each attempt
@@ -114,9 +170,17 @@ class ToolInvocationValidator:
                     f"This is attempt {attempt}/{self.max_retries + 1}.]"
                 )
 
-            # Invoke agent via InMemoryRunner
+            # Invoke agent via the pooled InMemoryRunner
             try:
-                response = await self._invoke_agent(effective_query, correlation_id)
+                if not session_ready:
+                    await runner.session_service.create_session(
+                        app_name=runner.app_name,
+                        user_id=VALIDATION_USER_ID,
+                        session_id=audit_key,
+                    )
+                    session_ready = True
+                with audit_correlation(audit_key):
+                    response, aborted = await self._invoke_agent(runner, audit_key, effective_query)
             except Exception as e:
                 logger.error(f"Agent invocation failed: {e}")
                 return {
@@ -130,7 +194,6 @@ class ToolInvocationValidator:
                 }
 
             # Validate tool invocation via audit_bridge
-            # ADK stores under "unknown" since it doesn't propagate session_id
             audit_trail = self.bridge.get_audit_trail(audit_key)
             tools_invoked = [
                 event["tool"]
@@ -164,7 +227,8 @@ class ToolInvocationValidator:
 
             # Log validation failure
             logger.warning(
-                f"Validation failed on attempt {attempt}/{self.max_retries + 1}. "
+                f"Validation failed on attempt {attempt}/{self.max_retries + 1}"
+                f"{' (aborted after first model turn)' if aborted else ''}. "
                 f"Required: {required_tools}, Invoked: {tools_invoked}"
             )
 
@@ -222,63 +286,65 @@ class ToolInvocationValidator:
             # Specific validation: all required tools must be invoked
             return all(tool in tools_invoked for tool in required_tools)
 
-    async def _invoke_agent(self, query: str, correlation_id: str) -> str:
+    async def _invoke_agent(self, runner, session_id: str, query: str) -> tuple[str, bool]:
         """
-        Invoke the wrapped agent using ADK InMemoryRunner.
+        Run one attempt of the wrapped agent on the pooled InMemoryRunner.
 
         Uses Google ADK's InMemoryRunner pattern for programmatic agent invocation.
-        The session_id (derived from correlation_id) is used by callbacks to key
-        audit events, enabling the validator to correlate events after completion.
+        Audit events are keyed by the caller's audit_correlation context, which
+        the runner's tasks (and so the tool callbacks) inherit.
 
         Args:
+            runner: The agent's pooled runner
+            session_id: Existing session shared by this call's attempts
             query: Query to send to agent
-            correlation_id: Correlation ID for audit trail (used in session_id)
 
         Returns:
-            Agent response text
+            Agent response text, and whether the attempt was aborted early
+            (early_abort and a first model turn without a function call)
 
         Reference:
             https://google.github.io/adk-docs/get-started/python/
         """
-        from google.adk.runners import InMemoryRunner
         from google.genai import types
 
-        # Create runner wrapping the agent
-        runner = InMemoryRunner(agent=self.agent)
-
-        # Create a session before running (required by InMemoryRunner)
-        # The session_id becomes tool_context.session_id in callbacks,
-        # which is used as the key for audit event storage/retrieval
-        user_id = "validation_layer"
-        session_id = f"validation-{correlation_id}"
-        await runner.session_service.create_session(
-            app_name=runner.app_name,
-            user_id=user_id,
-            session_id=session_id,
-        )
-
         # Collect response text from the event stream
         response_text = ""
+        first_turn = True
 
-        try:
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id,
-                new_message=types.Content(
-                    role="user",
-                    parts=[types.Part(text=query)]
-                ),
-            ):
+        # aclosing: an early abort closes the run in this task
+        async with aclosing(runner.run_async(
+            user_id=VALIDATION_USER_ID,
+            session_id=session_id,
+            new_message=types.Content(
+                role="user",
+                parts=[types.Part(text=query)]
+            ),
+        )) as events:
+            async for event in events:
                 # Extract text from content events
                 if hasattr(event, "content") and event.content:
                     for part in event.content.parts:
                         if hasattr(part, "text") and part.text:
                             response_text = part.text
-        finally:
-            # Clean up runner resources
-            await runner.close()
 
-        return response_text
+                    if self.early_abort and first_turn and not event.partial and event.author == self.agent.name:
+                        first_turn = False
+                        if not event.get_function_calls():
+                            return response_text, True
+
+        return response_text, False
+
+    async def _delete_session(self, runner, session_id: str) -> None:
+        """Drop a finished call's session from the pooled runner."""
+        try:
+            await runner.session_service.delete_session(
+                app_name=runner.app_name,
+                user_id=VALIDATION_USER_ID,
+                session_id=session_id,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to delete validation session {session_id}: {e}")
 
 
 class ValidatedAgentWrapper:
@@ -312,6 +378,7 @@ class ValidatedAgentWrapper:
         agent,
         required_tools: Optional[list[str]] = None,
         max_retries: int = 2,
+        early_abort: bool = False,
     ):
         """
         Initialize the validated agent wrapper.
@@ -321,8 +388,9 @@ class ValidatedAgentWrapper:
             required_tools: List of tool names that must be invoked, or None to
                 require any tool invocation
             max_retries: Maximum retry attempts if tool invocation is skipped (default: 2)
+            early_abort: Cancel attempts whose first model turn calls no tool
         """
-        self.validator = ToolInvocationValidator(agent, max_retries)
+        self.validator = ToolInvocationValidator(agent, max_retries, early_abort)
         self.required_tools = required_tools
 
     async def invoke(
@@ -351,6 +419,7 @@ def create_validated_agent(
     agent,
     required_tools: Optional[list[str]] = None,
     max_retries: int = 2,
+    early_abort: bool = False,
 ) -> ValidatedAgentWrapper:
     """
     Factory function for creating validated agent wrappers.
@@ -362,6 +431,7 @@ def create_validated_agent(
         required_tools: List of tool names that must be invoked, or None to
             require any tool invocation
         max_retries: Maximum retry attempts if tool invocation is skipped (default: 2)
+        early_abort: Cancel attempts whose first model turn calls no tool
 
     Returns:
         ValidatedAgentWrapper instance
@@ -376,11 +446,12 @@ def create_validated_agent(
         ... )
         >>> result = await validated.invoke("Assess trail damage for Cedar Creek")
     """
-    return ValidatedAgentWrapper(agent, required_tools, max_retries)
+    return ValidatedAgentWrapper(agent, required_tools, max_retries, early_abort)
 
 
 # Exported classes and functions
 __all__ = [
+    "close_runner_pool",
     "ToolInvocationValidator",
     "ValidatedAgentWrapper",
     "create_validated_agent",
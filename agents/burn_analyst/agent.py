@@ -20,33 +20,23 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-# Add skill scripts to path for dynamic loading
+# Skill directories; tools run their scripts off the event loop (run_skill)
 SKILLS_DIR = Path(__file__).parent / "skills"
+SEVERITY_SKILL = SKILLS_DIR / "soil-burn-severity"
+MTBS_SKILL = SKILLS_DIR / "mtbs-classification"
+BOUNDARY_SKILL = SKILLS_DIR / "boundary-mapping"
+
+from agents._shared.skill_runner import run_skill
 
 # Add agent directory to path for local imports (rag_query)
 if str(Path(__file__).parent) not in sys.path:
     sys.path.insert(0, str(Path(__file__).parent))
 
-# Soil Burn Severity skill
-SEVERITY_PATH = SKILLS_DIR / "soil-burn-severity" / "scripts"
-if SEVERITY_PATH.exists():
-    sys.path.insert(0, str(SEVERITY_PATH))
-
-# MTBS Classification skill
-MTBS_PATH = SKILLS_DIR / "mtbs-classification" / "scripts"
-if MTBS_PATH.exists():
-    sys.path.insert(0, str(MTBS_PATH))
-
-# Boundary Validation skill
-BOUNDARY_PATH = SKILLS_DIR / "boundary-validation" / "scripts"
-if BOUNDARY_PATH.exists():
-    sys.path.insert(0, str(BOUNDARY_PATH))
-
 # Import RAG/File Search tool
 from burn_rag_query import query_burn_severity_knowledge
 
 
-def assess_severity(fire_id: str, sectors_json: str = "[]", include_geometry: bool = False) -> dict:
+async def assess_severity(fire_id: str, sectors_json: str = "[]", include_geometry: bool = False) -> dict:
     """
     Assess soil burn severity for a fire incident.
 
@@ -75,16 +65,15 @@ def assess_severity(fire_id: str, sectors_json: str = "[]", include_geometry: bo
             - recommendations: BAER assessment recommendations
     """
     import json
-    from assess_severity import execute
     sectors = json.loads(sectors_json) if sectors_json and sectors_json != "[]" else None
-    return execute({
+    return await run_skill(SEVERITY_SKILL, "assess_severity", {
         "fire_id": fire_id,
         "sectors": sectors,
         "include_geometry": include_geometry,
     })
 
 
-def classify_mtbs(fire_id: str, sectors_json: str = "[]", include_class_map: bool = False) -> dict:
+async def classify_mtbs(fire_id: str, sectors_json: str = "[]", include_class_map: bool = False) -> dict:
     """
     Classify fire sectors using MTBS (Monitoring Trends in Burn Severity) protocol.
 
@@ -110,16 +99,15 @@ def classify_mtbs(fire_id: str, sectors_json: str = "[]", include_class_map: boo
             - reasoning_chain: Step-by-step classification decisions
     """
     import json
-    from classify_mtbs import execute
     sectors = json.loads(sectors_json) if sectors_json and sectors_json != "[]" else None
-    return execute({
+    return await run_skill(MTBS_SKILL, "classify_mtbs", {
         "fire_id": fire_id,
         "sectors": sectors,
         "include_class_map": include_class_map,
     })
 
 
-def validate_boundary(fire_id: str, sectors_json: str = "[]", tolerance: float = 5.0) -> dict:
+async def validate_boundary(fire_id: str, sectors_json: str = "[]", tolerance: float = 5.0) -> dict:
     """
     Validate fire perimeter geometry and calculate boundary statistics.
 
@@ -147,9 +135,8 @@ def validate_boundary(fire_id: str, sectors_json: str = "[]", tolerance: float =
             - reasoning_chain: Step-by-step validation decisions
     """
     import json
-    from validate_boundary import execute
     sectors = json.loads(sectors_json) if sectors_json and sectors_json != "[]" else None
-    return execute({
+    return await run_skill(BOUNDARY_SKILL, "validate_boundary", {
         "fire_id": fire_id,
         "sectors": sectors,
         "tolerance": tolerance,
@@ -64,10 +64,10 @@ def test_agent_has_assess_severity_tool(agent_module):
     assert "assess_severity" in tool_names
 
 
-def test_assess_severity_tool_works(agent_module):
+async def test_assess_severity_tool_works(agent_module):
     """The assess_severity tool should execute correctly."""
     assess_severity = agent_module.assess_severity
-    result = assess_severity(fire_id="cedar-creek-2022")
+    result = await assess_severity(fire_id="cedar-creek-2022")
 
     assert result["fire_id"] == "cedar-creek-2022"
     assert result["fire_name"] == "Cedar Creek Fire"
@@ -6,7 +6,8 @@ This agent calls specialist agents as tools (AgentTool pattern) to retain
 control of the conversation while leveraging domain expertise.
 
 Per ADR-005: Skills-First Multi-Agent Architecture
-Pattern: AgentTool wrappers (NOT sub_agents - coordinator retains control)
+Pattern: AgentTool wrappers (NOT sub_agents - coordinator retains control),
+loaded lazily on first invocation to keep cold starts short
 
 Specialist Tools:
     - burn_analyst_tool: Fire severity, MTBS classification, soil burn severity
@@ -19,42 +20,54 @@ import sys
 from pathlib import Path
 
 from google.adk.agents import Agent
-from google.adk.tools import AgentTool
 
 # Add project root to path for agents._shared imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-# Import specialist agents for multi-agent orchestration
-# Note: Using relative imports within agents/ directory
+# Specialist agents live alongside the coordinator in agents/
 AGENTS_DIR = Path(__file__).parent.parent
 if str(AGENTS_DIR) not in sys.path:
     sys.path.insert(0, str(AGENTS_DIR))
 
-from burn_analyst.agent import root_agent as burn_analyst
-from trail_assessor.agent import root_agent as trail_assessor
-from cruising_assistant.agent import root_agent as cruising_assistant
-from nepa_advisor.agent import root_agent as nepa_advisor
+from agents._shared.lazy_agent_tool import LazyAgentTool
 
-# Wrap specialists as AgentTools (coordinator retains control)
-burn_analyst_tool = AgentTool(agent=burn_analyst)
-trail_assessor_tool = AgentTool(agent=trail_assessor)
-cruising_assistant_tool = AgentTool(agent=cruising_assistant)
-nepa_advisor_tool = AgentTool(agent=nepa_advisor)
+# Wrap specialists as lazy AgentTools (coordinator retains control).
+# Each specialist's module tree (skills, RAG clients) is imported on its
+# first invocation rather than at coordinator import - see lazy_agent_tool.py.
+# Descriptions must match each specialist's Agent(description=...).
+burn_analyst_tool = LazyAgentTool(
+    name="burn_analyst",
+    module="burn_analyst.agent",
+    description="Fire severity and burn analysis specialist for RANGER.",
+)
+trail_assessor_tool = LazyAgentTool(
+    name="trail_assessor",
+    module="trail_assessor.agent",
+    description="Trail damage assessment and recreation priority specialist for RANGER.",
+)
+cruising_assistant_tool = LazyAgentTool(
+    name="cruising_assistant",
+    module="cruising_assistant.agent",
+    description="Timber inventory and salvage specialist for RANGER.",
+)
+nepa_advisor_tool = LazyAgentTool(
+    name="nepa_advisor",
+    module="nepa_advisor.agent",
+    description="NEPA compliance and environmental documentation specialist for RANGER.",
+)
 
-# Add skill scripts to path for dynamic loading
+# Skill directories; tools run their scripts off the event loop (run_skill)
 SKILLS_DIR = Path(__file__).parent / "skills"
+TRIAGE_SKILL = SKILLS_DIR / "portfolio-triage"
 
-# Portfolio Triage skill
-TRIAGE_PATH = SKILLS_DIR / "portfolio-triage" / "scripts"
-if TRIAGE_PATH.exists():
-    sys.path.insert(0, str(TRIAGE_PATH))
+from agents._shared.skill_runner import run_skill
 
 # Note: Delegation skill no longer used with AgentTool pattern
 
 
-def portfolio_triage(fires_json: str, top_n: int = 0) -> dict:
+async def portfolio_triage(fires_json: str, top_n: int = 0) -> dict:
     """
     Calculate portfolio triage scores for BAER prioritization.
 
@@ -75,9 +88,8 @@ def portfolio_triage(fires_json: str, top_n: int = 0) -> dict:
             - summary: Brief portfolio overview for briefings
     """
     import json
-    from calculate_priority import execute
     fires = json.loads(fires_json) if fires_json else []
-    return execute({"fires": fires, "top_n": top_n if top_n > 0 else None})
+    return await run_skill(TRIAGE_SKILL, "calculate_priority", {"fires": fires, "top_n": top_n if top_n > 0 else None})
 
 
 # NOTE: delegate_query() function removed - no longer needed with AgentTool pattern.
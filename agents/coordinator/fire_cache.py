@@ -0,0 +1,266 @@
+"""
+Fire Data Cache backing Tier 3 (Historical) of the tiered fallback.
+
+CoordinatorService stores every successful Tier 1 / Tier 2 fire lookup here
+so later assessments can degrade to cached data instead of failing:
+
+- In-process LRU bounded by `max_entries`
+- Optional SQLite store (WAL mode) shared by all workers on the instance and
+  surviving restarts; memory misses and stale memory entries read through
+- Entries carry the tier they were fetched at and their store time, so
+  callers can tell fresh, stale-but-usable and expired data apart
+- aget() / aput() serve the in-memory tier on the event loop and run SQLite
+  reads and writes in a worker thread (asyncio.to_thread)
+
+Freshness windows:
+    age < fresh_seconds        fresh - may be served in place of a live call
+    age < max_age_seconds      stale - served as Historical (Tier 3)
+    otherwise                  expired - dropped
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Prune expired rows from the disk store every N writes
+PRUNE_EVERY_WRITES = 100
+
+
+@dataclass(frozen=True)
+class CachedFire:
+    """A cached fire lookup."""
+    fire_id: str
+    data: dict[str, Any]
+    tier: str
+    stored_at: float
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        """Seconds since the data was fetched."""
+        return (time.time() if now is None else now) - self.stored_at
+
+
+class FireDataCache:
+    """
+    LRU fire data cache with optional shared on-disk persistence.
+
+    Usage:
+        >>> cache = FireDataCache(path="/tmp/ranger-fire-cache.db")
+        >>> cache.put("cedar-creek", metadata, tier="authoritative")
+        >>> entry = cache.get("cedar-creek")
+        >>> entry = await cache.aget("cedar-creek")  # From async code
+
+    Args:
+        max_entries: In-memory entries before evicting least recently used
+        fresh_seconds: Age below which an entry counts as fresh
+        max_age_seconds: Age at which an entry expires entirely
+        path: SQLite database file (None keeps the cache in-process only)
+        clock: Wall-clock time source (injectable for tests). Wall time, not
+            monotonic, because entries are shared across processes.
+
+    Thread Safety:
+        All public methods are thread-safe. The in-memory tier and the SQLite
+        connection have separate locks, so a memory lookup never waits on
+        disk I/O. The connection is reopened after fork so pre-forked
+        workers never share a handle.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        fresh_seconds: float = 300.0,
+        max_age_seconds: float = 86400.0,
+        path: Optional[str | Path] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_entries = max_entries
+        self.fresh_seconds = fresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self.path = Path(path) if path else None
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedFire] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(self, fire_id: str) -> Optional[CachedFire]:
+        """
+        Return the newest unexpired entry for a fire, or None.
+
+        Memory is checked first; the disk store is consulted when the memory
+        entry is missing or no longer fresh (another worker may have a newer one).
+        """
+        now = self._clock()
+        return self._memory_hit(fire_id, now) or self._read_through(fire_id, now)
+
+    async def aget(self, fire_id: str) -> Optional[CachedFire]:
+        """get() for async callers: disk reads run in a worker thread."""
+        now = self._clock()
+        entry = self._memory_hit(fire_id, now)
+        if entry is not None:
+            return entry
+        if self.path is None:
+            return self._read_through(fire_id, now)
+        return await asyncio.to_thread(self._read_through, fire_id, now)
+
+    def put(self, fire_id: str, data: dict[str, Any], tier: str) -> CachedFire:
+        """Store a successful lookup in memory and (if configured) on disk."""
+        entry = self._remember_new(fire_id, data, tier)
+        self._write_disk(entry)
+        return entry
+
+    async def aput(self, fire_id: str, data: dict[str, Any], tier: str) -> CachedFire:
+        """put() for async callers: the disk write runs in a worker thread."""
+        entry = self._remember_new(fire_id, data, tier)
+        if self.path is not None:
+            await asyncio.to_thread(self._write_disk, entry)
+        return entry
+
+    def is_fresh(self, entry: CachedFire) -> bool:
+        """Whether an entry is young enough to stand in for a live call."""
+        return entry.age_seconds(self._clock()) < self.fresh_seconds
+
+    def clear(self) -> None:
+        """Drop all entries from memory and disk."""
+        with self._lock:
+            self._entries.clear()
+        with self._disk_lock:
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM fire_cache")
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters and occupancy."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "persistent": self.path is not None,
+        }
+
+    def _memory_hit(self, fire_id: str, now: float) -> Optional[CachedFire]:
+        """The in-memory entry if it is still fresh (no disk access)."""
+        with self._lock:
+            entry = self._entries.get(fire_id)
+            if entry is not None and entry.age_seconds(now) < self.fresh_seconds:
+                self._entries.move_to_end(fire_id)
+                self.hits += 1
+                return entry
+        return None
+
+    def _read_through(self, fire_id: str, now: float) -> Optional[CachedFire]:
+        """Newest of the memory and disk entries, or None if both are missing or expired."""
+        disk_entry = self._read_disk(fire_id)
+        with self._lock:
+            entry = self._entries.get(fire_id)
+            if disk_entry is not None and (entry is None or disk_entry.stored_at > entry.stored_at):
+                entry = disk_entry
+                self.disk_hits += 1
+                self._remember(entry)
+            elif entry is not None:
+                self.hits += 1
+
+            if entry is None or entry.age_seconds(now) >= self.max_age_seconds:
+                self._entries.pop(fire_id, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(fire_id)
+            return entry
+
+    def _remember_new(self, fire_id: str, data: dict[str, Any], tier: str) -> CachedFire:
+        entry = CachedFire(fire_id=fire_id, data=dict(data), tier=tier, stored_at=self._clock())
+        with self._lock:
+            self._remember(entry)
+        return entry
+
+    def _remember(self, entry: CachedFire) -> None:
+        self._entries[entry.fire_id] = entry
+        self._entries.move_to_end(entry.fire_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open (or reopen after fork) the SQLite store."""
+        if self.path is None:
+            return None
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=1.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fire_cache ("
+                "fire_id TEXT PRIMARY KEY, data TEXT NOT NULL, "
+                "tier TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Fire cache store unavailable at {self.path}: {e}")
+            self.path = None
+            return None
+        self._conn = conn
+        self._conn_pid = os.getpid()
+        return conn
+
+    def _read_disk(self, fire_id: str) -> Optional[CachedFire]:
+        if self.path is None:
+            return None
+        try:
+            with self._disk_lock:
+                conn = self._connection()
+                if conn is None:
+                    return None
+                row = conn.execute(
+                    "SELECT data, tier, stored_at FROM fire_cache WHERE fire_id = ?", (fire_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Fire cache read failed for {fire_id}: {e}")
+            return None
+        if row is None:
+            return None
+        data, tier, stored_at = row
+        return CachedFire(fire_id=fire_id, data=json.loads(data), tier=tier, stored_at=stored_at)
+
+    def _write_disk(self, entry: CachedFire) -> None:
+        if self.path is None:
+            return
+        try:
+            with self._disk_lock:
+                conn = self._connection()
+                if conn is None:
+                    return
+                with conn:
+                    # Keep the newer row if another worker wrote concurrently
+                    conn.execute(
+                        "INSERT INTO fire_cache (fire_id, data, tier, stored_at) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(fire_id) DO UPDATE SET data = excluded.data, "
+                        "tier = excluded.tier, stored_at = excluded.stored_at "
+                        "WHERE excluded.stored_at >= fire_cache.stored_at",
+                        (entry.fire_id, json.dumps(entry.data, default=str), entry.tier, entry.stored_at),
+                    )
+                    self._writes += 1
+                    if self._writes % PRUNE_EVERY_WRITES == 0:
+                        conn.execute(
+                            "DELETE FROM fire_cache WHERE stored_at < ?",
+                            (self._clock() - self.max_age_seconds,),
+                        )
+        except sqlite3.Error as e:
+            logger.warning(f"Fire cache write failed for {entry.fire_id}: {e}")
@@ -13,19 +13,68 @@ Aligned with:
 """
 
 import asyncio
+import functools
 import logging
+import sys
 import time
 from typing import Any, Callable, Optional
 from pathlib import Path
 
+from .fire_cache import CachedFire, FireDataCache
+
 logger = logging.getLogger(__name__)
 
+DELEGATION_SCRIPTS_DIR = Path(__file__).parent / "skills" / "delegation" / "scripts"
+TRIAGE_SCRIPTS_DIR = Path(__file__).parent / "skills" / "portfolio-triage" / "scripts"
+
 # Confidence Tiers per PROTOCOL-AGENT-COMMUNICATION.md
 CONFIDENCE_AUTHORITATIVE = 0.95  # Tier 1: Direct, verified data
 CONFIDENCE_DERIVED = 0.75       # Tier 2: Proxy or aggregated data
 CONFIDENCE_HISTORICAL = 0.40    # Tier 3: Cached or stale data (>24h)
 CONFIDENCE_FAILURE = 0.0        # Tier 4: Unable to answer
 
+# Fires listed in a portfolio response's rankings
+PORTFOLIO_RANKINGS = 5
+
+# Portfolio fan-out limits (see handle_portfolio_query)
+DEFAULT_MAX_CONCURRENCY = 8       # Concurrent fire assessments
+DEFAULT_DEADLINE_SECONDS = 8.0    # Whole portfolio response
+DEFAULT_TIER_TIMEOUTS = {         # Per tool call, seconds
+    "authoritative": 3.0,
+    "derived": 2.0,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _load_delegation_router() -> Optional[Callable[[dict], dict]]:
+    """Import the delegation skill's execute() once per process."""
+    if str(DELEGATION_SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(DELEGATION_SCRIPTS_DIR))
+    try:
+        from route_query import execute
+    except ImportError as e:
+        logger.debug(f"Delegation skill not available: {e}")
+        return None
+    return execute
+
+
+@functools.lru_cache(maxsize=1)
+def _load_triage_scorer() -> Callable[..., tuple[float, dict]]:
+    """Import the portfolio-triage skill's scoring formula once per process."""
+    if str(TRIAGE_SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(TRIAGE_SCRIPTS_DIR))
+    from calculate_priority import calculate_triage_score
+    return calculate_triage_score
+
+
+@functools.lru_cache(maxsize=1)
+def _load_triage_ranker() -> Callable[[Any, int], list[int]]:
+    """Import the portfolio-triage skill's partial-sort top-N once per process."""
+    if str(TRIAGE_SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(TRIAGE_SCRIPTS_DIR))
+    from calculate_priority import select_top_n
+    return select_top_n
+
 
 class CoordinatorService:
     """
@@ -41,16 +90,41 @@ class CoordinatorService:
                Keys are tool names, values are async callables.
     """
 
-    def __init__(self, tools: Optional[dict[str, Callable]] = None):
+    def __init__(
+        self,
+        tools: Optional[dict[str, Callable]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        deadline_seconds: float = DEFAULT_DEADLINE_SECONDS,
+        tier_timeouts: Optional[dict[str, float]] = None,
+        hedge_after_seconds: Optional[float] = None,
+        fire_cache: Optional[FireDataCache] = None,
+        stale_while_revalidate: bool = True,
+    ):
         """
         Initialize CoordinatorService.
 
         Args:
             tools: Dict of tool callables (from MCPMockProvider.get_tool_context())
+            max_concurrency: Max fires assessed at once during portfolio fan-out
+            deadline_seconds: Overall portfolio response deadline
+            tier_timeouts: Per-call timeout for "authoritative" (Tier 1) and
+                "derived" (Tier 2) tools; a timeout falls through to the next tier
+            hedge_after_seconds: If set, issue a second Tier 1 call when the
+                first has not answered after this long and use whichever
+                succeeds first
+            fire_cache: Tier 3 store, populated from Tier 1/2 results
+                (default: in-process only)
+            stale_while_revalidate: Serve a stale cached fire immediately
+                as Tier 3 and refresh it in the background
         """
         self.tools = tools or {}
-        self._cache: dict[str, tuple[Any, float]] = {}  # fire_id -> (data, timestamp)
-        self._cache_ttl = 86400  # 24 hours in seconds
+        self.max_concurrency = max(1, max_concurrency)
+        self.deadline_seconds = deadline_seconds
+        self.tier_timeouts = {**DEFAULT_TIER_TIMEOUTS, **(tier_timeouts or {})}
+        self.hedge_after_seconds = hedge_after_seconds
+        self.fire_cache = fire_cache or FireDataCache()
+        self.stale_while_revalidate = stale_while_revalidate
+        self._refreshing: dict[str, asyncio.Task] = {}
 
         logger.info(
             "CoordinatorService initialized",
@@ -147,21 +221,26 @@ class CoordinatorService:
             "double-creek"
         ])
 
-        # 2. Fan-Out: Assess each fire in parallel
-        tasks = [self._assess_fire_priority(fid) for fid in fire_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # 2. Fan-Out: Assess fires in parallel (bounded, under a deadline)
+        results = await self._fan_out(fire_ids)
 
         # 3. Process results with graceful degradation
         valid_results = []
         failed_fires = []
+        timed_out_fires = []
         degradation_notices = []
 
         for fire_id, result in zip(fire_ids, results):
             if isinstance(result, Exception):
                 logger.warning(f"Fire assessment failed: {fire_id}", exc_info=result)
                 failed_fires.append(fire_id)
-            elif result.get("tier") == "failure":
+                continue
+            if result.get("timed_out"):
+                timed_out_fires.append(fire_id)
+            if result.get("tier") == "failure":
                 failed_fires.append(fire_id)
+                if result.get("timed_out"):
+                    degradation_notices.append(f"{result['name']}: {result['degradation_notice']}")
             else:
                 valid_results.append(result)
                 if result.get("tier") != "authoritative":
@@ -169,8 +248,10 @@ class CoordinatorService:
                         f"{result['name']}: {result.get('degradation_notice', 'Using fallback data')}"
                     )
 
-        # 4. Sort by priority score
-        valid_results.sort(key=lambda x: x.get("score", 0), reverse=True)
+        # 4. Rank by priority score (top fires only, ties in input order)
+        select_top_n = _load_triage_ranker()
+        scores = [r.get("score", 0) for r in valid_results]
+        ranked = [valid_results[i] for i in select_top_n(scores, PORTFOLIO_RANKINGS)]
 
         # 5. Calculate aggregate confidence
         if valid_results:
@@ -179,7 +260,7 @@ class CoordinatorService:
             avg_confidence = CONFIDENCE_FAILURE
 
         # 6. Build response
-        top_fire = valid_results[0] if valid_results else None
+        top_fire = ranked[0] if ranked else None
 
         summary = self._build_portfolio_summary(
             total=len(fire_ids),
@@ -192,6 +273,7 @@ class CoordinatorService:
             f"Initiated fan-out to {len(fire_ids)} fires",
             f"Successfully analyzed {len(valid_results)} fires",
             f"Failed to analyze {len(failed_fires)} fires" if failed_fires else None,
+            f"{len(timed_out_fires)} fires missed the {self.deadline_seconds:g}s deadline" if timed_out_fires else None,
             "Ranked by Severity * Acres * Phase multiplier",
             f"Top priority: {top_fire['name']} (score: {top_fire['score']:.1f})" if top_fire else None
         ]
@@ -209,11 +291,13 @@ class CoordinatorService:
             "portfolio": {
                 "rankings": [
                     {"fire_id": r["id"], "name": r["name"], "score": r["score"]}
-                    for r in valid_results[:5]  # Top 5
+                    for r in ranked
                 ],
                 "total_fires": len(fire_ids),
                 "analyzed": len(valid_results),
-                "failed": failed_fires
+                "failed": failed_fires,
+                "timed_out": timed_out_fires,
+                "partial": bool(timed_out_fires),
             }
         }
 
@@ -226,6 +310,91 @@ class CoordinatorService:
 
         return response
 
+    async def _fan_out(self, fire_ids: list[str]) -> list[Any]:
+        """
+        Assess fires concurrently under the semaphore and global deadline.
+
+        Fires still running at the deadline are cancelled and fall back to
+        cached (Tier 3) data, or a failure stub marked `timed_out`.
+
+        Returns:
+            One assessment dict or Exception per fire, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(fire_id: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self._assess_fire_priority(fire_id)
+
+        tasks = [asyncio.create_task(bounded(fid)) for fid in fire_ids]
+        if not tasks:
+            return []
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=self.deadline_seconds)
+        finally:
+            # Also reached if the portfolio request itself is cancelled
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(
+                "Portfolio deadline reached",
+                extra={"pending": len(pending), "deadline_seconds": self.deadline_seconds}
+            )
+
+        results = []
+        for fire_id, task in zip(fire_ids, tasks):
+            if task in pending:
+                cached = await self.fire_cache.aget(fire_id)
+                result = self._historical_assessment(fire_id, cached) or self._failure_assessment(
+                    fire_id,
+                    f"No response within the {self.deadline_seconds:g}s deadline",
+                )
+                result["timed_out"] = True
+                results.append(result)
+            elif task.exception() is not None:
+                results.append(task.exception())
+            else:
+                results.append(task.result())
+        return results
+
+    async def _call_tier(self, tier: str, tool_name: str, fire_id: str) -> Any:
+        """Call a tier's tool under its timeout (hedged for Tier 1 if enabled)."""
+        tool = self.tools[tool_name]
+        timeout = self.tier_timeouts.get(tier)
+        if tier == "authoritative" and self.hedge_after_seconds is not None:
+            call = self._call_hedged(tool, fire_id=fire_id)
+        else:
+            call = tool(fire_id=fire_id)
+        return await asyncio.wait_for(call, timeout)
+
+    async def _call_hedged(self, tool: Callable, **kwargs) -> Any:
+        """
+        Hedged request: start a duplicate call if the first is slow.
+
+        Returns the first successful result; raises the primary call's error
+        only if both calls fail. The loser is cancelled.
+        """
+        primary = asyncio.ensure_future(tool(**kwargs))
+        calls = [primary]
+        try:
+            done, _ = await asyncio.wait(calls, timeout=self.hedge_after_seconds)
+            if not done:
+                logger.debug("Issuing hedged Tier 1 call", extra=kwargs)
+                calls.append(asyncio.ensure_future(tool(**kwargs)))
+            pending = set(calls)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for call in done:
+                    if call.exception() is None:
+                        return call.result()
+            return primary.result()
+        finally:
+            for call in calls:
+                if not call.done():
+                    call.cancel()
+
     async def _assess_fire_priority(self, fire_id: str) -> dict[str, Any]:
         """
         Assess a single fire's priority using Tiered Fallback.
@@ -233,9 +402,13 @@ class CoordinatorService:
         Implements Graceful Degradation:
         - Tier 1 (Authoritative): Direct MCP tool call
         - Tier 2 (Derived): Aggregated/proxy data
-        - Tier 3 (Historical): Cached data (>24h)
+        - Tier 3 (Historical): Cached data from earlier Tier 1/2 results
         - Tier 4 (Failure): Unable to assess
 
+        A fresh cache entry is served at its original tier without a tool
+        call. With stale_while_revalidate, a stale entry is served as Tier 3
+        right away while a background refresh fetches live data.
+
         Args:
             fire_id: Fire incident identifier
 
@@ -244,124 +417,155 @@ class CoordinatorService:
         """
         logger.debug(f"Assessing fire priority: {fire_id}")
 
+        cached = await self.fire_cache.aget(fire_id)
+        if cached is not None:
+            if self.fire_cache.is_fresh(cached) and cached.tier in ("authoritative", "derived"):
+                return self._build_assessment(fire_id, cached.data, cached.tier)
+            if self.stale_while_revalidate:
+                self._schedule_refresh(fire_id)
+                return self._historical_assessment(fire_id, cached, refreshing=True)
+
+        live = await self._fetch_live_assessment(fire_id)
+        if live:
+            return live
+
+        # Tier 3: Try Cache
+        historical = self._historical_assessment(fire_id, await self.fire_cache.aget(fire_id))
+        if historical:
+            return historical
+
+        # Tier 4: Failure - Return minimal stub for graceful degradation
+        logger.warning(f"All tiers failed for {fire_id}, using failure mode")
+        return self._failure_assessment(fire_id, "Unable to fetch fire data from any source")
+
+    async def _fetch_live_assessment(self, fire_id: str) -> Optional[dict[str, Any]]:
+        """Tiers 1 and 2; successful results are written to the fire cache."""
         # Tier 1: Try Authoritative Tool
         if "get_incident_metadata" in self.tools:
             try:
-                metadata = await self.tools["get_incident_metadata"](fire_id=fire_id)
+                metadata = await self._call_tier("authoritative", "get_incident_metadata", fire_id)
 
                 if metadata:
-                    score = self._calculate_triage_score(metadata)
-                    return {
-                        "id": fire_id,
-                        "name": metadata.get("name", fire_id.replace("-", " ").title() + " Fire"),
-                        "score": score,
-                        "tier": "authoritative",
-                        "confidence": CONFIDENCE_AUTHORITATIVE,
-                        "acres": metadata.get("acres", 0),
-                        "containment": metadata.get("containment", 0),
-                        "phase": metadata.get("phase", "unknown")
-                    }
+                    await self._cache_fire_data(fire_id, metadata, "authoritative")
+                    return self._build_assessment(fire_id, metadata, "authoritative")
             except Exception as e:
                 logger.warning(f"Tier 1 failed for {fire_id}: {e}")
 
         # Tier 2: Try Derived/Fixture Data
         if "get_fire_summary" in self.tools:
             try:
-                summary = await self.tools["get_fire_summary"](fire_id=fire_id)
+                summary = await self._call_tier("derived", "get_fire_summary", fire_id)
 
                 if summary:
-                    score = self._calculate_triage_score(summary)
-                    return {
-                        "id": fire_id,
-                        "name": summary.get("name", fire_id.replace("-", " ").title() + " Fire"),
-                        "score": score,
-                        "tier": "derived",
-                        "confidence": CONFIDENCE_DERIVED,
-                        "degradation_notice": "Using derived data from fixture summaries",
-                        "acres": summary.get("acres", 0),
-                        "phase": summary.get("phase", "unknown")
-                    }
+                    await self._cache_fire_data(fire_id, summary, "derived")
+                    return self._build_assessment(fire_id, summary, "derived")
             except Exception as e:
                 logger.warning(f"Tier 2 failed for {fire_id}: {e}")
 
-        # Tier 3: Try Cache
-        cached = self._get_cached(fire_id)
-        if cached:
-            score = self._calculate_triage_score(cached)
-            cache_age_hours = (time.time() - cached.get("cached_at", 0)) / 3600
+        return None
+
+    def _schedule_refresh(self, fire_id: str) -> None:
+        """Refresh a stale fire in the background (one refresh per fire at a time)."""
+        if fire_id in self._refreshing:
+            return
+
+        def done(task: asyncio.Task) -> None:
+            self._refreshing.pop(fire_id, None)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(f"Background refresh failed for {fire_id}: {task.exception()}")
+
+        task = asyncio.get_running_loop().create_task(self._fetch_live_assessment(fire_id))
+        self._refreshing[fire_id] = task
+        task.add_done_callback(done)
+
+    def _build_assessment(self, fire_id: str, data: dict, tier: str) -> dict[str, Any]:
+        """Assessment dict for Tier 1 ("authoritative") or Tier 2 ("derived") data."""
+        name = data.get("name", fire_id.replace("-", " ").title() + " Fire")
+        score = self._calculate_triage_score(data)
+        if tier == "authoritative":
             return {
                 "id": fire_id,
-                "name": cached.get("name", fire_id.replace("-", " ").title() + " Fire"),
+                "name": name,
                 "score": score,
-                "tier": "historical",
-                "confidence": CONFIDENCE_HISTORICAL,
-                "degradation_notice": f"Using cached data ({cache_age_hours:.1f}h old)",
-                "acres": cached.get("acres", 0)
+                "tier": "authoritative",
+                "confidence": CONFIDENCE_AUTHORITATIVE,
+                "acres": data.get("acres", 0),
+                "containment": data.get("containment", 0),
+                "phase": data.get("phase", "unknown")
             }
+        return {
+            "id": fire_id,
+            "name": name,
+            "score": score,
+            "tier": "derived",
+            "confidence": CONFIDENCE_DERIVED,
+            "degradation_notice": "Using derived data from fixture summaries",
+            "acres": data.get("acres", 0),
+            "phase": data.get("phase", "unknown")
+        }
 
-        # Tier 4: Failure - Return minimal stub for graceful degradation
-        logger.warning(f"All tiers failed for {fire_id}, using failure mode")
+    def _historical_assessment(
+        self,
+        fire_id: str,
+        cached: Optional[CachedFire],
+        refreshing: bool = False,
+    ) -> Optional[dict[str, Any]]:
+        """Tier 3 assessment from cached data, or None if nothing is cached."""
+        if cached is None:
+            return None
+        score = self._calculate_triage_score(cached.data)
+        cache_age_hours = cached.age_seconds() / 3600
+        notice = f"Using cached data ({cache_age_hours:.1f}h old)"
+        if refreshing:
+            notice += "; refresh in progress"
+        return {
+            "id": fire_id,
+            "name": cached.data.get("name", fire_id.replace("-", " ").title() + " Fire"),
+            "score": score,
+            "tier": "historical",
+            "confidence": CONFIDENCE_HISTORICAL,
+            "degradation_notice": notice,
+            "acres": cached.data.get("acres", 0)
+        }
+
+    def _failure_assessment(self, fire_id: str, notice: str) -> dict[str, Any]:
+        """Tier 4 stub for a fire that could not be assessed."""
         return {
             "id": fire_id,
             "name": fire_id.replace("-", " ").title() + " Fire",
             "score": 0,
             "tier": "failure",
             "confidence": CONFIDENCE_FAILURE,
-            "degradation_notice": "Unable to fetch fire data from any source"
+            "degradation_notice": notice
         }
 
     def _calculate_triage_score(self, data: dict) -> float:
         """
         Calculate triage priority score.
 
-        Formula: severity_weight * normalized_acres * phase_multiplier
+        Uses the portfolio-triage skill's formula (mission.ts):
+        severity_weight * min(acres / 10000, 50) * phase_multiplier
 
         Args:
             data: Fire data with acres, severity, phase
 
         Returns:
-            Triage score (0-100)
+            Triage score (0-400)
         """
-        # Severity weights
-        severity_weights = {
-            "critical": 4.0,
-            "high": 3.0,
-            "moderate": 2.0,
-            "low": 1.0
-        }
-
-        # Phase multipliers per domain model
-        phase_multipliers = {
-            "active": 2.0,
-            "baer_assessment": 1.75,
-            "baer_implementation": 1.25,
-            "in_restoration": 1.0
-        }
-
-        severity = data.get("severity", "moderate")
-        phase = data.get("phase", "in_restoration")
-        acres = data.get("acres", 0)
-
-        severity_weight = severity_weights.get(severity, 2.0)
-        phase_mult = phase_multipliers.get(phase, 1.0)
-        normalized_acres = min(acres, 500000) / 500000 * 100  # Cap at 500k, scale to 100
-
-        score = severity_weight * normalized_acres * phase_mult
-        return min(score, 100)  # Cap at 100
-
-    def _get_cached(self, fire_id: str) -> Optional[dict]:
-        """Get cached fire data if still valid."""
-        if fire_id in self._cache:
-            data, timestamp = self._cache[fire_id]
-            if time.time() - timestamp < self._cache_ttl:
-                return data
-            else:
-                del self._cache[fire_id]
-        return None
+        score, _ = _load_triage_scorer()(
+            severity=data.get("severity", "moderate"),
+            acres=data.get("acres", 0),
+            phase=data.get("phase", "in_restoration"),
+        )
+        return score
 
-    def _cache_fire_data(self, fire_id: str, data: dict) -> None:
-        """Cache fire data with timestamp."""
-        self._cache[fire_id] = (data, time.time())
+    async def _cache_fire_data(self, fire_id: str, data: dict, tier: str) -> None:
+        """Cache a successful Tier 1/2 lookup for later Tier 3 fallback."""
+        try:
+            await self.fire_cache.aput(fire_id, data, tier)
+        except Exception as e:
+            # Caching is best effort; never fail an assessment over it
+            logger.warning(f"Failed to cache fire data for {fire_id}: {e}")
 
     async def _route_query(
         self,
@@ -378,22 +582,11 @@ class CoordinatorService:
         Returns:
             Routing decision with target_agent and confidence
         """
-        # Try to import delegation skill
-        try:
-            import sys
-            from pathlib import Path
-
-            delegation_path = Path(__file__).parent / "skills" / "delegation" / "scripts"
-            if str(delegation_path) not in sys.path:
-                sys.path.insert(0, str(delegation_path))
-
-            from route_query import execute
-            return execute({"query": query, "context": context})
-
-        except ImportError as e:
-            logger.debug(f"Delegation skill not available: {e}")
+        execute = _load_delegation_router()
+        if execute is None:
             # Fallback: simple keyword routing
             return self._simple_route(query)
+        return execute({"query": query, "context": context})
 
     def _simple_route(self, query: str) -> dict[str, Any]:
         """Simple keyword-based routing fallback."""
@@ -0,0 +1,232 @@
+"""
+Response Cache for the legacy /api/v1/chat endpoint.
+
+The Command Console often sends the same triage query from many browser tabs
+at once. CoordinatorService responses are deterministic for a given query,
+fire context and fixture data set, so they can be shared:
+
+- LRU + TTL cache keyed by (normalized query, fire_context hash, fixture version)
+- Single-flight coalescing: concurrent identical requests await one computation,
+  which runs in its own task so no single caller's cancellation (e.g. the
+  first client disconnecting) takes it away from the others
+- Hit / miss / coalesced counters for monitoring
+
+Error responses are never cached; a failed computation is propagated to every
+coalesced waiter and the next request retries. Degraded responses (fallback
+tiers, partial portfolios) are shared with coalesced waiters but not stored,
+so the next request gets another chance at authoritative data.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str, str]
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share a key."""
+    return " ".join(query.lower().split())
+
+
+def hash_fire_context(fire_context: Optional[dict[str, Any]]) -> str:
+    """Stable short hash of the fire_context payload (order-insensitive)."""
+    if not fire_context:
+        return "-"
+    encoded = json.dumps(fire_context, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def cacheable_response(response: dict[str, Any]) -> bool:
+    """
+    Whether a CoordinatorService response may be stored.
+
+    Errors, partial portfolios (fires past the deadline), failed fires and
+    anything served from a fallback tier (which carries a degradation
+    notice) are not cached.
+    """
+    if "error" in response:
+        return False
+    portfolio = response.get("portfolio") or {}
+    if portfolio.get("partial") or portfolio.get("failed"):
+        return False
+    return not (response.get("content") or {}).get("degradation_notice")
+
+
+class FixtureVersion:
+    """
+    Version tag for the fixture data set backing responses.
+
+    Uses the FIXTURE_VERSION environment variable when set (e.g. the image
+    tag); otherwise derives a tag from file names, sizes and mtimes under the
+    fixtures directory. The directory walk is re-done at most once per
+    `recheck_seconds` so the hot path stays a clock read.
+
+    Args:
+        fixtures_dir: Root of the fixture data (data/fixtures)
+        recheck_seconds: Minimum interval between directory scans
+    """
+
+    def __init__(self, fixtures_dir: Path, recheck_seconds: float = 5.0):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.recheck_seconds = recheck_seconds
+        self._override = os.environ.get("FIXTURE_VERSION")
+        self._value = ""
+        self._checked_at = float("-inf")
+
+    def get(self) -> str:
+        """Return the current fixture version tag."""
+        if self._override:
+            return self._override
+        now = time.monotonic()
+        if now - self._checked_at >= self.recheck_seconds:
+            self._value = self._scan()
+            self._checked_at = now
+        return self._value
+
+    def _scan(self) -> str:
+        if not self.fixtures_dir.is_dir():
+            return "none"
+        digest = hashlib.sha256()
+        for path in sorted(self.fixtures_dir.rglob("*.json")):
+            stat = path.stat()
+            digest.update(f"{path.relative_to(self.fixtures_dir)}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()[:16]
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    # Failures whose callers all went away must not log "never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+class ResponseCache:
+    """
+    LRU + TTL response cache with single-flight request coalescing.
+
+    Usage:
+        >>> cache = ResponseCache(max_entries=256, ttl_seconds=30)
+        >>> key = cache.make_key(query, fire_context, fixture_version)
+        >>> response = await cache.get_or_compute(key, lambda: compute(query))
+
+    Args:
+        max_entries: Maximum cached responses before evicting least recently used
+        ttl_seconds: Lifetime of a cached response (<= 0 disables storage but
+            keeps request coalescing)
+        clock: Monotonic time source (injectable for tests)
+
+    Thread Safety:
+        Designed for a single asyncio event loop (one per uvicorn worker).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        fire_context: Optional[dict[str, Any]],
+        fixture_version: str,
+    ) -> CacheKey:
+        """Build the cache key for a chat request."""
+        return (normalize_query(query), hash_fire_context(fire_context), fixture_version)
+
+    async def get_or_compute(
+        self,
+        key: CacheKey,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda response: True,
+    ) -> Any:
+        """
+        Return a cached response or compute it once for all concurrent callers.
+
+        Args:
+            key: Cache key from make_key()
+            compute: Zero-argument coroutine factory producing the response
+            cacheable: Predicate deciding whether a computed response may be stored
+
+        Returns:
+            The cached or freshly computed response
+
+        Raises:
+            Exception: Whatever `compute` raised (shared with coalesced waiters)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, response = entry
+            if self._clock() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return response
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            inflight = asyncio.ensure_future(self._compute(key, compute, cacheable))
+            inflight.add_done_callback(_retrieve_exception)
+            self._inflight[key] = inflight
+        # shield: a cancelled caller (the first one included) must not cancel
+        # the shared computation
+        return await asyncio.shield(inflight)
+
+    async def _compute(
+        self,
+        key: CacheKey,
+        compute: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool],
+    ) -> Any:
+        try:
+            response = await compute()
+        finally:
+            self._inflight.pop(key, None)
+        if self.ttl_seconds > 0 and cacheable(response):
+            self._store(key, response)
+        return response
+
+    def _store(self, key: CacheKey, response: Any) -> None:
+        self._entries[key] = (self._clock() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            logger.debug("Evicted cached response", extra={"query": evicted[0][:100]})
+
+    def clear(self) -> None:
+        """Drop all cached responses (in-flight computations are unaffected)."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters and occupancy."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "inflight": len(self._inflight),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -3,12 +3,22 @@ Query Routing Script for Delegation Skill
 
 Analyzes user queries and determines which specialist agent
 should handle them based on domain keywords and context.
+
+Routing rules are compiled once into an Aho-Corasick automaton
+(RoutingEngine) so each query is matched in a single pass. The compiled
+rules are swapped atomically when routing-rules.json changes on disk.
 """
 
 import json
+import logging
+import os
 import re
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Literal, TypedDict
+from typing import Literal, Optional, TypedDict
+
+logger = logging.getLogger(__name__)
 
 
 # Agent type literals
@@ -124,15 +134,219 @@ def normalize_query(query: str) -> str:
     return query.lower().strip()
 
 
+# Short keywords that need word boundary matching to avoid false positives
+# (e.g., "ce" in "Cedar" should not match NEPA's "ce" categorical exclusion)
+SHORT_KEYWORDS = frozenset({"ce", "ea", "hi", "rod"})
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same definition of a word character as the `\\w` regex class."""
+    return ch.isalnum() or ch == "_"
+
+
+class _Automaton:
+    """
+    Aho-Corasick automaton over lowercase pattern strings.
+
+    Built as a full transition table (goto + failure links folded together)
+    so scanning costs one dict lookup per character.
+    """
+
+    def __init__(self, patterns: list[str]):
+        goto: list[dict[str, int]] = [{}]
+        output: list[tuple[int, ...]] = [()]
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    output.append(())
+                state = next_state
+            output[state] += (index,)
+
+        # Breadth-first: a state's failure target is always shallower, so its
+        # transitions are complete by the time they are inherited.
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            output[state] += output[fail[state]]
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0)
+                queue.append(child)
+
+        self._delta = delta
+        self._output = output
+
+    def scan(self, text: str):
+        """Yield (pattern_index, end_offset) for every occurrence in text."""
+        delta = self._delta
+        output = self._output
+        state = 0
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if output[state]:
+                for index in output[state]:
+                    yield index, end
+
+
+class CompiledRules:
+    """
+    Immutable, compiled form of a routing rules dict.
+
+    `match()` returns exactly what find_keyword_matches() returns for the
+    same rules: per-agent matches in rule order (keywords, then phrases),
+    agents in rule order, original casing preserved.
+    """
+
+    def __init__(self, rules: dict):
+        self.rules = rules
+        patterns: list[str] = []
+        pattern_ids: dict[str, int] = {}
+        # pattern index -> [(agent_rank, position, original, needs_boundary)]
+        entries: dict[int, list[tuple[int, int, str, bool]]] = {}
+        self._agents = list(rules)
+        self._always: list[tuple[int, int, str]] = []
+
+        for rank, (agent, config) in enumerate(rules.items()):
+            terms = [(kw, kw.lower() in SHORT_KEYWORDS) for kw in config.get("keywords", [])]
+            terms += [(phrase, False) for phrase in config.get("phrases", [])]
+            for position, (term, needs_boundary) in enumerate(terms):
+                text = term.lower()
+                if not text:
+                    # "" in query is always True for substring matching
+                    self._always.append((rank, position, term))
+                    continue
+                index = pattern_ids.setdefault(text, len(patterns))
+                if index == len(patterns):
+                    patterns.append(text)
+                entries.setdefault(index, []).append((rank, position, term, needs_boundary))
+
+        self._automaton = _Automaton(patterns)
+        self._entries = entries
+        self._patterns = patterns
+        self._bounded = frozenset(
+            index for index, items in entries.items() if any(e[3] for e in items)
+        )
+
+    def match(self, query: str) -> dict[str, list[str]]:
+        """Find all keyword and phrase matches for each agent in one pass."""
+        normalized = normalize_query(query)
+        found: set[int] = set()
+        found_bounded: set[int] = set()
+
+        for index, end in self._automaton.scan(normalized):
+            found.add(index)
+            if index in self._bounded and index not in found_bounded:
+                start = end - len(self._patterns[index])
+                if self._has_boundaries(normalized, start, end):
+                    found_bounded.add(index)
+
+        hits = list(self._always)
+        for index in found:
+            for rank, position, term, needs_boundary in self._entries[index]:
+                if not needs_boundary or index in found_bounded:
+                    hits.append((rank, position, term))
+        hits.sort()
+
+        matches: dict[str, list[str]] = {}
+        for rank, _, term in hits:
+            matches.setdefault(self._agents[rank], []).append(term)
+        return matches
+
+    @staticmethod
+    def _has_boundaries(text: str, start: int, end: int) -> bool:
+        """Equivalent of matching text[start:end] against r'\\b...\\b'."""
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end < len(text) and _is_word_char(text[end])
+        return (
+            before != _is_word_char(text[start])
+            and _is_word_char(text[end - 1]) != after
+        )
+
+
+class RoutingEngine:
+    """
+    Compiled routing rules with atomic reload on file change.
+
+    The rules file is stat'ed on each lookup; when its mtime or size changes
+    the rules are recompiled and the snapshot reference is swapped, so
+    concurrent callers always see one complete rule set. A rules file that
+    fails to parse keeps the previous snapshot in service.
+
+    Args:
+        rules_path: routing-rules.json location (embedded defaults if missing)
+    """
+
+    def __init__(self, rules_path: Path):
+        self.rules_path = Path(rules_path)
+        self._snapshot: Optional[CompiledRules] = None
+        self._signature: Optional[tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self.reloads = 0
+
+    def snapshot(self) -> CompiledRules:
+        """Return the compiled rules, recompiling if the rules file changed."""
+        signature = self._stat()
+        snapshot = self._snapshot
+        if snapshot is not None and signature == self._signature:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and signature == self._signature:
+                return self._snapshot
+            try:
+                compiled = CompiledRules(self._load())
+            except (OSError, ValueError):
+                if self._snapshot is None:
+                    raise
+                logger.warning("Invalid routing rules at %s - keeping previous rules", self.rules_path)
+                self._signature = signature
+                return self._snapshot
+            self._snapshot = compiled
+            self._signature = signature
+            self.reloads += 1
+            return compiled
+
+    def match(self, query: str) -> dict[str, list[str]]:
+        """Find keyword matches using the current compiled rules."""
+        return self.snapshot().match(query)
+
+    def _stat(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.rules_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> dict:
+        if self.rules_path.exists():
+            return json.loads(self.rules_path.read_text())
+        return get_default_routing_rules()
+
+
+_engine = RoutingEngine(RESOURCES_DIR / "routing-rules.json")
+
+
+def get_routing_engine() -> RoutingEngine:
+    """Get the process-wide routing engine for the bundled rules file."""
+    return _engine
+
+
 def find_keyword_matches(query: str, rules: dict) -> dict[str, list[str]]:
-    """Find all keyword matches for each agent."""
+    """Find all keyword matches for each agent.
+
+    Reference (uncompiled) implementation; route_query() uses RoutingEngine,
+    which returns identical results.
+    """
     normalized = normalize_query(query)
     matches: dict[str, list[str]] = {}
 
-    # Short keywords that need word boundary matching to avoid false positives
-    # (e.g., "ce" in "Cedar" should not match NEPA's "ce" categorical exclusion)
-    SHORT_KEYWORDS = {"ce", "ea", "hi", "rod"}
-
     for agent, config in rules.items():
         agent_matches = []
 
@@ -238,8 +452,9 @@ def route_query(query: str, context: dict | None = None) -> RoutingResult:
             "synthesis_agents": [],
         }
 
-    rules = load_routing_rules()
-    matches = find_keyword_matches(query, rules)
+    compiled = get_routing_engine().snapshot()
+    rules = compiled.rules
+    matches = compiled.match(query)
 
     # Check for multi-agent synthesis need
     needs_synthesis, synthesis_agents = detect_multi_agent_query(matches)
@@ -297,7 +512,7 @@ def route_query(query: str, context: dict | None = None) -> RoutingResult:
             reasoning = f"Matched domain keywords: {', '.join(best_matches[:3])}"
 
     # Get fallback agents
-    fallback_agents = rules.get(best_agent, {}).get("fallback", ["coordinator"])
+    fallback_agents = list(rules.get(best_agent, {}).get("fallback", ["coordinator"]))
     if best_agent in fallback_agents:
         fallback_agents = [a for a in fallback_agents if a != best_agent]
 
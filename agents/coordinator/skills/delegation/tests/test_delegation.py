@@ -296,3 +296,144 @@ class TestExamples:
             if "requires_synthesis" in expected:
                 assert result["requires_synthesis"] == expected["requires_synthesis"], \
                     f"Example '{example['name']}': synthesis mismatch"
+
+
+class TestRoutingEngine:
+    """Tests for the compiled routing engine."""
+
+    EQUIVALENCE_QUERIES = [
+        "What is the soil burn severity in the northwest sector?",
+        "Which trails are closed due to hazard trees?",
+        "Do we need an EIS or can this qualify for a categorical exclusion?",
+        "How much merchantable timber can we salvage?",
+        "Which fires in our portfolio need the most attention?",
+        "Give me the full recovery picture including burn damage and trail impacts",
+        "Hello, what can you help me with?",
+        "Cedar Creek area overview",  # "ce"/"ea" inside words must not match
+        "hi",
+        "CE, EA or EIS? rod_ce hi-there",
+        "burn severity burn severity",
+        "",
+    ]
+
+    def _stress_matrix_queries(self):
+        yaml = pytest.importorskip("yaml")
+        matrix_path = SKILL_ROOT.parents[3] / "tests" / "stress_test_matrix.yaml"
+        matrix = yaml.safe_load(matrix_path.read_text())
+        return [
+            test["query"]
+            for suite in matrix.get("test_suites", [])
+            for test in suite.get("tests", [])
+            if "query" in test
+        ]
+
+    def test_matches_reference_implementation(self):
+        """Compiled matching returns exactly what find_keyword_matches does."""
+        from route_query import CompiledRules, find_keyword_matches, load_routing_rules
+
+        rules = load_routing_rules()
+        compiled = CompiledRules(rules)
+
+        for query in self.EQUIVALENCE_QUERIES + self._stress_matrix_queries():
+            assert compiled.match(query) == find_keyword_matches(query, rules), query
+
+    def test_matches_reference_for_default_rules(self):
+        """Equivalence also holds for the embedded fallback rules."""
+        from route_query import CompiledRules, find_keyword_matches, get_default_routing_rules
+
+        rules = get_default_routing_rules()
+        compiled = CompiledRules(rules)
+
+        for query in self.EQUIVALENCE_QUERIES:
+            assert compiled.match(query) == find_keyword_matches(query, rules), query
+
+    def test_short_keywords_require_word_boundaries(self):
+        """Short keywords match whole words only."""
+        from route_query import CompiledRules
+
+        compiled = CompiledRules({"nepa-advisor": {"keywords": ["ce", "nepa"]}})
+
+        assert compiled.match("Cedar Creek") == {}
+        assert compiled.match("is a CE enough?") == {"nepa-advisor": ["ce"]}
+
+    def test_overlapping_patterns_all_reported(self):
+        """Nested keywords ("burn" inside "burn severity") are all found."""
+        from route_query import CompiledRules
+
+        compiled = CompiledRules({
+            "burn-analyst": {
+                "keywords": ["burn severity", "burn", "severity"],
+                "phrases": ["burn"],
+            },
+        })
+
+        assert compiled.match("soil burn severity") == {
+            "burn-analyst": ["burn severity", "burn", "severity", "burn"],
+        }
+
+    def test_route_query_results_unchanged(self, monkeypatch):
+        """route_query output is identical with the reference matcher swapped in."""
+        import route_query as rq
+
+        queries = self.EQUIVALENCE_QUERIES + self._stress_matrix_queries()
+        compiled_results = [rq.route_query(q) for q in queries]
+
+        class ReferenceRules:
+            rules = rq.load_routing_rules()
+
+            def match(self, query):
+                return rq.find_keyword_matches(query, self.rules)
+
+        class ReferenceEngine:
+            def snapshot(self):
+                return ReferenceRules()
+
+        monkeypatch.setattr(rq, "get_routing_engine", ReferenceEngine)
+
+        assert [rq.route_query(q) for q in queries] == compiled_results
+
+    def test_reloads_when_rules_file_changes(self, tmp_path):
+        """Editing the rules file swaps in newly compiled rules."""
+        import os
+
+        from route_query import RoutingEngine
+
+        rules_path = tmp_path / "routing-rules.json"
+        rules_path.write_text(json.dumps({"trail-assessor": {"keywords": ["trail"]}}))
+        engine = RoutingEngine(rules_path)
+
+        assert engine.match("bridge out") == {}
+        first = engine.snapshot()
+        assert engine.snapshot() is first
+
+        rules_path.write_text(json.dumps({"trail-assessor": {"keywords": ["trail", "bridge"]}}))
+        stat = rules_path.stat()
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert engine.match("bridge out") == {"trail-assessor": ["bridge"]}
+        assert engine.reloads == 2
+
+    def test_invalid_rules_keep_previous_snapshot(self, tmp_path):
+        """A half-written rules file does not take routing down."""
+        import os
+
+        from route_query import RoutingEngine
+
+        rules_path = tmp_path / "routing-rules.json"
+        rules_path.write_text(json.dumps({"trail-assessor": {"keywords": ["trail"]}}))
+        engine = RoutingEngine(rules_path)
+        engine.snapshot()
+
+        rules_path.write_text("{not json")
+        stat = rules_path.stat()
+        os.utime(rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert engine.match("trail status") == {"trail-assessor": ["trail"]}
+
+    def test_missing_file_uses_default_rules(self, tmp_path):
+        """Without a rules file the embedded defaults are compiled."""
+        from route_query import RoutingEngine, get_default_routing_rules
+
+        engine = RoutingEngine(tmp_path / "missing.json")
+
+        assert engine.snapshot().rules == get_default_routing_rules()
@@ -5,9 +5,19 @@ Implements the BAER prioritization algorithm for ranking fires
 based on severity, size, and phase in the recovery lifecycle.
 
 Values must match mission.ts exactly for frontend consistency.
+
+Scoring is columnar: a batch of fires is held as NumPy arrays (severity
+weight, acres, phase multiplier) and scored in one vectorized pass that is
+bit-for-bit identical to calculate_triage_score(). TriageEngine keeps a live
+ranking for national-scale portfolios and re-ranks only fires whose inputs
+changed.
 """
 
-from typing import Literal, TypedDict
+import heapq
+from bisect import bisect_left, insort
+from typing import Any, Iterable, Literal, Optional, TypedDict
+
+import numpy as np
 
 
 # Type definitions matching apps/command-console/src/types/mission.ts
@@ -97,6 +107,236 @@ def calculate_triage_score(
     return score, components
 
 
+def _round_like_builtin(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    np.round() corrected to match the builtin round().
+
+    np.round scales, rounds half-to-even and unscales, so it can disagree
+    with round() only when the scaled value is within float error of a .5
+    tie. Those few elements are re-rounded with the builtin.
+    """
+    scaled = values * 10.0 ** ndigits
+    rounded = np.round(values, ndigits)
+    fraction = scaled - np.floor(scaled)
+    for i in np.flatnonzero(np.abs(fraction - 0.5) < 1e-6):
+        rounded[i] = round(float(values[i]), ndigits)
+    return rounded
+
+
+def score_columns(
+    severity_weights: np.ndarray,
+    acres: np.ndarray,
+    phase_multipliers: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized calculate_triage_score() over parallel columns.
+
+    Args:
+        severity_weights: Severity weight per fire (see SEVERITY_WEIGHTS)
+        acres: Burned acres per fire (0 for unknown)
+        phase_multipliers: Phase multiplier per fire (see PHASE_MULTIPLIERS)
+
+    Returns:
+        Tuple of (acres_normalized, scores) arrays
+    """
+    acres = np.asarray(acres, dtype=np.float64)
+    acres_normalized = _round_like_builtin(np.minimum(acres / 10000, 50), 2)
+    acres_normalized[acres == 0] = 0.0
+    # Same operation order as the scalar formula so results are identical
+    scores = _round_like_builtin(
+        np.asarray(severity_weights, dtype=np.float64) * acres_normalized
+        * np.asarray(phase_multipliers, dtype=np.float64),
+        1,
+    )
+    return acres_normalized, scores
+
+
+def select_top_n(scores: np.ndarray | list[float], n: int) -> list[int]:
+    """
+    Indices of the n highest scores, highest first, ties in index order.
+
+    Partial sort: np.partition finds the n-th largest score in O(N), then a
+    heap orders only the candidates at or above it. Equivalent to a stable
+    descending sort truncated to n, without sorting the whole batch.
+    """
+    scores = np.asarray(scores, dtype=float)
+    count = len(scores)
+    if n <= 0 or count == 0:
+        return []
+    if n >= count:
+        return sorted(range(count), key=lambda i: -scores[i])
+    threshold = np.partition(scores, count - n)[count - n]
+    candidates = np.flatnonzero(scores >= threshold).tolist()
+    return heapq.nlargest(n, candidates, key=lambda i: (scores[i], -i))
+
+
+def _fire_columns(fire: dict) -> tuple[str, str, str, int, Any, str, float]:
+    """Extract (id, name, severity, weight, acres, phase, multiplier) like execute() always has."""
+    severity = fire.get("severity", "moderate")
+    severity_lower = severity.lower() if severity else "moderate"
+    phase = fire.get("phase", "in_restoration")
+    return (
+        fire.get("id", "unknown"),
+        fire.get("name", "Unknown Fire"),
+        severity,
+        SEVERITY_WEIGHTS.get(severity_lower, 1),
+        fire.get("acres", 0) or 0,
+        phase,
+        PHASE_MULTIPLIERS.get(phase, 1.0),
+    )
+
+
+def _reasoning(name: str, weight: int, severity: str, acres_normalized: Any,
+               multiplier: float, phase: str, score: float) -> str:
+    return (
+        f"{name}: {weight} ({severity} severity) x "
+        f"{acres_normalized} (normalized acres) x "
+        f"{multiplier} ({phase}) = {score}"
+    )
+
+
+class TriageEngine:
+    """
+    Columnar triage ranking with incremental updates.
+
+    Fire inputs are held as NumPy columns. load() scores the whole batch in
+    one vectorized pass; update() rescores only fires whose severity, acres
+    or phase changed and moves just those within the ranking. Ranking order
+    matches execute(): score descending, ties in first-seen order. Fire IDs
+    are expected to be unique.
+
+    Usage:
+        >>> engine = TriageEngine()
+        >>> engine.load(national_fires)
+        >>> engine.top_n(10)
+        >>> engine.update([{"id": "bootleg", "acres": 420000, ...}])
+    """
+
+    def __init__(self):
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._phases: list[str] = []
+        self._rows: dict[str, int] = {}  # live fires only; removed rows stay as tombstones
+        self._weights = np.empty(0)
+        self._acres = np.empty(0)
+        self._multipliers = np.empty(0)
+        self._acres_normalized = np.empty(0)
+        self._scores = np.empty(0)
+        self._ranking: list[tuple[float, int]] = []  # sorted (-score, row) for live fires
+
+    def __len__(self) -> int:
+        return len(self._ranking)
+
+    def __contains__(self, fire_id: str) -> bool:
+        return fire_id in self._rows
+
+    def load(self, fires: Iterable[dict]) -> None:
+        """Replace the portfolio with `fires` and rank it."""
+        self.__init__()
+        self._append([_fire_columns(fire) for fire in fires])
+        rows = np.fromiter(self._rows.values(), dtype=np.intp, count=len(self._rows))
+        rows = rows[np.argsort(-self._scores[rows], kind="stable")]
+        self._ranking = list(zip((-self._scores[rows]).tolist(), rows.tolist()))
+
+    def update(self, fires: Iterable[dict]) -> list[str]:
+        """
+        Insert or update fires, re-ranking only those whose inputs changed.
+
+        Returns:
+            IDs of fires that were added or rescored
+        """
+        changed_rows: list[int] = []
+        added: dict[str, tuple] = {}
+        for fire in fires:
+            columns = _fire_columns(fire)
+            fire_id, name, _, weight, acres, phase, multiplier = columns
+            row = self._rows.get(fire_id)
+            if row is None:
+                added[fire_id] = columns
+                continue
+            self._names[row] = name
+            if (
+                self._weights[row] != weight
+                or self._acres[row] != acres
+                or self._multipliers[row] != multiplier
+                or self._phases[row] != phase
+            ):
+                self._weights[row] = weight
+                self._acres[row] = acres
+                self._multipliers[row] = multiplier
+                self._phases[row] = phase
+                changed_rows.append(row)
+
+        if changed_rows:
+            rows = np.array(changed_rows)
+            old_scores = self._scores[rows].tolist()
+            self._acres_normalized[rows], self._scores[rows] = score_columns(
+                self._weights[rows], self._acres[rows], self._multipliers[rows]
+            )
+            for row, old_score in zip(changed_rows, old_scores):
+                self._unrank(row, old_score)
+                insort(self._ranking, (-float(self._scores[row]), row))
+
+        if added:
+            first_new = len(self._ids)
+            self._append(list(added.values()))
+            for row in range(first_new, len(self._ids)):
+                insort(self._ranking, (-float(self._scores[row]), row))
+
+        return [self._ids[row] for row in changed_rows] + list(added)
+
+    def remove(self, fire_ids: Iterable[str]) -> int:
+        """Drop fires from the ranking. Returns how many were removed."""
+        removed = 0
+        for fire_id in fire_ids:
+            row = self._rows.pop(fire_id, None)
+            if row is not None:
+                self._unrank(row, float(self._scores[row]))
+                removed += 1
+        return removed
+
+    def top_n(self, n: Optional[int] = None) -> list[dict[str, Any]]:
+        """Highest-priority fires (all if n is None), highest first."""
+        entries = self._ranking if n is None else self._ranking[:max(n, 0)]
+        return [self._result(row) for _, row in entries]
+
+    def _result(self, row: int) -> dict[str, Any]:
+        weight = self._weights[row]
+        return {
+            "id": self._ids[row],
+            "name": self._names[row],
+            "triage_score": float(self._scores[row]),
+            "severity_weight": int(weight) if weight.is_integer() else float(weight),
+            "acres_normalized": float(self._acres_normalized[row]),
+            "phase_multiplier": float(self._multipliers[row]),
+            "phase": self._phases[row],
+        }
+
+    def _append(self, columns: list[tuple]) -> None:
+        if not columns:
+            return
+        first_row = len(self._ids)
+        ids, names, _, weights, acres, phases, multipliers = zip(*columns)
+        weights = np.array(weights, dtype=np.float64)
+        acres = np.array(acres, dtype=np.float64)
+        multipliers = np.array(multipliers, dtype=np.float64)
+        acres_normalized, scores = score_columns(weights, acres, multipliers)
+
+        self._ids.extend(ids)
+        self._names.extend(names)
+        self._phases.extend(phases)
+        self._weights = np.concatenate([self._weights, weights])
+        self._acres = np.concatenate([self._acres, acres])
+        self._multipliers = np.concatenate([self._multipliers, multipliers])
+        self._acres_normalized = np.concatenate([self._acres_normalized, acres_normalized])
+        self._scores = np.concatenate([self._scores, scores])
+        self._rows.update(zip(ids, range(first_row, first_row + len(ids))))
+
+    def _unrank(self, row: int, score: float) -> None:
+        index = bisect_left(self._ranking, (-score, row))
+        del self._ranking[index]
+
+
 def execute(inputs: dict) -> dict:
     """
     Execute portfolio triage calculation.
@@ -126,51 +366,51 @@ def execute(inputs: dict) -> dict:
             "summary": "No fires provided for triage analysis.",
         }
 
-    results: list[TriageResult] = []
-    reasoning_chain: list[str] = []
-
-    for fire in fires:
-        fire_id = fire.get("id", "unknown")
-        fire_name = fire.get("name", "Unknown Fire")
-        severity = fire.get("severity", "moderate")
-        acres = fire.get("acres", 0)
-        phase = fire.get("phase", "in_restoration")
-
-        score, components = calculate_triage_score(
-            severity=severity,
-            acres=acres,
-            phase=phase,
-        )
-
-        reasoning = (
-            f"{fire_name}: {components['severity_weight']} ({severity} severity) x "
-            f"{components['acres_normalized']} (normalized acres) x "
-            f"{components['phase_multiplier']} ({phase}) = {score}"
-        )
-
-        result: TriageResult = {
-            "id": fire_id,
-            "name": fire_name,
-            "triage_score": score,
-            "severity_weight": components["severity_weight"],
-            "acres_normalized": components["acres_normalized"],
-            "phase_multiplier": components["phase_multiplier"],
-            "phase": phase,
-            "reasoning": reasoning,
-        }
-        results.append(result)
-        reasoning_chain.append(reasoning)
-
-    # Sort by triage score (highest first)
-    results.sort(key=lambda x: x["triage_score"], reverse=True)
+    # Score the whole batch at once
+    columns = [_fire_columns(fire) for fire in fires]
+    _, _, _, weights, acres, _, multipliers = zip(*columns)
+    acres_normalized, scores = score_columns(
+        np.array(weights, dtype=np.float64),
+        np.array(acres, dtype=np.float64),
+        np.array(multipliers, dtype=np.float64),
+    )
 
-    # Rebuild reasoning chain in sorted order
-    reasoning_chain = [r["reasoning"] for r in results]
+    # Sort by triage score (highest first); stable, like list.sort(reverse=True)
+    order = np.argsort(-scores, kind="stable").tolist()
 
-    # Apply top_n filter if specified
-    returned_results = results
+    # Every fire gets a reasoning line; result dicts only for returned fires
+    returned_count = len(order)
     if top_n and isinstance(top_n, int) and top_n > 0:
-        returned_results = results[:top_n]
+        returned_count = min(top_n, len(order))
+    acres_normalized = acres_normalized.tolist()
+    scores = scores.tolist()
+
+    reasoning_chain: list[str] = []
+    returned_results: list[TriageResult] = []
+    for rank, row in enumerate(order):
+        fire_id, fire_name, severity, weight, fire_acres, phase, multiplier = columns[row]
+        # The scalar formula yields int 0 / int 50 at the bounds; keep the
+        # same types so reasoning strings are unchanged
+        if not fire_acres:
+            normalized = 0
+        elif fire_acres / 10000 > 50:
+            normalized = 50
+        else:
+            normalized = acres_normalized[row]
+        score = scores[row]
+        reasoning = _reasoning(fire_name, weight, severity, normalized, multiplier, phase, score)
+        reasoning_chain.append(reasoning)
+        if rank < returned_count:
+            returned_results.append({
+                "id": fire_id,
+                "name": fire_name,
+                "triage_score": score,
+                "severity_weight": weight,
+                "acres_normalized": normalized,
+                "phase_multiplier": multiplier,
+                "phase": phase,
+                "reasoning": reasoning,
+            })
 
     # Calculate confidence based on data completeness
     # High confidence (0.92) for complete fixture data
@@ -5,6 +5,7 @@ Validates:
 - Skill structure matches skill-format.md specification
 - Calculation accuracy matches mission.ts
 - Phase/severity values are consistent with TypeScript
+- Columnar engine is identical to the scalar formula; top-N and incremental ranking
 """
 
 import json
@@ -218,6 +219,23 @@ class TestCalculatePriority:
         # reasoning_chain should still contain all fires for context
         assert len(result["reasoning_chain"]) == 10
 
+    def test_top_n_matches_full_ranking(self):
+        """top_n returns the full ranking's head; the reasoning chain keeps the full ranking."""
+        from calculate_priority import execute
+
+        fires = [
+            {"id": f"fire-{i}", "name": f"Fire {i}", "severity": "high", "acres": acres, "phase": "active"}
+            for i, acres in enumerate([20000, 80000, 50000, 80000, 10000, 50000])
+        ]
+
+        full = execute({"fires": fires})
+        top = execute({"fires": fires, "top_n": 3})
+
+        assert top["ranked_fires"] == full["ranked_fires"][:3]
+        assert [f["id"] for f in top["ranked_fires"]] == ["fire-1", "fire-3", "fire-2"]
+        assert top["reasoning_chain"] == full["reasoning_chain"]
+        assert [line.split(":")[0] for line in top["reasoning_chain"][3:]] == ["Fire 5", "Fire 0", "Fire 4"]
+
     def test_confidence_present(self):
         """Result should include confidence score."""
         from calculate_priority import execute
@@ -312,3 +330,141 @@ class TestExamples:
         result_ids = [f["id"] for f in result["ranked_fires"]]
         expected_ids = [f["id"] for f in data["expected_output"]["ranked_fires"]]
         assert result_ids == expected_ids
+
+
+def make_fires(count: int, seed: int = 7) -> list[dict]:
+    """Deterministic synthetic fires, including acre values that round on .5 ties."""
+    import random
+
+    rng = random.Random(seed)
+    severities = ["low", "moderate", "high", "critical", "High", None, "unknown"]
+    phases = ["active", "baer_assessment", "baer_implementation", "in_restoration", "other"]
+    acres_choices = [0, None, 5, 50, 150, 127850, 500000, 750000]
+    return [
+        {
+            "id": f"fire-{i}",
+            "name": f"Fire {i}",
+            "severity": rng.choice(severities),
+            "acres": rng.choice(acres_choices) if i % 3 == 0 else rng.randint(0, 900000),
+            "phase": rng.choice(phases),
+        }
+        for i in range(count)
+    ]
+
+
+def scalar_ranking(fires: list[dict]) -> list[tuple[str, float]]:
+    """Rank with the scalar formula and a stable sort, as execute() did per fire."""
+    from calculate_priority import calculate_triage_score
+
+    scored = [
+        (
+            fire["id"],
+            calculate_triage_score(
+                severity=fire.get("severity", "moderate"),
+                acres=fire.get("acres", 0),
+                phase=fire.get("phase", "in_restoration"),
+            )[0],
+        )
+        for fire in fires
+    ]
+    return sorted(scored, key=lambda item: item[1], reverse=True)
+
+
+class TestColumnarEngine:
+    """Tests for vectorized scoring, top-N selection and incremental ranking."""
+
+    def test_vectorized_scores_match_scalar(self):
+        """score_columns reproduces calculate_triage_score bit for bit."""
+        import numpy as np
+        from calculate_priority import calculate_triage_score, score_columns
+
+        cases = [
+            ("high", 100000, "active"),
+            ("low", 50, "in_restoration"),           # 0.005 -> round() tie
+            ("moderate", 127850, "baer_assessment"),  # 12.785 -> round() tie
+            ("low", 1250, "baer_implementation"),     # 0.125 * 1.25 score tie
+            ("critical", 2000000, "active"),
+            ("moderate", 0, "active"),
+        ]
+        expected = [calculate_triage_score(*case) for case in cases]
+
+        from calculate_priority import PHASE_MULTIPLIERS, SEVERITY_WEIGHTS
+        acres_normalized, scores = score_columns(
+            np.array([SEVERITY_WEIGHTS[c[0]] for c in cases]),
+            np.array([c[1] for c in cases]),
+            np.array([PHASE_MULTIPLIERS[c[2]] for c in cases]),
+        )
+
+        assert scores.tolist() == [score for score, _ in expected]
+        assert acres_normalized.tolist() == [c["acres_normalized"] for _, c in expected]
+
+    def test_execute_matches_scalar_ranking(self):
+        """Batch execute() ranks exactly like the per-fire formula."""
+        from calculate_priority import execute
+
+        fires = make_fires(500)
+        result = execute({"fires": fires})
+
+        assert [(f["id"], f["triage_score"]) for f in result["ranked_fires"]] == scalar_ranking(fires)
+
+    def test_select_top_n_is_stable_partial_sort(self):
+        """select_top_n equals a stable descending sort truncated to n."""
+        import numpy as np
+        from calculate_priority import select_top_n
+
+        scores = np.array([5.0, 9.0, 5.0, 1.0, 9.0, 5.0, 7.0])
+
+        assert select_top_n(scores, 4) == [1, 4, 6, 0]
+        assert select_top_n(scores, 10) == [1, 4, 6, 0, 2, 5, 3]
+        assert select_top_n(scores, 0) == []
+
+    def test_engine_top_n_matches_execute(self):
+        """TriageEngine ranking matches execute() ordering."""
+        from calculate_priority import TriageEngine
+
+        fires = make_fires(1000)
+        engine = TriageEngine()
+        engine.load(fires)
+
+        expected = scalar_ranking(fires)[:25]
+        assert [(f["id"], f["triage_score"]) for f in engine.top_n(25)] == expected
+        assert len(engine) == 1000
+
+    def test_incremental_update_rescores_only_changed(self):
+        """update() reports and re-ranks only fires whose inputs changed."""
+        from calculate_priority import TriageEngine
+
+        fires = make_fires(200)
+        engine = TriageEngine()
+        engine.load(fires)
+
+        updated = [dict(fire) for fire in fires[:20]]
+        updated[3]["acres"] = 900000
+        updated[3]["severity"] = "critical"
+        updated[3]["phase"] = "active"
+        updated[7]["name"] = "Renamed Fire"  # name only: no rescore
+        changed = engine.update(updated + [{"id": "new-fire", "severity": "low", "acres": 10}])
+
+        assert changed == [updated[3]["id"], "new-fire"]
+        fires[3] = updated[3]
+        fires[7] = updated[7]
+        expected = scalar_ranking(fires + [{"id": "new-fire", "severity": "low", "acres": 10}])
+        assert [(f["id"], f["triage_score"]) for f in engine.top_n()] == expected
+        assert engine.top_n(1)[0]["id"] == updated[3]["id"]
+
+    def test_remove_drops_from_ranking(self):
+        """Removed fires disappear from the ranking and can be re-added."""
+        from calculate_priority import TriageEngine
+
+        engine = TriageEngine()
+        engine.load([
+            {"id": "a", "severity": "high", "acres": 100000, "phase": "active"},
+            {"id": "b", "severity": "low", "acres": 1000, "phase": "active"},
+        ])
+
+        assert engine.remove(["a", "missing"]) == 1
+        assert [f["id"] for f in engine.top_n()] == ["b"]
+        assert "a" not in engine
+
+        engine.update([{"id": "a", "severity": "high", "acres": 100000, "phase": "active"}])
+        assert [f["id"] for f in engine.top_n()] == ["a", "b"]
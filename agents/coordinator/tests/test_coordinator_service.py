@@ -6,12 +6,18 @@ Verifies the Maestro pattern implementation:
 - Tiered Fallback (Graceful Degradation)
 - Query Routing
 - Error Handling
+- Bounded, deadline-aware fan-out and hedged Tier 1 calls
+- Tier 3 fire cache population and stale-while-revalidate
 
 Per SKILL-RUNTIME-SPEC and PROTOCOL-AGENT-COMMUNICATION.
 """
 
+import asyncio
+import time
+
 import pytest
 
+from coordinator.fire_cache import FireDataCache
 from skill_runtime.testing import MCPMockProvider
 
 
@@ -268,6 +274,302 @@ class TestCoordinatorServiceIntegration:
         assert len(result["proof_layer"]["reasoning_chain"]) > 0
 
 
+def fire_data(fire_id: str) -> dict:
+    """Minimal incident metadata for fan-out tests."""
+    return {"name": f"{fire_id} Fire", "acres": 50000, "severity": "high", "phase": "active"}
+
+
+class TestTriageFormula:
+    """CoordinatorService scores with the portfolio-triage skill formula."""
+
+    def test_matches_skill_formula(self):
+        """severity_weight * min(acres / 10000, 50) * phase_multiplier, as in mission.ts."""
+        from coordinator.implementation import CoordinatorService
+
+        service = CoordinatorService()
+
+        # 3 x 12.78 x 1.75
+        assert service._calculate_triage_score(
+            {"severity": "high", "acres": 127831, "phase": "baer_assessment"}
+        ) == 67.1
+        # Acres cap at 50 normalized; no 100-point ceiling
+        assert service._calculate_triage_score(
+            {"severity": "critical", "acres": 900000, "phase": "active"}
+        ) == 400.0
+
+    @pytest.mark.asyncio
+    async def test_rankings_top_five_by_score(self):
+        """Rankings are the five highest scores, ties in fire_ids order."""
+        from coordinator.implementation import CoordinatorService
+
+        acres = {f"fire-{i}": a for i, a in enumerate([10000, 90000, 30000, 90000, 50000, 20000, 90000, 70000])}
+
+        async def metadata(fire_id):
+            return {**fire_data(fire_id), "acres": acres[fire_id]}
+
+        service = CoordinatorService(tools={"get_incident_metadata": metadata})
+        result = await service.handle_portfolio_query("triage", {"fire_ids": list(acres)})
+
+        expected = sorted(acres, key=lambda fire_id: -acres[fire_id])[:5]
+        assert [r["fire_id"] for r in result["portfolio"]["rankings"]] == expected
+        assert expected[:3] == ["fire-1", "fire-3", "fire-6"]
+
+
+class TestPortfolioFanOut:
+    """Tests for bounded, deadline-aware portfolio fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """No more than max_concurrency fires are assessed at once."""
+        from coordinator.implementation import CoordinatorService
+
+        in_flight = 0
+        peak = 0
+
+        async def metadata(fire_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return fire_data(fire_id)
+
+        service = CoordinatorService(tools={"get_incident_metadata": metadata}, max_concurrency=3)
+        fire_ids = [f"fire-{i}" for i in range(12)]
+
+        result = await service.handle_portfolio_query("triage", {"fire_ids": fire_ids})
+
+        assert peak == 3
+        assert result["portfolio"]["analyzed"] == 12
+        assert result["portfolio"]["partial"] is False
+
+    @pytest.mark.asyncio
+    async def test_tier1_timeout_falls_back_to_tier2(self):
+        """A Tier 1 call exceeding its timeout degrades to derived data."""
+        from coordinator.implementation import CoordinatorService
+
+        async def slow_metadata(fire_id):
+            await asyncio.sleep(1)
+            return fire_data(fire_id)
+
+        async def summary(fire_id):
+            return fire_data(fire_id)
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": slow_metadata, "get_fire_summary": summary},
+            tier_timeouts={"authoritative": 0.02},
+        )
+
+        assessment = await service._assess_fire_priority("cedar-creek")
+
+        assert assessment["tier"] == "derived"
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_partial_rankings(self):
+        """Fires that miss the deadline are reported, the rest are ranked."""
+        from coordinator.implementation import CoordinatorService
+
+        async def metadata(fire_id):
+            if fire_id == "stuck":
+                await asyncio.sleep(5)
+            return fire_data(fire_id)
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": metadata},
+            deadline_seconds=0.05,
+            tier_timeouts={"authoritative": 10},
+        )
+
+        start = time.monotonic()
+        result = await service.handle_portfolio_query(
+            "triage", {"fire_ids": ["cedar-creek", "stuck", "bootleg"]}
+        )
+
+        assert time.monotonic() - start < 1
+        portfolio = result["portfolio"]
+        assert portfolio["partial"] is True
+        assert portfolio["timed_out"] == ["stuck"]
+        assert portfolio["failed"] == ["stuck"]
+        assert [r["fire_id"] for r in portfolio["rankings"]] == ["cedar-creek", "bootleg"]
+        assert "deadline" in result["content"]["degradation_notice"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_uses_cached_data_when_available(self):
+        """A timed-out fire with cached data is ranked from Tier 3."""
+        from coordinator.implementation import CoordinatorService
+
+        async def metadata(fire_id):
+            await asyncio.sleep(5)
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": metadata},
+            deadline_seconds=0.02,
+            fire_cache=FireDataCache(fresh_seconds=0),
+            stale_while_revalidate=False,
+        )
+        await service._cache_fire_data("stuck", fire_data("stuck"), "authoritative")
+
+        result = await service.handle_portfolio_query("triage", {"fire_ids": ["stuck"]})
+
+        assert result["portfolio"]["analyzed"] == 1
+        assert result["portfolio"]["timed_out"] == ["stuck"]
+        assert result["portfolio"]["failed"] == []
+
+    @pytest.mark.asyncio
+    async def test_hedged_tier1_uses_faster_call(self):
+        """A slow first Tier 1 call is hedged and the faster answer wins."""
+        from coordinator.implementation import CoordinatorService
+
+        calls = []
+
+        async def metadata(fire_id):
+            calls.append(fire_id)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+            return fire_data(fire_id)
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": metadata},
+            hedge_after_seconds=0.01,
+        )
+
+        start = time.monotonic()
+        assessment = await service._assess_fire_priority("cedar-creek")
+
+        assert time.monotonic() - start < 1
+        assert assessment["tier"] == "authoritative"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_fast_tier1_is_not_hedged(self):
+        """Hedging only kicks in after the hedge delay."""
+        from coordinator.implementation import CoordinatorService
+
+        calls = []
+
+        async def metadata(fire_id):
+            calls.append(fire_id)
+            return fire_data(fire_id)
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": metadata},
+            hedge_after_seconds=0.5,
+        )
+
+        await service._assess_fire_priority("cedar-creek")
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_flaky_mcp_degrades_to_tier2(self):
+        """Injected Tier 1 errors and hangs fall back to Tier 2 without losing fires."""
+        from coordinator.implementation import CoordinatorService
+
+        mock = MCPMockProvider(seed=3)
+        mock.register("mcp-nifc", "get_incident_metadata", handler=fire_data)
+        mock.register("mcp-fixtures", "get_fire_summary", handler=fire_data)
+        mock.inject_faults(
+            "mcp-nifc", latency=("uniform", 0, 0.002), error_rate=0.2, timeout_rate=0.05
+        )
+        service = CoordinatorService(
+            tools=mock.get_tool_context(),
+            max_concurrency=50,
+            # Only injected hangs should time out, even on a busy loop
+            tier_timeouts={"authoritative": 0.5},
+        )
+        fire_ids = [f"fire-{i}" for i in range(200)]
+
+        result = await service.handle_portfolio_query("triage", {"fire_ids": fire_ids})
+
+        stats = mock.get_fault_stats()["mcp-nifc/get_incident_metadata"]
+        assert result["portfolio"]["analyzed"] == 200
+        assert result["portfolio"]["partial"] is False
+        assert stats["errors"] > 0 and stats["timeouts"] > 0
+        assert len(mock.get_call_history()) == 200 + stats["errors"] + stats["timeouts"]
+        assert "derived data" in result["content"]["degradation_notice"]
+
+
+class TestHistoricalCache:
+    """Tests for Tier 3 cache population and stale-while-revalidate."""
+
+    @pytest.mark.asyncio
+    async def test_tier1_results_populate_cache(self):
+        """Successful Tier 1 lookups become Tier 3 fallback data."""
+        from coordinator.implementation import CoordinatorService
+
+        healthy = True
+
+        async def metadata(fire_id):
+            if not healthy:
+                raise RuntimeError("NIFC unavailable")
+            return fire_data(fire_id)
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": metadata},
+            fire_cache=FireDataCache(fresh_seconds=0),
+            stale_while_revalidate=False,
+        )
+
+        first = await service._assess_fire_priority("cedar-creek")
+        healthy = False
+        second = await service._assess_fire_priority("cedar-creek")
+
+        assert first["tier"] == "authoritative"
+        assert second["tier"] == "historical"
+        assert second["score"] == first["score"]
+        assert "0.0h old" in second["degradation_notice"]
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_skips_tool_call(self):
+        """A fresh cached result is served at its original tier."""
+        from coordinator.implementation import CoordinatorService
+
+        calls = []
+
+        async def metadata(fire_id):
+            calls.append(fire_id)
+            return fire_data(fire_id)
+
+        service = CoordinatorService(tools={"get_incident_metadata": metadata})
+
+        await service._assess_fire_priority("cedar-creek")
+        cached = await service._assess_fire_priority("cedar-creek")
+
+        assert cached["tier"] == "authoritative"
+        assert calls == ["cedar-creek"]
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_revalidating(self):
+        """A stale entry returns immediately and is refreshed in the background."""
+        from coordinator.implementation import CoordinatorService
+
+        release = asyncio.Event()
+        calls = []
+
+        async def metadata(fire_id):
+            calls.append(fire_id)
+            await release.wait()
+            return {**fire_data(fire_id), "acres": 400000}
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": metadata},
+            fire_cache=FireDataCache(fresh_seconds=0),
+        )
+        await service._cache_fire_data("cedar-creek", fire_data("cedar-creek"), "authoritative")
+
+        stale = await service._assess_fire_priority("cedar-creek")
+        again = await service._assess_fire_priority("cedar-creek")
+
+        assert stale["tier"] == again["tier"] == "historical"
+        assert "refresh in progress" in stale["degradation_notice"]
+        await asyncio.sleep(0.01)
+        assert calls == ["cedar-creek"]  # one background refresh, not two
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert service.fire_cache.get("cedar-creek").data["acres"] == 400000
+
+
 class TestConfidenceTiers:
     """Tests for confidence tier calculations per PROTOCOL-AGENT-COMMUNICATION."""
 
@@ -0,0 +1,182 @@
+"""
+Tests for the Tier 3 fire data cache.
+
+Verifies:
+- Freshness and expiry windows
+- LRU eviction of the in-process layer
+- SQLite persistence shared between cache instances (workers / restarts)
+- Async access keeps SQLite off the event loop
+"""
+
+import threading
+
+import pytest
+
+from coordinator.fire_cache import FireDataCache
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFireDataCache:
+    """Tests for the in-process cache layer."""
+
+    def test_put_then_get(self):
+        cache = FireDataCache()
+        cache.put("cedar-creek", {"acres": 127831}, tier="authoritative")
+
+        entry = cache.get("cedar-creek")
+
+        assert entry.data == {"acres": 127831}
+        assert entry.tier == "authoritative"
+        assert cache.is_fresh(entry)
+
+    def test_stale_entry_still_returned(self):
+        clock = FakeClock()
+        cache = FireDataCache(fresh_seconds=60, max_age_seconds=3600, clock=clock)
+        cache.put("cedar-creek", {"acres": 1}, tier="derived")
+
+        clock.now += 120
+        entry = cache.get("cedar-creek")
+
+        assert entry is not None
+        assert not cache.is_fresh(entry)
+        assert entry.age_seconds(clock.now) == 120
+
+    def test_expired_entry_dropped(self):
+        clock = FakeClock()
+        cache = FireDataCache(max_age_seconds=3600, clock=clock)
+        cache.put("cedar-creek", {"acres": 1}, tier="derived")
+
+        clock.now += 3600
+
+        assert cache.get("cedar-creek") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        cache = FireDataCache(max_entries=2)
+        cache.put("a", {}, tier="derived")
+        cache.put("b", {}, tier="derived")
+        cache.get("a")
+        cache.put("c", {}, tier="derived")
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_stored_data_is_copied(self):
+        cache = FireDataCache()
+        data = {"acres": 1}
+        cache.put("cedar-creek", data, tier="derived")
+        data["acres"] = 2
+
+        assert cache.get("cedar-creek").data == {"acres": 1}
+
+
+class TestPersistentStore:
+    """Tests for the shared SQLite store."""
+
+    def test_entries_survive_new_instance(self, tmp_path):
+        path = tmp_path / "fire-cache.db"
+        FireDataCache(path=path).put("bootleg", {"acres": 413765}, tier="authoritative")
+
+        restarted = FireDataCache(path=path)
+        entry = restarted.get("bootleg")
+
+        assert entry.data == {"acres": 413765}
+        assert entry.tier == "authoritative"
+        assert restarted.stats()["disk_hits"] == 1
+
+    def test_newer_entry_from_other_worker_wins(self, tmp_path):
+        clock = FakeClock()
+        path = tmp_path / "fire-cache.db"
+        worker_a = FireDataCache(fresh_seconds=60, path=path, clock=clock)
+        worker_b = FireDataCache(fresh_seconds=60, path=path, clock=clock)
+
+        worker_a.put("mosquito", {"acres": 1}, tier="derived")
+        clock.now += 120  # worker_a's memory copy is no longer fresh
+        worker_b.put("mosquito", {"acres": 2}, tier="authoritative")
+
+        entry = worker_a.get("mosquito")
+
+        assert entry.data == {"acres": 2}
+        assert entry.tier == "authoritative"
+
+    def test_older_write_does_not_overwrite_newer_row(self, tmp_path):
+        clock = FakeClock()
+        path = tmp_path / "fire-cache.db"
+        cache = FireDataCache(path=path, clock=clock)
+        cache.put("mosquito", {"acres": 2}, tier="authoritative")
+
+        clock.now -= 10
+        FireDataCache(path=path, clock=clock).put("mosquito", {"acres": 1}, tier="derived")
+
+        assert FireDataCache(path=path, clock=clock).get("mosquito").data == {"acres": 2}
+
+    def test_wal_mode_enabled(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "fire-cache.db"
+        FireDataCache(path=path).put("a", {}, tier="derived")
+
+        mode = sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_clear_removes_disk_rows(self, tmp_path):
+        path = tmp_path / "fire-cache.db"
+        cache = FireDataCache(path=path)
+        cache.put("a", {}, tier="derived")
+        cache.clear()
+
+        assert FireDataCache(path=path).get("a") is None
+
+
+class TestAsyncAccess:
+    """Tests for aget() / aput(), used on the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_disk_access_runs_off_the_loop(self, tmp_path):
+        path = tmp_path / "fire-cache.db"
+        cache = FireDataCache(path=path)
+        loop_thread = threading.current_thread()
+        disk_threads = []
+        for name in ("_read_disk", "_write_disk"):
+            method = getattr(cache, name)
+
+            def recorded(*args, _method=method):
+                disk_threads.append(threading.current_thread())
+                return _method(*args)
+
+            setattr(cache, name, recorded)
+
+        await cache.aput("bootleg", {"acres": 413765}, tier="authoritative")
+        restarted = FireDataCache(path=path)
+        restarted._read_disk = cache._read_disk
+
+        assert (await restarted.aget("bootleg")).data == {"acres": 413765}
+        assert len(disk_threads) == 2
+        assert loop_thread not in disk_threads
+
+    @pytest.mark.asyncio
+    async def test_fresh_memory_hit_skips_disk(self, tmp_path):
+        cache = FireDataCache(path=tmp_path / "fire-cache.db")
+        await cache.aput("bootleg", {"acres": 1}, tier="derived")
+        cache._read_disk = lambda fire_id: pytest.fail("disk read on a fresh memory hit")
+
+        assert (await cache.aget("bootleg")).data == {"acres": 1}
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_in_memory_only(self):
+        cache = FireDataCache()
+        await cache.aput("bootleg", {"acres": 1}, tier="derived")
+
+        assert (await cache.aget("bootleg")).tier == "derived"
+        assert await cache.aget("mosquito") is None
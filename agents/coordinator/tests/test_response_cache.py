@@ -0,0 +1,300 @@
+"""
+Tests for the /api/v1/chat response cache.
+
+Verifies:
+- Key normalization (query whitespace/case, fire_context ordering)
+- LRU eviction and TTL expiry
+- Single-flight coalescing of concurrent identical requests, surviving
+  cancellation of the first caller
+- Failures are shared with waiters but never cached
+- Degraded and partial coordinator responses are not cached
+- Fixture version tagging
+"""
+
+import asyncio
+
+import pytest
+
+from coordinator.response_cache import (
+    FixtureVersion,
+    ResponseCache,
+    cacheable_response,
+    hash_fire_context,
+    normalize_query,
+)
+
+
+def returning(value):
+    """Build a compute coroutine factory that returns `value`."""
+    async def compute():
+        return value
+    return compute
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheKey:
+    """Tests for cache key construction."""
+
+    def test_normalize_query_collapses_case_and_whitespace(self):
+        assert normalize_query("  Prioritize   my\tFIRES ") == "prioritize my fires"
+
+    def test_fire_context_hash_ignores_key_order(self):
+        a = hash_fire_context({"fire_id": "cedar-creek", "phase": "baer_assessment"})
+        b = hash_fire_context({"phase": "baer_assessment", "fire_id": "cedar-creek"})
+        assert a == b
+        assert a != hash_fire_context({"fire_id": "bootleg"})
+
+    def test_empty_fire_context(self):
+        assert hash_fire_context(None) == hash_fire_context({})
+
+    def test_make_key_includes_fixture_version(self):
+        k1 = ResponseCache.make_key("Triage", None, "v1")
+        k2 = ResponseCache.make_key("triage", None, "v2")
+        assert k1[0] == k2[0]
+        assert k1 != k2
+
+
+class TestResponseCache:
+    """Tests for LRU + TTL behavior and counters."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self):
+        cache = ResponseCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"summary": "ok"}
+
+        key = cache.make_key("q", None, "v1")
+        first = await cache.get_or_compute(key, compute)
+        second = await cache.get_or_compute(key, compute)
+
+        assert first == second == {"summary": "ok"}
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl_seconds=10, clock=clock)
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return len(calls)
+
+        key = cache.make_key("q", None, "v1")
+        assert await cache.get_or_compute(key, compute) == 1
+        clock.now = 9.9
+        assert await cache.get_or_compute(key, compute) == 1
+        clock.now = 10.0
+        assert await cache.get_or_compute(key, compute) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+
+        keys = [cache.make_key(q, None, "v1") for q in ("a", "b", "c")]
+        await cache.get_or_compute(keys[0], returning("a"))
+        await cache.get_or_compute(keys[1], returning("b"))
+        # Touch "a" so "b" becomes least recently used
+        await cache.get_or_compute(keys[0], returning("unused"))
+        await cache.get_or_compute(keys[2], returning("c"))
+
+        assert cache.stats()["entries"] == 2
+        assert await cache.get_or_compute(keys[0], returning("new-a")) == "a"
+        assert await cache.get_or_compute(keys[1], returning("new-b")) == "new-b"
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_response_not_stored(self):
+        cache = ResponseCache()
+
+        async def compute():
+            return {"error": "boom"}
+
+        key = cache.make_key("q", None, "v1")
+        await cache.get_or_compute(key, compute, cacheable=lambda r: "error" not in r)
+
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.parametrize("response, cacheable", [
+        ({"summary": "ok", "portfolio": {"partial": False, "failed": []}}, True),
+        ({"summary": "ok"}, True),
+        ({"error": "boom"}, False),
+        ({"portfolio": {"partial": True, "failed": [], "timed_out": ["bootleg"]}}, False),
+        ({"portfolio": {"partial": False, "failed": ["bootleg"]}}, False),
+        ({"portfolio": {"partial": False, "failed": []},
+          "content": {"degradation_notice": "Bootleg: Using derived data from fixture summaries"}}, False),
+    ])
+    def test_cacheable_response(self, response, cacheable):
+        """Only complete, authoritative coordinator responses are cacheable."""
+        assert cacheable_response(response) is cacheable
+
+    @pytest.mark.asyncio
+    async def test_degraded_portfolio_not_stored(self):
+        """A portfolio served from fallback tiers is recomputed on the next request."""
+        from coordinator.implementation import CoordinatorService
+
+        async def nifc_down(fire_id):
+            raise RuntimeError("NIFC unavailable")
+
+        async def summary(fire_id):
+            return {"name": fire_id, "acres": 1000, "severity": "high", "phase": "active"}
+
+        service = CoordinatorService(
+            tools={"get_incident_metadata": nifc_down, "get_fire_summary": summary}
+        )
+        cache = ResponseCache()
+        key = cache.make_key("triage", None, "v1")
+
+        def compute():
+            return service.handle_portfolio_query("triage", {"fire_ids": ["bootleg"]})
+
+        response = await cache.get_or_compute(key, compute, cacheable=cacheable_response)
+        await cache.get_or_compute(key, compute, cacheable=cacheable_response)
+
+        assert "degradation_notice" in response["content"]
+        assert cache.stats()["misses"] == 2
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_storage(self):
+        cache = ResponseCache(ttl_seconds=0)
+
+        async def compute():
+            return "x"
+
+        key = cache.make_key("q", None, "v1")
+        await cache.get_or_compute(key, compute)
+        await cache.get_or_compute(key, compute)
+
+        assert cache.stats()["misses"] == 2
+
+
+class TestSingleFlight:
+    """Tests for request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_computation(self):
+        cache = ResponseCache()
+        calls = []
+        release = asyncio.Event()
+
+        async def compute():
+            calls.append(1)
+            await release.wait()
+            return {"summary": "triage"}
+
+        key = cache.make_key("Prioritize my portfolio", None, "v1")
+        tasks = [asyncio.create_task(cache.get_or_compute(key, compute)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert all(r == {"summary": "triage"} for r in results)
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 9
+        assert stats["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_first_caller_cancelled(self):
+        """Cancelling the request that started the computation doesn't fail the others."""
+        cache = ResponseCache()
+        calls = []
+        release = asyncio.Event()
+
+        async def compute():
+            calls.append(1)
+            await release.wait()
+            return {"summary": "triage"}
+
+        key = cache.make_key("Prioritize my portfolio", None, "v1")
+        first = asyncio.create_task(cache.get_or_compute(key, compute))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(cache.get_or_compute(key, compute))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+
+        assert await second == {"summary": "triage"}
+        assert len(calls) == 1
+        assert cache.stats()["entries"] == 1
+        assert cache.stats()["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_and_is_not_cached(self):
+        cache = ResponseCache()
+        release = asyncio.Event()
+        attempts = []
+
+        async def failing():
+            attempts.append(1)
+            await release.wait()
+            raise RuntimeError("upstream down")
+
+        key = cache.make_key("q", None, "v1")
+        tasks = [asyncio.create_task(cache.get_or_compute(key, failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(attempts) == 1
+
+        async def ok():
+            return "recovered"
+
+        assert await cache.get_or_compute(key, ok) == "recovered"
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_coalesced(self):
+        cache = ResponseCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return len(calls)
+
+        await asyncio.gather(
+            cache.get_or_compute(cache.make_key("a", None, "v1"), compute),
+            cache.get_or_compute(cache.make_key("b", None, "v1"), compute),
+        )
+
+        assert len(calls) == 2
+        assert cache.stats()["coalesced"] == 0
+
+
+class TestFixtureVersion:
+    """Tests for fixture version tagging."""
+
+    def test_version_changes_when_fixture_changes(self, tmp_path):
+        fixture = tmp_path / "cedar-creek" / "incident-metadata.json"
+        fixture.parent.mkdir()
+        fixture.write_text('{"acres": 1}')
+
+        version = FixtureVersion(tmp_path, recheck_seconds=0)
+        before = version.get()
+        fixture.write_text('{"acres": 12345}')
+
+        assert version.get() != before
+
+    def test_env_override(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FIXTURE_VERSION", "image-abc123")
+        assert FixtureVersion(tmp_path).get() == "image-abc123"
@@ -0,0 +1,91 @@
+"""
+Cold-start budget tests for the Coordinator agent.
+
+Imports coordinator.agent in a fresh interpreter (after warming the ADK
+framework itself) and fails if RANGER's own import cost exceeds the budget
+or if specialist module trees are imported eagerly.
+
+Budget override: RANGER_STARTUP_BUDGET_MS (default 150ms).
+Per-module breakdown: python scripts/import_time_report.py --first-party
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parents[3]
+STARTUP_BUDGET_MS = float(os.environ.get("RANGER_STARTUP_BUDGET_MS", 150))
+
+SPECIALIST_MODULES = [
+    "burn_analyst.agent",
+    "trail_assessor.agent",
+    "cruising_assistant.agent",
+    "nepa_advisor.agent",
+]
+
+# Framework warm-up: ADK defers most of its own imports to the first Agent
+# construction, which is not RANGER's cost and is excluded from the budget.
+MEASURE_SCRIPT = f"""
+import json, sys, time
+sys.path[:0] = [{str(PROJECT_ROOT / "agents")!r}, {str(PROJECT_ROOT)!r}]
+from google.adk.agents import Agent
+from google.adk.tools import AgentTool
+AgentTool(agent=Agent(name="warmup", model="gemini-2.0-flash", tools=[lambda: None]))._get_declaration()
+start = time.perf_counter()
+import coordinator.agent
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{
+    "elapsed_ms": elapsed_ms,
+    "loaded": [m for m in {SPECIALIST_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+@pytest.fixture(scope="module")
+def cold_start():
+    """Measure a cold coordinator import in a subprocess (best of 3)."""
+    pytest.importorskip("google.adk")
+    env = {**os.environ, "GOOGLE_API_KEY": os.environ.get("GOOGLE_API_KEY", "startup-budget")}
+    runs = []
+    for _ in range(3):
+        proc = subprocess.run(
+            [sys.executable, "-c", MEASURE_SCRIPT],
+            cwd=PROJECT_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert proc.returncode == 0, proc.stderr[-2000:]
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return min(runs, key=lambda r: r["elapsed_ms"])
+
+
+def test_specialists_not_imported_at_startup(cold_start):
+    """Specialist agent modules load on first invocation, not at import."""
+    assert cold_start["loaded"] == []
+
+
+def test_coordinator_import_within_budget(cold_start):
+    """RANGER's share of coordinator import stays within the startup budget."""
+    assert cold_start["elapsed_ms"] <= STARTUP_BUDGET_MS, (
+        f"coordinator.agent import took {cold_start['elapsed_ms']:.0f}ms "
+        f"(budget {STARTUP_BUDGET_MS:.0f}ms)"
+    )
+
+
+def test_lazy_tool_descriptions_match_specialists():
+    """Stub descriptions advertised to the model match the real agents."""
+    pytest.importorskip("google.adk")
+    from agents.coordinator.agent import root_agent
+    from agents._shared.lazy_agent_tool import LazyAgentTool
+
+    lazy_tools = [t for t in root_agent.tools if isinstance(t, LazyAgentTool)]
+    assert len(lazy_tools) == 4
+
+    for tool in lazy_tools:
+        assert tool.agent.description == tool.description
@@ -20,33 +20,24 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-# Add skill scripts to path for dynamic loading
+# Skill directories; tools run their scripts off the event loop (run_skill)
 SKILLS_DIR = Path(__file__).parent / "skills"
+METHODOLOGY_SKILL = SKILLS_DIR / "cruise-methodology"
+VOLUME_SKILL = SKILLS_DIR / "volume-estimation"
+SALVAGE_SKILL = SKILLS_DIR / "salvage-assessment"
+CSV_SKILL = SKILLS_DIR / "csv-insight"
+
+from agents._shared.skill_runner import run_skill
 
 # Add agent directory to path for local imports (timber_rag_query)
 if str(Path(__file__).parent) not in sys.path:
     sys.path.insert(0, str(Path(__file__).parent))
 
-# Cruise Methodology skill
-METHODOLOGY_PATH = SKILLS_DIR / "cruise-methodology" / "scripts"
-if METHODOLOGY_PATH.exists():
-    sys.path.insert(0, str(METHODOLOGY_PATH))
-
-# Volume Estimation skill
-VOLUME_PATH = SKILLS_DIR / "volume-estimation" / "scripts"
-if VOLUME_PATH.exists():
-    sys.path.insert(0, str(VOLUME_PATH))
-
-# Salvage Assessment skill
-SALVAGE_PATH = SKILLS_DIR / "salvage-assessment" / "scripts"
-if SALVAGE_PATH.exists():
-    sys.path.insert(0, str(SALVAGE_PATH))
-
 # Import RAG/File Search tool
 from timber_rag_query import query_timber_infrastructure_knowledge
 
 
-def recommend_methodology(
+async def recommend_methodology(
     fire_id: str,
     sector: str | None = None,
     stand_type: str | None = None,
@@ -87,8 +78,7 @@ def recommend_methodology(
             - confidence: Recommendation confidence (0-1)
             - recommendations: Implementation guidance
     """
-    from recommend_methodology import execute
-    return execute({
+    return await run_skill(METHODOLOGY_SKILL, "recommend_methodology", {
         "fire_id": fire_id,
         "sector": sector,
         "stand_type": stand_type,
@@ -101,7 +91,7 @@ def recommend_methodology(
     })
 
 
-def estimate_volume(
+async def estimate_volume(
     fire_id: str,
     plot_id: str = "",
     trees_json: str = "[]",
@@ -137,11 +127,9 @@ def estimate_volume(
             - recommendations: Volume utilization guidance
     """
     import json
-    from estimate_volume import execute
-
     trees = json.loads(trees_json) if trees_json else None
 
-    return execute({
+    return await run_skill(VOLUME_SKILL, "estimate_volume", {
         "fire_id": fire_id,
         "plot_id": plot_id if plot_id else None,
         "trees": trees,
@@ -151,7 +139,7 @@ def estimate_volume(
     })
 
 
-def assess_salvage(
+async def assess_salvage(
     fire_id: str,
     fire_date: str = "",
     assessment_date: str = "",
@@ -185,8 +173,6 @@ def assess_salvage(
             - recommendations: Operational harvest guidance
     """
     import json
-    from assess_salvage import execute
-
     plots = json.loads(plots_json) if plots_json else None
 
     # Build inputs dict, only including parameters that are provided
@@ -204,10 +190,10 @@ def assess_salvage(
     if assessment_date:
         inputs["assessment_date"] = assessment_date
 
-    return execute(inputs)
+    return await run_skill(SALVAGE_SKILL, "assess_salvage", inputs)
 
 
-def analyze_csv_data(
+async def analyze_csv_data(
     file_path: str,
     analysis_type: str = "summary",
     group_by: str = "",
@@ -242,11 +228,9 @@ def analyze_csv_data(
             - error: Error message if analysis failed
     """
     import json
-    from analyze_csv import execute
-
     filter_dict = json.loads(filters) if filters else {}
 
-    return execute({
+    return await run_skill(CSV_SKILL, "analyze_csv", {
         "file_path": file_path,
         "analysis_type": analysis_type,
         "group_by": group_by if group_by else None,
@@ -33,28 +33,14 @@ if str(AGENT_DIR) not in sys.path:
 # Import File Search tool
 from file_search import consult_mandatory_nepa_standards
 
-# Add skill scripts to path for dynamic loading
+# Skill directories; tools run their scripts off the event loop (run_skill)
 SKILLS_DIR = Path(__file__).parent / "skills"
+PATHWAY_SKILL = SKILLS_DIR / "pathway-decision"
+DOCUMENTATION_SKILL = SKILLS_DIR / "documentation"
+TIMELINE_SKILL = SKILLS_DIR / "compliance-timeline"
+PDF_EXTRACTION_SKILL = SKILLS_DIR / "pdf-extraction"
 
-# Pathway Decision skill
-PATHWAY_PATH = SKILLS_DIR / "pathway-decision" / "scripts"
-if PATHWAY_PATH.exists():
-    sys.path.insert(0, str(PATHWAY_PATH))
-
-# Documentation skill
-DOCUMENTATION_PATH = SKILLS_DIR / "documentation" / "scripts"
-if DOCUMENTATION_PATH.exists():
-    sys.path.insert(0, str(DOCUMENTATION_PATH))
-
-# Compliance Timeline skill
-TIMELINE_PATH = SKILLS_DIR / "compliance-timeline" / "scripts"
-if TIMELINE_PATH.exists():
-    sys.path.insert(0, str(TIMELINE_PATH))
-
-# PDF Extraction skill
-PDF_EXTRACTION_PATH = SKILLS_DIR / "pdf-extraction" / "scripts"
-if PDF_EXTRACTION_PATH.exists():
-    sys.path.insert(0, str(PDF_EXTRACTION_PATH))
+from agents._shared.skill_runner import run_skill
 
 # Template Lookup skill (Template-First with RAG Fallback pattern)
 from skills.template_lookup import (
@@ -64,7 +50,7 @@ from skills.template_lookup import (
 )
 
 
-def decide_pathway(fire_id: str, action_type: str, acres: float, project_context: str = "{}") -> dict:
+async def decide_pathway(fire_id: str, action_type: str, acres: float, project_context: str = "{}") -> dict:
     """
     Determine appropriate NEPA pathway (CE/EA/EIS) for a proposed action.
 
@@ -84,9 +70,8 @@ def decide_pathway(fire_id: str, action_type: str, acres: float, project_context
         circumstances, and compliance guidance.
     """
     import json
-    from decide_pathway import execute
     ctx = json.loads(project_context) if project_context else {}
-    return execute({
+    return await run_skill(PATHWAY_SKILL, "decide_pathway", {
         "fire_id": fire_id,
         "action_type": action_type,
         "acres": acres,
@@ -94,7 +79,7 @@ def decide_pathway(fire_id: str, action_type: str, acres: float, project_context
     })
 
 
-def generate_documentation_checklist(fire_id: str, pathway: str, action_type: str, project_context: str = "{}") -> dict:
+async def generate_documentation_checklist(fire_id: str, pathway: str, action_type: str, project_context: str = "{}") -> dict:
     """
     Generate documentation checklist for a NEPA pathway.
 
@@ -114,9 +99,8 @@ def generate_documentation_checklist(fire_id: str, pathway: str, action_type: st
         consultation requirements, and workflow recommendations.
     """
     import json
-    from generate_checklist import execute
     ctx = json.loads(project_context) if project_context else {}
-    return execute({
+    return await run_skill(DOCUMENTATION_SKILL, "generate_checklist", {
         "fire_id": fire_id,
         "pathway": pathway,
         "action_type": action_type,
@@ -124,7 +108,7 @@ def generate_documentation_checklist(fire_id: str, pathway: str, action_type: st
     })
 
 
-def estimate_compliance_timeline(fire_id: str, pathway: str, consultations: str = "[]", start_date: str = "") -> dict:
+async def estimate_compliance_timeline(fire_id: str, pathway: str, consultations: str = "[]", start_date: str = "") -> dict:
     """
     Estimate compliance timeline for a NEPA pathway.
 
@@ -142,9 +126,8 @@ def estimate_compliance_timeline(fire_id: str, pathway: str, consultations: str
         Dictionary containing timeline estimate, milestones, and recommendations.
     """
     import json
-    from estimate_timeline import execute
     consult_list = json.loads(consultations) if consultations else []
-    return execute({
+    return await run_skill(TIMELINE_SKILL, "estimate_timeline", {
         "fire_id": fire_id,
         "pathway": pathway,
         "consultations": consult_list,
@@ -152,7 +135,7 @@ def estimate_compliance_timeline(fire_id: str, pathway: str, consultations: str
     })
 
 
-def extract_pdf_content(
+async def extract_pdf_content(
     file_path: str,
     extraction_mode: str = "full",
     section_number: str = "",
@@ -186,8 +169,6 @@ def extract_pdf_content(
         - citations: Page/section references for traceability
         - error: Error message if extraction failed
     """
-    from extract_pdf import execute
-
     inputs = {
         "file_path": file_path,
         "extraction_mode": extraction_mode,
@@ -199,7 +180,7 @@ def extract_pdf_content(
         inputs["start_page"] = start_page
         inputs["end_page"] = end_page if end_page > 0 else start_page
 
-    return execute(inputs)
+    return await run_skill(PDF_EXTRACTION_SKILL, "extract_pdf", inputs)
 
 
 # =============================================================================
@@ -26,33 +26,23 @@ if str(PROJECT_ROOT) not in sys.path:
 # Configure audit logging
 logger = logging.getLogger("ranger.trail_assessor")
 
-# Add skill scripts to path for dynamic loading
+# Skill directories; tools run their scripts off the event loop (run_skill)
 SKILLS_DIR = Path(__file__).parent / "skills"
+DAMAGE_SKILL = SKILLS_DIR / "damage-classification"
+CLOSURE_SKILL = SKILLS_DIR / "closure-decision"
+PRIORITY_SKILL = SKILLS_DIR / "recreation-priority"
+
+from agents._shared.skill_runner import run_skill
 
 # Add agent directory to path for local imports (rag_query)
 if str(Path(__file__).parent) not in sys.path:
     sys.path.insert(0, str(Path(__file__).parent))
 
-# Trail Classification skill
-CLASSIFICATION_PATH = SKILLS_DIR / "trail-classification" / "scripts"
-if CLASSIFICATION_PATH.exists():
-    sys.path.insert(0, str(CLASSIFICATION_PATH))
-
-# Closure Evaluation skill
-CLOSURE_PATH = SKILLS_DIR / "closure-evaluation" / "scripts"
-if CLOSURE_PATH.exists():
-    sys.path.insert(0, str(CLOSURE_PATH))
-
-# Priority Assessment skill
-PRIORITY_PATH = SKILLS_DIR / "trail-priority" / "scripts"
-if PRIORITY_PATH.exists():
-    sys.path.insert(0, str(PRIORITY_PATH))
-
 # Import RAG/File Search tool
 from trail_rag_query import query_trail_infrastructure_knowledge
 
 
-def classify_damage(fire_id: str, trail_id: str = "", damage_points_json: str = "[]") -> dict:
+async def classify_damage(fire_id: str, trail_id: str = "", damage_points_json: str = "[]") -> dict:
     """
     Classify trail damage into USFS Type I-IV categories.
 
@@ -80,16 +70,15 @@ def classify_damage(fire_id: str, trail_id: str = "", damage_points_json: str =
             - recommendations: Damage mitigation recommendations
     """
     import json
-    from classify_damage import execute
     damage_points = json.loads(damage_points_json) if damage_points_json and damage_points_json != "[]" else None
-    return execute({
+    return await run_skill(DAMAGE_SKILL, "classify_damage", {
         "fire_id": fire_id,
         "trail_id": trail_id if trail_id else None,
         "damage_points": damage_points,
     })
 
 
-def evaluate_closure(fire_id: str, trail_id: str = "", season: str = "summer") -> dict:
+async def evaluate_closure(fire_id: str, trail_id: str = "", season: str = "summer") -> dict:
     """
     Determine risk-based trail closure recommendations.
 
@@ -114,15 +103,14 @@ def evaluate_closure(fire_id: str, trail_id: str = "", season: str = "summer") -
             - data_sources: Sources used
             - recommendations: Closure and reopening recommendations
     """
-    from evaluate_closure import execute
-    return execute({
+    return await run_skill(CLOSURE_SKILL, "evaluate_closure", {
         "fire_id": fire_id,
         "trail_id": trail_id if trail_id else None,
         "season": season,
     })
 
 
-def prioritize_trails(fire_id: str, budget: float = 0.0, include_quick_wins: bool = True) -> dict:
+async def prioritize_trails(fire_id: str, budget: float = 0.0, include_quick_wins: bool = True) -> dict:
     """
     Prioritize trail repairs using multi-factor analysis.
 
@@ -147,8 +135,7 @@ def prioritize_trails(fire_id: str, budget: float = 0.0, include_quick_wins: boo
             - data_sources: Sources used
             - recommendations: Repair sequencing recommendations
     """
-    from prioritize_trails import execute
-    return execute({
+    return await run_skill(PRIORITY_SKILL, "prioritize_trails", {
         "fire_id": fire_id,
         "budget": budget if budget > 0 else None,
         "include_quick_wins": include_quick_wins,
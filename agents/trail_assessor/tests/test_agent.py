@@ -46,3 +46,11 @@ def test_agent_has_instruction(agent_module):
 def test_agent_uses_correct_model(agent_module):
     """Agent should use gemini-2.0-flash model."""
     assert agent_module.root_agent.model == "gemini-2.0-flash"
+
+
+async def test_classify_damage_tool_works(agent_module):
+    """The classify_damage tool should run the damage-classification skill."""
+    result = await agent_module.classify_damage(fire_id="cedar-creek-2022")
+
+    assert result["fire_id"] == "cedar-creek-2022"
+    assert "reasoning_chain" in result
@@ -14,6 +14,9 @@ Run locally:
   # or
   uvicorn main:app --host 0.0.0.0 --port 8000 --reload
 
+Run in production (pre-forked workers, no file watcher):
+  SERVE_MODE=production WEB_CONCURRENCY=4 python main.py
+
 Run with ADK web UI (for development):
   adk web --port 8000
 
@@ -23,23 +26,50 @@ Environment variables:
   SESSION_SERVICE_URI - Optional Firestore session backend (Phase 2)
     Example: firestore://projects/ranger-twin-dev/databases/default
   ALLOW_ORIGINS - CORS allowed origins (comma-separated)
+  SERVE_MODE - "development" (default, auto-reload) or "production"
+  WEB_CONCURRENCY - Number of worker processes in production mode (default: 1)
+  TIMEOUT_KEEP_ALIVE - Idle keep-alive timeout in seconds (default: 75)
+  LIMIT_CONCURRENCY - Max concurrent connections per worker before 503 (default: unlimited;
+    Cloud Run's --concurrency already caps requests per instance)
+  BACKLOG - Listen socket backlog (default: 2048)
+  PRELOAD_SPECIALISTS - Import every specialist before forking workers instead of on first use (default: false)
+  CHAT_CACHE_TTL_SECONDS - /api/v1/chat response cache lifetime (default: 30, 0 = off)
+  CHAT_CACHE_MAX_ENTRIES - /api/v1/chat response cache size (default: 256)
+  FIXTURE_VERSION - Fixture data version tag for cache keys (default: derived from mtimes)
+  TRIAGE_MAX_CONCURRENCY - Concurrent fire assessments in portfolio triage (default: 8)
+  TRIAGE_DEADLINE_SECONDS - Portfolio triage response deadline (default: 8)
+  TRIAGE_HEDGE_AFTER_SECONDS - Hedge slow Tier 1 calls after this delay (default: off)
+  FIRE_CACHE_PATH - SQLite file for the shared Tier 3 fire cache (default: in-process only)
+  FIRE_CACHE_FRESH_SECONDS - Age before cached fire data is revalidated (default: 300)
+  FIRE_CACHE_MAX_ENTRIES - In-process fire cache size (default: 1024)
+  AUDIT_STREAM_QUEUE_SIZE - Audit events buffered per /run_sse_enhanced client (default: 256)
+  SKILL_CPU_WORKERS - Worker processes for cpu-class skills per server worker (default: 1)
 """
 
+import gc
+import inspect
 import os
+import signal
+import socket
+import time
 import logging
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Optional, List, Any, get_type_hints
 
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from google.adk.cli.fast_api import get_fast_api_app
+from google.adk.cli.utils.agent_loader import AgentLoader
 
-# Import legacy CoordinatorService for /api/v1/chat compatibility
-# We add agents/ to path so imports within implementation.py work
+# Legacy CoordinatorService for /api/v1/chat compatibility is imported on
+# first use (see get_coordinator_service). We add agents/ to path so imports
+# within implementation.py work
 import sys
 AGENTS_DIR_FOR_PATH = str(Path(__file__).parent / "agents")
 if AGENTS_DIR_FOR_PATH not in sys.path:
     sys.path.insert(0, AGENTS_DIR_FOR_PATH)
-from coordinator.implementation import CoordinatorService
+from coordinator.response_cache import FixtureVersion, ResponseCache, cacheable_response
+from agents._shared.audit_bridge import get_audit_bridge, interleave_audit_events
 
 class ChatRequest(BaseModel):
     """Legacy chat request model for frontend compatibility."""
@@ -62,6 +92,68 @@ SESSION_SERVICE_URI = os.environ.get(
 )
 ALLOW_ORIGINS = os.environ.get("ALLOW_ORIGINS", "*").split(",")
 
+# Serving configuration (see serve_production)
+SERVE_MODE = os.environ.get("SERVE_MODE", "development").lower()
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", 1))
+TIMEOUT_KEEP_ALIVE = int(os.environ.get("TIMEOUT_KEEP_ALIVE", 75))
+LIMIT_CONCURRENCY = int(os.environ["LIMIT_CONCURRENCY"]) if os.environ.get("LIMIT_CONCURRENCY") else None
+BACKLOG = int(os.environ.get("BACKLOG", 2048))
+PRELOAD_SPECIALISTS = os.environ.get("PRELOAD_SPECIALISTS", "false").lower() == "true"
+
+# /api/v1/chat response cache (per worker)
+CHAT_CACHE_TTL_SECONDS = float(os.environ.get("CHAT_CACHE_TTL_SECONDS", 30))
+CHAT_CACHE_MAX_ENTRIES = int(os.environ.get("CHAT_CACHE_MAX_ENTRIES", 256))
+FIXTURES_DIR = Path(__file__).parent / "data" / "fixtures"
+
+# Portfolio triage fan-out (see CoordinatorService.handle_portfolio_query)
+TRIAGE_MAX_CONCURRENCY = int(os.environ.get("TRIAGE_MAX_CONCURRENCY", 8))
+TRIAGE_DEADLINE_SECONDS = float(os.environ.get("TRIAGE_DEADLINE_SECONDS", 8))
+TRIAGE_HEDGE_AFTER_SECONDS = (
+    float(os.environ["TRIAGE_HEDGE_AFTER_SECONDS"])
+    if os.environ.get("TRIAGE_HEDGE_AFTER_SECONDS") else None
+)
+
+# Tier 3 fire cache (shared by workers on an instance when FIRE_CACHE_PATH is set)
+FIRE_CACHE_PATH = os.environ.get("FIRE_CACHE_PATH") or None
+FIRE_CACHE_FRESH_SECONDS = float(os.environ.get("FIRE_CACHE_FRESH_SECONDS", 300))
+FIRE_CACHE_MAX_ENTRIES = int(os.environ.get("FIRE_CACHE_MAX_ENTRIES", 1024))
+
+# Proof-layer SSE (see /run_sse_enhanced)
+AUDIT_STREAM_QUEUE_SIZE = int(os.environ.get("AUDIT_STREAM_QUEUE_SIZE", 256))
+
+# Agents served by this orchestrator (ADR-008: single service, AgentTool pattern)
+SERVED_AGENTS = [
+    "coordinator",
+    "burn_analyst",
+    "trail_assessor",
+    "cruising_assistant",
+    "nepa_advisor",
+]
+
+# Shared loader so agents preloaded before fork are the ones ADK serves
+agent_loader = AgentLoader(AGENTS_DIR)
+
+_coordinator_service = None
+
+
+def get_coordinator_service():
+    """Create the legacy CoordinatorService on first use."""
+    global _coordinator_service
+    if _coordinator_service is None:
+        from coordinator.fire_cache import FireDataCache
+        from coordinator.implementation import CoordinatorService
+        _coordinator_service = CoordinatorService(
+            max_concurrency=TRIAGE_MAX_CONCURRENCY,
+            deadline_seconds=TRIAGE_DEADLINE_SECONDS,
+            hedge_after_seconds=TRIAGE_HEDGE_AFTER_SECONDS,
+            fire_cache=FireDataCache(
+                max_entries=FIRE_CACHE_MAX_ENTRIES,
+                fresh_seconds=FIRE_CACHE_FRESH_SECONDS,
+                path=FIRE_CACHE_PATH,
+            ),
+        )
+    return _coordinator_service
+
 # Log configuration
 logger.info(f"RANGER ADK Orchestrator starting...")
 logger.info(f"Agents directory: {AGENTS_DIR}")
@@ -79,6 +171,7 @@ def create_app():
         # - Session management via session_service_uri
         app = get_fast_api_app(
             agents_dir=AGENTS_DIR,
+            agent_loader=agent_loader,
             session_service_uri=SESSION_SERVICE_URI,
             allow_origins=ALLOW_ORIGINS,
             web=False,  # Disable built-in UI, use our React console
@@ -106,33 +199,64 @@ def create_app():
                 "description": "Multi-agent post-fire forest recovery platform",
                 "endpoints": {
                     "POST /run_sse": "Stream agent responses via SSE",
+                    "POST /run_sse_enhanced": "SSE stream with proof-layer audit events",
                     "GET /health": "Health check",
+                    "POST /api/v1/chat": "Legacy chat (cached, coalesced)",
+                    "GET /api/v1/chat/cache": "Chat response cache counters",
                 },
-                "agents": [
-                    "coordinator",
-                    "burn_analyst",
-                    "trail_assessor",
-                    "cruising_assistant",
-                    "nepa_advisor"
-                ]
+                "agents": SERVED_AGENTS
             }
 
+        # Proof-layer SSE: ADK's /run_sse stream with audit events interleaved
+        # as the agents' tool callbacks record them (ADR-007.1 audit bridge,
+        # keyed by session_id). Takes the same request body as /run_sse.
+        run_sse = next(r for r in app.routes if getattr(r, "path", None) == "/run_sse").endpoint
+        RunRequest = get_type_hints(run_sse)[next(iter(inspect.signature(run_sse).parameters))]
+
+        @app.post("/run_sse_enhanced")
+        async def run_sse_enhanced(req: RunRequest):
+            """Stream agent responses via SSE with audit events as they happen."""
+            response = await run_sse(req)
+            if not isinstance(response, StreamingResponse):
+                return response
+
+            async def stream():
+                # Subscribed before ADK's generator starts, so no event is missed
+                with get_audit_bridge().subscribe(req.session_id, max_queue=AUDIT_STREAM_QUEUE_SIZE) as subscription:
+                    async for chunk in interleave_audit_events(response.body_iterator, subscription):
+                        yield chunk
+
+            return StreamingResponse(stream(), media_type="text/event-stream")
+
         # Legacy /api/v1/chat endpoint for Phase 1 frontend compatibility
-        coordinator_service = CoordinatorService()
+        # Identical queries (same fire context and fixture data) share one
+        # cached / in-flight response - see coordinator/response_cache.py
+        chat_cache = ResponseCache(
+            max_entries=CHAT_CACHE_MAX_ENTRIES,
+            ttl_seconds=CHAT_CACHE_TTL_SECONDS,
+        )
+        fixture_version = FixtureVersion(FIXTURES_DIR)
 
         @app.post("/api/v1/chat")
         async def legacy_chat(request: ChatRequest):
             """Legacy chat endpoint that routes to CoordinatorService."""
             logger.info(f"Legacy chat request: {request.query[:100]}...")
-            
-            result = await coordinator_service.handle_message(
-                query=request.query,
-                context={
-                    "session_id": request.session_id,
-                    "fire_context": request.fire_context
-                }
+
+            key = chat_cache.make_key(
+                request.query, request.fire_context, fixture_version.get()
+            )
+            result = await chat_cache.get_or_compute(
+                key,
+                lambda: get_coordinator_service().handle_message(
+                    query=request.query,
+                    context={
+                        "session_id": request.session_id,
+                        "fire_context": request.fire_context
+                    }
+                ),
+                cacheable=cacheable_response,
             )
-            
+
             # Map CoordinatorService response to frontend expected format
             return {
                 "success": True,
@@ -147,6 +271,11 @@ def create_app():
                 "processingTimeMs": result.get("processing_time_ms", 0)
             }
 
+        @app.get("/api/v1/chat/cache")
+        async def chat_cache_stats():
+            """Response cache counters (hits, misses, coalesced) for this worker."""
+            return chat_cache.stats()
+
         logger.info("FastAPI app created successfully")
         return app
 
@@ -155,8 +284,173 @@ def create_app():
         raise
 
 
-# Create the app instance
-app = create_app()
+# Create the app instance. Skill worker processes (agents/_shared/skill_runner.py)
+# are spawned, so they import this module as __mp_main__; they don't serve
+app = create_app() if __name__ != "__mp_main__" else None
+
+
+def preload_agents(specialists: bool = PRELOAD_SPECIALISTS) -> list[str]:
+    """
+    Load agents into the shared loader cache before workers fork.
+
+    By default only the coordinator is loaded; its specialist tools stay
+    LazyAgentTool stubs and import on first use, in the worker. With
+    `specialists` (PRELOAD_SPECIALISTS=true) every served agent and lazy
+    tool is imported here and shared copy-on-write by the workers.
+
+    Returns:
+        Names of the agents loaded
+    """
+    names = SERVED_AGENTS if specialists else SERVED_AGENTS[:1]
+    for agent_name in names:
+        agent = agent_loader.load_agent(agent_name)
+        if specialists:
+            from agents._shared.lazy_agent_tool import preload_lazy_tools
+
+            preload_lazy_tools(getattr(agent, "tools", []))
+    logger.info(f"Preloaded agents: {', '.join(names)}")
+    return names
+
+
+# Production worker respawn: a worker that exits within WORKER_MIN_UPTIME_SECONDS
+# is a fast crash; each consecutive one doubles the respawn delay, and after
+# WORKER_MAX_FAST_CRASHES the master stops so the platform restarts the instance
+WORKER_MIN_UPTIME_SECONDS = 10.0
+WORKER_MAX_FAST_CRASHES = 5
+WORKER_RESPAWN_BASE_DELAY = 0.5
+WORKER_RESPAWN_MAX_DELAY = 8.0
+
+
+def _respawn_delay(fast_crashes: int) -> float:
+    """Seconds to wait before replacing a worker after `fast_crashes` consecutive fast crashes."""
+    if fast_crashes <= 0:
+        return 0.0
+    return min(WORKER_RESPAWN_BASE_DELAY * 2 ** (fast_crashes - 1), WORKER_RESPAWN_MAX_DELAY)
+
+
+def _build_server_config(host: str, port: int):
+    """Build the uvicorn config used by each production worker."""
+    import uvicorn
+
+    return uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        reload=False,
+        timeout_keep_alive=TIMEOUT_KEEP_ALIVE,
+        limit_concurrency=LIMIT_CONCURRENCY,
+        backlog=BACKLOG,
+        log_level="info",
+    )
+
+
+def serve_production(host: str, port: int, workers: int) -> None:
+    """
+    Run the orchestrator with pre-forked workers.
+
+    The master binds the listen socket, preloads agents, then forks
+    `workers` children that each run a uvicorn server on the inherited
+    socket. Crashed workers are replaced, with backoff when they crash
+    right after starting; after WORKER_MAX_FAST_CRASHES in a row the master
+    stops the rest and exits 1. SIGTERM/SIGINT are forwarded to all workers
+    for graceful shutdown (Cloud Run sends SIGTERM).
+
+    Args:
+        host: Bind address
+        port: Bind port
+        workers: Number of worker processes (1 = serve in-process, no fork)
+    """
+    import uvicorn
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(BACKLOG)
+    sock.set_inheritable(True)
+
+    preload_agents()
+
+    # Move everything loaded so far into the permanent generation so the
+    # collector never touches (and un-shares) those pages in the workers
+    gc.collect()
+    gc.freeze()
+
+    if workers <= 1:
+        logger.info(f"Serving on {host}:{port} (1 worker)")
+        uvicorn.Server(_build_server_config(host, port)).run(sockets=[sock])
+        return
+
+    children: dict[int, float] = {}  # pid -> start time (monotonic)
+    shutting_down = False
+    failed = False
+    fast_crashes = 0
+
+    def spawn_worker() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            exit_code = 0
+            try:
+                uvicorn.Server(_build_server_config(host, port)).run(sockets=[sock])
+            except Exception:
+                logger.exception("Worker crashed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        children[pid] = time.monotonic()
+
+    def shutdown(signum, frame):
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                children.pop(pid, None)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    logger.info(f"Serving on {host}:{port} ({workers} workers, pid {os.getpid()})")
+    for _ in range(workers):
+        spawn_worker()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        started = children.pop(pid, None)
+        if shutting_down or started is None:
+            continue
+
+        uptime = time.monotonic() - started
+        fast_crashes = fast_crashes + 1 if uptime < WORKER_MIN_UPTIME_SECONDS else 0
+        if fast_crashes >= WORKER_MAX_FAST_CRASHES:
+            logger.error(
+                f"Worker {pid} exited with status {status} after {uptime:.1f}s; "
+                f"{fast_crashes} fast crashes in a row, giving up"
+            )
+            shutdown(signal.SIGTERM, None)
+            failed = True
+            continue
+
+        delay = _respawn_delay(fast_crashes)
+        logger.warning(
+            f"Worker {pid} exited with status {status} after {uptime:.1f}s, restarting in {delay:g}s"
+        )
+        time.sleep(delay)
+        if not shutting_down:
+            spawn_worker()
+
+    sock.close()
+    if failed:
+        logger.error("Workers keep crashing, exiting")
+        sys.exit(1)
+    logger.info("All workers stopped")
 
 
 if __name__ == "__main__":
@@ -165,11 +459,14 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
 
-    logger.info(f"Starting server on {host}:{port}")
-    uvicorn.run(
-        "main:app",
-        host=host,
-        port=port,
-        reload=True,
-        log_level="info"
-    )
+    if SERVE_MODE == "production":
+        serve_production(host, port, WEB_CONCURRENCY)
+    else:
+        logger.info(f"Starting server on {host}:{port}")
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            reload=True,
+            log_level="info"
+        )
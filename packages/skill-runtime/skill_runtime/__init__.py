@@ -7,7 +7,8 @@ Provides testing infrastructure for deterministic skill validation.
 Phase 2 Implementation (Hybrid Approach):
 - MCPMockProvider for fixture injection in tests
 - Basic skill discovery and loading
-- Script execution support
+- Script execution support, sync or async on io threads / cpu worker processes
+- Record/replay cassettes of MCP tool calls
 
 Deferred to Phase 3:
 - Full SkillTestHarness wrapper
@@ -18,12 +19,24 @@ Deferred to Phase 3:
 __version__ = "0.2.0"
 
 from .loader import (
+    SkillManifest,
     SkillMetadata,
+    clear_skill_cache,
     discover_skills,
     execute_skill,
     load_skill_script,
     parse_skill_md,
 )
+from .executor import (
+    SkillExecutor,
+    execute_skill_async,
+    get_skill_executor,
+    shutdown_skill_executor,
+)
+from .cassette import (
+    Cassette,
+    CassettePlayer,
+)
 from .testing import (
     MCPMockProvider,
     SkillExecutionContext,
@@ -31,12 +44,21 @@ from .testing import (
 
 __all__ = [
     # Loader
+    "SkillManifest",
     "SkillMetadata",
+    "clear_skill_cache",
     "discover_skills",
     "execute_skill",
     "load_skill_script",
     "parse_skill_md",
+    # Executor
+    "SkillExecutor",
+    "execute_skill_async",
+    "get_skill_executor",
+    "shutdown_skill_executor",
     # Testing
+    "Cassette",
+    "CassettePlayer",
     "MCPMockProvider",
     "SkillExecutionContext",
 ]
@@ -0,0 +1,396 @@
+"""
+RANGER Skill Runtime - Skill Benchmark Suite
+
+Performance baselines for every skill script, offline (no LLM, no network):
+
+    python -m skill_runtime.bench run --output skill-baseline.json
+    python -m skill_runtime.bench compare skill-baseline.json skill-current.json
+
+`run` discovers skills, builds cases from each skill's fixtures (the
+**Input:** JSON blocks under "## Examples" in skill.md and the "input" /
+"examples[].input" entries of examples/*.json, where string values naming a
+file inside the skill folder are made absolute), adds scaled synthetic
+cases by repeating the fixture's lists of records, and measures each case
+in a fresh worker process:
+
+- wall_ms / cpu_ms:  median over --repeats calls, after one warm-up call
+- peak_rss_kb:       peak resident set size of the worker process
+- alloc_peak_kb:     tracemalloc peak during one call
+- alloc_blocks:      memory blocks allocated by that call and still live
+                     when it returns (the result included)
+
+`compare` flags a case when a metric grew by more than --threshold
+(relative) and by more than the metric's noise floor (absolute), when a
+case that used to run now raises, or when it is missing from the current
+run. It exits 1 if anything regressed.
+"""
+
+import argparse
+import copy
+import json
+import logging
+import multiprocessing
+import platform
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .loader import SkillMetadata, _split_sections, discover_skills, execute_skill
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BASELINE_VERSION = 1
+DEFAULT_SCALES = (10, 100)
+DEFAULT_THRESHOLD = 0.25
+
+# Absolute growth below which a metric change is treated as noise
+NOISE_FLOORS = {
+    "wall_ms": 0.5,
+    "cpu_ms": 0.5,
+    "peak_rss_kb": 2048,
+    "alloc_peak_kb": 64,
+    "alloc_blocks": 100,
+}
+
+_INPUT_BLOCK = re.compile(r"\*\*Input:?\*\*:?\s*```json\s*\n(.*?)```", re.DOTALL)
+
+
+def skill_id(skill: SkillMetadata) -> str:
+    """Short stable name: agents/burn_analyst/skills/x -> burn_analyst/x."""
+    parent = skill.path.parent
+    owner = parent.parent.name if parent.name == "skills" else parent.name
+    return f"{owner}/{skill.path.name}"
+
+
+def load_fixtures(skill: SkillMetadata) -> dict[str, dict]:
+    """Fixture inputs by case name, from skill.md examples and examples/*.json."""
+    fixtures = {}
+
+    _, sections = _split_sections((skill.path / "skill.md").read_text())
+    examples = "\n".join(sections.get("Examples", []))
+    for i, block in enumerate(_INPUT_BLOCK.findall(examples), start=1):
+        try:
+            fixtures[f"example-{i}"] = json.loads(block)
+        except ValueError:
+            continue  # Illustrative, not valid JSON
+
+    for path in sorted((skill.path / "examples").glob("*.json")):
+        try:
+            data = json.loads(path.read_text())
+        except ValueError:
+            continue
+        if isinstance(data, dict) and isinstance(data.get("input"), dict):
+            fixtures[path.stem] = data["input"]
+        elif isinstance(data, dict) and isinstance(data.get("examples"), list):
+            for i, example in enumerate(data["examples"], start=1):
+                if isinstance(example, dict) and isinstance(example.get("input"), dict):
+                    fixtures[f"{path.stem}-{i}"] = example["input"]
+
+    return {
+        name: _resolve_skill_files(inputs, skill.path)
+        for name, inputs in fixtures.items()
+        if isinstance(inputs, dict)
+    }
+
+
+def _resolve_skill_files(inputs: dict, skill_path: Path) -> dict:
+    """Make top-level string values that name a file in the skill folder absolute."""
+    resolved = dict(inputs)
+    for key, value in inputs.items():
+        if isinstance(value, str) and value and not Path(value).is_absolute():
+            candidate = skill_path / value
+            if candidate.is_file():
+                resolved[key] = str(candidate.resolve())
+    return resolved
+
+
+def scale_inputs(inputs: dict, factor: int) -> dict | None:
+    """
+    Repeat every top-level list of records factor times.
+
+    Copies after the first get "-<n>" appended to their "id" / "*_id"
+    string fields so they stay distinct. Returns None if the inputs have no
+    list of records to scale.
+    """
+    scaled = copy.deepcopy(inputs)
+    found = False
+    for key, value in inputs.items():
+        if not (isinstance(value, list) and value and all(isinstance(item, dict) for item in value)):
+            continue
+        found = True
+        records = []
+        for n in range(factor):
+            for item in value:
+                record = copy.deepcopy(item)
+                if n:
+                    for field, field_value in item.items():
+                        if (field == "id" or field.endswith("_id")) and isinstance(field_value, str):
+                            record[field] = f"{field_value}-{n}"
+                records.append(record)
+        scaled[key] = records
+    return scaled if found else None
+
+
+def build_cases(
+    search_paths: list[str | Path],
+    scales: tuple[int, ...] = DEFAULT_SCALES,
+    only: str | None = None,
+) -> list[dict]:
+    """Benchmark cases for every skill script with an execute() function."""
+    cases = []
+    for skill in sorted(discover_skills(search_paths), key=skill_id):
+        name = skill_id(skill)
+        if only and only not in name:
+            continue
+        scripts = sorted(p for p in skill.scripts_dir.glob("*.py") if p.name != "__init__.py")
+        if not scripts:
+            continue
+        fixtures = load_fixtures(skill)
+        for script in scripts:
+            if "def execute(" not in script.read_text():
+                continue
+            for fixture, inputs in fixtures.items():
+                variants = [(fixture, inputs)]
+                for factor in scales:
+                    scaled = scale_inputs(inputs, factor)
+                    if scaled is not None:
+                        variants.append((f"{fixture}@x{factor}", scaled))
+                for case, case_inputs in variants:
+                    cases.append({
+                        "id": f"{name}/{script.stem}:{case}",
+                        "skill_path": str(skill.path),
+                        "script": script.stem,
+                        "inputs": case_inputs,
+                    })
+    return cases
+
+
+def _max_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def measure(case: dict, repeats: int) -> dict:
+    """Run one case (in the calling process) and return its metrics."""
+    # Skills log per call; measure the work, not the log handlers
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.INFO)
+    try:
+        return _measure(case, repeats)
+    finally:
+        logging.disable(previous_disable)
+
+
+def _measure(case: dict, repeats: int) -> dict:
+    skill_path, script, inputs = Path(case["skill_path"]), case["script"], case["inputs"]
+    try:
+        execute_skill(skill_path, script, copy.deepcopy(inputs))  # Imports and fixture caches
+
+        walls, cpus = [], []
+        for _ in range(max(1, repeats)):
+            call_inputs = copy.deepcopy(inputs)
+            wall, cpu = time.perf_counter(), time.process_time()
+            result = execute_skill(skill_path, script, call_inputs)
+            cpus.append((time.process_time() - cpu) * 1000)
+            walls.append((time.perf_counter() - wall) * 1000)
+            del result
+
+        call_inputs = copy.deepcopy(inputs)
+        tracemalloc.start()
+        try:
+            result = execute_skill(skill_path, script, call_inputs)
+            _, peak = tracemalloc.get_traced_memory()
+            blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+    metrics = {
+        "wall_ms": statistics.median(walls),
+        "cpu_ms": statistics.median(cpus),
+        "peak_rss_kb": _max_rss_kb(),
+        "alloc_peak_kb": peak / 1024,
+        "alloc_blocks": blocks,
+    }
+    if isinstance(result, dict) and result.get("error"):
+        metrics["result_error"] = str(result["error"])
+    return metrics
+
+
+def run_suite(cases: list[dict], repeats: int = 5, isolate: bool = True) -> dict:
+    """
+    Measure every case; with isolate each runs in its own spawned process,
+    so peak RSS and import state belong to that case alone.
+    """
+    if not isolate:
+        return {case["id"]: measure(case, repeats) for case in cases}
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as pool:
+        futures = {case["id"]: pool.submit(measure, case, repeats) for case in cases}
+        results = {}
+        for case_id, future in futures.items():
+            try:
+                results[case_id] = future.result()
+            except Exception as e:  # Worker died (e.g. the skill exited the process)
+                results[case_id] = {"error": f"{type(e).__name__}: {e}"}
+        return results
+
+
+def baseline_document(results: dict, repeats: int) -> dict:
+    """Results plus enough context to tell whether two baselines are comparable."""
+    return {
+        "version": BASELINE_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    metrics: list[str] | None = None,
+) -> list[dict]:
+    """
+    Regressions of current against baseline.
+
+    Each regression is {"case", "metric", "baseline", "current", "change"},
+    where change is the relative growth (None for a new error). A case that
+    ran in the baseline but is missing from current is a regression with
+    metric "missing"; cases new in current are not compared.
+    """
+    metrics = metrics or list(NOISE_FLOORS)
+    regressions = []
+    for case_id, before in baseline["results"].items():
+        if "error" in before:
+            continue
+        after = current["results"].get(case_id)
+        if after is None:
+            regressions.append({
+                "case": case_id, "metric": "missing", "baseline": None, "current": None, "change": None,
+            })
+            continue
+        if "error" in after:
+            regressions.append({
+                "case": case_id, "metric": "error", "baseline": None, "current": after["error"], "change": None,
+            })
+            continue
+        for metric in metrics:
+            old, new = before.get(metric), after.get(metric)
+            if old is None or new is None:
+                continue
+            if new - old > NOISE_FLOORS.get(metric, 0) and new > old * (1 + threshold):
+                regressions.append({
+                    "case": case_id,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change": (new - old) / old if old else None,
+                })
+    return regressions
+
+
+def _selected(case_id: str, only: str | None, scales: list[int]) -> bool:
+    """Whether `run` with this --skill / --scales selection builds the case."""
+    prefix, case = case_id.split(":", 1)
+    name = prefix.rsplit("/", 1)[0]
+    fixture, _, factor = case.rpartition("@x")
+    if fixture and factor.isdigit() and int(factor) not in scales:
+        return False
+    return not only or only in name
+
+
+def _print_results(results: dict) -> None:
+    print(f"{'case':<72} {'wall ms':>9} {'cpu ms':>9} {'rss MB':>7} {'peak KB':>9} {'blocks':>8}")
+    for case_id, r in results.items():
+        if "error" in r:
+            print(f"{case_id:<72} error: {r['error']}")
+            continue
+        rss = f"{r['peak_rss_kb'] / 1024:>7.1f}" if r["peak_rss_kb"] is not None else f"{'-':>7}"
+        note = f"  (result error: {r['result_error'][:40]})" if "result_error" in r else ""
+        print(f"{case_id:<72} {r['wall_ms']:>9.3f} {r['cpu_ms']:>9.3f} {rss} "
+              f"{r['alloc_peak_kb']:>9.1f} {r['alloc_blocks']:>8}{note}")
+
+
+def _print_regressions(regressions: list[dict], threshold: float) -> None:
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}")
+        return
+    print(f"{len(regressions)} regression(s) above {threshold:.0%}:")
+    for r in regressions:
+        if r["metric"] == "error":
+            print(f"  {r['case']}: now fails ({r['current']})")
+        elif r["metric"] == "missing":
+            print(f"  {r['case']}: missing from the current run")
+        else:
+            change = f"+{r['change']:.0%}" if r["change"] is not None else "new"
+            print(f"  {r['case']}: {r['metric']} {r['baseline']:.3f} -> {r['current']:.3f} ({change})")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m skill_runtime.bench", description=__doc__.split("\n\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Measure every skill and write a baseline")
+    run.add_argument("paths", nargs="*", default=["agents", "skills"], help="Skill search paths")
+    run.add_argument("--output", type=Path, help="Write the baseline JSON here")
+    run.add_argument("--repeats", type=int, default=5, help="Timed calls per case")
+    run.add_argument("--scales", type=int, nargs="*", default=list(DEFAULT_SCALES), help="Synthetic scale factors")
+    run.add_argument("--skill", help="Only skills whose id contains this")
+    run.add_argument("--no-isolate", action="store_true", help="Measure in this process (RSS not per case)")
+    run.add_argument("--compare", type=Path, metavar="BASELINE", help="Also compare against this baseline")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative growth that fails")
+
+    cmp = commands.add_parser("compare", help="Compare two baselines")
+    cmp.add_argument("baseline", type=Path)
+    cmp.add_argument("current", type=Path)
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative growth that fails")
+    cmp.add_argument("--metrics", nargs="*", choices=list(NOISE_FLOORS), help="Metrics to gate on (all)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        baseline = json.loads(args.baseline.read_text())
+        current = json.loads(args.current.read_text())
+        regressions = compare(baseline, current, args.threshold, args.metrics)
+        _print_regressions(regressions, args.threshold)
+        return 1 if regressions else 0
+
+    cases = build_cases(args.paths, tuple(args.scales), args.skill)
+    results = run_suite(cases, args.repeats, isolate=not args.no_isolate)
+    document = baseline_document(results, args.repeats)
+    _print_results(results)
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2))
+        print(f"\nWrote {len(results)} cases to {args.output}")
+    if args.compare:
+        # Cases this run didn't select (--skill, --scales) aren't missing
+        baseline = json.loads(args.compare.read_text())
+        baseline["results"] = {
+            case_id: result for case_id, result in baseline["results"].items()
+            if _selected(case_id, args.skill, args.scales)
+        }
+        regressions = compare(baseline, document, args.threshold)
+        print()
+        _print_regressions(regressions, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+RANGER Skill Runtime - MCP Cassettes
+
+Records MCP tool calls (arguments, response or error, and duration) to an
+on-disk cassette, and replays them without the server, so latency
+benchmarks of the coordinator and specialists see the same data and the
+same MCP timing on every build.
+
+A cassette is JSON Lines, gzip-compressed when the path ends in ".gz":
+
+    {"version": 1, "tools": {"mcp-fixtures": [<MCP tool schema>, ...]}}
+    {"body": 0, "data": {...}}
+    {"server": "mcp-fixtures", "tool": "get_fire_context", "args": {...}, "duration": 0.0042, "body": 0}
+    {"server": "mcp-fixtures", "tool": "get_fire_context", "args": {...}, "duration": 0.0031, "body": 0}
+    {"server": "mcp-nifc", "tool": "get_incident", "args": {...}, "duration": 3.0, "error": {...}}
+
+Identical response bodies are stored once. Replay matches calls on
+server, tool and arguments; repeated calls get the recorded responses in
+order, starting over once they run out.
+
+Recording and replay are wired into MCPMockProvider (record_to / replay)
+and the agent MCP toolsets (agents/_shared/mcp_client.py, MCP_CASSETTE).
+"""
+
+import asyncio
+import builtins
+import gzip
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+CASSETTE_VERSION = 1
+
+
+def _call_key(server: str, tool: str, args: dict | None) -> tuple[str, str, str]:
+    return server, tool, json.dumps(args or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _error_record(error: BaseException) -> dict[str, str]:
+    return {"type": type(error).__name__, "message": str(error)}
+
+
+def _rebuild_error(record: dict[str, str]) -> Exception:
+    """The recorded exception, as its built-in type or else RuntimeError."""
+    error_type = getattr(builtins, record["type"], None)
+    if isinstance(error_type, type) and issubclass(error_type, Exception):
+        return error_type(record["message"])
+    return RuntimeError(f"{record['type']}: {record['message']}")
+
+
+def _open(path: Path, mode: str, compressed: bool):
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """
+    Recorded MCP tool calls, in call order.
+
+    Usage:
+        cassette = Cassette()
+        result = await cassette.record("mcp-fixtures", "get_fire_context", args, lambda: tool(**args))
+        cassette.save("run.jsonl.gz")
+
+        player = Cassette.load("run.jsonl.gz").player(speed=10)
+        result = await player.play("mcp-fixtures", "get_fire_context", args)
+
+    Thread Safety:
+        Recording is lock-protected.
+    """
+
+    def __init__(self):
+        self.interactions: list[dict[str, Any]] = []
+        # server -> tool name -> MCP tool schema, for replaying tool listings
+        self.tools: dict[str, dict[str, dict]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def add(
+        self,
+        server: str,
+        tool: str,
+        args: dict | None,
+        duration: float,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Append one call: its result, or the exception it raised."""
+        interaction = {"server": server, "tool": tool, "args": args or {}, "duration": round(duration, 6)}
+        if error is not None:
+            interaction["error"] = _error_record(error)
+        else:
+            interaction["result"] = result
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def add_tools(self, server: str, schemas: list[dict]) -> None:
+        """Record tool schemas a server listed (merged by tool name)."""
+        with self._lock:
+            tools = self.tools.setdefault(server, {})
+            for schema in schemas:
+                tools[schema["name"]] = schema
+
+    async def record(
+        self,
+        server: str,
+        tool: str,
+        args: dict | None,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Await call(), record its outcome and duration, and pass it on."""
+        start = time.perf_counter()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            raise  # The caller gave up; nothing was answered
+        except Exception as e:
+            self.add(server, tool, args, time.perf_counter() - start, error=e)
+            raise
+        self.add(server, tool, args, time.perf_counter() - start, result=result)
+        return result
+
+    def save(self, path: str | Path) -> None:
+        """Write the cassette (atomically), storing identical bodies once."""
+        path = Path(path)
+        with self._lock:
+            interactions = list(self.interactions)
+            tools = {server: list(schemas.values()) for server, schemas in self.tools.items()}
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        body_ids: dict[str, int] = {}
+        with _open(tmp_path, "w", compressed=path.suffix == ".gz") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION, "tools": tools}) + "\n")
+            for interaction in interactions:
+                line = {k: v for k, v in interaction.items() if k != "result"}
+                if "result" in interaction:
+                    data = json.dumps(interaction["result"], sort_keys=True, default=str)
+                    if data not in body_ids:
+                        body_ids[data] = len(body_ids)
+                        f.write(f'{{"body": {body_ids[data]}, "data": {data}}}\n')
+                    line["body"] = body_ids[data]
+                f.write(json.dumps(line, default=str) + "\n")
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """
+        Read a cassette written by save().
+
+        Raises:
+            FileNotFoundError: If the cassette doesn't exist
+            ValueError: If it was written by an incompatible version
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Cassette not found: {path}")
+
+        cassette = cls()
+        bodies: dict[int, Any] = {}
+        with _open(path, "r", compressed=path.suffix == ".gz") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(f"Unsupported cassette version {header.get('version')!r} in {path}")
+            for server, schemas in header.get("tools", {}).items():
+                cassette.add_tools(server, schemas)
+            for line in f:
+                record = json.loads(line)
+                if "data" in record:
+                    bodies[record["body"]] = record["data"]
+                    continue
+                if "body" in record:
+                    record["result"] = bodies[record.pop("body")]
+                cassette.interactions.append(record)
+        return cassette
+
+    def player(self, speed: float = 1.0) -> "CassettePlayer":
+        """A CassettePlayer for this cassette."""
+        return CassettePlayer(self, speed)
+
+
+class CassettePlayer:
+    """
+    Serves recorded responses in place of MCP calls.
+
+    Args:
+        cassette: Recorded calls
+        speed: 1.0 replays each call with its recorded duration, 10 with a
+               tenth of it, 0 without any delay
+    """
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0):
+        if speed < 0:
+            raise ValueError(f"speed must be >= 0, got {speed}")
+        self.cassette = cassette
+        self.speed = speed
+        self._queues: dict[tuple[str, str, str], list[dict]] = {}
+        self._positions: dict[tuple[str, str, str], int] = {}
+        self._lock = threading.Lock()
+        for interaction in cassette.interactions:
+            key = _call_key(interaction["server"], interaction["tool"], interaction["args"])
+            self._queues.setdefault(key, []).append(interaction)
+
+    @property
+    def recorded_tools(self) -> set[tuple[str, str]]:
+        """(server, tool) pairs that have recorded calls."""
+        return {(server, tool) for server, tool, _ in self._queues}
+
+    def next(self, server: str, tool: str, args: dict | None) -> dict[str, Any]:
+        """
+        The next recorded interaction for this call.
+
+        Raises:
+            KeyError: If the call (with these arguments) was never recorded
+        """
+        key = _call_key(server, tool, args)
+        queue = self._queues.get(key)
+        if not queue:
+            raise KeyError(f"No recorded call to {server}/{tool} with args {key[2]}")
+        with self._lock:
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        return queue[position % len(queue)]
+
+    def respond(self, interaction: dict[str, Any]) -> Any:
+        """The interaction's recorded result, or raise its recorded error."""
+        if "error" in interaction:
+            raise _rebuild_error(interaction["error"])
+        return interaction["result"]
+
+    def play_now(self, server: str, tool: str, args: dict | None) -> Any:
+        """Replay a call without its recorded delay."""
+        return self.respond(self.next(server, tool, args))
+
+    async def play(self, server: str, tool: str, args: dict | None) -> Any:
+        """Replay a call, taking its recorded duration divided by speed."""
+        interaction = self.next(server, tool, args)
+        if self.speed:
+            await asyncio.sleep(interaction["duration"] / self.speed)
+        return self.respond(interaction)
+
+    def rewind(self) -> None:
+        """Start every call's recorded responses over from the first."""
+        with self._lock:
+            self._positions.clear()
@@ -0,0 +1,354 @@
+"""
+RANGER Skill Runtime - Skill Executor
+
+Runs skill scripts off the event loop, so one slow skill doesn't stall
+every other request served by the worker:
+
+- "io" skills run on a thread pool
+- "cpu" skills run in warm worker processes, which keep their loaded script
+  modules between calls
+
+A skill declares its class and timeout in the "## Execution" section of
+its skill.md. Every call has a timeout and can be cancelled. When a "cpu"
+skill times out or is cancelled, its worker process is killed and
+replaced. An "io" skill's thread can't be interrupted, so it runs to
+completion in the background and its result is discarded.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from .loader import (
+    DEFAULT_EXECUTION_CLASS,
+    DEFAULT_SKILL_TIMEOUT_SECONDS,
+    EXECUTION_CLASSES,
+    SkillManifest,
+    execute_skill,
+    load_skill_script,
+)
+
+
+def _worker_main(conn, preload: list[tuple[str, str]]) -> None:
+    """Worker process loop: run (skill_path, script, inputs, entry_point) requests."""
+    try:
+        for skill_path, script_name in preload:
+            try:
+                load_skill_script(Path(skill_path), script_name)
+            except Exception:
+                pass  # Surfaces when the skill is executed
+        conn.send(None)  # Ready
+
+        while True:
+            request = conn.recv()
+            if request is None:
+                return
+            skill_path, script_name, inputs, entry_point = request
+            try:
+                reply = (True, execute_skill(Path(skill_path), script_name, inputs, entry_point))
+            except Exception as e:
+                reply = (False, e)
+            try:
+                conn.send(reply)
+            except Exception as e:
+                # Result or exception can't be pickled back
+                conn.send((False, RuntimeError(f"Skill {script_name} returned an unpicklable result: {e!r}")))
+    except (EOFError, OSError, KeyboardInterrupt):
+        return
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, context, preload: list[tuple[str, str]]):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child, preload), name="skill-worker", daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def wait_ready(self) -> None:
+        self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class _Job:
+    """A cpu skill call; cancel() kills the worker it is running on."""
+
+    __slots__ = ("lock", "cancelled", "worker")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cancelled = False
+        self.worker: _Worker | None = None
+
+    def cancel(self) -> None:
+        with self.lock:
+            self.cancelled = True
+            if self.worker is not None:
+                self.worker.process.kill()
+
+
+class _ProcessPool:
+    """Fixed set of warm worker processes; dead or killed workers are replaced."""
+
+    def __init__(self, size: int, preload: list[tuple[str, str]], context):
+        self._context = context
+        self._preload = preload
+        self._idle: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self._workers: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        workers = [self._start() for _ in range(size)]
+        for worker in workers:
+            worker.wait_ready()
+            self._idle.put(worker)
+
+    def _start(self) -> _Worker:
+        worker = _Worker(self._context, self._preload)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def run(self, job: _Job, request: tuple) -> Any:
+        """Run a request on the next idle worker (blocking; call from a thread)."""
+        worker = self._idle.get()
+        with job.lock:
+            if job.cancelled:
+                self._idle.put(worker)
+                return None
+            job.worker = worker
+
+        healthy = True
+        try:
+            worker.conn.send(request)
+            ok, payload = worker.conn.recv()
+        except (EOFError, OSError):
+            healthy = False
+            raise RuntimeError(f"Skill worker exited while running {request[1]}") from None
+        finally:
+            with job.lock:
+                job.worker = None
+                healthy = healthy and not job.cancelled
+            self._release(worker, healthy)
+
+        if ok:
+            return payload
+        raise payload
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        if not healthy:
+            worker.kill()
+            with self._lock:
+                self._workers.discard(worker)
+                if self._closed:
+                    return
+            worker = self._start()
+            worker.wait_ready()
+        self._idle.put(worker)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+
+class SkillExecutor:
+    """
+    Thread pool for io skills plus warm worker processes for cpu skills.
+
+    Worker processes start on the first cpu skill (from a dispatch thread,
+    not the event loop) or on warm_up(). They use the "spawn" start method
+    by default, since forking a process that runs an event loop and
+    threads is unsafe.
+    """
+
+    def __init__(
+        self,
+        io_workers: int | None = None,
+        cpu_workers: int | None = None,
+        preload: list[tuple[str | Path, str]] | None = None,
+        mp_context=None,
+    ):
+        """
+        Args:
+            io_workers: Threads for io skills (ThreadPoolExecutor default)
+            cpu_workers: Worker processes for cpu skills (CPU count)
+            preload: (skill_path, script_name) pairs each worker process
+                loads before taking work
+            mp_context: multiprocessing context (spawn)
+        """
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self._threads = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="skill-io")
+        self._dispatch = ThreadPoolExecutor(max_workers=self.cpu_workers, thread_name_prefix="skill-cpu")
+        self._preload = [(str(path), script) for path, script in preload or []]
+        self._context = mp_context or multiprocessing.get_context("spawn")
+        self._processes: _ProcessPool | None = None
+        self._lock = threading.Lock()
+        self._manifest = SkillManifest()
+        # skill_path -> (execution class, timeout), read once per skill
+        self._declared: dict[Path, tuple[str, float]] = {}
+
+    def warm_up(self) -> None:
+        """Start the worker processes now and wait until they are ready."""
+        self._process_pool()
+
+    def _process_pool(self) -> _ProcessPool:
+        with self._lock:
+            if self._processes is None:
+                self._processes = _ProcessPool(self.cpu_workers, self._preload, self._context)
+            return self._processes
+
+    def _run_in_process(self, job: _Job, request: tuple) -> Any:
+        return self._process_pool().run(job, request)
+
+    def declared(self, skill_path: Path) -> tuple[str, float]:
+        """
+        Execution class and timeout from a skill's skill.md (defaults if it has none).
+
+        Read on a skill's first call and cached for the executor's lifetime;
+        edits to skill.md take effect with a new executor.
+        """
+        skill_path = Path(skill_path)
+        declared = self._declared.get(skill_path)
+        if declared is None:
+            skill_md = skill_path / "skill.md"
+            if skill_md.exists():
+                metadata = self._manifest.metadata(skill_md)
+                declared = metadata.execution_class, metadata.timeout_seconds
+            else:
+                declared = DEFAULT_EXECUTION_CLASS, DEFAULT_SKILL_TIMEOUT_SECONDS
+            self._declared[skill_path] = declared
+        return declared
+
+    async def run(
+        self,
+        skill_path: str | Path,
+        script_name: str,
+        inputs: dict,
+        entry_point: str = "execute",
+        *,
+        execution_class: str | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """
+        Execute a skill script off the event loop.
+
+        Args:
+            skill_path: Path to skill directory
+            script_name: Name of script to execute
+            inputs: Input parameters for the script (picklable for cpu skills)
+            entry_point: Function name to call (default: "execute")
+            execution_class: "io" or "cpu"; defaults to the skill.md declaration
+            timeout: Seconds; defaults to the skill.md declaration
+
+        Returns:
+            Result dictionary from script execution
+
+        Raises:
+            TimeoutError: If the skill doesn't finish within the timeout
+            RuntimeError: If a cpu skill's worker process died
+            Any exception raised by the skill itself
+        """
+        skill_path = Path(skill_path)
+        if execution_class is None or timeout is None:
+            declared_class, declared_timeout = self.declared(skill_path)
+            execution_class = execution_class or declared_class
+            timeout = declared_timeout if timeout is None else timeout
+        if execution_class not in EXECUTION_CLASSES:
+            raise ValueError(f"Unknown execution class {execution_class!r}, expected one of {EXECUTION_CLASSES}")
+
+        loop = asyncio.get_running_loop()
+        job = None
+        if execution_class == "cpu":
+            job = _Job()
+            request = (str(skill_path), script_name, inputs, entry_point)
+            future = loop.run_in_executor(self._dispatch, self._run_in_process, job, request)
+        else:
+            future = loop.run_in_executor(self._threads, execute_skill, skill_path, script_name, inputs, entry_point)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            raise TimeoutError(f"Skill {skill_path.name}/{script_name} timed out after {timeout:g}s") from None
+        finally:
+            if job is not None and future.cancelled():
+                job.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes and threads; queued skills are cancelled."""
+        self._threads.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            processes, self._processes = self._processes, None
+        if processes is not None:
+            processes.shutdown()
+        self._dispatch.shutdown(wait=wait, cancel_futures=True)
+
+
+# Process-wide executor used by execute_skill_async
+_skill_executor: SkillExecutor | None = None
+_skill_executor_lock = threading.Lock()
+
+
+def get_skill_executor() -> SkillExecutor:
+    """Get the shared SkillExecutor, creating it on first use."""
+    global _skill_executor
+    with _skill_executor_lock:
+        if _skill_executor is None:
+            _skill_executor = SkillExecutor()
+        return _skill_executor
+
+
+def shutdown_skill_executor() -> None:
+    """Shut down the shared SkillExecutor (e.g. on application shutdown)."""
+    global _skill_executor
+    with _skill_executor_lock:
+        executor, _skill_executor = _skill_executor, None
+    if executor is not None:
+        executor.shutdown()
+
+
+async def execute_skill_async(
+    skill_path: str | Path,
+    script_name: str,
+    inputs: dict,
+    entry_point: str = "execute",
+    *,
+    execution_class: str | None = None,
+    timeout: float | None = None,
+    executor: SkillExecutor | None = None,
+) -> dict:
+    """
+    Async execute_skill: run the script on the shared (or given) SkillExecutor.
+
+    See SkillExecutor.run for arguments and errors.
+    """
+    executor = executor or get_skill_executor()
+    return await executor.run(
+        skill_path, script_name, inputs, entry_point, execution_class=execution_class, timeout=timeout
+    )
@@ -6,15 +6,34 @@ Skills follow the structure defined in docs/specs/skill-format.md.
 
 Phase 2 Implementation:
 - Basic skill discovery and loading
-- Skill metadata parsing from skill.md
-- Script execution support
+- Skill metadata parsing from skill.md, with an optional persisted manifest
+  index so discovery only re-parses changed files
+- Script execution support, with loaded script modules cached by path and mtime
 """
 
+import functools
+import hashlib
 import importlib.util
+import json
+import os
 import sys
+import threading
+import time
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
+# Loaded skill scripts: resolved path -> (mtime_ns, size, module). A cached
+# module is reused until its file changes on disk.
+_module_cache: dict[Path, tuple[int, int, ModuleType]] = {}
+_module_cache_lock = threading.Lock()
+
+# Execution classes a skill.md can declare under "## Execution": "io" skills
+# run on a thread pool, "cpu" skills in warm worker processes
+EXECUTION_CLASSES = ("io", "cpu")
+DEFAULT_EXECUTION_CLASS = "io"
+DEFAULT_SKILL_TIMEOUT_SECONDS = 30.0
+
 
 class SkillMetadata:
     """Parsed skill metadata from skill.md."""
@@ -27,6 +46,8 @@ class SkillMetadata:
         inputs: list[dict],
         outputs: list[dict],
         path: Path,
+        execution_class: str = DEFAULT_EXECUTION_CLASS,
+        timeout_seconds: float = DEFAULT_SKILL_TIMEOUT_SECONDS,
     ):
         self.name = name
         self.description = description
@@ -34,6 +55,8 @@ class SkillMetadata:
         self.inputs = inputs
         self.outputs = outputs
         self.path = path
+        self.execution_class = execution_class
+        self.timeout_seconds = timeout_seconds
         self.scripts_dir = path / "scripts"
         self.resources_dir = path / "resources"
         self.tests_dir = path / "tests"
@@ -57,6 +80,8 @@ class SkillMetadata:
             "inputs": self.inputs,
             "outputs": self.outputs,
             "path": str(self.path),
+            "execution_class": self.execution_class,
+            "timeout_seconds": self.timeout_seconds,
             "has_scripts": self.has_scripts,
             "has_resources": self.has_resources,
         }
@@ -79,67 +104,101 @@ def parse_skill_md(skill_md_path: Path) -> SkillMetadata:
     if not skill_md_path.exists():
         raise FileNotFoundError(f"skill.md not found: {skill_md_path}")
 
-    content = skill_md_path.read_text()
-    skill_dir = skill_md_path.parent
+    return _parse_skill_content(skill_md_path.read_text(), skill_md_path.parent)
 
-    # Extract skill name from first heading
-    name = ""
-    for line in content.split("\n"):
-        if line.startswith("# "):
-            name = line[2:].strip()
-            break
+
+def _parse_skill_content(content: str, skill_dir: Path) -> SkillMetadata:
+    """Build SkillMetadata from skill.md text in a single pass over its lines."""
+    name, sections = _split_sections(content)
 
     if not name:
         raise ValueError("skill.md must have a title (# Skill Name)")
 
-    # Extract description (content after ## Description)
-    description = _extract_section(content, "Description")
-
     # Extract triggers (bullet points after ## Triggers)
-    triggers_text = _extract_section(content, "Triggers")
     triggers = [
         line.strip().lstrip("- ")
-        for line in triggers_text.split("\n")
+        for line in _section(sections, "Triggers").split("\n")
         if line.strip().startswith("-")
     ]
 
-    # Extract inputs table
-    inputs = _parse_table(content, "Inputs")
-
-    # Extract outputs table
-    outputs = _parse_table(content, "Outputs")
+    execution_class, timeout_seconds = _parse_execution(_section(sections, "Execution"))
 
     return SkillMetadata(
         name=name,
-        description=description,
+        description=_section(sections, "Description"),
         triggers=triggers,
-        inputs=inputs,
-        outputs=outputs,
+        inputs=_parse_table(_section(sections, "Inputs")),
+        outputs=_parse_table(_section(sections, "Outputs")),
         path=skill_dir,
+        execution_class=execution_class,
+        timeout_seconds=timeout_seconds,
     )
 
 
-def _extract_section(content: str, section_name: str) -> str:
-    """Extract content between a section heading and the next heading."""
-    lines = content.split("\n")
-    in_section = False
-    section_lines = []
+def _parse_execution(section: str) -> tuple[str, float]:
+    """
+    Parse "- class: cpu" / "- timeout: 60" bullets from ## Execution.
+
+    Raises:
+        ValueError: If the class is unknown or the timeout isn't a
+            positive number of seconds
+    """
+    settings = {}
+    for line in section.split("\n"):
+        line = line.strip()
+        if line.startswith("-") and ":" in line:
+            key, value = line.lstrip("- ").split(":", 1)
+            settings[key.strip().lower()] = value.strip().strip("`")
+
+    execution_class = settings.get("class", DEFAULT_EXECUTION_CLASS).lower()
+    if execution_class not in EXECUTION_CLASSES:
+        raise ValueError(f"Unknown execution class {execution_class!r}, expected one of {EXECUTION_CLASSES}")
 
-    for line in lines:
-        if line.startswith(f"## {section_name}"):
-            in_section = True
+    timeout = settings.get("timeout", str(DEFAULT_SKILL_TIMEOUT_SECONDS)).removesuffix("s").strip()
+    try:
+        timeout_seconds = float(timeout)
+    except ValueError:
+        timeout_seconds = 0.0
+    if timeout_seconds <= 0:
+        raise ValueError(f"Execution timeout must be a positive number of seconds, got {timeout!r}")
+
+    return execution_class, timeout_seconds
+
+
+def _split_sections(content: str) -> tuple[str, dict[str, list[str]]]:
+    """
+    Split skill.md into its title (first "# " line) and "## " sections.
+
+    Sections map heading text to body lines; only the first occurrence of
+    a repeated heading is kept.
+    """
+    name = ""
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+
+    for line in content.split("\n"):
+        if line.startswith("## "):
+            heading = line[3:]
+            current = None if heading in sections else sections.setdefault(heading, [])
             continue
-        if in_section:
-            if line.startswith("## "):
-                break
-            section_lines.append(line)
+        if not name and line.startswith("# "):
+            name = line[2:].strip()
+        if current is not None:
+            current.append(line)
+
+    return name, sections
+
 
-    return "\n".join(section_lines).strip()
+def _section(sections: dict[str, list[str]], section_name: str) -> str:
+    """Body of the first section whose heading starts with section_name."""
+    for heading, lines in sections.items():
+        if heading.startswith(section_name):
+            return "\n".join(lines).strip()
+    return ""
 
 
-def _parse_table(content: str, section_name: str) -> list[dict]:
-    """Parse a markdown table in a section."""
-    section = _extract_section(content, section_name)
+def _parse_table(section: str) -> list[dict]:
+    """Parse the markdown table in a section body."""
     lines = [l.strip() for l in section.split("\n") if l.strip().startswith("|")]
 
     if len(lines) < 2:
@@ -158,12 +217,153 @@ def _parse_table(content: str, section_name: str) -> list[dict]:
     return rows
 
 
-def discover_skills(search_paths: list[str | Path]) -> list[SkillMetadata]:
+class SkillManifest:
+    """
+    Persisted index of parsed skill.md files for discover_skills.
+
+    Entries are keyed by absolute skill.md path and hold the file's mtime,
+    size and SHA-256 next to the parsed metadata. A file whose mtime and
+    size are unchanged is not read; one whose content hash is unchanged is
+    not re-parsed.
+
+    For each search root the index also keeps the mtime of every directory
+    under it and the skill.md files found there. Adding, removing or
+    renaming an entry changes its directory's mtime, so while none of them
+    changed the root is not walked again. The index is written back
+    (atomically) only when something changed.
+
+    Filesystem timestamps are coarse, so an mtime within RACY_WINDOW_NS of
+    the time it was read is not trusted: such files are re-hashed and such
+    directories re-walked on the next call.
+    """
+
+    VERSION = 2
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Args:
+            path: JSON file to load the index from and save it to; None
+                keeps the index in memory only
+        """
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, dict] = {}
+        self._trees: dict[str, dict] = {}
+        self._dirty = False
+        self.parsed = 0  # skill.md files parsed by this instance
+        if self.path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return  # Missing or unreadable index: rebuild from scratch
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self._entries = data.get("skills", {})
+            self._trees = data.get("trees", {})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def skill_files(self, root: Path) -> list[Path]:
+        """skill.md files under root, walking it only if a directory changed."""
+        key = str(root.absolute())
+        tree = self._trees.get(key)
+        if tree is not None and all(_mtime_ns(d) == mtime for d, mtime in tree["dirs"].items()):
+            return [Path(p) for p in tree["skills"]]
+
+        skills, dirs = _walk_skill_files(key)
+        racy = time.time_ns() - self.RACY_WINDOW_NS
+        dirs = {d: (mtime if mtime < racy else -1) for d, mtime in dirs.items()}
+        self._trees[key] = {"dirs": dirs, "skills": skills}
+        self._dirty = True
+        return [Path(p) for p in skills]
+
+    def metadata(self, skill_md: Path) -> SkillMetadata:
+        """
+        Metadata for a skill.md, from the index when the file is unchanged.
+
+        Raises:
+            FileNotFoundError: If skill.md doesn't exist
+            ValueError: If the skill.md has no title
+        """
+        skill_md = skill_md.absolute()
+        key = str(skill_md)
+        try:
+            stat = skill_md.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"skill.md not found: {skill_md}") from None
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        if stat.st_mtime_ns >= time.time_ns() - self.RACY_WINDOW_NS:
+            stamp[0] = -1  # Too recent to trust; re-hash next time
+
+        entry = self._entries.get(key)
+        if entry is None or entry["stamp"] != stamp or stamp[0] == -1:
+            raw = skill_md.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if entry is None or entry["sha256"] != digest:
+                metadata = _parse_skill_content(raw.decode(), skill_md.parent)
+                self.parsed += 1
+                entry = {
+                    "sha256": digest,
+                    "metadata": {
+                        "name": metadata.name,
+                        "description": metadata.description,
+                        "triggers": metadata.triggers,
+                        "inputs": metadata.inputs,
+                        "outputs": metadata.outputs,
+                        "execution_class": metadata.execution_class,
+                        "timeout_seconds": metadata.timeout_seconds,
+                    },
+                }
+                self._entries[key] = entry
+            entry["stamp"] = stamp
+            self._dirty = True
+
+        fields = entry["metadata"]
+        return SkillMetadata(
+            name=fields["name"],
+            description=fields["description"],
+            triggers=list(fields["triggers"]),
+            inputs=[dict(row) for row in fields["inputs"]],
+            outputs=[dict(row) for row in fields["outputs"]],
+            execution_class=fields["execution_class"],
+            timeout_seconds=fields["timeout_seconds"],
+            path=skill_md.parent,
+        )
+
+    def prune(self, root: Path, keep: set[str]) -> None:
+        """Drop entries under root that are not in keep (deleted skills)."""
+        prefix = os.path.join(str(root.absolute()), "")
+        stale = [key for key in self._entries if key.startswith(prefix) and key not in keep]
+        for key in stale:
+            del self._entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self) -> None:
+        """Write the index if it has a path and changed since loading."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": self.VERSION, "skills": self._entries, "trees": self._trees}))
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+def discover_skills(
+    search_paths: list[str | Path],
+    manifest: SkillManifest | None = None,
+) -> list[SkillMetadata]:
     """
     Discover skills in the given paths.
 
     Args:
         search_paths: Directories to search for skills
+        manifest: Optional SkillManifest; unchanged skill.md files are
+            served from it instead of being re-parsed, and it is saved
+            before returning
 
     Returns:
         List of SkillMetadata for discovered skills
@@ -175,25 +375,78 @@ def discover_skills(search_paths: list[str | Path]) -> list[SkillMetadata]:
         if not path.exists():
             continue
 
+        seen = set()
         # Look for skill.md files
-        for skill_md in path.rglob("skill.md"):
+        if manifest is None:
+            skill_files = [Path(p) for p in _walk_skill_files(str(path))[0]]
+        else:
+            skill_files = manifest.skill_files(path)
+        for skill_md in skill_files:
             # Skip template
             if "_template" in str(skill_md):
                 continue
             try:
-                metadata = parse_skill_md(skill_md)
+                if manifest is None:
+                    metadata = parse_skill_md(skill_md)
+                else:
+                    metadata = manifest.metadata(skill_md)
+                    seen.add(str(skill_md.absolute()))
                 skills.append(metadata)
             except (ValueError, FileNotFoundError) as e:
                 # Log warning but continue discovery
                 print(f"Warning: Could not parse {skill_md}: {e}")
 
+        if manifest is not None:
+            manifest.prune(path, seen)
+
+    if manifest is not None:
+        manifest.save()
+
     return skills
 
 
+def _walk_skill_files(root: str) -> tuple[list[str], dict[str, int]]:
+    """
+    Find skill.md files under root without following directory symlinks.
+
+    Returns the sorted skill.md paths and the mtime of every directory
+    visited, each taken before the directory is listed so a change made
+    mid-walk is seen on the next call.
+    """
+    skill_files = []
+    dirs = {}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            dirs[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "skill.md":
+                        skill_files.append(entry.path)
+        except OSError:
+            continue
+    return sorted(skill_files), dirs
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def load_skill_script(skill_path: Path, script_name: str) -> Any:
     """
     Load a Python script from a skill's scripts directory.
 
+    The module is executed once and cached by resolved path; later calls
+    return the cached module until the file's mtime or size changes. Each
+    script is registered in sys.modules under a name unique to its path,
+    so skills with identically named scripts don't collide.
+
     Args:
         skill_path: Path to skill directory
         script_name: Name of script (with or without .py extension)
@@ -205,26 +458,69 @@ def load_skill_script(skill_path: Path, script_name: str) -> Any:
         FileNotFoundError: If script doesn't exist
         ImportError: If script can't be loaded
     """
+    script_path = _resolve_script(Path(skill_path), script_name)
+
+    try:
+        stat = script_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Script not found: {script_path}") from None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _module_cache.get(script_path)
+    if cached is not None and cached[:2] == stamp:
+        return cached[2]
+
+    with _module_cache_lock:
+        cached = _module_cache.get(script_path)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+        module = _exec_script(script_path)
+        _module_cache[script_path] = (*stamp, module)
+    return module
+
+
+def clear_skill_cache() -> None:
+    """Forget all cached skill script modules (e.g. between tests)."""
+    with _module_cache_lock:
+        for path in _module_cache:
+            sys.modules.pop(_module_name(path), None)
+        _module_cache.clear()
+    _resolve_script.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_script(skill_path: Path, script_name: str) -> Path:
+    """Absolute script path; memoized since resolve() dominates a warm load."""
     if not script_name.endswith(".py"):
         script_name = f"{script_name}.py"
+    return (skill_path / "scripts" / script_name).resolve()
 
-    script_path = skill_path / "scripts" / script_name
 
-    if not script_path.exists():
-        raise FileNotFoundError(f"Script not found: {script_path}")
+def _module_name(script_path: Path) -> str:
+    """sys.modules name for a script, unique per resolved path."""
+    digest = hashlib.sha1(str(script_path).encode()).hexdigest()[:12]
+    return f"skill_script_{script_path.stem}_{digest}"
 
-    # Load module dynamically
-    spec = importlib.util.spec_from_file_location(
-        f"skill_script_{script_path.stem}",
-        script_path
-    )
+
+def _exec_script(script_path: Path) -> ModuleType:
+    """Execute a script file as a fresh module."""
+    name = _module_name(script_path)
+    spec = importlib.util.spec_from_file_location(name, script_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Could not load script: {script_path}")
 
     module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
-
+    previous = sys.modules.get(name)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Don't leave a half-executed module registered
+        if previous is not None:
+            sys.modules[name] = previous
+        else:
+            sys.modules.pop(name, None)
+        raise
     return module
 
 
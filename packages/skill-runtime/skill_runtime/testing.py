@@ -6,13 +6,119 @@ Skills remain pure functions; this module enables fixture injection
 for deterministic MCP simulation.
 
 Phase 2 Implementation (Hybrid Approach):
-- MCPMockProvider: Mock MCP server responses
+- MCPMockProvider: Mock MCP server responses, with optional latency,
+  error, timeout and rate-limit injection for load testing, and
+  record/replay of calls through cassettes (see cassette.py)
 - Deferred to Phase 3: Full SkillTestHarness wrapper
 """
 
+import asyncio
 import json
+import math
+import random
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from .cassette import Cassette
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+RATE_LIMIT_MODES = ("reject", "wait")
+
+
+def _latency_sampler(latency: Any) -> Callable[[random.Random], float]:
+    """
+    Build a sampler (rng -> seconds) from a latency spec.
+
+    Specs:
+        0.05                        fixed 50 ms
+        ("fixed", seconds)
+        ("uniform", low, high)
+        ("normal", mean, stddev)    clipped at 0
+        ("lognormal", median, sigma)
+        ("exponential", mean)
+        callable(rng) -> seconds
+    """
+    if latency is None:
+        return lambda rng: 0.0
+    if callable(latency):
+        return lambda rng: max(0.0, float(latency(rng)))
+    if isinstance(latency, (int, float)):
+        latency = ("fixed", latency)
+
+    name, *params = latency
+    arity = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exponential": 1}
+    if name not in arity:
+        raise ValueError(f"Unknown latency distribution {name!r}, expected one of {LATENCY_DISTRIBUTIONS}")
+    if len(params) != arity[name] or any(p < 0 for p in params):
+        raise ValueError(f"{name} latency takes {arity[name]} non-negative parameter(s), got {params}")
+
+    if name == "fixed":
+        return lambda rng: params[0]
+    if name == "uniform":
+        return lambda rng: rng.uniform(*params)
+    if name == "normal":
+        return lambda rng: max(0.0, rng.gauss(*params))
+    if name == "lognormal":
+        median, sigma = params
+        return lambda rng: rng.lognormvariate(math.log(median), sigma) if median else 0.0
+    return lambda rng: rng.expovariate(1 / params[0]) if params[0] else 0.0
+
+
+class _FaultProfile:
+    """Latency, failure rates and token-bucket rate limit for one server or tool."""
+
+    def __init__(
+        self,
+        latency: Any,
+        error_rate: float,
+        error: str,
+        timeout_rate: float,
+        timeout_after: float | None,
+        rate_limit: float | None,
+        burst: int | None,
+        on_rate_limit: str,
+    ):
+        if not 0 <= error_rate <= 1 or not 0 <= timeout_rate <= 1 or error_rate + timeout_rate > 1:
+            raise ValueError("error_rate and timeout_rate must be in [0, 1] and sum to at most 1")
+        if rate_limit is not None and rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive, got {rate_limit}")
+        if on_rate_limit not in RATE_LIMIT_MODES:
+            raise ValueError(f"Unknown on_rate_limit {on_rate_limit!r}, expected one of {RATE_LIMIT_MODES}")
+
+        self.sample_latency = _latency_sampler(latency)
+        self.error_rate = error_rate
+        self.error = error
+        self.timeout_rate = timeout_rate
+        self.timeout_after = timeout_after
+        self.rate_limit = rate_limit
+        self.on_rate_limit = on_rate_limit
+        self.capacity = float(burst or max(1, math.ceil(rate_limit or 1)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def acquire(self) -> float | None:
+        """
+        Take a rate-limit token.
+
+        Returns:
+            Seconds to wait before the call may proceed, or None if the
+            call is rejected ("reject" mode with the bucket empty)
+        """
+        if self.rate_limit is None:
+            return 0.0
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_limit)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        if self.on_rate_limit == "reject":
+            return None
+        # Reserve the next token; concurrent waiters queue up behind it
+        self._tokens -= 1
+        return -self._tokens / self.rate_limit
 
 
 class MCPMockProvider:
@@ -28,13 +134,30 @@ class MCPMockProvider:
         mock.register("mcp-nifc", "get_incident", {"acres": 1200})
         response = mock.call("mcp-nifc", "get_incident", {"fire_id": "cedar-creek"})
         assert response["acres"] == 1200
+
+    Fault injection (async tool context only):
+        mock = MCPMockProvider(seed=7)
+        mock.register("mcp-nifc", "get_incident", handler=lookup)
+        mock.inject_faults("mcp-nifc", latency=("lognormal", 0.05, 0.6), error_rate=0.02)
+        tools = mock.get_tool_context()
     """
 
-    def __init__(self):
-        """Initialize empty mock registry."""
+    def __init__(self, seed: int | None = None):
+        """
+        Initialize empty mock registry.
+
+        Args:
+            seed: Seed for the fault-injection RNG, so latencies and
+                  injected failures repeat from run to run
+        """
         self._mocks: dict[str, dict[str, Any]] = {}
         self._call_history: list[dict] = []
         self._fixture_paths: list[Path] = []
+        self._faults: dict[tuple[str, str | None], _FaultProfile] = {}
+        self._fault_stats: dict[str, Counter] = {}
+        self._seed = seed
+        self._rng = random.Random(seed)
+        self._cassette: Cassette | None = None
 
     def register(
         self,
@@ -84,6 +207,39 @@ class MCPMockProvider:
 
         return self
 
+    def replay(self, cassette: Cassette | str | Path, speed: float = 1.0) -> "MCPMockProvider":
+        """
+        Register every server/tool in a cassette to answer from its recordings.
+
+        Args:
+            cassette: Cassette, or path to one
+            speed: 1.0 replays async calls with their recorded durations,
+                   10 with a tenth of them, 0 instantly (call() is always
+                   instant)
+
+        Returns:
+            Self for method chaining
+        """
+        if not isinstance(cassette, Cassette):
+            cassette = Cassette.load(cassette)
+        player = cassette.player(speed)
+        for server, tool in sorted(player.recorded_tools):
+            self._mocks.setdefault(server, {})[tool] = {"player": player}
+        return self
+
+    def record_to(self, cassette: Cassette | None) -> "MCPMockProvider":
+        """
+        Record every call (arguments, response or error, duration) to a cassette.
+
+        Async calls are recorded with their injected latency and faults, so
+        a replay reproduces a faulty run exactly. Pass None to stop.
+
+        Returns:
+            Self for method chaining
+        """
+        self._cassette = cassette
+        return self
+
     def register_fixture_directory(self, directory: str | Path) -> "MCPMockProvider":
         """
         Register all JSON files in a directory as fixtures.
@@ -107,6 +263,64 @@ class MCPMockProvider:
 
         return self
 
+    def inject_faults(
+        self,
+        server: str,
+        tool: str | None = None,
+        *,
+        latency: Any = None,
+        error_rate: float = 0.0,
+        error: str = "Injected MCP error",
+        timeout_rate: float = 0.0,
+        timeout_after: float | None = None,
+        rate_limit: float | None = None,
+        burst: int | None = None,
+        on_rate_limit: str = "reject",
+    ) -> "MCPMockProvider":
+        """
+        Make calls to a server (or one of its tools) slow, flaky or rate limited.
+
+        Faults apply to the async callables from get_tool_context() (and
+        call_async); call() stays instant and deterministic. A tool-level
+        profile replaces its server's profile. A server-level rate limit
+        is shared by all of the server's tools.
+
+        Args:
+            server: MCP server ID
+            tool: Tool name, or None for every tool on the server
+            latency: Per-call delay: seconds, a distribution tuple such as
+                     ("lognormal", median, sigma) or ("uniform", low, high),
+                     or a callable(rng) -> seconds
+            error_rate: Fraction of calls that raise RuntimeError(error)
+            error: Message for injected errors
+            timeout_rate: Fraction of calls that never answer
+            timeout_after: Seconds before a non-answering call raises
+                           TimeoutError (None: hang until cancelled)
+            rate_limit: Sustained calls per second (token bucket)
+            burst: Bucket size (default: one second of rate_limit)
+            on_rate_limit: "reject" raises RuntimeError for calls over the
+                           limit; "wait" delays them until a token frees up
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If a rate, distribution or mode is invalid
+        """
+        self._faults[(server, tool)] = _FaultProfile(
+            latency, error_rate, error, timeout_rate, timeout_after, rate_limit, burst, on_rate_limit
+        )
+        return self
+
+    def get_fault_stats(self) -> dict[str, dict[str, float]]:
+        """
+        Per "server/tool" counters for calls that had a fault profile.
+
+        Keys: calls, errors, timeouts, rate_limited, latency_seconds
+        (injected delay, including waits for a rate-limit token).
+        """
+        return {key: dict(counter) for key, counter in self._fault_stats.items()}
+
     def call(self, server: str, tool: str, params: dict | None = None) -> Any:
         """
         Simulate an MCP tool call.
@@ -123,12 +337,89 @@ class MCPMockProvider:
             KeyError: If no mock registered for server/tool
             RuntimeError: If mock was registered with an error
         """
+        self._record(server, tool, params)
+        if self._cassette is None:
+            return self._respond(server, tool, params)
+
+        start = time.perf_counter()
+        try:
+            result = self._respond(server, tool, params)
+        except Exception as e:
+            self._cassette.add(server, tool, params, time.perf_counter() - start, error=e)
+            raise
+        self._cassette.add(server, tool, params, time.perf_counter() - start, result=result)
+        return result
+
+    async def call_async(self, server: str, tool: str, params: dict | None = None) -> Any:
+        """
+        Simulate an MCP tool call with any faults injected for it.
+
+        Args:
+            server: MCP server ID
+            tool: Tool name
+            params: Tool parameters (passed to handler if registered)
+
+        Returns:
+            Registered mock response or handler result
+
+        Raises:
+            KeyError: If no mock registered for server/tool
+            RuntimeError: If mock was registered with an error, an error
+                was injected, or the call was over a "reject" rate limit
+            TimeoutError: If an injected timeout has timeout_after set
+        """
+        self._record(server, tool, params)
+        if self._cassette is None:
+            return await self._call_with_faults(server, tool, params)
+        return await self._cassette.record(
+            server, tool, params, lambda: self._call_with_faults(server, tool, params)
+        )
+
+    async def _call_with_faults(self, server: str, tool: str, params: dict | None) -> Any:
+        profile = self._faults.get((server, tool)) or self._faults.get((server, None))
+        if profile is None:
+            return await self._respond_async(server, tool, params)
+
+        stats = self._fault_stats.setdefault(f"{server}/{tool}", Counter())
+        stats["calls"] += 1
+        wait = profile.acquire()
+        if wait is None:
+            stats["rate_limited"] += 1
+            raise RuntimeError(f"Rate limit exceeded for {server}/{tool} ({profile.rate_limit:g} calls/s)")
+
+        outcome = self._rng.random()
+        delay = wait + profile.sample_latency(self._rng)
+
+        if outcome < profile.timeout_rate:
+            stats["timeouts"] += 1
+            if profile.timeout_after is None:
+                await asyncio.Event().wait()  # Until the caller cancels
+            else:
+                await asyncio.sleep(wait + profile.timeout_after)
+            raise TimeoutError(f"Injected timeout for {server}/{tool} after {profile.timeout_after:g}s")
+
+        stats["latency_seconds"] += delay
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if outcome < profile.timeout_rate + profile.error_rate:
+            stats["errors"] += 1
+            raise RuntimeError(profile.error)
+        return await self._respond_async(server, tool, params)
+
+    def _record(self, server: str, tool: str, params: dict | None) -> None:
         self._call_history.append({
             "server": server,
             "tool": tool,
             "params": params or {},
         })
 
+    async def _respond_async(self, server: str, tool: str, params: dict | None) -> Any:
+        player = self._mocks.get(server, {}).get(tool, {}).get("player")
+        if player is not None:
+            return await player.play(server, tool, params)
+        return self._respond(server, tool, params)
+
+    def _respond(self, server: str, tool: str, params: dict | None) -> Any:
         if server not in self._mocks:
             raise KeyError(f"No mocks registered for server: {server}")
 
@@ -144,6 +435,9 @@ class MCPMockProvider:
             # Call handler with params for dynamic response
             return mock_data["handler"](**(params or {}))
 
+        if "player" in mock_data:
+            return mock_data["player"].play_now(server, tool, params)
+
         return mock_data["response"]
 
     def get_call_history(self) -> list[dict]:
@@ -188,10 +482,14 @@ class MCPMockProvider:
         )
 
     def reset(self) -> None:
-        """Clear all mocks and call history."""
+        """Clear all mocks, faults and call history, stop recording, and reseed the RNG."""
         self._mocks.clear()
         self._call_history.clear()
         self._fixture_paths.clear()
+        self._faults.clear()
+        self._fault_stats.clear()
+        self._cassette = None
+        self._rng = random.Random(self._seed)
 
     @property
     def registered_servers(self) -> list[str]:
@@ -223,8 +521,6 @@ class MCPMockProvider:
             tools = mock.get_tool_context()
             result = await tools["get_incident"](fire_id="cedar-creek")
         """
-        import asyncio
-
         tools: dict[str, Any] = {}
 
         for server, server_tools in self._mocks.items():
@@ -232,7 +528,7 @@ class MCPMockProvider:
                 # Create closure to capture server and tool_name
                 def create_mock_callable(srv: str, tl: str):
                     async def mock_tool(**kwargs) -> Any:
-                        return self.call(srv, tl, kwargs)
+                        return await self.call_async(srv, tl, kwargs)
                     return mock_tool
 
                 tools[tool_name] = create_mock_callable(server, tool_name)
@@ -0,0 +1,201 @@
+"""
+Tests for the skill benchmark suite (skill_runtime.bench).
+
+Verifies fixture discovery, synthetic scaling, measurement, and the
+baseline compare gate.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from skill_runtime import bench
+from skill_runtime.loader import parse_skill_md
+
+
+SKILL_MD = """# Sector Scorer
+
+## Description
+Scores sectors.
+
+## Examples
+
+### Example 1: Two sectors
+**Input:**
+```json
+{
+  "fire_id": "cedar-creek-2022",
+  "sectors": [{"id": "NW-1", "dnbr": 0.5}, {"id": "SE-2", "dnbr": 0.2}]
+}
+```
+
+**Output:**
+```json
+{"count": 2}
+```
+
+### Example 2: Illustrative only
+**Input:**
+```json
+{ "fire_id": ... }
+```
+"""
+
+SCRIPT = """
+from pathlib import Path
+
+
+def execute(inputs):
+    if inputs.get("fail"):
+        raise RuntimeError("scorer failed")
+    if "notes" in inputs:
+        return {"notes": Path(inputs["notes"]).read_text().strip()}
+    sectors = inputs.get("sectors", [])
+    return {"count": len(sectors), "ids": [s["id"] for s in sectors]}
+"""
+
+
+@pytest.fixture
+def skill_root(tmp_path):
+    skill_dir = tmp_path / "scorer_agent" / "skills" / "sector-scorer"
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "examples").mkdir()
+    (skill_dir / "data").mkdir()
+    (skill_dir / "skill.md").write_text(SKILL_MD)
+    (skill_dir / "scripts" / "score.py").write_text(SCRIPT)
+    (skill_dir / "data" / "notes.txt").write_text("field notes\n")
+    (skill_dir / "examples" / "notes.json").write_text(json.dumps({"input": {"notes": "data/notes.txt"}}))
+    return tmp_path
+
+
+def document(results: dict) -> dict:
+    return bench.baseline_document(results, repeats=1)
+
+
+class TestCases:
+    """Test fixture discovery and scaling."""
+
+    def test_fixtures_from_examples(self, skill_root):
+        """Input blocks and examples/*.json become fixtures; invalid JSON is skipped."""
+        skill = parse_skill_md(skill_root / "scorer_agent" / "skills" / "sector-scorer" / "skill.md")
+        fixtures = bench.load_fixtures(skill)
+
+        assert sorted(fixtures) == ["example-1", "notes"]
+        assert Path(fixtures["notes"]["notes"]).is_absolute()
+
+    def test_scale_inputs(self):
+        """Lists of records are repeated with distinct ids; inputs without them aren't scaled."""
+        scaled = bench.scale_inputs({"fire_id": "f", "sectors": [{"id": "A"}, {"id": "B"}]}, 3)
+
+        assert [s["id"] for s in scaled["sectors"]] == ["A", "B", "A-1", "B-1", "A-2", "B-2"]
+        assert scaled["fire_id"] == "f"
+        assert bench.scale_inputs({"fire_id": "f", "tags": ["a"]}, 3) is None
+
+    def test_build_cases(self, skill_root):
+        """Each fixture gets a case, plus one per scale when it has records."""
+        cases = bench.build_cases([skill_root], scales=(10,))
+
+        assert [case["id"] for case in cases] == [
+            "scorer_agent/sector-scorer/score:example-1",
+            "scorer_agent/sector-scorer/score:example-1@x10",
+            "scorer_agent/sector-scorer/score:notes",
+        ]
+        assert len(cases[1]["inputs"]["sectors"]) == 20
+
+
+class TestMeasure:
+    """Test measurement."""
+
+    def test_measure_in_process(self, skill_root):
+        """Every metric is recorded for a case that runs."""
+        results = bench.run_suite(bench.build_cases([skill_root], scales=(10,)), repeats=2, isolate=False)
+
+        metrics = results["scorer_agent/sector-scorer/score:example-1@x10"]
+        assert set(metrics) == {"wall_ms", "cpu_ms", "peak_rss_kb", "alloc_peak_kb", "alloc_blocks"}
+        assert metrics["wall_ms"] > 0 and metrics["alloc_blocks"] > 0
+
+    def test_measure_isolated(self, skill_root):
+        """Isolated runs measure in a worker process with the same metrics."""
+        cases = bench.build_cases([skill_root], scales=())
+        results = bench.run_suite(cases, repeats=1)
+
+        assert set(results) == {case["id"] for case in cases}
+        assert all("error" not in metrics for metrics in results.values())
+        assert results["scorer_agent/sector-scorer/score:notes"]["peak_rss_kb"] > 0
+
+    def test_skill_error_recorded(self, skill_root):
+        """An exception is recorded for the case instead of aborting the run."""
+        case = bench.build_cases([skill_root], scales=())[0]
+        case["inputs"] = {"fail": True}
+
+        assert bench.run_suite([case], isolate=False)[case["id"]] == {"error": "RuntimeError: scorer failed"}
+
+
+class TestCompare:
+    """Test the regression gate."""
+
+    BASE = {"wall_ms": 10.0, "cpu_ms": 10.0, "peak_rss_kb": 40000, "alloc_peak_kb": 100.0, "alloc_blocks": 1000}
+
+    def test_flags_growth_above_threshold(self):
+        """Growth above the threshold and the noise floor is a regression."""
+        current = dict(self.BASE, wall_ms=14.0, alloc_blocks=1500)
+        regressions = bench.compare(document({"a": self.BASE}), document({"a": current}), threshold=0.25)
+
+        assert [(r["metric"], round(r["change"], 2)) for r in regressions] == [("wall_ms", 0.4), ("alloc_blocks", 0.5)]
+
+    def test_ignores_growth_within_noise(self):
+        """Small absolute growth isn't flagged, however large in relative terms."""
+        before = dict(self.BASE, wall_ms=0.1)
+        after = dict(self.BASE, wall_ms=0.3, cpu_ms=11.0)
+
+        assert bench.compare(document({"a": before}), document({"a": after})) == []
+
+    def test_new_error_is_regression(self):
+        """A case that now raises or is missing is flagged; new cases are not."""
+        regressions = bench.compare(
+            document({"a": self.BASE, "gone": self.BASE, "broken": {"error": "ValueError: old"}}),
+            document({"a": {"error": "ValueError: boom"}, "new": self.BASE}),
+        )
+
+        assert [(r["case"], r["metric"]) for r in regressions] == [("a", "error"), ("gone", "missing")]
+
+    def test_cli_reports_missing_cases(self, tmp_path, capsys):
+        """compare prints cases missing from the current run and exits 1."""
+        baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+        baseline.write_text(json.dumps(document({"a": self.BASE, "gone": self.BASE})))
+        current.write_text(json.dumps(document({"a": self.BASE})))
+
+        assert bench.main(["compare", str(baseline), str(current)]) == 1
+        assert "gone: missing from the current run" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("case_id, expected", [
+        ("agent/skill/run:example-1", True),
+        ("agent/skill/run:example-1@x10", True),
+        ("agent/skill/run:example-1@x100", False),
+        ("agent/other/run:example-1", False),
+    ])
+    def test_run_selection(self, case_id, expected):
+        """run --compare skips baseline cases outside its --skill / --scales selection."""
+        assert bench._selected(case_id, "skill", [10]) is expected
+
+    def test_cli_exit_codes(self, tmp_path, capsys):
+        """compare exits 1 on regressions and 0 otherwise."""
+        baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+        baseline.write_text(json.dumps(document({"a": self.BASE})))
+
+        current.write_text(json.dumps(document({"a": dict(self.BASE, cpu_ms=20.0)})))
+        assert bench.main(["compare", str(baseline), str(current)]) == 1
+        assert "cpu_ms 10.000 -> 20.000 (+100%)" in capsys.readouterr().out
+
+        assert bench.main(["compare", str(baseline), str(current), "--metrics", "wall_ms"]) == 0
+
+    def test_cli_run_writes_baseline(self, skill_root, tmp_path):
+        """run writes a baseline that compares clean against itself."""
+        output = tmp_path / "baseline.json"
+
+        assert bench.main(["run", str(skill_root), "--no-isolate", "--repeats", "1", "--output", str(output)]) == 0
+        data = json.loads(output.read_text())
+        assert data["version"] == bench.BASELINE_VERSION
+        assert len(data["results"]) == 4
+        assert bench.main(["compare", str(output), str(output)]) == 0
@@ -0,0 +1,182 @@
+"""
+Tests for MCP cassettes (skill_runtime.cassette).
+
+Verifies the on-disk format, replay matching and timing, and recording
+and replay through MCPMockProvider.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from skill_runtime.cassette import Cassette
+from skill_runtime.testing import MCPMockProvider
+
+
+FIRE = {"name": "Cedar Creek Fire", "acres": 127831}
+
+
+def make_cassette() -> Cassette:
+    cassette = Cassette()
+    cassette.add_tools("mcp-fixtures", [{"name": "get_fire_context", "inputSchema": {"type": "object"}}])
+    cassette.add("mcp-fixtures", "get_fire_context", {"fire_id": "cc"}, 0.05, result=FIRE)
+    cassette.add("mcp-fixtures", "get_fire_context", {"fire_id": "cc"}, 0.01, result={**FIRE, "acres": 1})
+    cassette.add("mcp-fixtures", "get_fire_context", {"fire_id": "bl"}, 0.02, result=FIRE)
+    cassette.add("mcp-nifc", "get_incident", {"fire_id": "cc"}, 0.03, error=TimeoutError("NIFC slow"))
+    return cassette
+
+
+class TestCassetteFile:
+    """Test saving and loading."""
+
+    @pytest.mark.parametrize("name", ["run.jsonl", "run.jsonl.gz"])
+    def test_round_trip(self, tmp_path, name):
+        """Interactions and tool schemas survive save/load, plain or gzipped."""
+        cassette = make_cassette()
+        cassette.save(tmp_path / name)
+        loaded = Cassette.load(tmp_path / name)
+
+        assert loaded.interactions == cassette.interactions
+        assert loaded.tools == cassette.tools
+        assert not (tmp_path / f"{name}.tmp").exists()
+
+    def test_identical_bodies_stored_once(self, tmp_path):
+        """A response repeated across calls is written once."""
+        make_cassette().save(tmp_path / "run.jsonl")
+        lines = [json.loads(line) for line in (tmp_path / "run.jsonl").read_text().splitlines()]
+
+        assert [line["body"] for line in lines if "data" in line] == [0, 1]
+        assert [line.get("body") for line in lines if "tool" in line] == [0, 1, 0, None]
+
+    def test_missing_and_incompatible(self, tmp_path):
+        """Missing files and other versions are rejected."""
+        with pytest.raises(FileNotFoundError):
+            Cassette.load(tmp_path / "missing.jsonl")
+
+        (tmp_path / "old.jsonl").write_text(json.dumps({"version": 0}) + "\n")
+        with pytest.raises(ValueError, match="Unsupported cassette version 0"):
+            Cassette.load(tmp_path / "old.jsonl")
+
+
+class TestCassettePlayer:
+    """Test replay matching and timing."""
+
+    def test_repeated_calls_in_order(self):
+        """Calls with the same arguments get the recorded responses in order, then start over."""
+        player = make_cassette().player(speed=0)
+
+        acres = [player.play_now("mcp-fixtures", "get_fire_context", {"fire_id": "cc"})["acres"] for _ in range(3)]
+        assert acres == [127831, 1, 127831]
+
+    def test_argument_order_irrelevant(self):
+        """Arguments match regardless of key order."""
+        cassette = Cassette()
+        cassette.add("s", "t", {"a": 1, "b": [1, 2]}, 0.0, result="ok")
+
+        assert cassette.player().play_now("s", "t", {"b": [1, 2], "a": 1}) == "ok"
+
+    def test_unrecorded_call(self):
+        """A call that was never recorded raises KeyError."""
+        with pytest.raises(KeyError, match="No recorded call to mcp-fixtures/get_fire_context"):
+            make_cassette().player().play_now("mcp-fixtures", "get_fire_context", {"fire_id": "zz"})
+
+    def test_recorded_error_raised(self):
+        """Recorded exceptions are raised again, as built-in types where possible."""
+        player = make_cassette().player()
+        with pytest.raises(TimeoutError, match="NIFC slow"):
+            player.play_now("mcp-nifc", "get_incident", {"fire_id": "cc"})
+
+        cassette = Cassette()
+        cassette.add("s", "t", {}, 0.0, error=json.JSONDecodeError("bad", "", 0))
+        with pytest.raises(RuntimeError, match="JSONDecodeError: bad"):
+            cassette.player().play_now("s", "t", {})
+
+    @pytest.mark.asyncio
+    async def test_timing(self):
+        """play() takes the recorded duration divided by speed."""
+        cassette = make_cassette()
+
+        start = time.perf_counter()
+        await cassette.player(speed=1).play("mcp-fixtures", "get_fire_context", {"fire_id": "cc"})
+        assert time.perf_counter() - start >= 0.05
+
+        start = time.perf_counter()
+        await cassette.player(speed=10).play("mcp-fixtures", "get_fire_context", {"fire_id": "cc"})
+        assert time.perf_counter() - start < 0.03
+
+        with pytest.raises(ValueError):
+            cassette.player(speed=-1)
+
+
+class TestMockRecordReplay:
+    """Test recording and replay through MCPMockProvider."""
+
+    @pytest.mark.asyncio
+    async def test_replay_reproduces_faulty_run(self, tmp_path):
+        """A run with injected faults replays identically from its cassette."""
+        cassette = Cassette()
+        mock = MCPMockProvider(seed=5).record_to(cassette)
+        mock.register("mcp-nifc", "get_incident", handler=lambda fire_id: {"fire_id": fire_id})
+        mock.inject_faults("mcp-nifc", latency=("uniform", 0, 0.002), error_rate=0.3)
+
+        async def outcomes(tools) -> list:
+            results = []
+            for i in range(20):
+                try:
+                    results.append(await tools["get_incident"](fire_id=f"fire-{i}"))
+                except RuntimeError as e:
+                    results.append(str(e))
+            return results
+
+        recorded = await outcomes(mock.get_tool_context())
+        cassette.save(tmp_path / "run.jsonl")
+
+        replay = MCPMockProvider().replay(tmp_path / "run.jsonl", speed=0)
+        assert replay.registered_tools == {"mcp-nifc": ["get_incident"]}
+        assert await outcomes(replay.get_tool_context()) == recorded
+        assert "Injected MCP error" in recorded
+
+    @pytest.mark.asyncio
+    async def test_replay_keeps_recorded_latency(self):
+        """Async replay waits the recorded duration; call() answers instantly."""
+        cassette = Cassette()
+        mock = MCPMockProvider().record_to(cassette)
+        mock.register("mcp-nifc", "get_incident", FIRE).inject_faults("mcp-nifc", latency=0.05)
+        await mock.get_tool_context()["get_incident"](fire_id="cc")
+        assert cassette.interactions[0]["duration"] >= 0.05
+
+        replay = MCPMockProvider().replay(cassette)
+        start = time.perf_counter()
+        assert await replay.get_tool_context()["get_incident"](fire_id="cc") == FIRE
+        assert time.perf_counter() - start >= 0.05
+        assert replay.call("mcp-nifc", "get_incident", {"fire_id": "cc"}) == FIRE
+
+    def test_sync_calls_recorded(self):
+        """call() is recorded too, including registered errors."""
+        cassette = Cassette()
+        mock = MCPMockProvider().record_to(cassette)
+        mock.register("mcp-fixtures", "burn-severity", {"sectors": []})
+        mock.register("mcp-fixtures", "broken", error="fixture missing")
+
+        mock.call("mcp-fixtures", "burn-severity")
+        with pytest.raises(RuntimeError):
+            mock.call("mcp-fixtures", "broken")
+        mock.record_to(None).call("mcp-fixtures", "burn-severity")
+
+        assert [(i["tool"], "error" in i) for i in cassette.interactions] == [
+            ("burn-severity", False),
+            ("broken", True),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_not_recorded(self):
+        """A call the caller gave up on leaves no interaction behind."""
+        cassette = Cassette()
+        mock = MCPMockProvider().record_to(cassette)
+        mock.register("mcp-nifc", "get_incident", FIRE).inject_faults("mcp-nifc", timeout_rate=1.0)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(mock.get_tool_context()["get_incident"](fire_id="cc"), 0.02)
+        assert len(cassette) == 0
@@ -0,0 +1,209 @@
+"""
+Tests for SkillExecutor and execute_skill_async.
+
+Verifies io/cpu dispatch from skill.md, warm worker processes, timeouts,
+cancellation, and recovery from dead workers.
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from skill_runtime.executor import SkillExecutor, execute_skill_async
+from skill_runtime.loader import parse_skill_md
+
+
+SCRIPT = """
+import os
+import threading
+import time
+
+calls = 0
+
+
+def execute(inputs):
+    global calls
+    calls += 1
+    action = inputs.get("action")
+    if action == "sleep":
+        time.sleep(inputs["seconds"])
+    elif action == "spin":
+        deadline = time.perf_counter() + inputs["seconds"]
+        while time.perf_counter() < deadline:
+            pass
+    elif action == "raise":
+        raise ValueError("bad input")
+    elif action == "exit":
+        os._exit(1)
+    elif action == "unpicklable":
+        return {"lock": threading.Lock()}
+    return {"pid": os.getpid(), "thread": threading.current_thread().name, "calls": calls}
+"""
+
+
+def make_skill(root: Path, name: str, execution: str = "") -> Path:
+    """Skill folder with scripts/run.py and a skill.md with an optional Execution section."""
+    skill_dir = root / name
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "scripts" / "run.py").write_text(SCRIPT)
+    section = f"\n## Execution\n{execution}\n" if execution else ""
+    (skill_dir / "skill.md").write_text(f"# {name}\n\n## Description\nTest skill.\n{section}")
+    return skill_dir
+
+
+@pytest.fixture(scope="module")
+def skills(tmp_path_factory):
+    root = tmp_path_factory.mktemp("skills")
+    return {
+        "io": make_skill(root, "io-skill"),
+        "cpu": make_skill(root, "cpu-skill", "- class: cpu\n- timeout: 5"),
+    }
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = SkillExecutor(io_workers=4, cpu_workers=1)
+    executor.warm_up()
+    yield executor
+    executor.shutdown()
+
+
+class TestExecutionSection:
+    """Test the ## Execution section of skill.md."""
+
+    def test_defaults(self, skills):
+        """Skills without the section run as io with the default timeout."""
+        metadata = parse_skill_md(skills["io"] / "skill.md")
+        assert (metadata.execution_class, metadata.timeout_seconds) == ("io", 30.0)
+
+    def test_declared_class_and_timeout(self, skills):
+        """Class and timeout are read from the bullets."""
+        metadata = parse_skill_md(skills["cpu"] / "skill.md")
+        assert (metadata.execution_class, metadata.timeout_seconds) == ("cpu", 5.0)
+        assert metadata.to_dict()["execution_class"] == "cpu"
+
+    @pytest.mark.parametrize("execution", ["- class: gpu", "- timeout: soon", "- timeout: 0"])
+    def test_invalid_declaration(self, tmp_path, execution):
+        """Unknown classes and non-positive timeouts are rejected."""
+        skill_dir = make_skill(tmp_path, "bad", execution)
+        with pytest.raises(ValueError):
+            parse_skill_md(skill_dir / "skill.md")
+
+
+    def test_declared_read_once_per_skill(self, tmp_path):
+        """The executor parses a skill's Execution section on its first call only."""
+        skill_dir = make_skill(tmp_path, "cached", "- class: cpu\n- timeout: 5")
+        executor = SkillExecutor(io_workers=1, cpu_workers=1)
+
+        assert executor.declared(skill_dir) == ("cpu", 5.0)
+        (skill_dir / "skill.md").unlink()
+        assert executor.declared(skill_dir) == ("cpu", 5.0)
+        assert executor.declared(tmp_path / "missing") == ("io", 30.0)
+        executor.shutdown()
+
+
+class TestDispatch:
+    """Test io/cpu dispatch."""
+
+    async def test_io_skill_runs_on_thread_pool(self, executor, skills):
+        """io skills run on a skill-io thread in this process."""
+        result = await execute_skill_async(skills["io"], "run", {}, executor=executor)
+
+        assert result["pid"] == os.getpid()
+        assert result["thread"].startswith("skill-io")
+
+    async def test_cpu_skill_runs_in_warm_worker(self, executor, skills):
+        """cpu skills run in another process that keeps the module loaded."""
+        first = await execute_skill_async(skills["cpu"], "run", {}, executor=executor)
+        second = await execute_skill_async(skills["cpu"], "run", {}, executor=executor)
+
+        assert first["pid"] != os.getpid()
+        assert second["pid"] == first["pid"]
+        assert second["calls"] == first["calls"] + 1
+
+    async def test_class_override(self, executor, skills):
+        """An explicit execution_class overrides skill.md."""
+        result = await executor.run(skills["io"], "run", {}, execution_class="cpu")
+        assert result["pid"] != os.getpid()
+
+    @pytest.mark.parametrize("skill", ["io", "cpu"])
+    async def test_skill_exception_propagates(self, executor, skills, skill):
+        """Exceptions raised by the skill reach the caller unchanged."""
+        with pytest.raises(ValueError, match="bad input"):
+            await executor.run(skills[skill], "run", {"action": "raise"})
+
+    async def test_unpicklable_result(self, executor, skills):
+        """A cpu result that can't be sent back raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="unpicklable"):
+            await executor.run(skills["cpu"], "run", {"action": "unpicklable"})
+
+    async def test_event_loop_not_blocked(self, executor, skills):
+        """The loop keeps ticking while a cpu skill spins."""
+        lags = []
+
+        async def ticker():
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - start - 0.01)
+
+        task = asyncio.create_task(ticker())
+        await executor.run(skills["cpu"], "run", {"action": "spin", "seconds": 0.5})
+        task.cancel()
+
+        assert len(lags) > 5
+        assert max(lags) < 0.25
+
+
+class TestTimeoutsAndCancellation:
+    """Test timeouts, cancellation and worker replacement."""
+
+    async def test_cpu_timeout_kills_worker(self, executor, skills):
+        """A timed-out cpu skill is stopped and its worker replaced."""
+        before = await executor.run(skills["cpu"], "run", {})
+
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError, match="timed out after 0.3s"):
+            await executor.run(skills["cpu"], "run", {"action": "sleep", "seconds": 30}, timeout=0.3)
+        assert time.perf_counter() - start < 5
+
+        after = await executor.run(skills["cpu"], "run", {})
+        assert after["pid"] != before["pid"]
+
+    async def test_cpu_cancel_kills_worker(self, executor, skills):
+        """Cancelling the awaiting task stops the cpu skill."""
+        before = await executor.run(skills["cpu"], "run", {})
+        task = asyncio.create_task(executor.run(skills["cpu"], "run", {"action": "sleep", "seconds": 30}))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        after = await executor.run(skills["cpu"], "run", {})
+        assert after["pid"] != before["pid"]
+
+    async def test_io_timeout(self, executor, skills):
+        """io skills time out too (the thread finishes in the background)."""
+        with pytest.raises(TimeoutError):
+            await executor.run(skills["io"], "run", {"action": "sleep", "seconds": 0.5}, timeout=0.05)
+
+    async def test_dead_worker_replaced(self, executor, skills):
+        """A worker that exits mid-call raises RuntimeError and is replaced."""
+        with pytest.raises(RuntimeError, match="exited"):
+            await executor.run(skills["cpu"], "run", {"action": "exit"})
+
+        result = await executor.run(skills["cpu"], "run", {})
+        assert result["calls"] == 1
+
+    async def test_shutdown_stops_workers(self, skills):
+        """shutdown() stops the worker processes."""
+        executor = SkillExecutor(cpu_workers=1)
+        await executor.run(skills["cpu"], "run", {})
+        workers = list(executor._processes._workers)
+
+        executor.shutdown()
+
+        assert workers and not any(worker.process.is_alive() for worker in workers)
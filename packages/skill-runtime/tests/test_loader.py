@@ -4,13 +4,17 @@ Tests for skill loader functionality.
 Verifies skill discovery, metadata parsing, and script execution.
 """
 
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
+from skill_runtime import loader
 from skill_runtime.loader import (
+    SkillManifest,
     SkillMetadata,
+    clear_skill_cache,
     discover_skills,
     execute_skill,
     load_skill_script,
@@ -124,6 +128,164 @@ class TestDiscoverSkills:
         assert len(skills) >= 1
 
 
+SKILL_MD = """# {name}
+
+## Description
+Scores {name}.
+
+## Triggers
+- score {name}
+
+## Inputs
+| Input | Type | Required |
+|-------|------|----------|
+| fire_id | string | Yes |
+
+## Outputs
+| Output | Type |
+|--------|------|
+| score | number |
+"""
+
+
+def write_skill(root: Path, name: str) -> Path:
+    """Write root/<name>/skill.md and return its path."""
+    skill_md = root / name / "skill.md"
+    skill_md.parent.mkdir(parents=True, exist_ok=True)
+    skill_md.write_text(SKILL_MD.format(name=name))
+    return skill_md
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward a second, as an edit would."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def backdate(root: Path) -> None:
+    """Age every file and directory under root, like an existing checkout."""
+    old = 1_000_000_000_000_000_000
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, ns=(old, old))
+
+
+class TestSkillManifest:
+    """Test the persisted skill manifest index."""
+
+    def test_single_pass_parse_sections(self, tmp_path):
+        """Every section is extracted from one pass; repeated headings keep the first."""
+        skill_md = write_skill(tmp_path, "alpha")
+        skill_md.write_text(skill_md.read_text() + "\n## Description\nIgnored duplicate\n")
+
+        metadata = parse_skill_md(skill_md)
+
+        assert metadata.name == "alpha"
+        assert metadata.description == "Scores alpha."
+        assert metadata.triggers == ["score alpha"]
+        assert metadata.inputs == [{"Input": "fire_id", "Type": "string", "Required": "Yes"}]
+        assert metadata.outputs == [{"Output": "score", "Type": "number"}]
+
+    def test_manifest_matches_parser(self, tmp_path):
+        """Discovery through the manifest returns what parsing returns."""
+        for name in ("alpha", "beta"):
+            write_skill(tmp_path, name)
+
+        plain = discover_skills([tmp_path])
+        indexed = discover_skills([tmp_path], manifest=SkillManifest(tmp_path / "manifest.json"))
+
+        assert sorted(s.to_dict()["name"] for s in indexed) == ["alpha", "beta"]
+        assert sorted(map(SkillMetadata.to_dict, indexed), key=str) == sorted(map(SkillMetadata.to_dict, plain), key=str)
+
+    def test_unchanged_skills_not_reparsed(self, tmp_path):
+        """A reloaded manifest serves unchanged skills without parsing."""
+        index = tmp_path / "index" / "manifest.json"
+        for name in ("alpha", "beta", "gamma"):
+            write_skill(tmp_path / "skills", name)
+
+        first = SkillManifest(index)
+        discover_skills([tmp_path / "skills"], manifest=first)
+        assert first.parsed == 3 and index.exists()
+
+        second = SkillManifest(index)
+        skills = discover_skills([tmp_path / "skills"], manifest=second)
+        assert second.parsed == 0
+        assert len(skills) == 3
+
+    def test_changed_skill_reparsed(self, tmp_path):
+        """An edited skill.md is re-parsed; a touched but identical one is not."""
+        index = tmp_path / "manifest.json"
+        alpha = write_skill(tmp_path / "skills", "alpha")
+        beta = write_skill(tmp_path / "skills", "beta")
+        discover_skills([tmp_path / "skills"], manifest=SkillManifest(index))
+
+        alpha.write_text(alpha.read_text().replace("Scores alpha.", "Scores alpha v2."))
+        bump_mtime(alpha)
+        bump_mtime(beta)
+
+        manifest = SkillManifest(index)
+        skills = {s.name: s for s in discover_skills([tmp_path / "skills"], manifest=manifest)}
+        assert manifest.parsed == 1
+        assert skills["alpha"].description == "Scores alpha v2."
+
+    def test_deleted_skill_pruned(self, tmp_path):
+        """Removed skills leave the index; other roots' entries stay."""
+        manifest = SkillManifest(tmp_path / "manifest.json")
+        gone = write_skill(tmp_path / "a", "alpha")
+        write_skill(tmp_path / "b", "beta")
+        discover_skills([tmp_path / "a", tmp_path / "b"], manifest=manifest)
+
+        gone.unlink()
+        skills = discover_skills([tmp_path / "a"], manifest=manifest)
+
+        assert skills == []
+        assert len(manifest) == 1
+        assert len(SkillManifest(tmp_path / "manifest.json")) == 1
+
+    def test_unchanged_tree_not_walked(self, tmp_path, monkeypatch):
+        """Directories whose mtimes match the index are not listed again."""
+        index = tmp_path / "manifest.json"
+        for name in ("alpha", "beta"):
+            write_skill(tmp_path / "skills", name)
+        backdate(tmp_path / "skills")
+        discover_skills([tmp_path / "skills"], manifest=SkillManifest(index))
+
+        walks = []
+        walk = loader._walk_skill_files
+        monkeypatch.setattr(loader, "_walk_skill_files", lambda root: walks.append(root) or walk(root))
+
+        assert len(discover_skills([tmp_path / "skills"], manifest=SkillManifest(index))) == 2
+        assert walks == []
+
+        write_skill(tmp_path / "skills", "gamma")
+        skills = discover_skills([tmp_path / "skills"], manifest=SkillManifest(index))
+        assert sorted(s.name for s in skills) == ["alpha", "beta", "gamma"]
+        assert len(walks) == 1
+
+    def test_recent_mtimes_not_trusted(self, tmp_path, monkeypatch):
+        """A tree modified within the racy window is walked again."""
+        manifest = SkillManifest()
+        write_skill(tmp_path, "alpha")
+        discover_skills([tmp_path], manifest=manifest)
+
+        walks = []
+        walk = loader._walk_skill_files
+        monkeypatch.setattr(loader, "_walk_skill_files", lambda root: walks.append(root) or walk(root))
+        discover_skills([tmp_path], manifest=manifest)
+
+        assert len(walks) == 1
+        assert manifest.parsed == 1
+
+    def test_corrupt_manifest_rebuilt(self, tmp_path):
+        """An unreadable index file is ignored and rewritten."""
+        index = tmp_path / "manifest.json"
+        index.write_text("{not json")
+        write_skill(tmp_path / "skills", "alpha")
+
+        manifest = SkillManifest(index)
+        assert [s.name for s in discover_skills([tmp_path / "skills"], manifest=manifest)] == ["alpha"]
+        assert len(SkillManifest(index)) == 1
+
+
 class TestLoadSkillScript:
     """Test script loading."""
 
@@ -197,6 +359,75 @@ class TestExecuteSkill:
             )
 
 
+def write_script(skill_dir: Path, name: str, body: str) -> Path:
+    """Write skill_dir/scripts/<name>.py and return its path."""
+    script = skill_dir / "scripts" / f"{name}.py"
+    script.parent.mkdir(parents=True, exist_ok=True)
+    script.write_text(body)
+    return script
+
+
+class TestSkillModuleCache:
+    """Test the path + mtime keyed script module cache."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self):
+        clear_skill_cache()
+        yield
+        clear_skill_cache()
+
+    def test_repeat_loads_reuse_module(self, tmp_path):
+        """A second load returns the already executed module."""
+        write_script(tmp_path, "run", "def execute(inputs):\n    return {'ok': True}\n")
+
+        first = load_skill_script(tmp_path, "run")
+        assert load_skill_script(tmp_path, "run.py") is first
+        assert execute_skill(tmp_path, "run", {}) == {"ok": True}
+        assert load_skill_script(tmp_path, "run") is first
+
+    def test_modified_script_is_reloaded(self, tmp_path):
+        """A changed mtime re-executes the script."""
+        script = write_script(tmp_path, "run", "def execute(inputs):\n    return {'version': 1}\n")
+        first = load_skill_script(tmp_path, "run")
+
+        script.write_text("def execute(inputs):\n    return {'version': 2}\n")
+        stat = script.stat()
+        os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = load_skill_script(tmp_path, "run")
+        assert second is not first
+        assert execute_skill(tmp_path, "run", {}) == {"version": 2}
+
+    def test_same_stem_in_two_skills_does_not_collide(self, tmp_path):
+        """Scripts named alike in different skills get distinct modules."""
+        write_script(tmp_path / "skill_a", "classify", "def execute(inputs):\n    return {'skill': 'a'}\n")
+        write_script(tmp_path / "skill_b", "classify", "def execute(inputs):\n    return {'skill': 'b'}\n")
+
+        a = load_skill_script(tmp_path / "skill_a", "classify")
+        b = load_skill_script(tmp_path / "skill_b", "classify")
+
+        assert a.__name__ != b.__name__
+        assert sys.modules[a.__name__] is a and sys.modules[b.__name__] is b
+        assert execute_skill(tmp_path / "skill_a", "classify", {}) == {"skill": "a"}
+        assert execute_skill(tmp_path / "skill_b", "classify", {}) == {"skill": "b"}
+
+    def test_failed_script_is_not_registered(self, tmp_path):
+        """A script that raises on import leaves nothing cached or registered."""
+        write_script(tmp_path, "broken", "raise RuntimeError('bad script')\n")
+
+        with pytest.raises(RuntimeError, match="bad script"):
+            load_skill_script(tmp_path, "broken")
+        assert not [name for name in sys.modules if name.startswith("skill_script_broken_")]
+
+    def test_clear_skill_cache(self, tmp_path):
+        """Clearing the cache forces re-execution."""
+        write_script(tmp_path, "run", "def execute(inputs):\n    return {}\n")
+        first = load_skill_script(tmp_path, "run")
+
+        clear_skill_cache()
+        assert load_skill_script(tmp_path, "run") is not first
+
+
 class TestIntegration:
     """Integration tests with real skills."""
 
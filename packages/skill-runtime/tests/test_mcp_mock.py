@@ -1,11 +1,14 @@
 """
 Tests for MCPMockProvider.
 
-Verifies mock registration, fixture injection, and call tracking.
+Verifies mock registration, fixture injection, call tracking, and
+latency/fault injection.
 """
 
+import asyncio
 import json
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -321,3 +324,141 @@ class TestSkillExecutionContext:
         assert ctx.get_metadata("start_time") == "2025-12-25T10:00:00"
         assert ctx.get_metadata("user_id") == "ranger-001"
         assert ctx.get_metadata("missing", "default") == "default"
+
+
+class TestFaultInjection:
+    """Test latency, error, timeout and rate-limit injection."""
+
+    @staticmethod
+    def make_mock(seed: int | None = 1) -> MCPMockProvider:
+        mock = MCPMockProvider(seed=seed)
+        mock.register("mcp-nifc", "get_incident", handler=lambda fire_id: {"fire_id": fire_id})
+        mock.register("mcp-nifc", "get_perimeter", {"type": "Polygon"})
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_sync_call_ignores_faults(self):
+        """call() stays instant and deterministic; only async calls get faults."""
+        mock = self.make_mock().inject_faults("mcp-nifc", error_rate=1.0)
+
+        assert mock.call("mcp-nifc", "get_incident", {"fire_id": "a"}) == {"fire_id": "a"}
+        with pytest.raises(RuntimeError, match="Injected MCP error"):
+            await mock.get_tool_context()["get_incident"](fire_id="a")
+
+    @pytest.mark.asyncio
+    async def test_latency_delays_calls(self):
+        """Calls take the injected latency."""
+        mock = self.make_mock().inject_faults("mcp-nifc", "get_incident", latency=0.05)
+        tools = mock.get_tool_context()
+
+        start = time.perf_counter()
+        await tools["get_incident"](fire_id="a")
+        assert time.perf_counter() - start >= 0.05
+
+        start = time.perf_counter()
+        await tools["get_perimeter"]()
+        assert time.perf_counter() - start < 0.05
+
+    @pytest.mark.parametrize("latency", [
+        ("uniform", 0.001, 0.002),
+        ("normal", 0.001, 0.001),
+        ("lognormal", 0.001, 0.5),
+        ("exponential", 0.001),
+        lambda rng: rng.choice([0.001, 0.002]),
+    ])
+    @pytest.mark.asyncio
+    async def test_latency_distributions(self, latency):
+        """Each distribution samples non-negative delays."""
+        mock = self.make_mock().inject_faults("mcp-nifc", latency=latency)
+        tools = mock.get_tool_context()
+
+        for _ in range(5):
+            await tools["get_incident"](fire_id="a")
+
+        stats = mock.get_fault_stats()["mcp-nifc/get_incident"]
+        assert stats["calls"] == 5
+        assert stats["latency_seconds"] > 0
+
+    @pytest.mark.parametrize("latency", [("gamma", 1, 2), ("uniform", 0.1), ("fixed", -1)])
+    def test_invalid_latency(self, latency):
+        """Unknown distributions and bad parameters are rejected."""
+        with pytest.raises(ValueError):
+            MCPMockProvider().inject_faults("mcp-nifc", latency=latency)
+
+    def test_invalid_rates(self):
+        """Rates outside [0, 1] and non-positive rate limits are rejected."""
+        mock = MCPMockProvider()
+        with pytest.raises(ValueError):
+            mock.inject_faults("mcp-nifc", error_rate=0.7, timeout_rate=0.5)
+        with pytest.raises(ValueError):
+            mock.inject_faults("mcp-nifc", rate_limit=0)
+        with pytest.raises(ValueError):
+            mock.inject_faults("mcp-nifc", rate_limit=5, on_rate_limit="drop")
+
+    @pytest.mark.asyncio
+    async def test_seeded_runs_repeat(self):
+        """The same seed injects the same failures."""
+        async def outcomes(seed):
+            mock = self.make_mock(seed).inject_faults("mcp-nifc", error_rate=0.5)
+            tools = mock.get_tool_context()
+            results = []
+            for i in range(40):
+                try:
+                    await tools["get_incident"](fire_id=str(i))
+                    results.append(True)
+                except RuntimeError:
+                    results.append(False)
+            return results
+
+        first = await outcomes(7)
+        assert first == await outcomes(7)
+        assert 5 < first.count(False) < 35
+        assert first != await outcomes(8)
+
+    @pytest.mark.asyncio
+    async def test_timeout_hangs_until_cancelled(self):
+        """Injected timeouts never answer unless timeout_after is set."""
+        mock = self.make_mock().inject_faults("mcp-nifc", "get_incident", timeout_rate=1.0)
+        tools = mock.get_tool_context()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(tools["get_incident"](fire_id="a"), 0.05)
+
+        mock.inject_faults("mcp-nifc", "get_incident", timeout_rate=1.0, timeout_after=0.01)
+        with pytest.raises(TimeoutError, match="after 0.01s"):
+            await tools["get_incident"](fire_id="a")
+        assert mock.get_fault_stats()["mcp-nifc/get_incident"]["timeouts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_rejects_over_burst(self):
+        """Calls beyond the burst are rejected; the server bucket is shared by its tools."""
+        mock = self.make_mock().inject_faults("mcp-nifc", rate_limit=1, burst=2)
+        tools = mock.get_tool_context()
+
+        await tools["get_incident"](fire_id="a")
+        await tools["get_perimeter"]()
+        with pytest.raises(RuntimeError, match="Rate limit exceeded for mcp-nifc/get_incident"):
+            await tools["get_incident"](fire_id="b")
+        assert len(mock.get_call_history()) == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_wait_spaces_calls(self):
+        """In "wait" mode calls over the limit are delayed, not rejected."""
+        mock = self.make_mock().inject_faults("mcp-nifc", rate_limit=50, burst=1, on_rate_limit="wait")
+        tools = mock.get_tool_context()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(tools["get_incident"](fire_id=str(i)) for i in range(5)))
+
+        assert time.perf_counter() - start >= 0.07  # 4 waits of 20 ms
+        assert mock.get_fault_stats()["mcp-nifc/get_incident"].get("rate_limited", 0) == 0
+
+    @pytest.mark.asyncio
+    async def test_reset_clears_faults(self):
+        """reset() drops fault profiles and stats."""
+        mock = self.make_mock().inject_faults("mcp-nifc", error_rate=1.0)
+        mock.reset()
+        mock.register("mcp-nifc", "get_perimeter", {"type": "Polygon"})
+
+        assert await mock.get_tool_context()["get_perimeter"]() == {"type": "Polygon"}
+        assert mock.get_fault_stats() == {}
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+RANGER Audit Bridge Contention Benchmark
+
+Records audit events from many threads at once (default 64) and compares the
+lock-striped ring-buffer AuditEventBridge with the previous design (one
+global lock, list.pop(0) trimming), kept here as LegacyAuditEventBridge:
+
+- isolated: every thread records into its own invocation
+- shared:   all threads record into 4 invocations (full ring buffers)
+- mixed:    isolated writers plus a get_audit_trail() after every 10th event
+
+Events are pre-serialized dicts, so only the store itself is measured.
+
+Run with: python scripts/bench_audit_bridge.py --threads 64 --events 2000
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from agents._shared.audit_bridge import AuditEventBridge  # noqa: E402
+
+
+class LegacyAuditEventBridge:
+    """The store as it was: one lock for everything, O(n) trimming."""
+
+    def __init__(self, max_events_per_invocation: int = 100):
+        self._store = defaultdict(list)
+        self._lock = threading.Lock()
+        self._max_events_per_invocation = max_events_per_invocation
+
+    def _record(self, invocation_id, event):
+        with self._lock:
+            key = invocation_id or "default"
+            self._store[key].append(event)
+            if len(self._store[key]) > self._max_events_per_invocation:
+                self._store[key].pop(0)
+
+    def get_audit_trail(self, invocation_id):
+        with self._lock:
+            return self._store.get(invocation_id, []).copy()
+
+
+def make_event(thread_id: int, i: int) -> dict:
+    return {
+        "event_type": "tool_response",
+        "agent": f"agent_{thread_id % 5}",
+        "tool": "assess_severity",
+        "confidence": 0.9,
+        "data_sources": ["MTBS"],
+        "reasoning_chain": ["Loaded sectors", f"Step {i}"],
+    }
+
+
+def run(bridge, scenario: str, threads: int, events: int) -> float:
+    """Events recorded per second across all threads."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(thread_id: int) -> None:
+        invocation_id = f"inv-{thread_id % 4}" if scenario == "shared" else f"inv-{thread_id}"
+        batch = [make_event(thread_id, i) for i in range(events)]
+        barrier.wait()
+        for i, event in enumerate(batch):
+            bridge._record(invocation_id, event)
+            if scenario == "mixed" and i % 10 == 9:
+                bridge.get_audit_trail(invocation_id)
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    start = time.perf_counter()
+    barrier.wait()
+    for w in workers:
+        w.join()
+    return threads * events / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Audit bridge contention benchmark")
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--events", type=int, default=2000, help="Events per thread")
+    parser.add_argument("--max-events", type=int, default=100, help="Ring buffer size per invocation")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    stores = {
+        "legacy": lambda: LegacyAuditEventBridge(args.max_events),
+        "striped": lambda: AuditEventBridge(args.max_events),
+    }
+    results = {}
+    for scenario in ("isolated", "shared", "mixed"):
+        results[scenario] = {}
+        for name, factory in stores.items():
+            rates = []
+            for _ in range(args.repeats):
+                bridge = factory()
+                rates.append(run(bridge, scenario, args.threads, args.events))
+                if hasattr(bridge, "close"):
+                    bridge.close()
+            results[scenario][name] = max(rates)
+
+    print(f"{args.threads} threads x {args.events} events, best of {args.repeats}\n")
+    print(f"{'scenario':<10} {'legacy ev/s':>12} {'striped ev/s':>13} {'speedup':>8}")
+    for scenario, r in results.items():
+        print(f"{scenario:<10} {r['legacy']:>12.0f} {r['striped']:>13.0f} {r['striped'] / r['legacy']:>7.2f}x")
+
+    if args.output:
+        args.output.write_text(json.dumps({"threads": args.threads, "events": args.events, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
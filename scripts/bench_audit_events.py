@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+RANGER Audit Callback Storm Benchmark
+
+Drives the ADR-007.1 audit callbacks (create_audit_callbacks) through a storm
+of before/after tool calls and profiles the AuditEventBridge record path:
+
+- eager: events serialized with dataclasses.asdict() when recorded (the
+         previous behavior, which deep-copied parameters / data_sources /
+         reasoning_chain on every callback)
+- lazy:  slotted events stored as-is, serialized by get_audit_trail()
+
+Reports callback time (without tracing) and, under tracemalloc, the bytes
+the bridge retains after the storm and the peak. A read phase then
+serializes --read-fraction of the invocations, as SSE middleware would.
+
+Run with: python scripts/bench_audit_events.py --calls 50000
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from agents._shared import audit_bridge  # noqa: E402
+from agents._shared.audit_bridge import AuditEventBridge  # noqa: E402
+from agents._shared.callbacks import create_audit_callbacks  # noqa: E402
+
+
+class EagerAuditEventBridge(AuditEventBridge):
+    """Serializes on record, as the bridge did before lazy serialization."""
+
+    def _record(self, invocation_id, event):
+        super()._record(invocation_id, dataclasses.asdict(event))
+
+    def _events(self, invocation_id):
+        return [_Serialized(d) for d in super()._events(invocation_id)]
+
+
+class _Serialized(dict):
+    """An already-serialized event, readable through the lazy read path."""
+
+    def to_dict(self):
+        return dict(self)
+
+    @property
+    def event_type(self):
+        return self["event_type"]
+
+
+def tool_response(i: int) -> dict:
+    """Skill-shaped response with proof layer fields."""
+    return {
+        "status": "success",
+        "confidence": 0.9,
+        "data_sources": ["MTBS burn severity map", "Cedar Creek field assessment", "Sentinel-2"],
+        "reasoning_chain": [f"Step {n}: analyzed sector {i % 8}" for n in range(10)],
+        "sectors": [{"id": f"S-{n}", "severity": "HIGH"} for n in range(8)],
+    }
+
+
+def storm(kind: str, calls: int, invocations: int, traced: bool) -> dict:
+    """Run `calls` before/after callback pairs against a fresh bridge."""
+    bridge = (EagerAuditEventBridge if kind == "eager" else AuditEventBridge)(ttl_seconds=0)
+    audit_bridge._audit_bridge = bridge
+    before, after, _ = create_audit_callbacks("burn_analyst")
+    tool = types.SimpleNamespace(name="assess_severity")
+    contexts = [types.SimpleNamespace(session_id=f"session-{n}", invocation_id=f"inv-{n}") for n in range(invocations)]
+    work = [
+        ({"fire_id": "cedar-creek-2022", "sector_ids": [f"S-{n}" for n in range(8)]}, tool_response(i))
+        for i in range(calls)
+    ]
+
+    gc.collect()
+    if traced:
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for i, (args, response) in enumerate(work):
+        context = contexts[i % invocations]
+        before(tool, args, context)
+        after(tool, args, context, response)
+    elapsed = time.perf_counter() - start
+    result = {"us_per_call": elapsed / calls * 1e6}
+    if traced:
+        del work
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        result["retained_bytes"] = current - base
+        result["peak_bytes"] = peak - base
+        tracemalloc.stop()
+    return result, bridge
+
+
+def read_phase(bridge: AuditEventBridge, invocations: int, fraction: float) -> float:
+    """Milliseconds to serialize the trails of `fraction` of the invocations."""
+    sessions = [f"session-{n}" for n in range(0, invocations, max(1, round(1 / fraction)))]
+    start = time.perf_counter()
+    for session in sessions:
+        bridge.get_audit_trail(session)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Audit callback storm allocation benchmark")
+    parser.add_argument("--calls", type=int, default=50000, help="before/after callback pairs")
+    parser.add_argument("--invocations", type=int, default=500, help="Distinct session IDs")
+    parser.add_argument("--read-fraction", type=float, default=0.1, help="Share of invocations read back")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    # Callbacks log at INFO; a storm should measure the audit path, not logging
+    logging.getLogger("ranger").setLevel(logging.WARNING)
+
+    results = {}
+    for kind in ("eager", "lazy"):
+        timings = [storm(kind, args.calls, args.invocations, traced=False)[0]["us_per_call"] for _ in range(args.repeats)]
+        memory, bridge = storm(kind, args.calls, args.invocations, traced=True)
+        results[kind] = {
+            "us_per_call": min(timings),
+            "retained_bytes": memory["retained_bytes"],
+            "peak_bytes": memory["peak_bytes"],
+            "read_ms": read_phase(bridge, args.invocations, args.read_fraction),
+        }
+
+    print(f"{args.calls} before/after callback pairs over {args.invocations} invocations, "
+          f"reading {args.read_fraction:.0%} of trails\n")
+    print(f"{'path':<6} {'us/call':>8} {'retained MB':>12} {'peak MB':>8} {'read ms':>8}")
+    for kind, r in results.items():
+        print(f"{kind:<6} {r['us_per_call']:>8.2f} {r['retained_bytes'] / 1e6:>12.1f} "
+              f"{r['peak_bytes'] / 1e6:>8.1f} {r['read_ms']:>8.1f}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"calls": args.calls, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+RANGER Audit Log Sink Benchmark
+
+Measures the durable JsonlAuditSink behind the AuditEventBridge:
+
+- throughput: events/sec through the writer thread (write() until flush()
+              returns) for fsync every batch, fsync every second and no fsync
+- callback:   per-call latency (p50/p99) of the audit before/after callbacks
+              with no sink vs with the sink attached
+- lookup:     read_trail(session_id=...) through the segment indexes vs a
+              full scan of every segment
+
+Run with: python scripts/bench_audit_sink.py --events 100000
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import types
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from agents._shared import audit_bridge  # noqa: E402
+from agents._shared.audit_bridge import AuditEventBridge, ToolInvocationEvent, ToolResponseEvent  # noqa: E402
+from agents._shared.audit_sink import JsonlAuditSink  # noqa: E402
+from agents._shared.callbacks import create_audit_callbacks  # noqa: E402
+
+FSYNC_MODES = {"every batch": 0.0, "1s": 1.0, "never": -1.0}
+
+
+def make_events(count: int, sessions: int) -> list[tuple[str, object]]:
+    """Alternating invocation/response events spread over `sessions` sessions."""
+    events = []
+    for i in range(count // 2):
+        invocation_id = f"inv-{i}"
+        events.append((invocation_id, ToolInvocationEvent(
+            agent="burn_analyst",
+            tool="assess_severity",
+            parameters={"fire_id": "cedar-creek-2022", "sector_ids": [f"S-{n}" for n in range(8)]},
+            invocation_id=invocation_id,
+            session_id=f"session-{i % sessions}",
+        )))
+        events.append((invocation_id, ToolResponseEvent(
+            agent="burn_analyst",
+            tool="assess_severity",
+            status="success",
+            confidence=0.9,
+            reasoning_chain=[f"Step {n}: analyzed sector {i % 8}" for n in range(10)],
+            data_sources=["MTBS burn severity map", "Sentinel-2"],
+            invocation_id=invocation_id,
+        )))
+    return events
+
+
+def throughput(events, fsync: float, segment_mb: int) -> dict:
+    """Events/sec and MB/sec from the first write() until flush() returns."""
+    with tempfile.TemporaryDirectory() as directory:
+        # Queue the whole burst: this measures the writer, not the drop policy
+        sink = JsonlAuditSink(
+            directory,
+            segment_max_bytes=segment_mb * 1024 * 1024,
+            fsync_interval_seconds=fsync,
+            max_queued=len(events),
+        )
+        start = time.perf_counter()
+        for invocation_id, event in events:
+            sink.write(invocation_id, event)
+        sink.flush()
+        elapsed = time.perf_counter() - start
+        sink.close()
+        stats = sink.stats()
+    return {
+        "events_per_sec": len(events) / elapsed,
+        "mb_per_sec": stats["bytes_written"] / elapsed / 1e6,
+        "fsyncs": stats["fsyncs"],
+        "segments": stats["rotations"] + 1,
+        "dropped": stats["events_dropped"],
+    }
+
+
+def callback_latency(calls: int, sink) -> dict:
+    """p50/p99 microseconds of one before+after callback pair."""
+    bridge = AuditEventBridge(ttl_seconds=0, sink=sink)
+    audit_bridge._audit_bridge = bridge
+    before, after, _ = create_audit_callbacks("burn_analyst")
+    tool = types.SimpleNamespace(name="assess_severity")
+    response = {"status": "success", "confidence": 0.9, "data_sources": ["MTBS"], "reasoning_chain": ["Loaded"]}
+    samples = []
+    for i in range(calls):
+        context = types.SimpleNamespace(session_id=f"session-{i % 100}", invocation_id=f"inv-{i}")
+        start = time.perf_counter()
+        before(tool, {"fire_id": "cedar-creek-2022"}, context)
+        after(tool, {"fire_id": "cedar-creek-2022"}, context, response)
+        samples.append((time.perf_counter() - start) * 1e6)
+    if sink is not None:
+        sink.flush()
+    bridge.close()
+    quantiles = statistics.quantiles(samples, n=100)
+    return {"p50_us": quantiles[49], "p99_us": quantiles[98]}
+
+
+def full_scan(directory: Path, session_id: str) -> list[dict]:
+    """What read_trail() would cost without indexes."""
+    events = []
+    for path in sorted(directory.glob("audit-*.jsonl")):
+        with open(path, "rb") as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get("session_id") == session_id:
+                    events.append(record)
+    return events
+
+
+def lookup(events, sessions: int, segment_mb: int, lookups: int) -> dict:
+    """Milliseconds per session lookup, indexed vs full scan."""
+    with tempfile.TemporaryDirectory() as directory:
+        sink = JsonlAuditSink(
+            directory,
+            segment_max_bytes=segment_mb * 1024 * 1024,
+            fsync_interval_seconds=-1,
+            max_queued=len(events),
+        )
+        for invocation_id, event in events:
+            sink.write(invocation_id, event)
+        sink.close()
+
+        reader = JsonlAuditSink(directory, fsync_interval_seconds=-1)
+        targets = [f"session-{n}" for n in range(0, sessions, max(1, sessions // lookups))][:lookups]
+        reader.read_trail(session_id=targets[0])  # load the sidecar indexes once
+        start = time.perf_counter()
+        for session_id in targets:
+            indexed = reader.read_trail(session_id=session_id)
+        indexed_ms = (time.perf_counter() - start) * 1000 / len(targets)
+        reader.close()
+
+        start = time.perf_counter()
+        scanned = full_scan(Path(directory), targets[-1])
+        scan_ms = (time.perf_counter() - start) * 1000
+        assert len(scanned) == len(indexed)
+    return {"indexed_ms": indexed_ms, "scan_ms": scan_ms}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Audit log sink benchmark")
+    parser.add_argument("--events", type=int, default=100000, help="Events written per throughput run")
+    parser.add_argument("--sessions", type=int, default=1000, help="Distinct session IDs")
+    parser.add_argument("--segment-mb", type=int, default=8, help="Segment rotation size")
+    parser.add_argument("--calls", type=int, default=20000, help="Callback pairs for the latency run")
+    parser.add_argument("--lookups", type=int, default=20, help="Sessions looked up")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    # Callbacks log at INFO; measure the audit path, not logging
+    logging.getLogger("ranger").setLevel(logging.WARNING)
+
+    events = make_events(args.events, args.sessions)
+    results = {"throughput": {}, "callback": {}}
+    for mode, fsync in FSYNC_MODES.items():
+        results["throughput"][mode] = throughput(events, fsync, args.segment_mb)
+
+    results["callback"]["no sink"] = callback_latency(args.calls, None)
+    with tempfile.TemporaryDirectory() as directory:
+        sink = JsonlAuditSink(directory, fsync_interval_seconds=1.0)
+        results["callback"]["jsonl sink"] = callback_latency(args.calls, sink)
+        sink.close()
+
+    results["lookup"] = lookup(events, args.sessions, args.segment_mb, args.lookups)
+
+    print(f"{args.events} events, {args.segment_mb} MB segments\n")
+    print(f"{'fsync':<12} {'events/s':>10} {'MB/s':>7} {'fsyncs':>7} {'segments':>9}")
+    for mode, r in results["throughput"].items():
+        print(f"{mode:<12} {r['events_per_sec']:>10.0f} {r['mb_per_sec']:>7.1f} {r['fsyncs']:>7} {r['segments']:>9}")
+
+    print(f"\n{'callbacks':<12} {'p50 us':>8} {'p99 us':>8}")
+    for name, r in results["callback"].items():
+        print(f"{name:<12} {r['p50_us']:>8.1f} {r['p99_us']:>8.1f}")
+
+    lk = results["lookup"]
+    print(f"\nsession lookup: indexed {lk['indexed_ms']:.2f} ms, full scan {lk['scan_ms']:.1f} ms "
+          f"({lk['scan_ms'] / lk['indexed_ms']:.0f}x)")
+
+    if args.output:
+        args.output.write_text(json.dumps({"events": args.events, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
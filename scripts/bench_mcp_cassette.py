@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+RANGER MCP Cassette Benchmark
+
+Runs the MCP tool calls of the four agent toolsets (burn, trail,
+cruising, coordinator) concurrently, as the specialists and coordinator
+make them, and either:
+
+- record: calls the MCP fixtures server (stdio) and writes every call,
+          response and duration to a cassette
+- replay: serves the calls from the cassette, without a server, at each
+          --speed (1 = recorded timing, 10 = ten times faster, 0 = no
+          delay), --repeats times
+
+Replays see the same data and MCP timing on every build, so differences
+in wall time between builds come from RANGER code, not the network or
+the fixtures server. The spread across repeats shows the replay noise.
+
+Run with:
+    python scripts/bench_mcp_cassette.py record mcp-cassette.jsonl.gz --rounds 20
+    python scripts/bench_mcp_cassette.py replay mcp-cassette.jsonl.gz --speed 1 10 0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import warnings
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "packages" / "skill-runtime"))
+
+from agents._shared import mcp_client  # noqa: E402
+
+FIRES = ["cedar-creek", "bootleg"]
+
+# Tool filters of the get_*_toolset() factories
+TOOLSETS = {
+    "burn": ["get_fire_context", "mtbs_classify"],
+    "trail": ["assess_trails"],
+    "cruising": ["get_timber_plots"],
+    "coordinator": ["get_fire_context", "mtbs_classify", "assess_trails", "get_timber_plots"],
+}
+
+
+def stdio_params(server_env: dict[str, str]):
+    from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+    from mcp.client.stdio import StdioServerParameters
+
+    return StdioConnectionParams(
+        server_params=StdioServerParameters(
+            command=sys.executable,
+            args=[str(mcp_client.MCP_SERVER_PATH)],
+            env={**os.environ, **server_env},
+        ),
+        timeout=30.0,
+    )
+
+
+async def run_workload(session, server_env: dict[str, str], rounds: int) -> dict:
+    """Every toolset calls each of its tools for each fire, `rounds` times."""
+    PooledMcpToolset = mcp_client._pooled_toolset_class()
+    pool = mcp_client.McpSessionPool()
+    toolsets = {
+        name: PooledMcpToolset(
+            pool=pool,
+            cassette=session,
+            connection_params=stdio_params(server_env),
+            tool_filter=tool_filter,
+            tool_name_prefix="mcp_",
+        )
+        for name, tool_filter in TOOLSETS.items()
+    }
+    tools = {name: await toolset.get_tools() for name, toolset in toolsets.items()}
+    latencies: list[float] = []
+
+    async def toolset_loop(name: str) -> None:
+        for _ in range(rounds):
+            for fire_id in FIRES:
+                for tool in tools[name]:
+                    start = time.perf_counter()
+                    await tool.run_async(args={"fire_id": fire_id}, tool_context=None)
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(toolset_loop(name) for name in toolsets))
+    elapsed = time.perf_counter() - start
+
+    for toolset in toolsets.values():
+        await toolset.close()
+    await pool.close()
+
+    latencies.sort()
+    return {
+        "wall_ms": elapsed * 1000,
+        "calls": len(latencies),
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[max(0, int(len(latencies) * 0.99) - 1)],
+    }
+
+
+def record(args) -> dict:
+    session = mcp_client.McpCassetteSession(args.cassette, mode="record")
+    result = asyncio.run(run_workload(session, dict(pair.split("=", 1) for pair in args.server_env), args.rounds))
+    session.save()
+    size_kb = args.cassette.stat().st_size / 1024
+    print(f"Recorded {result['calls']} calls in {result['wall_ms']:.0f} ms "
+          f"(p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms) to {args.cassette} ({size_kb:.0f} KB)")
+    return {"record": result}
+
+
+def replay(args) -> dict:
+    results = {}
+    print(f"{'speed':>6} {'wall ms':>9} {'stdev':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for speed in args.speed:
+        runs = []
+        for _ in range(args.repeats):
+            session = mcp_client.McpCassetteSession(args.cassette, mode="replay", speed=speed)
+            runs.append(asyncio.run(run_workload(session, {}, args.rounds)))
+        walls = [run["wall_ms"] for run in runs]
+        results[f"x{speed:g}"] = {
+            "wall_ms": statistics.mean(walls),
+            "wall_stdev_ms": statistics.stdev(walls) if len(walls) > 1 else 0.0,
+            "p50_ms": statistics.mean(run["p50_ms"] for run in runs),
+            "p99_ms": statistics.mean(run["p99_ms"] for run in runs),
+            "calls": runs[0]["calls"],
+        }
+        r = results[f"x{speed:g}"]
+        print(f"{speed:>6g} {r['wall_ms']:>9.1f} {r['wall_stdev_ms']:>7.2f} {r['p50_ms']:>8.3f} {r['p99_ms']:>8.3f}")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record/replay MCP toolset calls")
+    parser.add_argument("mode", choices=mcp_client.CASSETTE_MODES)
+    parser.add_argument("cassette", type=Path, help="Cassette file (.gz to compress)")
+    parser.add_argument("--rounds", type=int, default=20, help="Calls per toolset tool and fire")
+    parser.add_argument("--speed", type=float, nargs="+", default=[1.0, 0.0], help="Replay speeds")
+    parser.add_argument("--repeats", type=int, default=3, help="Replays per speed")
+    parser.add_argument("--server-env", nargs="*", default=[], metavar="KEY=VALUE",
+                        help="Extra environment for the recorded server process")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    results = record(args) if args.mode == "record" else replay(args)
+
+    if args.output:
+        config = {k: str(v) if isinstance(v, Path) else v for k, v in vars(args).items() if k != "output"}
+        args.output.write_text(json.dumps({"args": config, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
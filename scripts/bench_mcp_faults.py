@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+RANGER MCP Fault Injection Benchmark
+
+Drives CoordinatorService.handle_portfolio_query over --fires synthetic
+fires, with MCPMockProvider standing in for the MCP servers:
+get_incident_metadata on mcp-nifc (Tier 1) and get_fire_summary on
+mcp-fixtures (Tier 2). Each scenario injects different faults into
+mcp-nifc:
+
+- healthy:      fixed 5 ms latency
+- jittery:      lognormal latency (--median-ms, sigma 0.8)
+- flaky:        jittery plus --error-rate errors and --timeout-rate calls
+                that never answer (cut off by the 3 s Tier 1 timeout)
+- rate_limited: jittery, limited to --rate-limit calls/s; calls over the
+                limit are rejected and fall back to Tier 2
+- throttled:    jittery, limited to --rate-limit calls/s; calls over the
+                limit wait for a token
+- outage:       every call fails
+
+Reports wall time, tier mix, fires that missed the portfolio deadline,
+and injected fault counts. Runs are reproducible for a given --seed.
+
+Run with: python scripts/bench_mcp_faults.py --fires 1000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "agents"))
+sys.path.insert(0, str(PROJECT_ROOT / "packages" / "skill-runtime"))
+
+from coordinator.implementation import CoordinatorService  # noqa: E402
+from skill_runtime.testing import MCPMockProvider  # noqa: E402
+
+SEVERITIES = ["low", "moderate", "high", "critical"]
+PHASES = ["active", "baer_assessment", "baer_implementation", "in_restoration"]
+TIERS = ["authoritative", "derived", "historical", "failure"]
+
+
+def make_fires(count: int, seed: int) -> dict[str, dict]:
+    """Synthetic incident metadata keyed by fire_id."""
+    rng = random.Random(seed)
+    return {
+        f"fire-{i:05d}": {
+            "name": f"Fire {i}",
+            "acres": int(rng.paretovariate(1.2) * 500),
+            "severity": rng.choice(SEVERITIES),
+            "phase": rng.choice(PHASES),
+        }
+        for i in range(count)
+    }
+
+
+def scenarios(args) -> dict[str, dict]:
+    """inject_faults() arguments for mcp-nifc per scenario."""
+    jitter = ("lognormal", args.median_ms / 1000, 0.8)
+    return {
+        "healthy": {"latency": 0.005},
+        "jittery": {"latency": jitter},
+        "flaky": {"latency": jitter, "error_rate": args.error_rate, "timeout_rate": args.timeout_rate},
+        "rate_limited": {"latency": jitter, "rate_limit": args.rate_limit, "burst": 10},
+        "throttled": {"latency": jitter, "rate_limit": args.rate_limit, "burst": 10, "on_rate_limit": "wait"},
+        "outage": {"error_rate": 1.0, "error": "NIFC unavailable"},
+    }
+
+
+async def run_scenario(faults: dict, fires: dict[str, dict], args) -> dict:
+    mock = MCPMockProvider(seed=args.seed)
+    mock.register("mcp-nifc", "get_incident_metadata", handler=lambda fire_id: fires[fire_id])
+    mock.register("mcp-fixtures", "get_fire_summary", handler=lambda fire_id: fires[fire_id])
+    mock.inject_faults("mcp-nifc", **faults)
+    mock.inject_faults("mcp-fixtures", latency=("uniform", 0.001, 0.003))
+
+    service = CoordinatorService(
+        tools=mock.get_tool_context(),
+        max_concurrency=args.concurrency,
+        deadline_seconds=args.deadline,
+    )
+    tiers = Counter()
+    assess = service._assess_fire_priority
+
+    async def counted(fire_id: str) -> dict:
+        assessment = await assess(fire_id)
+        tiers[assessment["tier"]] += 1
+        return assessment
+
+    service._assess_fire_priority = counted
+
+    start = time.perf_counter()
+    response = await service.handle_portfolio_query("Prioritize my portfolio", {"fire_ids": list(fires)})
+    elapsed = time.perf_counter() - start
+
+    portfolio = response["portfolio"]
+    nifc = mock.get_fault_stats().get("mcp-nifc/get_incident_metadata", {})
+    return {
+        "elapsed_s": elapsed,
+        "fires_per_sec": len(fires) / elapsed,
+        "tiers": {tier: tiers[tier] for tier in TIERS},
+        "timed_out": len(portfolio["timed_out"]),
+        "failed": len(portfolio["failed"]),
+        "confidence": response["confidence"],
+        "mcp_calls": len(mock.get_call_history()),
+        "nifc_faults": {k: nifc.get(k, 0) for k in ("errors", "timeouts", "rate_limited")},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Portfolio fan-out under injected MCP faults")
+    parser.add_argument("--fires", type=int, default=1000, help="Fires in the portfolio")
+    parser.add_argument("--concurrency", type=int, default=8, help="CoordinatorService max_concurrency")
+    parser.add_argument("--deadline", type=float, default=8.0, help="Portfolio deadline, seconds")
+    parser.add_argument("--median-ms", type=float, default=10.0, help="Median Tier 1 latency when jittery")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Tier 1 error rate when flaky")
+    parser.add_argument("--timeout-rate", type=float, default=0.005, help="Tier 1 hang rate when flaky")
+    parser.add_argument("--rate-limit", type=float, default=200.0, help="Tier 1 calls/s when rate limited")
+    parser.add_argument("--scenario", nargs="+", help="Scenarios to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for fires and injected faults")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)  # One warning per failed tier call otherwise
+    fires = make_fires(args.fires, args.seed)
+    selected = {
+        name: faults for name, faults in scenarios(args).items()
+        if not args.scenario or name in args.scenario
+    }
+
+    results = {}
+    for name, faults in selected.items():
+        results[name] = asyncio.run(run_scenario(faults, fires, args))
+
+    print(f"{args.fires} fires, concurrency {args.concurrency}, deadline {args.deadline:g}s, seed {args.seed}\n")
+    print(f"{'scenario':<13} {'wall s':>7} {'fires/s':>8} {'tier1':>6} {'tier2':>6} {'tier3':>6} "
+          f"{'fail':>5} {'late':>5} {'conf':>5} {'errors':>7} {'hangs':>6} {'limited':>8}")
+    for name, r in results.items():
+        t, f = r["tiers"], r["nifc_faults"]
+        print(f"{name:<13} {r['elapsed_s']:>7.2f} {r['fires_per_sec']:>8.0f} {t['authoritative']:>6} "
+              f"{t['derived']:>6} {t['historical']:>6} {r['failed']:>5} {r['timed_out']:>5} "
+              f"{r['confidence']:>5} {f['errors']:>7} {f['timeouts']:>6} {f['rate_limited']:>8}")
+
+    if args.output:
+        config = {k: v for k, v in vars(args).items() if k != "output"}
+        args.output.write_text(json.dumps({"args": config, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
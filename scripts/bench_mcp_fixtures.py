@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+RANGER MCP Fixtures Payload Benchmark
+
+Replays a mix of MCP tool calls (every tool x every fixture fire, with and
+without optional arguments) through the fixtures server's payload path:
+
+- indent_json:  build result dict + json.dumps(indent=2) per call (pre-cache path)
+- compact_json: build result dict + compact stdlib encoding per call
+- compact_orjson: build result dict + orjson per call (if installed)
+- cached:       encode_tool_result() with the encoded response cache
+
+Verifies every path decodes to the same result before timing, then reports
+payload bytes per list tool: full, projected (the agent toolsets' default
+PROJECTED_TOOL_ARGUMENTS) and summary_only.
+
+Run with: python scripts/bench_mcp_fixtures.py --calls 20000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MCP_FIXTURES_DIR = PROJECT_ROOT / "services" / "mcp-fixtures"
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(MCP_FIXTURES_DIR))
+
+import server  # noqa: E402
+from agents._shared.mcp_client import PROJECTED_TOOL_ARGUMENTS, projected_arguments  # noqa: E402
+from response_cache import get_encoder  # noqa: E402
+
+
+def build_workload(count: int) -> list[tuple[str, dict]]:
+    """Cycle every tool over every fixture fire up to `count` calls."""
+    calls = []
+    for fire_id in server.registry.fire_ids():
+        calls.append(("get_fire_context", {"fire_id": fire_id}))
+        calls.append(("mtbs_classify", {"fire_id": fire_id}))
+        calls.append(("mtbs_classify", {"fire_id": fire_id, "include_sectors": False}))
+        calls.append(("assess_trails", {"fire_id": fire_id}))
+        calls.append(("get_timber_plots", {"fire_id": fire_id}))
+        trails = server.build_trail_assessment(server.registry.fire_snapshot(fire_id), {}).get("trails", [])
+        if trails:
+            calls.append(("assess_trails", {"fire_id": fire_id, "trail_id": trails[0].get("trail_id")}))
+    return [calls[i % len(calls)] for i in range(count)]
+
+
+def uncached(encode):
+    """Per-call build + encode, as call_tool did before the cache."""
+    def call(name: str, arguments: dict) -> str:
+        fire_id = server.registry.resolve(arguments["fire_id"])
+        builder, _ = server.TOOL_BUILDERS[name]
+        return encode(builder(server.registry.fire_snapshot(fire_id), arguments))
+    return call
+
+
+def projection_savings() -> dict[str, dict[str, int]]:
+    """Payload bytes per list tool, summed over all fixture fires."""
+    savings = {}
+    for tool in PROJECTED_TOOL_ARGUMENTS:
+        sizes = {"full": 0, "projected": 0, "summary_only": 0}
+        for fire_id in server.registry.fire_ids():
+            arguments = {"fire_id": fire_id}
+            sizes["full"] += len(server.encode_tool_result(tool, arguments))
+            sizes["projected"] += len(server.encode_tool_result(tool, projected_arguments(tool, arguments)))
+            sizes["summary_only"] += len(server.encode_tool_result(tool, {**arguments, "summary_only": True}))
+        savings[tool] = sizes
+    return savings
+
+
+def run(fn, workload: list[tuple[str, dict]], repeats: int) -> tuple[float, int]:
+    """Best calls/sec over `repeats` runs, plus payload bytes of one run."""
+    best = 0.0
+    total_bytes = 0
+    for _ in range(repeats):
+        total_bytes = 0
+        start = time.perf_counter()
+        for name, arguments in workload:
+            total_bytes += len(fn(name, arguments))
+        best = max(best, len(workload) / (time.perf_counter() - start))
+    return best, total_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MCP fixtures payload benchmark")
+    parser.add_argument("--calls", type=int, default=20000, help="Tool calls per run")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per path")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    workload = build_workload(args.calls)
+
+    paths = {
+        "indent_json": uncached(lambda result: json.dumps(result, indent=2)),
+        "compact_json": uncached(get_encoder("json")[1]),
+    }
+    encoder_name, encode = get_encoder("orjson")
+    if encoder_name == "orjson":
+        paths["compact_orjson"] = uncached(encode)
+    paths["cached"] = server.encode_tool_result
+
+    for name, arguments in set((n, json.dumps(a, sort_keys=True)) for n, a in workload):
+        arguments = json.loads(arguments)
+        expected = json.loads(paths["indent_json"](name, arguments))
+        for path, fn in paths.items():
+            if json.loads(fn(name, arguments)) != expected:
+                sys.exit(f"{path} disagrees with indent_json on {name} {arguments}")
+
+    results = {}
+    for path, fn in paths.items():
+        calls_per_sec, total_bytes = run(fn, workload, args.repeats)
+        results[path] = {"calls_per_sec": calls_per_sec, "bytes_per_call": total_bytes / len(workload)}
+
+    baseline = results["indent_json"]["calls_per_sec"]
+    print(f"{len(workload)} tool calls over {len(server.registry.fire_ids())} fires, best of {args.repeats}\n")
+    print(f"{'path':<16} {'calls/s':>10} {'bytes/call':>11} {'speedup':>8}")
+    for path, r in results.items():
+        print(f"{path:<16} {r['calls_per_sec']:>10.0f} {r['bytes_per_call']:>11.0f} "
+              f"{r['calls_per_sec'] / baseline:>7.1f}x")
+    print(f"\nResponse cache: {server.response_cache.stats()}")
+
+    savings = projection_savings()
+    print("\nPayload bytes over all fires\n")
+    print(f"{'tool':<18} {'full':>8} {'projected':>10} {'saved':>7} {'summary_only':>13}")
+    for tool, sizes in savings.items():
+        saved = 1 - sizes["projected"] / sizes["full"]
+        print(f"{tool:<18} {sizes['full']:>8} {sizes['projected']:>10} {saved:>7.0%} {sizes['summary_only']:>13}")
+
+    if args.output:
+        args.output.write_text(json.dumps({
+            "calls": len(workload),
+            "results": results,
+            "response_cache": server.response_cache.stats(),
+            "payload_bytes": savings,
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
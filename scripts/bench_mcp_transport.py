@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+RANGER MCP Transport Benchmark
+
+Simulates the four agent toolsets (burn, trail, cruising, coordinator)
+calling the MCP fixtures server concurrently, over:
+
+- stdio_per_toolset: one stdio server subprocess per toolset (pre-pool path)
+- stdio_pooled:      toolsets share McpSessionPool stdio sessions
+- http_pooled:       toolsets share McpSessionPool Streamable HTTP sessions
+                     to a local `server.py --http`
+
+Reports connection setup time, server processes spawned, and per-call
+latency (p50/p99) including ADK's session lookup.
+
+Run with: python scripts/bench_mcp_transport.py --calls 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from agents._shared.mcp_client import MCP_SERVER_PATH, McpSessionPool  # noqa: E402
+
+TOOLSET_CALLS = {
+    "burn": ("mtbs_classify", {"fire_id": "cedar-creek"}),
+    "trail": ("assess_trails", {"fire_id": "cedar-creek"}),
+    "cruising": ("get_timber_plots", {"fire_id": "cedar-creek"}),
+    "coordinator": ("get_fire_context", {"fire_id": "cedar-creek"}),
+}
+
+
+def stdio_params(server_env: dict[str, str]):
+    from google.adk.tools.mcp_tool.mcp_session_manager import StdioConnectionParams
+    from mcp.client.stdio import StdioServerParameters
+
+    return StdioConnectionParams(
+        server_params=StdioServerParameters(
+            command=sys.executable,
+            args=[str(MCP_SERVER_PATH)],
+            env={**os.environ, **server_env},
+        ),
+        timeout=30.0,
+    )
+
+
+def http_params(url: str):
+    from google.adk.tools.mcp_tool.mcp_session_manager import StreamableHTTPConnectionParams
+
+    return StreamableHTTPConnectionParams(url=url, timeout=30.0)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_http_server(server_env: dict[str, str]) -> tuple[subprocess.Popen, str]:
+    """Launch `server.py --http` and wait for /health."""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, str(MCP_SERVER_PATH), "--http", "--port", str(port)],
+        env={**os.environ, **server_env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process, f"http://127.0.0.1:{port}/mcp"
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.kill()
+    sys.exit("HTTP fixtures server did not become healthy")
+
+
+async def run_scenario(managers: dict, calls: int) -> dict:
+    """Connect every toolset's manager, then issue `calls` calls per toolset concurrently."""
+    start = time.perf_counter()
+    await asyncio.gather(*(manager.create_session() for manager in set(managers.values())))
+    setup_ms = (time.perf_counter() - start) * 1000
+
+    latencies: list[float] = []
+
+    async def toolset_loop(toolset: str) -> None:
+        name, arguments = TOOLSET_CALLS[toolset]
+        manager = managers[toolset]
+        for _ in range(calls):
+            call_start = time.perf_counter()
+            session = await manager.create_session()
+            await session.call_tool(name, arguments)
+            latencies.append((time.perf_counter() - call_start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(toolset_loop(toolset) for toolset in managers))
+    elapsed = time.perf_counter() - start
+
+    for manager in set(managers.values()):
+        await manager.close()
+
+    latencies.sort()
+    return {
+        "setup_ms": setup_ms,
+        "server_sessions": len(set(map(id, managers.values()))),
+        "calls_per_sec": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+async def main_async(args: argparse.Namespace) -> dict:
+    from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager
+
+    server_env = dict(pair.split("=", 1) for pair in args.server_env)
+    results = {}
+
+    params = stdio_params(server_env)
+    results["stdio_per_toolset"] = await run_scenario(
+        {toolset: MCPSessionManager(connection_params=params) for toolset in TOOLSET_CALLS},
+        args.calls,
+    )
+
+    pool = McpSessionPool(size=args.pool_size)
+    results["stdio_pooled"] = await run_scenario(
+        {toolset: pool.acquire(params) for toolset in TOOLSET_CALLS},
+        args.calls,
+    )
+
+    process, url = start_http_server(server_env)
+    try:
+        pool = McpSessionPool(size=args.pool_size)
+        results["http_pooled"] = await run_scenario(
+            {toolset: pool.acquire(http_params(url)) for toolset in TOOLSET_CALLS},
+            args.calls,
+        )
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MCP stdio vs pooled HTTP benchmark")
+    parser.add_argument("--calls", type=int, default=200, help="Tool calls per toolset")
+    parser.add_argument("--pool-size", type=int, default=2, help="McpSessionPool size")
+    parser.add_argument("--server-env", nargs="*", default=[], metavar="KEY=VALUE",
+                        help="Extra environment for the server processes (e.g. FIXTURES_DIR=...)")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    results = asyncio.run(main_async(args))
+
+    print(f"{len(TOOLSET_CALLS)} toolsets x {args.calls} calls, pool size {args.pool_size}\n")
+    print(f"{'path':<18} {'setup ms':>9} {'sessions':>9} {'calls/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for path, r in results.items():
+        print(f"{path:<18} {r['setup_ms']:>9.0f} {r['server_sessions']:>9} {r['calls_per_sec']:>9.0f} "
+              f"{r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f}")
+
+    if args.output:
+        args.output.write_text(json.dumps({
+            "calls_per_toolset": args.calls,
+            "pool_size": args.pool_size,
+            "results": results,
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
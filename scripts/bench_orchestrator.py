@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+RANGER Orchestrator Serving Benchmark
+
+Starts main.py in production mode at several worker counts and drives
+/api/v1/chat and /run_sse with concurrent clients, reporting requests/sec
+and p50/p99 latency per endpoint.
+
+Run with: python scripts/bench_orchestrator.py --workers 1 2 4 8 --requests 400
+
+Note: /run_sse invokes the coordinator LLM. Without GOOGLE_API_KEY (or
+Vertex AI ADC) every call ends in an error event, so its numbers then
+measure request handling overhead only.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+CHAT_QUERIES = [
+    "Prioritize my fire portfolio",
+    "What is the burn severity for Cedar Creek?",
+    "Which trails are closed due to hazard trees?",
+    "Hello, what can you help me with?",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _wait_healthy(base_url: str, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{base_url}/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.25)
+    raise TimeoutError(f"Server at {base_url} did not become healthy in {timeout}s")
+
+
+async def _chat_request(client: httpx.AsyncClient, base_url: str, i: int) -> None:
+    response = await client.post(
+        f"{base_url}/api/v1/chat",
+        json={"session_id": f"bench-{i}", "query": CHAT_QUERIES[i % len(CHAT_QUERIES)]},
+    )
+    response.raise_for_status()
+
+
+async def _sse_request(client: httpx.AsyncClient, base_url: str, i: int) -> None:
+    user_id = "bench"
+    session_id = f"bench-{uuid.uuid4().hex[:12]}"
+    await client.post(
+        f"{base_url}/apps/coordinator/users/{user_id}/sessions/{session_id}", json={}
+    )
+    payload = {
+        "app_name": "coordinator",
+        "user_id": user_id,
+        "session_id": session_id,
+        "new_message": {"role": "user", "parts": [{"text": CHAT_QUERIES[i % len(CHAT_QUERIES)]}]},
+        "streaming": False,
+    }
+    async with client.stream("POST", f"{base_url}/run_sse", json=payload) as response:
+        async for _ in response.aiter_lines():
+            pass
+
+
+async def run_load(base_url: str, endpoint: str, total: int, concurrency: int) -> dict:
+    """Issue `total` requests against one endpoint with bounded concurrency."""
+    request_fn = _chat_request if endpoint == "/api/v1/chat" else _sse_request
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(timeout=120.0) as client:
+
+        async def one(i: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await request_fn(client, base_url, i)
+                except httpx.HTTPError:
+                    errors += 1
+                    return
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        wall = time.perf_counter() - wall_start
+
+    return {
+        "endpoint": endpoint,
+        "requests": total,
+        "errors": errors,
+        "rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "p50_ms": round(_percentile(latencies, 50), 1),
+        "p99_ms": round(_percentile(latencies, 99), 1),
+        "mean_ms": round(statistics.fmean(latencies), 1) if latencies else 0.0,
+    }
+
+
+async def bench_workers(workers: int, args: argparse.Namespace) -> list[dict]:
+    """Start the orchestrator with `workers` processes and benchmark it."""
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {
+        **os.environ,
+        "SERVE_MODE": "production",
+        "WEB_CONCURRENCY": str(workers),
+        "PORT": str(port),
+        "HOST": "127.0.0.1",
+        "LIMIT_CONCURRENCY": str(args.limit_concurrency),
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        await _wait_healthy(base_url, args.startup_timeout)
+        results = []
+        for endpoint in args.endpoints:
+            await run_load(base_url, endpoint, min(20, args.requests), args.concurrency)  # warm-up
+            result = await run_load(base_url, endpoint, args.requests, args.concurrency)
+            result["workers"] = workers
+            results.append(result)
+        return results
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark RANGER orchestrator serving modes")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--endpoints", nargs="+", default=["/api/v1/chat", "/run_sse"])
+    parser.add_argument("--requests", type=int, default=400, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--limit-concurrency", type=int, default=64)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    all_results: list[dict] = []
+    for workers in args.workers:
+        all_results.extend(asyncio.run(bench_workers(workers, args)))
+
+    print(f"{'workers':>7}  {'endpoint':<14} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>6}")
+    for r in all_results:
+        print(
+            f"{r['workers']:>7}  {r['endpoint']:<14} {r['rps']:>8} "
+            f"{r['p50_ms']:>8} {r['p99_ms']:>8} {r['errors']:>6}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(all_results, indent=2))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
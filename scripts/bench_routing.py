@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+RANGER Routing Micro-Benchmark
+
+Replays queries from tests/stress_test_matrix.yaml through the delegation
+skill and compares the legacy per-call path (reload routing-rules.json, then
+linear keyword scan) with the compiled RoutingEngine. Verifies both paths
+agree on every query before timing.
+
+Run with: python scripts/bench_routing.py --queries 10000
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DELEGATION_SCRIPTS_DIR = PROJECT_ROOT / "agents" / "coordinator" / "skills" / "delegation" / "scripts"
+STRESS_MATRIX = PROJECT_ROOT / "tests" / "stress_test_matrix.yaml"
+
+sys.path.insert(0, str(DELEGATION_SCRIPTS_DIR))
+
+import route_query as rq  # noqa: E402
+
+
+def load_queries(count: int) -> list[str]:
+    """Cycle the stress matrix queries up to `count` entries."""
+    matrix = yaml.safe_load(STRESS_MATRIX.read_text())
+    queries = [
+        test["query"]
+        for suite in matrix.get("test_suites", [])
+        for test in suite.get("tests", [])
+        if "query" in test
+    ]
+    return [queries[i % len(queries)] for i in range(count)]
+
+
+def legacy_match(query: str) -> dict[str, list[str]]:
+    """Matching as done before compilation: rules reloaded on every call."""
+    return rq.find_keyword_matches(query, rq.load_routing_rules())
+
+
+def time_per_query(fn, queries: list[str], repeats: int) -> list[float]:
+    """Return per-repeat mean microseconds per query."""
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for query in queries:
+            fn(query)
+        runs.append((time.perf_counter() - start) / len(queries) * 1e6)
+    return runs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Routing engine micro-benchmark")
+    parser.add_argument("--queries", type=int, default=10000, help="Queries per run")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per path")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries)
+    engine = rq.get_routing_engine()
+
+    mismatches = [q for q in set(queries) if engine.match(q) != legacy_match(q)]
+    if mismatches:
+        sys.exit(f"Compiled engine disagrees with legacy matcher on: {mismatches[:3]}")
+
+    paths = {
+        "legacy_match": legacy_match,
+        "compiled_match": engine.match,
+        "route_query": rq.route_query,
+    }
+    results = {}
+    for name, fn in paths.items():
+        runs = time_per_query(fn, queries, args.repeats)
+        results[name] = {"us_per_query": min(runs), "median_us": statistics.median(runs)}
+
+    speedup = results["legacy_match"]["us_per_query"] / results["compiled_match"]["us_per_query"]
+
+    print(f"Routing {len(queries)} queries ({len(set(queries))} distinct), best of {args.repeats}\n")
+    print(f"{'path':<16} {'us/query':>9} {'median':>9}")
+    for name, r in results.items():
+        print(f"{name:<16} {r['us_per_query']:>9.2f} {r['median_us']:>9.2f}")
+    print(f"\nCompiled matching speedup: {speedup:.1f}x")
+
+    if args.output:
+        args.output.write_text(json.dumps({
+            "queries": len(queries),
+            "results": results,
+            "speedup": speedup,
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
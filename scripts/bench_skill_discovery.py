@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+RANGER Skill Discovery Benchmark
+
+Times skill_runtime.discover_skills over a synthetic tree of --skills skill
+folders (copies of the repo's skill.md files, each with scripts/ and
+resources/ directories, aged so their mtimes are outside the manifest's
+racy window):
+
+- legacy:        the previous parser, which re-split the document once per
+                 section (LegacyParser below), no manifest
+- single-pass:   the current single-pass parser, no manifest
+- index build:   first run with an empty SkillManifest (parse + hash + save)
+- index reload:  fresh SkillManifest loaded from disk, nothing changed (a new
+                 process); no directory is walked
+- index warm:    same SkillManifest instance, nothing changed
+- 10% changed:   fresh SkillManifest after editing a tenth of the skills
+
+Run with: python scripts/bench_skill_discovery.py --skills 500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "packages" / "skill-runtime"))
+
+from skill_runtime import loader  # noqa: E402
+from skill_runtime.loader import SkillManifest, SkillMetadata, discover_skills  # noqa: E402
+
+
+class LegacyParser:
+    """parse_skill_md as it was: every section lookup re-splits the document."""
+
+    @staticmethod
+    def extract_section(content: str, section_name: str) -> str:
+        in_section, section_lines = False, []
+        for line in content.split("\n"):
+            if line.startswith(f"## {section_name}"):
+                in_section = True
+                continue
+            if in_section:
+                if line.startswith("## "):
+                    break
+                section_lines.append(line)
+        return "\n".join(section_lines).strip()
+
+    @classmethod
+    def parse(cls, skill_md_path: Path) -> SkillMetadata:
+        content = skill_md_path.read_text()
+        name = next((line[2:].strip() for line in content.split("\n") if line.startswith("# ")), "")
+        triggers_text = cls.extract_section(content, "Triggers")
+        return SkillMetadata(
+            name=name,
+            description=cls.extract_section(content, "Description"),
+            triggers=[l.strip().lstrip("- ") for l in triggers_text.split("\n") if l.strip().startswith("-")],
+            inputs=loader._parse_table(cls.extract_section(content, "Inputs")),
+            outputs=loader._parse_table(cls.extract_section(content, "Outputs")),
+            path=skill_md_path.parent,
+        )
+
+
+def build_tree(root: Path, count: int) -> list[Path]:
+    """count skill folders cycling through the repo's skill.md files."""
+    sources = sorted(p for p in PROJECT_ROOT.glob("agents/*/skills/*/skill.md"))
+    paths = []
+    for i in range(count):
+        skill_dir = root / f"agent_{i % 10}" / "skills" / f"skill-{i}"
+        for sub in ("scripts", "resources"):
+            (skill_dir / sub).mkdir(parents=True)
+        (skill_dir / "scripts" / "run.py").write_text("def execute(inputs):\n    return inputs\n")
+        skill_md = skill_dir / "skill.md"
+        skill_md.write_text(sources[i % len(sources)].read_text())
+        paths.append(skill_md)
+    old = time.time_ns() - 3600 * 10**9
+    for path in [root, *root.rglob("*")]:
+        os.utime(path, ns=(old, old))
+    return paths
+
+
+def timed(fn, repeats: int) -> float:
+    """Median milliseconds of fn()."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Skill discovery / manifest index benchmark")
+    parser.add_argument("--skills", type=int, default=500, help="Synthetic skill folders")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed runs per variant")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory) / "skills"
+        index = Path(directory) / "manifest.json"
+        skill_mds = build_tree(root, args.skills)
+
+        original_parse = loader.parse_skill_md
+        loader.parse_skill_md = LegacyParser.parse
+        try:
+            results["legacy"] = timed(lambda: discover_skills([root]), args.repeats)
+        finally:
+            loader.parse_skill_md = original_parse
+        results["single-pass"] = timed(lambda: discover_skills([root]), args.repeats)
+
+        def build():
+            index.unlink(missing_ok=True)
+            discover_skills([root], manifest=SkillManifest(index))
+
+        results["index build"] = timed(build, args.repeats)
+        results["index reload"] = timed(lambda: discover_skills([root], manifest=SkillManifest(index)), args.repeats)
+        warm = SkillManifest(index)
+        results["index warm"] = timed(lambda: discover_skills([root], manifest=warm), args.repeats)
+
+        changed = skill_mds[::10]
+        samples = []
+        for run in range(args.repeats):
+            for skill_md in changed:
+                skill_md.write_text(skill_md.read_text() + f"\n<!-- edit {run} -->\n")
+                stat = skill_md.stat()
+                os.utime(skill_md, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            start = time.perf_counter()
+            manifest = SkillManifest(index)
+            discover_skills([root], manifest=manifest)
+            samples.append((time.perf_counter() - start) * 1000)
+            assert manifest.parsed == len(changed)
+        results["10% changed"] = statistics.median(samples)
+
+        # Listing the tree alone, the floor without the manifest
+        results["walk only"] = timed(lambda: loader._walk_skill_files(str(root)), args.repeats)
+
+    print(f"{args.skills} skills, median of {args.repeats} runs\n")
+    print(f"{'variant':<14} {'ms':>8}")
+    for name, ms in results.items():
+        print(f"{name:<14} {ms:>8.2f}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"skills": args.skills, "results_ms": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+RANGER Skill Executor Benchmark
+
+Measures event-loop lag while --clients concurrent coroutines call skills,
+standing in for SSE streams served by one worker. The mix is --cpu-share
+CPU-bound calls (a fixed amount of pure-Python work, calibrated to take
+--cpu-ms on one core) and the rest io-bound calls (a script that sleeps for
+--io-ms):
+
+- inline:    execute_skill on the event loop, as the agent tool wrappers
+             call skill scripts today
+- threads:   execute_skill_async with every skill forced onto the io
+             thread pool
+- executor:  execute_skill_async with the classes declared in skill.md
+             (cpu skills in warm worker processes)
+
+Lag is how late a 5 ms asyncio.sleep ticker wakes up: the delay any other
+stream on the loop would see.
+
+Run with: python scripts/bench_skill_executor.py --clients 16 --seconds 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "packages" / "skill-runtime"))
+
+from skill_runtime.executor import SkillExecutor  # noqa: E402
+from skill_runtime.loader import execute_skill  # noqa: E402
+
+TICK = 0.005
+
+SCRIPTS = {
+    "cpu": """
+def execute(inputs):
+    total = 0
+    for i in range(inputs["iterations"]):
+        total += i * i % 7
+    return {"total": total}
+""",
+    "io": """
+import time
+
+
+def execute(inputs):
+    time.sleep(inputs["ms"] / 1000)
+    return {"slept_ms": inputs["ms"]}
+""",
+}
+
+
+def calibrate(cpu_ms: float) -> int:
+    """Loop iterations of the cpu script that take cpu_ms here."""
+    namespace = {}
+    exec(SCRIPTS["cpu"], namespace)
+    iterations = 100_000
+    start = time.perf_counter()
+    namespace["execute"]({"iterations": iterations})
+    return int(iterations * cpu_ms / ((time.perf_counter() - start) * 1000))
+
+
+def make_skills(root: Path) -> dict[str, Path]:
+    """One skill per execution class, declared in its skill.md."""
+    skills = {}
+    for execution_class, script in SCRIPTS.items():
+        skill_dir = root / f"{execution_class}-skill"
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "scripts" / "run.py").write_text(script)
+        (skill_dir / "skill.md").write_text(
+            f"# {execution_class} skill\n\n## Execution\n- class: {execution_class}\n- timeout: 30\n"
+        )
+        skills[execution_class] = skill_dir
+    return skills
+
+
+async def workload(mode: str, skills: dict, executor: SkillExecutor, args) -> dict:
+    lags = []
+    calls = 0
+    stop = time.perf_counter() + args.seconds
+    rng = random.Random(0)
+
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append((time.perf_counter() - start - TICK) * 1000)
+
+    async def client():
+        nonlocal calls
+        while time.perf_counter() < stop:
+            kind = "cpu" if rng.random() < args.cpu_share else "io"
+            inputs = {"iterations": args.iterations} if kind == "cpu" else {"ms": args.io_ms}
+            if mode == "inline":
+                execute_skill(skills[kind], "run", inputs)
+                await asyncio.sleep(0)
+            elif mode == "threads":
+                await executor.run(skills[kind], "run", inputs, execution_class="io")
+            else:
+                await executor.run(skills[kind], "run", inputs)
+            calls += 1
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.gather(*(client() for _ in range(args.clients)))
+    tick.cancel()
+
+    quantiles = statistics.quantiles(lags, n=100, method="inclusive")
+    return {
+        "lag_p50_ms": quantiles[49],
+        "lag_p99_ms": quantiles[98],
+        "lag_max_ms": max(lags),
+        "calls_per_sec": calls / args.seconds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Skill executor event-loop lag benchmark")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent skill-calling coroutines")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per mode")
+    parser.add_argument("--cpu-share", type=float, default=0.2, help="Fraction of calls that are CPU-bound")
+    parser.add_argument("--cpu-ms", type=float, default=50.0, help="CPU time per CPU-bound call")
+    parser.add_argument("--io-ms", type=float, default=20.0, help="Wait per io-bound call")
+    parser.add_argument("--cpu-workers", type=int, default=None, help="Worker processes (CPU count)")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    args.iterations = calibrate(args.cpu_ms)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        skills = make_skills(Path(directory))
+        executor = SkillExecutor(io_workers=args.clients, cpu_workers=args.cpu_workers)
+        executor.warm_up()
+        try:
+            for mode in ("inline", "threads", "executor"):
+                results[mode] = asyncio.run(workload(mode, skills, executor, args))
+        finally:
+            executor.shutdown()
+
+    print(f"{args.clients} clients, {args.cpu_share:.0%} CPU-bound ({args.cpu_ms:g} ms) / "
+          f"io-bound ({args.io_ms:g} ms), {executor.cpu_workers} worker processes\n")
+    print(f"{'mode':<10} {'lag p50':>8} {'lag p99':>8} {'lag max':>8} {'calls/s':>8}")
+    for mode, r in results.items():
+        print(f"{mode:<10} {r['lag_p50_ms']:>8.1f} {r['lag_p99_ms']:>8.1f} {r['lag_max_ms']:>8.1f} "
+              f"{r['calls_per_sec']:>8.0f}")
+
+    if args.output:
+        config = {k: v for k, v in vars(args).items() if k not in ("output", "iterations")}
+        args.output.write_text(json.dumps({"args": config, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+RANGER Skill Loader Benchmark
+
+Times skill_runtime.load_skill_script for every skill script in the tree
+(agents/*/skills/*/scripts and skills/*/*/scripts):
+
+- first:  the very first load in this process (compiles the file and pays
+          for any imports the script pulls in)
+- cold:   re-executing the script after clear_skill_cache(), which is what
+          every execute_skill call cost before the module cache
+- warm:   a cached load (stat + dict lookup)
+
+Scripts that fail to import here (missing optional dependencies) are
+reported and skipped.
+
+Run with: python scripts/bench_skill_loader.py --calls 200
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "packages" / "skill-runtime"))
+
+from skill_runtime.loader import clear_skill_cache, load_skill_script  # noqa: E402
+
+
+def discover_scripts() -> list[Path]:
+    """Every non-package skill script in the repo."""
+    patterns = ["agents/*/skills/*/scripts/*.py", "skills/*/*/scripts/*.py"]
+    scripts = [path for pattern in patterns for path in PROJECT_ROOT.glob(pattern)]
+    return sorted(path for path in scripts if path.name != "__init__.py")
+
+
+def time_load(skill_path: Path, script_name: str) -> float:
+    """Microseconds for one load_skill_script call."""
+    start = time.perf_counter()
+    load_skill_script(skill_path, script_name)
+    return (time.perf_counter() - start) * 1e6
+
+
+def bench_script(script: Path, calls: int) -> dict:
+    skill_path = script.parent.parent
+    first_us = time_load(skill_path, script.name)
+
+    cold = []
+    for _ in range(calls):
+        clear_skill_cache()
+        cold.append(time_load(skill_path, script.name))
+
+    warm = [time_load(skill_path, script.name) for _ in range(calls)]
+    return {
+        "first_us": first_us,
+        "cold_us": statistics.median(cold),
+        "warm_us": statistics.median(warm),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Skill script module cache benchmark")
+    parser.add_argument("--calls", type=int, default=200, help="Cold and warm loads per script")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results, skipped = {}, {}
+    for script in discover_scripts():
+        name = str(script.relative_to(PROJECT_ROOT))
+        try:
+            results[name] = bench_script(script, args.calls)
+        except Exception as e:
+            skipped[name] = f"{type(e).__name__}: {e}"
+        finally:
+            clear_skill_cache()
+
+    print(f"{len(results)} skill scripts, {args.calls} loads each (median us)\n")
+    print(f"{'script':<84} {'first':>9} {'cold':>8} {'warm':>6} {'speedup':>8}")
+    for name, r in results.items():
+        print(f"{name:<84} {r['first_us']:>9.0f} {r['cold_us']:>8.0f} {r['warm_us']:>6.1f} "
+              f"{r['cold_us'] / r['warm_us']:>7.0f}x")
+    for name, reason in skipped.items():
+        print(f"skipped {name}: {reason}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"calls": args.calls, "results": results, "skipped": skipped}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+RANGER Spatial Index Benchmark
+
+Builds synthetic fires of jittered quadrilateral sectors (default 1k and 10k
+sectors, 5 damage points per sector) and compares the MCP fixtures server's
+STR-packed R-tree with a linear scan over every feature for:
+
+- bbox:            query_bbox over ~1% of the fire extent
+- bbox_severity:   query_bbox for points inside HIGH sectors
+- sector_at_point: polygon containing a random point
+
+Verifies both paths return the same features before timing.
+
+Run with: python scripts/bench_spatial_index.py --sectors 1000 10000
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MCP_FIXTURES_DIR = PROJECT_ROOT / "services" / "mcp-fixtures"
+
+sys.path.insert(0, str(MCP_FIXTURES_DIR))
+
+from spatial_index import (  # noqa: E402
+    FireSpatialIndex,
+    bbox_intersects,
+    damage_point_features,
+    point_in_geometry,
+    sector_features,
+)
+
+# Synthetic fire extent (around Cedar Creek)
+ORIGIN = (-122.5, 43.5)
+EXTENT = 1.0
+SEVERITIES = ("HIGH", "MODERATE", "LOW", "UNBURNED")
+
+
+def synthetic_fire(sectors: int, points_per_sector: int, seed: int) -> tuple[dict, dict]:
+    """burn-severity / trail-damage shaped documents on a jittered grid."""
+    rng = random.Random(seed)
+    side = math.ceil(math.sqrt(sectors))
+    cell = EXTENT / side
+
+    def corner(i: int, j: int) -> list[float]:
+        # Interior corners jitter; shared by neighbours so sectors tile the extent
+        jitter = 0.0 if i in (0, side) or j in (0, side) else cell * 0.3
+        r = random.Random(seed * 1_000_003 + i * 7919 + j)
+        return [ORIGIN[0] + i * cell + r.uniform(-jitter, jitter),
+                ORIGIN[1] + j * cell + r.uniform(-jitter, jitter)]
+
+    burn_sectors = []
+    for n in range(sectors):
+        i, j = divmod(n, side)
+        ring = [corner(i, j), corner(i + 1, j), corner(i + 1, j + 1), corner(i, j + 1)]
+        burn_sectors.append({
+            "id": f"S-{n:05d}",
+            "name": f"Sector {n}",
+            "severity": rng.choice(SEVERITIES),
+            "acres": rng.randint(100, 5000),
+            "geometry": {"type": "Polygon", "coordinates": [ring + [ring[0]]]},
+        })
+
+    damage_points = [
+        {
+            "damage_id": f"DP-{k:06d}",
+            "type": "EROSION",
+            "severity": rng.randint(1, 5),
+            "coords": [ORIGIN[0] + rng.uniform(0, EXTENT), ORIGIN[1] + rng.uniform(0, EXTENT)],
+        }
+        for k in range(sectors * points_per_sector)
+    ]
+    return {"sectors": burn_sectors}, {"trails": [{"trail_id": "synthetic", "damage_points": damage_points}]}
+
+
+class LinearScan:
+    """Reference: test every feature on every query."""
+
+    def __init__(self, burn: dict, trails: dict):
+        self.sectors = sector_features(burn)
+        self.points = damage_point_features(trails)
+
+    def sectors_at(self, lon: float, lat: float) -> list[dict]:
+        return [
+            feature for feature, geometry in self.sectors
+            if bbox_intersects(tuple(feature["bbox"]), (lon, lat, lon, lat))
+            and point_in_geometry(lon, lat, geometry)
+        ]
+
+    def query_bbox(self, bbox, layers=None, sector_severity=None) -> list[dict]:
+        layers = layers or ("sector", "damage_point")
+        found = [f for f, _ in self.sectors if "sector" in layers and bbox_intersects(tuple(f["bbox"]), bbox)
+                 and (sector_severity is None or f["severity"] == sector_severity)]
+        for point in self.points if "damage_point" in layers else ():
+            if not bbox_intersects(tuple(point["coords"]) * 2, bbox):
+                continue
+            if sector_severity and not any(s["severity"] == sector_severity for s in self.sectors_at(*point["coords"])):
+                continue
+            found.append(point)
+        return found
+
+
+def random_bbox(rng: random.Random, fraction: float) -> tuple[float, float, float, float]:
+    size = EXTENT * math.sqrt(fraction)
+    x = ORIGIN[0] + rng.uniform(0, EXTENT - size)
+    y = ORIGIN[1] + rng.uniform(0, EXTENT - size)
+    return (x, y, x + size, y + size)
+
+
+def ids(features: list[dict]) -> list[tuple]:
+    return sorted((f["layer"], f["id"]) for f in features)
+
+
+def per_query_us(fn, queries: list, repeats: int) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for query in queries:
+            fn(*query)
+        best = min(best, (time.perf_counter() - start) / len(queries) * 1e6)
+    return best
+
+
+def bench_size(sectors: int, args: argparse.Namespace) -> dict:
+    burn, trails = synthetic_fire(sectors, args.points_per_sector, args.seed)
+
+    start = time.perf_counter()
+    index = FireSpatialIndex.from_documents(burn, trails, None)
+    build_ms = (time.perf_counter() - start) * 1000
+    linear = LinearScan(burn, trails)
+
+    rng = random.Random(args.seed + sectors)
+    bbox_queries = [(random_bbox(rng, 0.01),) for _ in range(args.queries)]
+    severity_queries = [(random_bbox(rng, 0.01), ["damage_point"], "HIGH") for _ in range(args.queries)]
+    point_queries = [(ORIGIN[0] + rng.uniform(0, EXTENT), ORIGIN[1] + rng.uniform(0, EXTENT))
+                     for _ in range(args.queries)]
+
+    for query in bbox_queries[:20] + severity_queries[:5]:
+        assert ids(index.query_bbox(*query)) == ids(linear.query_bbox(*query)), query
+    for query in point_queries[:50]:
+        assert ids(index.sectors_at(*query)) == ids(linear.sectors_at(*query)), query
+
+    workloads = {
+        "bbox": bbox_queries,
+        "bbox_severity": severity_queries,
+        "sector_at_point": [(q,) for q in point_queries],
+    }
+    results = {"build_ms": build_ms, "features": len(index.sectors) + len(index.points)}
+    for name, queries in workloads.items():
+        if name == "sector_at_point":
+            tree_fn, scan_fn = (lambda p: index.sectors_at(*p)), (lambda p: linear.sectors_at(*p))
+        else:
+            tree_fn, scan_fn = index.query_bbox, linear.query_bbox
+        # The linear severity scan is slow at 10k sectors; fewer queries keep runs short
+        scan_queries = queries[:max(5, len(queries) // 20)] if name == "bbox_severity" else queries
+        results[name] = {
+            "rtree_us": per_query_us(tree_fn, queries, args.repeats),
+            "linear_us": per_query_us(scan_fn, scan_queries, 1),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Spatial index scaling benchmark")
+    parser.add_argument("--sectors", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--points-per-sector", type=int, default=5)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for sectors in args.sectors:
+        results[sectors] = r = bench_size(sectors, args)
+        print(f"\n{sectors} sectors, {r['features']} features, index build {r['build_ms']:.0f} ms")
+        print(f"{'query':<16} {'rtree us':>10} {'linear us':>11} {'speedup':>8}")
+        for name in ("bbox", "bbox_severity", "sector_at_point"):
+            q = r[name]
+            print(f"{name:<16} {q['rtree_us']:>10.1f} {q['linear_us']:>11.1f} {q['linear_us'] / q['rtree_us']:>7.0f}x")
+
+    if args.output:
+        args.output.write_text(json.dumps({"results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+RANGER Portfolio Triage Benchmark
+
+Ranks a synthetic national portfolio (default 100k fires) with:
+- per_fire:     calculate_triage_score() per dict + sort (pre-columnar path)
+- execute:      calculate_priority.execute() (vectorized, full output)
+- columns_topn: score_columns() + select_top_n() on prebuilt NumPy columns
+- engine_load:  TriageEngine.load() + top_n()
+- engine_update: TriageEngine.update() with --changed fires edited
+
+Run with: python scripts/bench_triage.py --fires 100000 --top 25
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TRIAGE_SCRIPTS_DIR = PROJECT_ROOT / "agents" / "coordinator" / "skills" / "portfolio-triage" / "scripts"
+
+sys.path.insert(0, str(TRIAGE_SCRIPTS_DIR))
+
+import calculate_priority as cp  # noqa: E402
+
+SEVERITIES = list(cp.SEVERITY_WEIGHTS)
+PHASES = list(cp.PHASE_MULTIPLIERS)
+
+
+def make_fires(count: int, seed: int) -> list[dict]:
+    """Synthetic portfolio with a realistic spread of sizes and phases."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"fire-{i:06d}",
+            "name": f"Fire {i}",
+            "severity": rng.choice(SEVERITIES),
+            "acres": int(rng.paretovariate(1.2) * 500),
+            "phase": rng.choice(PHASES),
+        }
+        for i in range(count)
+    ]
+
+
+def per_fire_rank(fires: list[dict], top: int) -> list[str]:
+    """Ranking as execute() computed it before the columnar engine."""
+    scored = []
+    for fire in fires:
+        score, _ = cp.calculate_triage_score(fire["severity"], fire["acres"], fire["phase"])
+        scored.append((fire["id"], score))
+    scored.sort(key=lambda item: item[1], reverse=True)
+    return [fire_id for fire_id, _ in scored[:top]]
+
+
+def best_ms(fn, repeats: int) -> float:
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - start) * 1000)
+    return min(runs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Portfolio triage benchmark")
+    parser.add_argument("--fires", type=int, default=100000)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--changed", type=int, default=1000, help="Fires edited per incremental update")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    fires = make_fires(args.fires, args.seed)
+    weights = np.array([cp.SEVERITY_WEIGHTS[f["severity"]] for f in fires], dtype=np.float64)
+    acres = np.array([f["acres"] for f in fires], dtype=np.float64)
+    multipliers = np.array([cp.PHASE_MULTIPLIERS[f["phase"]] for f in fires], dtype=np.float64)
+
+    def columns_top_n() -> list[int]:
+        _, scores = cp.score_columns(weights, acres, multipliers)
+        return cp.select_top_n(scores, args.top)
+
+    def engine_load() -> list[dict]:
+        engine = cp.TriageEngine()
+        engine.load(fires)
+        return engine.top_n(args.top)
+
+    # Same answer from every path before timing anything
+    expected = per_fire_rank(fires, args.top)
+    assert [fires[i]["id"] for i in columns_top_n()] == expected
+    assert [f["id"] for f in engine_load()] == expected
+    assert [f["id"] for f in cp.execute({"fires": fires, "top_n": args.top})["ranked_fires"]] == expected
+
+    rng = random.Random(args.seed + 1)
+    engine = cp.TriageEngine()
+    engine.load(fires)
+
+    def engine_update() -> list[dict]:
+        edits = []
+        for fire in rng.sample(fires, args.changed):
+            edits.append({**fire, "acres": fire["acres"] + rng.randint(1, 5000)})
+        engine.update(edits)
+        return engine.top_n(args.top)
+
+    results = {
+        "per_fire": best_ms(lambda: per_fire_rank(fires, args.top), args.repeats),
+        "execute": best_ms(lambda: cp.execute({"fires": fires, "top_n": args.top}), args.repeats),
+        "columns_topn": best_ms(columns_top_n, args.repeats),
+        "engine_load": best_ms(engine_load, args.repeats),
+        "engine_update": best_ms(engine_update, args.repeats),
+    }
+
+    print(f"Triage of {args.fires} fires, top {args.top}, best of {args.repeats}\n")
+    print(f"{'path':<14} {'ms':>9}")
+    for name, ms in results.items():
+        print(f"{name:<14} {ms:>9.1f}")
+    print(f"\nengine_update edits {args.changed} fires per run")
+
+    if args.output:
+        args.output.write_text(json.dumps({
+            "fires": args.fires,
+            "top": args.top,
+            "changed": args.changed,
+            "results_ms": results,
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
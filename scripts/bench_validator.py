@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+RANGER Tier-3 Validator Benchmark
+
+Times ToolInvocationValidator.invoke_with_enforcement on a scripted ADK agent
+(no API key needed) for queries that pass first time and queries whose first
+attempt skips the tool and must be retried:
+
+- legacy:       new InMemoryRunner and session for every attempt, each
+                attempt run to completion (the previous behavior, kept here
+                as LegacyValidator)
+- pooled:       shared runner per agent, one session reused across retries
+- early-abort:  pooled, plus cancelling an attempt once its first model turn
+                ends without a function call
+
+The scripted model sleeps --model-ms per turn to stand in for LLM latency.
+--after-run-ms adds an after_agent_callback of that cost, standing in for
+work that follows the final turn (logging, state writes); early abort skips
+it for aborted attempts.
+
+Run with: python scripts/bench_validator.py --queries 200 --model-ms 20
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from google.adk.agents import LlmAgent  # noqa: E402
+from google.adk.models.base_llm import BaseLlm  # noqa: E402
+from google.adk.models.llm_response import LlmResponse  # noqa: E402
+from google.adk.runners import InMemoryRunner  # noqa: E402
+from google.genai import types  # noqa: E402
+
+from agents._shared import validation  # noqa: E402
+from agents._shared.callbacks import create_audit_callbacks  # noqa: E402
+from agents._shared.validation import ToolInvocationValidator  # noqa: E402
+
+
+class ScriptedLlm(BaseLlm):
+    """Calls assess_fire unless the query says skip-once (and isn't a retry)."""
+
+    model: str = "scripted"
+    latency: float = 0.0
+
+    async def generate_content_async(self, llm_request, stream: bool = False):
+        await asyncio.sleep(self.latency)
+        last = llm_request.contents[-1]
+        if any(part.function_response for part in last.parts):
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="Severity is HIGH")]))
+            return
+        query = last.parts[0].text
+        if "skip-once" in query and "ENFORCEMENT REMINDER" not in query:
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="From memory: HIGH")]))
+            return
+        call = types.FunctionCall(name="assess_fire", args={"fire_id": "cedar-creek-2022"})
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(function_call=call)]))
+
+
+async def assess_fire(fire_id: str) -> dict:
+    """Assess a fire by ID."""
+    return {"status": "success", "fire_id": fire_id, "confidence": 0.9}
+
+
+class LegacyValidator(ToolInvocationValidator):
+    """Fresh runner and session per attempt, as _invoke_agent used to do."""
+
+    async def _invoke_agent(self, runner, session_id, query):
+        runner = InMemoryRunner(agent=self.agent)
+        session = await runner.session_service.create_session(app_name=runner.app_name, user_id="validation_layer")
+        response_text = ""
+        try:
+            async for event in runner.run_async(
+                user_id="validation_layer",
+                session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text=query)]),
+            ):
+                if event.content:
+                    for part in event.content.parts:
+                        if part.text:
+                            response_text = part.text
+        finally:
+            await runner.close()
+        return response_text, False
+
+
+def make_agent(model_ms: float, after_run_ms: float) -> LlmAgent:
+    before, after, on_error = create_audit_callbacks("bench_agent")
+
+    async def after_agent(callback_context):
+        await asyncio.sleep(after_run_ms / 1000)
+
+    return LlmAgent(
+        name="bench_agent",
+        model=ScriptedLlm(latency=model_ms / 1000),
+        tools=[assess_fire],
+        before_tool_callback=before,
+        after_tool_callback=after,
+        on_tool_error_callback=on_error,
+        after_agent_callback=after_agent if after_run_ms else None,
+    )
+
+
+async def run(validator: ToolInvocationValidator, query: str, count: int) -> list[float]:
+    """Milliseconds per sequential validated query."""
+    await validator.invoke_with_enforcement(query, required_tools=["assess_fire"])  # warm-up
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        result = await validator.invoke_with_enforcement(query, required_tools=["assess_fire"])
+        samples.append((time.perf_counter() - start) * 1000)
+        assert result["success"], result
+    return samples
+
+
+async def bench(args) -> dict:
+    variants = {
+        "legacy": lambda agent: LegacyValidator(agent),
+        "pooled": lambda agent: ToolInvocationValidator(agent),
+        "early-abort": lambda agent: ToolInvocationValidator(agent, early_abort=True),
+    }
+    results = {}
+    for name, factory in variants.items():
+        validator = factory(make_agent(args.model_ms, args.after_run_ms))
+        results[name] = {
+            "passed_ms": statistics.median(await run(validator, "Cedar Creek severity", args.queries)),
+            "retried_ms": statistics.median(await run(validator, "Cedar Creek severity skip-once", args.queries)),
+        }
+        await validation.close_runner_pool()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tier-3 validator runner reuse / early abort benchmark")
+    parser.add_argument("--queries", type=int, default=200, help="Sequential queries per variant")
+    parser.add_argument("--model-ms", type=float, default=20.0, help="Simulated latency per model turn")
+    parser.add_argument("--after-run-ms", type=float, default=0.0, help="Simulated work after the final turn")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    args = parser.parse_args()
+
+    # Validation failures on skipped attempts log at WARNING by design
+    logging.getLogger("ranger").setLevel(logging.ERROR)
+
+    results = asyncio.run(bench(args))
+
+    print(f"{args.queries} queries per variant, {args.model_ms:g} ms per model turn, "
+          f"{args.after_run_ms:g} ms after-run work (median ms)\n")
+    print(f"{'variant':<12} {'passed':>8} {'retried':>8} {'saved/retry':>12}")
+    legacy = results["legacy"]["retried_ms"]
+    for name, r in results.items():
+        print(f"{name:<12} {r['passed_ms']:>8.2f} {r['retried_ms']:>8.2f} {legacy - r['retried_ms']:>12.2f}")
+
+    if args.output:
+        args.output.write_text(json.dumps({"queries": args.queries, "model_ms": args.model_ms,
+                                           "after_run_ms": args.after_run_ms, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
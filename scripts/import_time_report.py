@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+RANGER Import-Time Report
+
+Imports a module in a fresh interpreter with `python -X importtime` and
+reports per-module self and cumulative import time in milliseconds.
+
+Run with:
+    python scripts/import_time_report.py                    # coordinator.agent
+    python scripts/import_time_report.py main --top 40
+    python scripts/import_time_report.py coordinator.agent --first-party --json
+
+--first-party limits the report to RANGER modules (agents.*, specialist
+agent modules, skill scripts, RAG query modules), which is where cold-start
+regressions usually come from.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+AGENTS_DIR = PROJECT_ROOT / "agents"
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def _first_party_prefixes() -> tuple[str, ...]:
+    """Top-level module names that belong to this repository."""
+    names = {"agents", "main"}
+    for entry in AGENTS_DIR.iterdir():
+        if entry.is_dir() and not entry.name.startswith((".", "_")):
+            names.add(entry.name)
+    # Skill scripts and RAG modules are imported as top-level modules via sys.path
+    for script in AGENTS_DIR.glob("*/skills/*/scripts/*.py"):
+        names.add(script.stem)
+    for script in AGENTS_DIR.glob("*/*.py"):
+        names.add(script.stem)
+    return tuple(sorted(names))
+
+
+def measure_imports(target: str) -> list[dict]:
+    """
+    Import `target` in a subprocess and parse -X importtime output.
+
+    Args:
+        target: Module to import (resolved with agents/ and the project root on sys.path)
+
+    Returns:
+        One dict per imported module with name, depth, self_ms and cumulative_ms,
+        in import order
+    """
+    code = (
+        "import sys; "
+        f"sys.path[:0] = [{str(AGENTS_DIR)!r}, {str(PROJECT_ROOT)!r}]; "
+        f"import {target}"
+    )
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    env.setdefault("GOOGLE_API_KEY", "import-time-report")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f"Importing {target} failed:\n{tail}")
+
+    modules = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.append({
+            "module": name,
+            "depth": len(indent) // 2,
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-module import time report")
+    parser.add_argument("target", nargs="?", default="coordinator.agent")
+    parser.add_argument("--top", type=int, default=25, help="Rows to show (0 = all)")
+    parser.add_argument("--sort", choices=["self", "cumulative"], default="cumulative")
+    parser.add_argument("--first-party", action="store_true", help="Only RANGER modules")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    modules = measure_imports(args.target)
+    total_ms = next(
+        (m["cumulative_ms"] for m in modules if m["module"] == args.target), 0.0
+    )
+
+    if args.first_party:
+        prefixes = _first_party_prefixes()
+        modules = [m for m in modules if m["module"].split(".")[0] in prefixes]
+
+    key = "self_ms" if args.sort == "self" else "cumulative_ms"
+    modules.sort(key=lambda m: m[key], reverse=True)
+    if args.top:
+        modules = modules[: args.top]
+
+    if args.json:
+        print(json.dumps({"target": args.target, "total_ms": total_ms, "modules": modules}, indent=2))
+        return
+
+    print(f"Import of {args.target}: {total_ms:.1f} ms total\n")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for m in modules:
+        print(f"{m['self_ms']:>9.1f} {m['cumulative_ms']:>9.1f}  {m['module']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,491 @@
+"""
+Fixture Registry for the RANGER MCP Fixtures Server.
+
+Discovers every fire directory under the fixtures root and serves its JSON
+documents as immutable per-fire snapshots:
+
+- Discovery only lists directories; no fixture JSON is parsed at startup
+- Alias index (like agents/_shared/fire_utils.FIRE_ID_ALIASES) built from
+  directory names, extended with the fire_id / name found in documents as
+  they load; a trailing year ("cedar-creek-2022", "cc-2022") is optional
+- A fire's documents load together on first access into a FireSnapshot,
+  kept in an LRU bounded by on-disk size so hundreds of fires fit a fixed
+  memory budget
+- A watcher (check_for_updates(), or start_watching() for a background
+  thread) re-stats loaded fires, parses and validates changed files off the
+  request path and swaps in a new snapshot atomically; a file that fails to
+  parse or validate leaves the previous snapshot in place
+
+Readers take one snapshot per request (fire_snapshot()) and read every
+document from it, so a request never mixes old and new file versions.
+signature() exposes the snapshot's file stamps so callers can key derived
+caches on them; derived() caches a structure built from the snapshot (e.g.
+a spatial index) on the snapshot itself, so it is dropped with it on reload
+or LRU eviction.
+
+A fire directory is any subdirectory containing at least one of
+FIRE_DOCUMENTS (data/fixtures/nepa etc. are ignored).
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional
+
+logger = logging.getLogger("ranger.mcp-fixtures.registry")
+
+INCIDENT_METADATA = "incident-metadata.json"
+BURN_SEVERITY = "burn-severity.json"
+TRAIL_DAMAGE = "trail-damage.json"
+TIMBER_PLOTS = "timber-plots.json"
+
+FIRE_DOCUMENTS = (INCIDENT_METADATA, BURN_SEVERITY, TRAIL_DAMAGE, TIMBER_PLOTS)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# "cedar-creek-2022", "cc2022", "bootleg 2021" -> base name + year
+YEAR_SUFFIX = re.compile(r"^(.+?)[-_\s]?((?:19|20)\d{2})$")
+
+# Item list each document must carry for the tools to serve it
+REQUIRED_LISTS = {
+    BURN_SEVERITY: "sectors",
+    TRAIL_DAMAGE: "trails",
+    TIMBER_PLOTS: "plots",
+}
+
+
+class FixtureValidationError(ValueError):
+    """A fixture file that cannot be served (bad JSON or unexpected shape)."""
+
+
+def fire_aliases(name: str) -> set[str]:
+    """
+    Spelling variants a user might type for a fire name or ID.
+
+    Examples:
+        >>> sorted(fire_aliases("cedar-creek"))
+        ['cc', 'cedar creek', 'cedar-creek', 'cedar_creek', 'cedarcreek']
+    """
+    words = [w for w in re.split(r"[-_\s]+", name.lower().strip()) if w]
+    if words and words[-1] == "fire" and len(words) > 1:
+        words = words[:-1]
+    if not words:
+        return set()
+    aliases = {"-".join(words), "_".join(words), " ".join(words), "".join(words)}
+    if len(words) > 1:
+        aliases.add("".join(w[0] for w in words))
+    return aliases
+
+
+def validate_document(name: str, data: Any) -> None:
+    """Raise FixtureValidationError unless `data` has the shape the tools expect."""
+    if name == TIMBER_PLOTS and isinstance(data, list):
+        return
+    if not isinstance(data, dict):
+        raise FixtureValidationError(f"{name}: expected a JSON object, got {type(data).__name__}")
+    list_key = REQUIRED_LISTS.get(name)
+    if list_key and not isinstance(data.get(list_key), list):
+        raise FixtureValidationError(f"{name}: missing '{list_key}' list")
+
+
+def load_document(path: Path) -> tuple[Any, tuple[int, int]]:
+    """
+    Parse and validate one fixture file.
+
+    Returns:
+        (data, (mtime_ns, size)) - the stamp the file had while it was read
+
+    Raises:
+        OSError, FixtureValidationError
+    """
+    stamp = _file_stamp(path)
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise FixtureValidationError(f"{path.name}: {e}") from e
+    if stamp is None or _file_stamp(path) != stamp:
+        # Still being written; the next watcher pass sees the finished file
+        raise FixtureValidationError(f"{path.name}: changed while loading")
+    validate_document(path.name, data)
+    return data, stamp
+
+
+@dataclass(frozen=True)
+class FireFixtures:
+    """A discovered fire directory."""
+    fire_id: str
+    directory: Path
+    documents: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class FireSnapshot:
+    """
+    One consistent version of a fire's documents.
+
+    `stamps` covers every file the snapshot looked at, including ones that
+    failed to load (absent from `documents`). Unchanged documents are shared
+    between generations and must be treated as read-only.
+    """
+    fire_id: str
+    generation: int
+    documents: Mapping[str, Any]
+    stamps: Mapping[str, tuple[int, int]]
+    size: int
+    loaded_at: float = field(default_factory=time.time)
+    _derived: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _derived_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def document(self, name: str) -> Optional[Any]:
+        """Parsed document, or None if the fire has no (valid) such document."""
+        return self.documents.get(name)
+
+    def signature(self, names: tuple[str, ...]) -> tuple:
+        """(mtime_ns, size) per name, None if absent; equal signatures mean equal data."""
+        return tuple(self.stamps.get(name) for name in names)
+
+    def derived(self, key: str, build: Callable[["FireSnapshot"], Any]) -> Any:
+        """build(self), computed once per snapshot and cached under `key`."""
+        value = self._derived.get(key)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = self._derived[key] = build(self)
+        return value
+
+
+class FixtureRegistry:
+    """
+    Lazily loaded, alias-indexed registry of immutable fire snapshots.
+
+    Usage:
+        >>> registry = FixtureRegistry(Path("data/fixtures"), reload_seconds=2.0)
+        >>> registry.start_watching()
+        >>> fire = registry.fire_snapshot(registry.resolve("CC-2022"))
+        >>> burn = fire.document(BURN_SEVERITY)
+
+    Args:
+        root: Fixtures root containing one directory per fire
+        max_bytes: Budget for loaded snapshots, measured as JSON file size
+        reload_seconds: Watcher poll interval (0 disables start_watching())
+
+    Thread Safety:
+        All public methods are thread-safe. Files are parsed outside the
+        lock; snapshots are swapped by reference under it.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES, reload_seconds: float = 0.0):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.reload_seconds = reload_seconds
+        self._lock = threading.RLock()
+        self._fires: dict[str, FireFixtures] = {}
+        self._aliases: dict[str, str] = {}
+        self._exact_aliases: set[str] = set()
+        self._ambiguous: set[str] = set()
+        self._snapshots: OrderedDict[str, FireSnapshot] = OrderedDict()
+        self._loaded_bytes = 0
+        # fire_id -> file stamps of the last rejected reload, so a bad file is reported once
+        self._rejected: dict[str, dict[str, Optional[tuple[int, int]]]] = {}
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.generation = 0
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+        self.reloads = 0
+        self.reload_failures = 0
+        self.last_reload_ms = 0.0
+        self.max_reload_ms = 0.0
+        self.discover()
+
+    def discover(self) -> list[str]:
+        """(Re)scan the fixtures root for fire directories. Returns fire IDs."""
+        fires: dict[str, FireFixtures] = {}
+        if self.root.is_dir():
+            for directory in sorted(self.root.iterdir()):
+                if not directory.is_dir() or directory.name.startswith((".", "_")):
+                    continue
+                documents = tuple(d for d in FIRE_DOCUMENTS if (directory / d).is_file())
+                if documents:
+                    fires[directory.name] = FireFixtures(directory.name, directory, documents)
+        else:
+            logger.warning(f"Fixtures directory not found: {self.root}")
+
+        with self._lock:
+            if fires == self._fires:
+                return list(fires)
+            self._fires = fires
+            self._aliases.clear()
+            self._exact_aliases.clear()
+            self._ambiguous.clear()
+            for fire_id in fires:
+                self._add_alias(fire_id.lower(), fire_id, exact=True)
+            for fire_id in fires:
+                for alias in fire_aliases(fire_id):
+                    self._add_alias(alias, fire_id)
+            # Drop snapshots of fires that disappeared
+            for fire_id in [f for f in self._snapshots if f not in fires]:
+                self._drop(fire_id)
+            for fire_id, snapshot in self._snapshots.items():
+                for document in snapshot.documents.values():
+                    self._learn_aliases(fire_id, document)
+        logger.info(f"Discovered {len(fires)} fires under {self.root}")
+        return list(fires)
+
+    def fire_ids(self) -> list[str]:
+        """IDs (directory names) of all discovered fires."""
+        return list(self._fires)
+
+    def get_fire(self, fire_id: str) -> Optional[FireFixtures]:
+        """Discovered fire by canonical ID."""
+        return self._fires.get(fire_id)
+
+    def resolve(self, fire_id: str) -> Optional[str]:
+        """Map any known spelling of a fire to its canonical ID, or None."""
+        if not fire_id:
+            return None
+        key = fire_id.lower().strip()
+        with self._lock:
+            match = self._aliases.get(key)
+            if match is None:
+                year_match = YEAR_SUFFIX.match(key)
+                if year_match:
+                    match = self._aliases.get(year_match.group(1))
+            return match
+
+    def fire_snapshot(self, fire_id: str) -> Optional[FireSnapshot]:
+        """
+        Current snapshot of a fire, loading it on first access.
+
+        Hold on to the returned snapshot for the whole request; later
+        reloads swap in a new one and never modify it.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(fire_id)
+            if snapshot is not None:
+                self._snapshots.move_to_end(fire_id)
+                self.hits += 1
+                return snapshot
+            fire = self._fires.get(fire_id)
+        if fire is None:
+            return None
+
+        loaded = self._load_fire(fire)
+        with self._lock:
+            # Another request may have loaded it meanwhile; serve that one
+            snapshot = self._snapshots.get(fire_id)
+            if snapshot is not None:
+                return snapshot
+            self.loads += 1
+            self._install(loaded)
+            return loaded
+
+    def get_document(self, fire_id: str, name: str) -> Optional[Any]:
+        """
+        Return a fire's parsed document from its current snapshot.
+
+        Args:
+            fire_id: Canonical fire ID (see resolve())
+            name: Document file name, one of FIRE_DOCUMENTS
+
+        Returns:
+            Parsed JSON, or None if the fire has no such document
+        """
+        snapshot = self.fire_snapshot(fire_id)
+        return snapshot.document(name) if snapshot is not None else None
+
+    def signature(self, fire_id: str, names: tuple[str, ...]) -> tuple:
+        """Change stamp of a fire's documents in its current snapshot."""
+        snapshot = self.fire_snapshot(fire_id)
+        if snapshot is None:
+            return (None,) * len(names)
+        return snapshot.signature(names)
+
+    def check_for_updates(self) -> list[str]:
+        """
+        One watcher pass: rediscover fires, then reload every loaded fire
+        whose files changed. Returns the fire IDs whose snapshots were swapped.
+        """
+        self.discover()
+        with self._lock:
+            candidates = [
+                (self._fires[fire_id], snapshot)
+                for fire_id, snapshot in self._snapshots.items()
+            ]
+
+        swapped = []
+        for fire, previous in candidates:
+            names = set(fire.documents).union(previous.stamps)
+            stamps = {name: _file_stamp(fire.directory / name) for name in names}
+            if all(stamp == previous.stamps.get(name) for name, stamp in stamps.items()):
+                continue
+            if self._rejected.get(fire.fire_id) == stamps:
+                continue
+            start = time.perf_counter()
+            try:
+                snapshot = self._load_fire(fire, previous)
+            except (OSError, FixtureValidationError) as e:
+                with self._lock:
+                    self.reload_failures += 1
+                    self._rejected[fire.fire_id] = stamps
+                logger.warning(f"Keeping generation {previous.generation} of {fire.fire_id}: {e}")
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                if self._snapshots.get(fire.fire_id) is not previous:
+                    continue  # evicted or replaced meanwhile
+                self._drop(fire.fire_id)
+                self._install(snapshot)
+                self._rejected.pop(fire.fire_id, None)
+                self.reloads += 1
+                self.last_reload_ms = elapsed_ms
+                self.max_reload_ms = max(self.max_reload_ms, elapsed_ms)
+            logger.info(f"Reloaded {fire.fire_id} as generation {snapshot.generation} ({elapsed_ms:.1f} ms)")
+            swapped.append(fire.fire_id)
+        return swapped
+
+    def start_watching(self) -> bool:
+        """Start the background watcher thread; False if disabled or already running."""
+        if self.reload_seconds <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return False
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="fixture-watcher", daemon=True)
+        self._watcher.start()
+        return True
+
+    def stop_watching(self) -> None:
+        """Stop the background watcher thread."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+            self._watcher = None
+
+    def stats(self) -> dict[str, Any]:
+        """Registry occupancy, counters and reload metrics."""
+        with self._lock:
+            return {
+                "fires": len(self._fires),
+                "aliases": len(self._aliases),
+                "loaded_fires": len(self._snapshots),
+                "loaded_bytes": self._loaded_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "generation": self.generation,
+                "reloads": self.reloads,
+                "reload_failures": self.reload_failures,
+                "last_reload_ms": round(self.last_reload_ms, 3),
+                "max_reload_ms": round(self.max_reload_ms, 3),
+                "watching": self._watcher is not None and self._watcher.is_alive(),
+            }
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.reload_seconds):
+            try:
+                self.check_for_updates()
+            except Exception as e:
+                logger.error(f"Fixture watcher pass failed: {e}")
+
+    def _load_fire(self, fire: FireFixtures, previous: Optional[FireSnapshot] = None) -> FireSnapshot:
+        """
+        Parse a fire's documents into a new snapshot.
+
+        On first load a bad document is logged and left out. On reload
+        (`previous` given) unchanged documents are reused and a bad one
+        raises, so the caller keeps the previous snapshot.
+        """
+        documents: dict[str, Any] = {}
+        stamps: dict[str, tuple[int, int]] = {}
+        for name in fire.documents:
+            path = fire.directory / name
+            if previous is not None:
+                stamp = _file_stamp(path)
+                if stamp is not None and stamp == previous.stamps.get(name):
+                    if name in previous.documents:
+                        documents[name] = previous.documents[name]
+                    stamps[name] = stamp
+                    continue
+            try:
+                documents[name], stamps[name] = load_document(path)
+            except (OSError, FixtureValidationError) as e:
+                if previous is not None:
+                    raise
+                logger.error(f"Failed to load fixture {path}: {e}")
+                stamp = _file_stamp(path)
+                if stamp is not None:
+                    stamps[name] = stamp
+        with self._lock:
+            self.generation += 1
+            generation = self.generation
+        return FireSnapshot(
+            fire_id=fire.fire_id,
+            generation=generation,
+            documents=MappingProxyType(documents),
+            stamps=MappingProxyType(stamps),
+            size=sum(stamp[1] for stamp in stamps.values()),
+        )
+
+    def _install(self, snapshot: FireSnapshot) -> None:
+        self._snapshots[snapshot.fire_id] = snapshot
+        self._loaded_bytes += snapshot.size
+        for document in snapshot.documents.values():
+            self._learn_aliases(snapshot.fire_id, document)
+        self._evict(keep=snapshot.fire_id)
+
+    def _add_alias(self, alias: str, fire_id: str, exact: bool = False) -> None:
+        if exact:
+            self._aliases[alias] = fire_id
+            self._exact_aliases.add(alias)
+            return
+        if alias in self._exact_aliases or alias in self._ambiguous:
+            return
+        existing = self._aliases.get(alias)
+        if existing is not None and existing != fire_id:
+            # Two fires share this spelling (e.g. initials); require a longer form
+            del self._aliases[alias]
+            self._ambiguous.add(alias)
+            return
+        self._aliases[alias] = fire_id
+
+    def _learn_aliases(self, fire_id: str, document: Any) -> None:
+        """Index the fire_id / name a document uses for itself."""
+        if not isinstance(document, dict):
+            return
+        for key in ("fire_id", "name", "fire_name"):
+            value = document.get(key)
+            if isinstance(value, str):
+                self._add_alias(value.lower().strip(), fire_id)
+                for alias in fire_aliases(value):
+                    self._add_alias(alias, fire_id)
+
+    def _evict(self, keep: str) -> None:
+        while self._loaded_bytes > self.max_bytes and len(self._snapshots) > 1:
+            fire_id = next(iter(self._snapshots))
+            if fire_id == keep:
+                self._snapshots.move_to_end(fire_id)
+                continue
+            self._drop(fire_id)
+            self.evictions += 1
+
+    def _drop(self, fire_id: str) -> None:
+        snapshot = self._snapshots.pop(fire_id)
+        self._loaded_bytes -= snapshot.size
+
+
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
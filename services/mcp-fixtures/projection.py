@@ -0,0 +1,107 @@
+"""
+Field projection and pagination for list-valued MCP tool results.
+
+assess_trails (trails), get_timber_plots (plots) and mtbs_classify (sectors)
+accept the same optional arguments:
+
+    fields        Item fields to keep; the item's ID field is always kept.
+                  Omitted or ["*"] keeps every field.
+    limit         Maximum items per page
+    cursor        Opaque cursor from a previous page's next_cursor
+    summary_only  Drop the item list entirely (summary and totals only)
+
+Without any of these the result is unchanged. When paging is requested the
+result gains "total" and, if more items remain, "next_cursor".
+"""
+
+from typing import Any, Optional
+
+# JSON Schema fragments merged into each list tool's inputSchema
+PROJECTION_SCHEMA = {
+    "fields": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Item fields to return (ID always included; omit or ['*'] for all fields)"
+    },
+    "limit": {
+        "type": "integer",
+        "minimum": 1,
+        "description": "Maximum items to return in this page"
+    },
+    "cursor": {
+        "type": "string",
+        "description": "next_cursor from a previous response, to fetch the following page"
+    },
+    "summary_only": {
+        "type": "boolean",
+        "description": "Return only the summary and item count, without the item list"
+    },
+}
+
+
+def project_item(item: Any, fields: Optional[list[str]], id_fields: tuple[str, ...]) -> Any:
+    """Keep only `fields` (plus any ID field) of a dict item."""
+    if not fields or "*" in fields or not isinstance(item, dict):
+        return item
+    keep = set(fields).union(id_fields)
+    return {key: value for key, value in item.items() if key in keep}
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Offset encoded in a cursor; raises ValueError for a malformed one."""
+    if cursor in (None, ""):
+        return 0
+    offset = int(cursor)
+    if offset < 0:
+        raise ValueError(cursor)
+    return offset
+
+
+def shape_items(
+    result: dict[str, Any],
+    list_key: str,
+    arguments: dict[str, Any],
+    id_fields: tuple[str, ...] = ("id",),
+) -> dict[str, Any]:
+    """
+    Apply fields / limit / cursor / summary_only to `result[list_key]`.
+
+    Args:
+        result: Tool result holding the full item list under `list_key`
+        list_key: "trails", "plots" or "sectors"
+        arguments: Raw tool arguments
+        id_fields: Item fields always kept by projection
+
+    Returns:
+        The reshaped result, or an error payload for invalid arguments
+    """
+    items = result.get(list_key)
+    if items is None:
+        return result
+
+    if arguments.get("summary_only"):
+        shaped = {key: value for key, value in result.items() if key != list_key}
+        shaped["total"] = len(items)
+        return shaped
+
+    limit = arguments.get("limit")
+    cursor = arguments.get("cursor")
+    try:
+        offset = decode_cursor(cursor)
+    except (TypeError, ValueError):
+        return {"error": f"Invalid cursor: {cursor}"}
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 1):
+        return {"error": f"Invalid limit: {limit}"}
+    fields = arguments.get("fields")
+    if fields is not None and (not isinstance(fields, list) or not all(isinstance(f, str) for f in fields)):
+        return {"error": f"Invalid fields: {fields}"}
+
+    page = items[offset:offset + limit] if limit is not None else items[offset:]
+    shaped = dict(result)
+    shaped[list_key] = [project_item(item, fields, id_fields) for item in page]
+
+    if limit is not None or cursor:
+        shaped["total"] = len(items)
+        if offset + len(page) < len(items):
+            shaped["next_cursor"] = str(offset + len(page))
+    return shaped
@@ -0,0 +1,147 @@
+"""
+Encoded Response Cache for the RANGER MCP Fixtures Server.
+
+Fixture data is static between file edits, so a tool's JSON payload for a
+given fire and argument set only changes when one of its source documents
+does. This cache keeps the compact encoded text per
+
+    (tool, canonical fire_id, normalized arguments)
+
+tagged with the FixtureRegistry.signature() of the documents the tool reads.
+A lookup whose signature no longer matches is a miss and the entry is rebuilt.
+
+Encoding is compact (no indentation). orjson is used when installed; set
+MCP_JSON_ENCODER=json to force the standard library encoder.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def _json_encode(result: Any) -> str:
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+
+
+def _orjson_encode(result: Any) -> str:
+    return orjson.dumps(result).decode()
+
+
+def get_encoder(name: Optional[str] = None) -> tuple[str, Callable[[Any], str]]:
+    """
+    Pick the payload encoder.
+
+    Args:
+        name: "orjson", "json", or None to prefer orjson when available
+
+    Returns:
+        (encoder name, encode function)
+    """
+    name = (name or os.environ.get("MCP_JSON_ENCODER") or "orjson").lower()
+    if name == "orjson" and orjson is not None:
+        return "orjson", _orjson_encode
+    return "json", _json_encode
+
+
+def normalize_arguments(arguments: dict[str, Any], exclude: tuple[str, ...] = ("fire_id",)) -> tuple:
+    """
+    Order-independent, hashable form of tool arguments.
+
+    None values are dropped so an omitted optional argument and an explicit
+    null share one entry.
+
+    Examples:
+        >>> normalize_arguments({"trail_id": "T1", "fire_id": "cc"})
+        (('trail_id', '"T1"'),)
+    """
+    return tuple(sorted(
+        (key, json.dumps(value, sort_keys=True))
+        for key, value in arguments.items()
+        if key not in exclude and value is not None
+    ))
+
+
+class EncodedResponseCache:
+    """
+    LRU of encoded tool payloads, invalidated by document signature.
+
+    Usage:
+        >>> cache = EncodedResponseCache()
+        >>> text = cache.get_or_encode(key, signature, lambda: build(fire_id, arguments))
+
+    Args:
+        max_entries: Payloads kept before evicting least recently used
+        encoder: Encoder name passed to get_encoder()
+
+    Thread Safety:
+        All public methods are thread-safe. Two threads missing on the same
+        key may both build; the payloads are identical, so the last one wins.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, encoder: Optional[str] = None):
+        self.max_entries = max_entries
+        self.encoder, self.encode = get_encoder(encoder)
+        self._entries: OrderedDict[Hashable, tuple[tuple, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.bytes_served = 0
+
+    def get_or_encode(self, key: Hashable, signature: tuple, build: Callable[[], Any]) -> str:
+        """
+        Return the cached payload for `key`, building and encoding it on a miss.
+
+        Args:
+            key: (tool, fire_id, normalized arguments)
+            signature: Source document signature the payload must match
+            build: Returns the result dict to encode
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                if cached[0] == signature:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self.bytes_served += len(cached[1])
+                    return cached[1]
+                del self._entries[key]
+                self.invalidations += 1
+            self.misses += 1
+
+        text = self.encode(build())
+
+        with self._lock:
+            self._entries[key] = (signature, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.bytes_served += len(text)
+        return text
+
+    def clear(self) -> None:
+        """Drop all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Cache counters and occupancy."""
+        with self._lock:
+            return {
+                "encoder": self.encoder,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "bytes_served": self.bytes_served,
+            }
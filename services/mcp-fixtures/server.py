@@ -1,50 +1,99 @@
 """
 RANGER MCP Fixtures Server
 
-Provides fixture data for Cedar Creek fire to ADK agents via MCP tools.
+Provides fire fixture data to ADK agents via MCP tools.
 This server is Phase 1's data source - simulated data for multi-agent demo.
+Every fire directory under the fixtures root is served (see fixture_registry.py);
+documents load on first use and are hot-reloaded: edited fixture files are
+validated in the background and swapped in as a new snapshot, while
+in-flight calls finish on the snapshot they started with.
 
 Tools:
 - get_fire_context: Fire metadata and summary
 - mtbs_classify: MTBS burn severity classification
 - assess_trails: Trail damage assessment data
 - get_timber_plots: Timber cruise plot data
+- query_bbox: Sectors, damage points and plots within a bounding box
+- sector_at_point: Burn severity sector(s) containing a point
 
-Transport: stdio (for local development and ADK integration)
-HTTP health endpoint for Cloud Run deployment
-Run locally: python services/mcp-fixtures/server.py
+Transports:
+- stdio (default for local development and ADK integration)
+- Streamable HTTP at /mcp (Cloud Run, pooled clients - see agents/_shared/mcp_client.py)
+- Legacy HTTP+SSE at /sse with POSTs to /messages/
+
+List tools (assess_trails, get_timber_plots, mtbs_classify) accept fields /
+limit / cursor / summary_only - see projection.py.
+HTTP health endpoint at /health
+
+Run locally (stdio): python services/mcp-fixtures/server.py
+Run locally (HTTP):  python services/mcp-fixtures/server.py --http --port 8080
 """
 
-import json
 import sys
 import os
+import contextlib
 from pathlib import Path
 from typing import Any
 
 from mcp.server import Server
+from mcp.server.sse import SseServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.types import Tool, TextContent
 from starlette.applications import Starlette
-from starlette.routing import Route
-from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+from starlette.responses import JSONResponse, Response
+
+from fixture_registry import (
+    BURN_SEVERITY,
+    DEFAULT_MAX_BYTES,
+    INCIDENT_METADATA,
+    TIMBER_PLOTS,
+    TRAIL_DAMAGE,
+    FireSnapshot,
+    FixtureRegistry,
+)
+from projection import PROJECTION_SCHEMA, shape_items
+from response_cache import EncodedResponseCache, normalize_arguments
+from spatial_index import LAYERS, FireSpatialIndex, first_value
+
+
+def _default_fixtures_root() -> Path:
+    """Container path, falling back to the repository's data/fixtures for local runs."""
+    container_root = Path("/app/data/fixtures")
+    if container_root.is_dir():
+        return container_root
+    return Path(__file__).resolve().parents[2] / "data" / "fixtures"
 
-# Path to fixture data (adjust based on container structure)
-FIXTURES_DIR = Path("/app/data/fixtures/cedar-creek")
 
+# Root of per-fire fixture directories (adjust based on container structure)
+FIXTURES_DIR = Path(os.environ.get("FIXTURES_DIR") or _default_fixtures_root())
+FIXTURE_CACHE_MAX_BYTES = int(os.environ.get("FIXTURE_CACHE_MAX_MB", 0)) * 1024 * 1024 or DEFAULT_MAX_BYTES
+
+# Seconds between checks for edited fixture files (0 disables hot reload)
+FIXTURE_RELOAD_SECONDS = float(os.environ.get("FIXTURE_RELOAD_SECONDS", 2))
+
+# Encoded tool payloads kept in memory (0 disables reuse)
+RESPONSE_CACHE_ENTRIES = int(os.environ.get("MCP_RESPONSE_CACHE_ENTRIES", 1024))
+
+# Known MTBS identifiers for fixture fires without one in burn-severity.json
+MTBS_IDS = {"cedar-creek": "cc_2025_001"}
+
+registry = FixtureRegistry(
+    FIXTURES_DIR,
+    max_bytes=FIXTURE_CACHE_MAX_BYTES,
+    reload_seconds=FIXTURE_RELOAD_SECONDS,
+)
+response_cache = EncodedResponseCache(max_entries=RESPONSE_CACHE_ENTRIES)
 
-def load_fixture(filename: str) -> dict[str, Any]:
-    """Load a fixture JSON file."""
-    filepath = FIXTURES_DIR / filename
-    if filepath.exists():
-        with open(filepath) as f:
-            return json.load(f)
-    return {"error": f"Fixture not found: {filename}"}
 
+def unknown_fire(fire_id: str) -> dict[str, Any]:
+    """Error payload for a fire with no fixture directory."""
+    return {"error": f"Unknown fire: {fire_id}", "available_fires": registry.fire_ids()}
 
-# Pre-load fixture data for performance
-INCIDENT_DATA = load_fixture("incident-metadata.json")
-BURN_SEVERITY_DATA = load_fixture("burn-severity.json")
-TRAIL_DAMAGE_DATA = load_fixture("trail-damage.json")
-TIMBER_PLOTS_DATA = load_fixture("timber-plots.json")
+
+def missing_document(fire_id: str, document: str) -> dict[str, Any]:
+    """Error payload for a known fire lacking one of its documents."""
+    return {"error": f"No {document.removesuffix('.json')} data for fire: {fire_id}"}
 
 
 # Initialize MCP Server
@@ -82,7 +131,8 @@ async def list_tools() -> list[Tool]:
                     "include_sectors": {
                         "type": "boolean",
                         "description": "Include detailed sector-level data (default: true)"
-                    }
+                    },
+                    **PROJECTION_SCHEMA
                 },
                 "required": ["fire_id"]
             }
@@ -100,7 +150,8 @@ async def list_tools() -> list[Tool]:
                     "trail_id": {
                         "type": "string",
                         "description": "Specific trail to assess (optional, returns all if not specified)"
-                    }
+                    },
+                    **PROJECTION_SCHEMA
                 },
                 "required": ["fire_id"]
             }
@@ -114,121 +165,283 @@ async def list_tools() -> list[Tool]:
                     "fire_id": {
                         "type": "string",
                         "description": "Fire identifier"
-                    }
+                    },
+                    **PROJECTION_SCHEMA
                 },
                 "required": ["fire_id"]
             }
+        ),
+        Tool(
+            name="query_bbox",
+            description="Find burn severity sectors, trail damage points and timber plots within a bounding box, optionally only those inside sectors of a given severity.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "fire_id": {
+                        "type": "string",
+                        "description": "Fire identifier"
+                    },
+                    "bbox": {
+                        "type": "array",
+                        "items": {"type": "number"},
+                        "minItems": 4,
+                        "maxItems": 4,
+                        "description": "[min_lon, min_lat, max_lon, max_lat]"
+                    },
+                    "layers": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": list(LAYERS)},
+                        "description": "Feature layers to return (default: all)"
+                    },
+                    "sector_severity": {
+                        "type": "string",
+                        "description": "Only sectors of this severity, and points inside such sectors (e.g. 'HIGH')"
+                    },
+                    **PROJECTION_SCHEMA
+                },
+                "required": ["fire_id", "bbox"]
+            }
+        ),
+        Tool(
+            name="sector_at_point",
+            description="Get the burn severity sector(s) containing a location.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "fire_id": {
+                        "type": "string",
+                        "description": "Fire identifier"
+                    },
+                    "lon": {"type": "number", "description": "Longitude"},
+                    "lat": {"type": "number", "description": "Latitude"}
+                },
+                "required": ["fire_id", "lon", "lat"]
+            }
         )
     ]
 
 
-@mcp_server.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle MCP tool calls."""
-    fire_id = arguments.get("fire_id", "").lower()
-
-    # Normalize fire_id - accept variations
-    if fire_id in ["cedar-creek", "cedar-creek-2022", "cc-2022", "cedar_creek"]:
-        fire_id = "cedar-creek"
-
-    if name == "get_fire_context":
-        if fire_id == "cedar-creek":
-            result = {
-                "fire_id": INCIDENT_DATA.get("fire_id"),
-                "name": INCIDENT_DATA.get("name"),
-                "discovery_date": INCIDENT_DATA.get("discovery_date"),
-                "containment_date": INCIDENT_DATA.get("containment_date"),
-                "acres": INCIDENT_DATA.get("acres"),
-                "severity": INCIDENT_DATA.get("severity"),
-                "phase": INCIDENT_DATA.get("phase"),
-                "forest": INCIDENT_DATA.get("forest"),
-                "state": INCIDENT_DATA.get("state"),
-                "coordinates": INCIDENT_DATA.get("coordinates"),
-                "summary": INCIDENT_DATA.get("summary"),
-                "baer_status": INCIDENT_DATA.get("baer_status"),
-                "source": "RANGER-Fixtures",
-                "confidence": 0.95
-            }
-        else:
-            result = {"error": f"Unknown fire: {fire_id}", "available_fires": ["cedar-creek"]}
-
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    elif name == "mtbs_classify":
-        if fire_id == "cedar-creek":
-            include_sectors = arguments.get("include_sectors", True)
-
-            result = {
-                "fire_id": BURN_SEVERITY_DATA.get("fire_id"),
-                "fire_name": BURN_SEVERITY_DATA.get("fire_name"),
-                "total_acres": BURN_SEVERITY_DATA.get("total_acres"),
-                "imagery_date": BURN_SEVERITY_DATA.get("imagery_date"),
-                "source": "MTBS",
-                "summary": BURN_SEVERITY_DATA.get("summary"),
-                "confidence": 0.94,
-                "mtbs_id": "cc_2025_001"
-            }
+def build_fire_context(fire: FireSnapshot, arguments: dict[str, Any]) -> dict[str, Any]:
+    """get_fire_context result for a resolved fire."""
+    incident = fire.document(INCIDENT_METADATA)
+    if incident is None:
+        incident = _incident_from_burn_severity(fire)
+    if incident is None:
+        return missing_document(fire.fire_id, INCIDENT_METADATA)
+    return {
+        "fire_id": incident.get("fire_id"),
+        "name": incident.get("name"),
+        "discovery_date": incident.get("discovery_date"),
+        "containment_date": incident.get("containment_date"),
+        "acres": incident.get("acres"),
+        "severity": incident.get("severity"),
+        "phase": incident.get("phase"),
+        "forest": incident.get("forest"),
+        "state": incident.get("state"),
+        "coordinates": incident.get("coordinates"),
+        "summary": incident.get("summary"),
+        "baer_status": incident.get("baer_status"),
+        "source": "RANGER-Fixtures",
+        "confidence": 0.95
+    }
+
+
+def build_mtbs_classification(fire: FireSnapshot, arguments: dict[str, Any]) -> dict[str, Any]:
+    """mtbs_classify result for a resolved fire."""
+    burn = fire.document(BURN_SEVERITY)
+    if burn is None:
+        return missing_document(fire.fire_id, BURN_SEVERITY)
+
+    include_sectors = arguments.get("include_sectors", True)
+
+    result = {
+        "fire_id": burn.get("fire_id"),
+        "fire_name": burn.get("fire_name"),
+        "total_acres": burn.get("total_acres"),
+        "imagery_date": burn.get("imagery_date"),
+        "source": "MTBS",
+        "summary": burn.get("summary"),
+        "confidence": 0.94,
+        "mtbs_id": burn.get("mtbs_id", MTBS_IDS.get(fire.fire_id))
+    }
+
+    if include_sectors:
+        # Include simplified sector data (without geometry for brevity)
+        sectors = []
+        for sector in burn.get("sectors", []):
+            sectors.append({
+                "id": first_value(sector, "id", "sector_id"),
+                "name": sector.get("name"),
+                "severity": sector.get("severity"),
+                "severity_class": sector.get("severity_class"),
+                "acres": sector.get("acres"),
+                "dnbr_mean": sector.get("dnbr_mean"),
+                "priority_notes": sector.get("priority_notes")
+            })
+        result["sectors"] = sectors
+    return shape_items(result, "sectors", arguments)
+
+
+def build_trail_assessment(fire: FireSnapshot, arguments: dict[str, Any]) -> dict[str, Any]:
+    """assess_trails result for a resolved fire."""
+    trail_data = fire.document(TRAIL_DAMAGE)
+    if trail_data is None:
+        return missing_document(fire.fire_id, TRAIL_DAMAGE)
+
+    trail_id = arguments.get("trail_id")
+
+    trails = trail_data.get("trails", [])
+
+    if trail_id:
+        # Filter to specific trail
+        trails = [t for t in trails if t.get("trail_id") == trail_id or t.get("trail_name") == trail_id]
+        if not trails:
+            return {"error": f"Trail not found: {trail_id}", "available_trails": [t.get("trail_id") for t in trail_data.get("trails", [])]}
+
+    result = {
+        "fire_id": trail_data.get("fire_id"),
+        "assessment_date": trail_data.get("assessment_date"),
+        "source": "RANGER-Fixtures",
+        "summary": trail_data.get("summary"),
+        "confidence": 0.92,
+        "trails": trails
+    }
+    return shape_items(result, "trails", arguments, id_fields=("trail_id",))
+
+
+def build_timber_plots(fire: FireSnapshot, arguments: dict[str, Any]) -> dict[str, Any]:
+    """get_timber_plots result for a resolved fire."""
+    timber = fire.document(TIMBER_PLOTS)
+    if timber is None:
+        return missing_document(fire.fire_id, TIMBER_PLOTS)
+    result = {
+        "fire_id": fire.fire_id,
+        "source": "RANGER-Fixtures",
+        "confidence": 0.88,
+        "plots": timber if isinstance(timber, list) else timber.get("plots", [])
+    }
+    return shape_items(result, "plots", arguments, id_fields=("plot_id",))
+
+
+# Documents a fire's spatial index is built from
+SPATIAL_DOCUMENTS = (BURN_SEVERITY, TRAIL_DAMAGE, TIMBER_PLOTS)
+
+
+def get_spatial_index(fire: FireSnapshot) -> FireSpatialIndex:
+    """
+    A fire's spatial index, built once per snapshot and held by it, so it
+    goes away with the snapshot on reload or registry eviction.
+    """
+    return fire.derived(
+        "spatial_index",
+        lambda snapshot: FireSpatialIndex.from_documents(
+            *(snapshot.document(name) for name in SPATIAL_DOCUMENTS)
+        ),
+    )
 
-            if include_sectors:
-                # Include simplified sector data (without geometry for brevity)
-                sectors = []
-                for sector in BURN_SEVERITY_DATA.get("sectors", []):
-                    sectors.append({
-                        "id": sector.get("id"),
-                        "name": sector.get("name"),
-                        "severity": sector.get("severity"),
-                        "severity_class": sector.get("severity_class"),
-                        "acres": sector.get("acres"),
-                        "dnbr_mean": sector.get("dnbr_mean"),
-                        "priority_notes": sector.get("priority_notes")
-                    })
-                result["sectors"] = sectors
-        else:
-            result = {"error": f"Unknown fire: {fire_id}", "available_fires": ["cedar-creek"]}
-
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    elif name == "assess_trails":
-        if fire_id == "cedar-creek":
-            trail_id = arguments.get("trail_id")
-
-            trails = TRAIL_DAMAGE_DATA.get("trails", [])
-
-            if trail_id:
-                # Filter to specific trail
-                trails = [t for t in trails if t.get("trail_id") == trail_id or t.get("trail_name") == trail_id]
-                if not trails:
-                    result = {"error": f"Trail not found: {trail_id}", "available_trails": [t.get("trail_id") for t in TRAIL_DAMAGE_DATA.get("trails", [])]}
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-            result = {
-                "fire_id": TRAIL_DAMAGE_DATA.get("fire_id"),
-                "assessment_date": TRAIL_DAMAGE_DATA.get("assessment_date"),
-                "source": "RANGER-Fixtures",
-                "summary": TRAIL_DAMAGE_DATA.get("summary"),
-                "confidence": 0.92,
-                "trails": trails
-            }
-        else:
-            result = {"error": f"Unknown fire: {fire_id}", "available_fires": ["cedar-creek"]}
-
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    elif name == "get_timber_plots":
-        if fire_id == "cedar-creek":
-            result = {
-                "fire_id": fire_id,
-                "source": "RANGER-Fixtures",
-                "confidence": 0.88,
-                "plots": TIMBER_PLOTS_DATA if isinstance(TIMBER_PLOTS_DATA, list) else TIMBER_PLOTS_DATA.get("plots", [])
-            }
-        else:
-            result = {"error": f"Unknown fire: {fire_id}", "available_fires": ["cedar-creek"]}
 
-        return [TextContent(type="text", text=json.dumps(result, indent=2))]
+def _coordinates(values: Any, count: int) -> tuple[float, ...] | None:
+    """`count` numbers from a tool argument, or None if malformed."""
+    if not isinstance(values, (list, tuple)) or len(values) != count:
+        return None
+    if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+        return None
+    return tuple(float(v) for v in values)
+
+
+def build_bbox_query(fire: FireSnapshot, arguments: dict[str, Any]) -> dict[str, Any]:
+    """query_bbox result for a resolved fire."""
+    bbox = _coordinates(arguments.get("bbox"), 4)
+    if bbox is None or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+        return {"error": f"Invalid bbox: {arguments.get('bbox')} (expected [min_lon, min_lat, max_lon, max_lat])"}
+    layers = arguments.get("layers")
+    unknown = set(layers or ()) - set(LAYERS)
+    if unknown:
+        return {"error": f"Unknown layers: {sorted(unknown)}", "available_layers": list(LAYERS)}
+
+    features = get_spatial_index(fire).query_bbox(bbox, layers, arguments.get("sector_severity"))
+    result = {
+        "fire_id": fire.fire_id,
+        "bbox": list(bbox),
+        "source": "RANGER-Fixtures",
+        "count": len(features),
+        "features": features
+    }
+    return shape_items(result, "features", arguments, id_fields=("layer", "id"))
+
+
+def build_sector_at_point(fire: FireSnapshot, arguments: dict[str, Any]) -> dict[str, Any]:
+    """sector_at_point result for a resolved fire."""
+    point = _coordinates([arguments.get("lon"), arguments.get("lat")], 2)
+    if point is None:
+        return {"error": f"Invalid point: lon={arguments.get('lon')}, lat={arguments.get('lat')}"}
+    return {
+        "fire_id": fire.fire_id,
+        "lon": point[0],
+        "lat": point[1],
+        "source": "MTBS",
+        "sectors": get_spatial_index(fire).sectors_at(*point)
+    }
+
+
+# Tool name -> (result builder, fixture documents the result depends on)
+TOOL_BUILDERS = {
+    "get_fire_context": (build_fire_context, (INCIDENT_METADATA, BURN_SEVERITY)),
+    "mtbs_classify": (build_mtbs_classification, (BURN_SEVERITY,)),
+    "assess_trails": (build_trail_assessment, (TRAIL_DAMAGE,)),
+    "get_timber_plots": (build_timber_plots, (TIMBER_PLOTS,)),
+    "query_bbox": (build_bbox_query, SPATIAL_DOCUMENTS),
+    "sector_at_point": (build_sector_at_point, SPATIAL_DOCUMENTS),
+}
+
+
+def encode_tool_result(name: str, arguments: dict[str, Any]) -> str:
+    """
+    Encoded payload for a tool call, served from response_cache when the
+    underlying fixture documents are unchanged.
+    """
+    if name not in TOOL_BUILDERS:
+        return response_cache.encode({"error": f"Unknown tool: {name}"})
+
+    requested_fire = arguments.get("fire_id", "").lower()
+
+    # Normalize fire_id - accept variations (see fixture_registry.fire_aliases)
+    fire_id = registry.resolve(requested_fire)
+    # One snapshot per call: a reload mid-call cannot mix document versions
+    fire = registry.fire_snapshot(fire_id) if fire_id is not None else None
+    if fire is None:
+        return response_cache.encode(unknown_fire(requested_fire))
+
+    builder, documents = TOOL_BUILDERS[name]
+    key = (name, fire_id, normalize_arguments(arguments))
+    return response_cache.get_or_encode(
+        key,
+        fire.signature(documents),
+        lambda: builder(fire, arguments),
+    )
+
 
-    else:
-        return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
+@mcp_server.call_tool()
+async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle MCP tool calls."""
+    return [TextContent(type="text", text=encode_tool_result(name, arguments))]
+
+
+def _incident_from_burn_severity(fire: FireSnapshot) -> dict[str, Any] | None:
+    """Minimal incident metadata for fires that only ship burn-severity.json."""
+    burn = fire.document(BURN_SEVERITY)
+    if burn is None:
+        return None
+    return {
+        "fire_id": burn.get("fire_id"),
+        "name": burn.get("fire_name"),
+        "discovery_date": burn.get("discovery_date"),
+        "containment_date": burn.get("containment_date"),
+        "acres": burn.get("total_acres"),
+        "forest": burn.get("forest"),
+        "state": burn.get("state"),
+        "summary": burn.get("summary"),
+    }
 
 
 # Health check endpoint for Cloud Run
@@ -237,26 +450,77 @@ async def health(request):
     return JSONResponse({
         "status": "healthy",
         "service": "ranger-mcp-fixtures",
-        "loaded_fires": ["cedar-creek"],
-        "tools": ["get_fire_context", "mtbs_classify", "assess_trails", "get_timber_plots"]
+        "loaded_fires": registry.fire_ids(),
+        "fixtures": registry.stats(),
+        "response_cache": response_cache.stats(),
+        "tools": list(TOOL_BUILDERS)
     })
 
 
-# Create Starlette app - minimal HTTP interface for Cloud Run health checks
-# TODO: Add MCP SSE transport endpoints for full integration
+# Streamable HTTP transport. Sessions are stateful so pooled clients initialize
+# once per connection; tool results are single JSON responses rather than SSE
+# streams since every tool returns one complete payload.
+session_manager = StreamableHTTPSessionManager(
+    app=mcp_server,
+    json_response=True,
+    stateless=False,
+)
+
+
+class StreamableHTTPEndpoint:
+    """ASGI app for /mcp (a class so Starlette's Route passes scope/receive/send through)."""
+
+    async def __call__(self, scope, receive, send):
+        await session_manager.handle_request(scope, receive, send)
+
+
+# Legacy HTTP+SSE transport for clients without Streamable HTTP support
+sse_transport = SseServerTransport("/messages/")
+
+
+async def handle_sse(request):
+    """Hold an SSE stream open and run an MCP session over it."""
+    async with sse_transport.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+        await mcp_server.run(read_stream, write_stream, mcp_server.create_initialization_options())
+    return Response()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    """Run the Streamable HTTP session manager and fixture watcher for the app's lifetime."""
+    registry.start_watching()
+    try:
+        async with session_manager.run():
+            yield
+    finally:
+        registry.stop_watching()
+
+
+# Create Starlette app - health check plus MCP HTTP transports
 app = Starlette(
     routes=[
         Route("/health", health),
-    ]
+        Route("/mcp", endpoint=StreamableHTTPEndpoint()),
+        Route("/sse", handle_sse),
+        Mount("/messages/", app=sse_transport.handle_post_message),
+    ],
+    lifespan=lifespan,
 )
 
 
-# Main entry point for stdio transport (local development)
+# Main entry point: stdio transport (local development) or --http
 if __name__ == "__main__":
+    import argparse
     import asyncio
     import logging
     from mcp.server.stdio import stdio_server
 
+    parser = argparse.ArgumentParser(description="RANGER MCP Fixtures Server")
+    parser.add_argument("--http", action="store_true", help="Serve Streamable HTTP/SSE instead of stdio")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8080)))
+    args = parser.parse_args()
+
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
@@ -265,10 +529,19 @@ if __name__ == "__main__":
     )
     logger = logging.getLogger("ranger.mcp-fixtures")
 
+    if args.http:
+        import uvicorn
+
+        logger.info(f"Starting RANGER MCP Fixtures Server (HTTP on {args.host}:{args.port}/mcp)")
+        uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+        sys.exit(0)
+
     logger.info("Starting RANGER MCP Fixtures Server (stdio transport)")
     logger.info(f"Fixtures directory: {FIXTURES_DIR}")
-    logger.info(f"Loaded fires: cedar-creek")
-    logger.info(f"Tools: get_fire_context, mtbs_classify, assess_trails, get_timber_plots")
+    logger.info(f"Discovered fires: {', '.join(registry.fire_ids())}")
+    logger.info(f"Tools: {', '.join(TOOL_BUILDERS)}")
+    if registry.start_watching():
+        logger.info(f"Watching fixtures for changes every {FIXTURE_RELOAD_SECONDS:g}s")
     logger.info("Waiting for MCP client connection on stdin/stdout...")
 
     # Run the MCP server with stdio transport
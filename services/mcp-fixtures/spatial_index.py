@@ -0,0 +1,305 @@
+"""
+Spatial Index for the RANGER MCP Fixtures Server.
+
+Backs the query_bbox and sector_at_point tools with a per-fire, in-memory
+R-tree bulk-loaded by Sort-Tile-Recursive (STR) packing:
+
+- Sector polygons from burn-severity.json
+- Damage points from trail-damage.json (every trail's damage_points)
+- Plot locations from timber-plots.json
+
+Coordinates are [lon, lat] (GeoJSON order). Bounding boxes are
+(min_lon, min_lat, max_lon, max_lat). Fixture spellings differ between fires
+(id / sector_id, coords / coordinates, HIGH / high), so features are
+normalized on the way in.
+"""
+
+import math
+from typing import Any, Iterable, Optional
+
+BBox = tuple[float, float, float, float]
+
+LAYERS = ("sector", "damage_point", "plot")
+
+DEFAULT_NODE_CAPACITY = 16
+
+
+def bbox_intersects(a: BBox, b: BBox) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def geometry_bbox(geometry: dict[str, Any]) -> Optional[BBox]:
+    """Bounding box of a GeoJSON Point, Polygon or MultiPolygon."""
+    kind = geometry.get("type")
+    coordinates = geometry.get("coordinates")
+    if not coordinates:
+        return None
+    if kind == "Point":
+        x, y = coordinates[:2]
+        return (x, y, x, y)
+    if kind == "Polygon":
+        points = [p for ring in coordinates for p in ring]
+    elif kind == "MultiPolygon":
+        points = [p for polygon in coordinates for ring in polygon for p in ring]
+    else:
+        return None
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _in_ring(x: float, y: float, ring: list[list[float]]) -> bool:
+    """Even-odd ray casting test."""
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i][0], ring[i][1]
+        xj, yj = ring[j][0], ring[j][1]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+def point_in_geometry(x: float, y: float, geometry: dict[str, Any]) -> bool:
+    """Whether (x, y) lies inside a Polygon / MultiPolygon (holes excluded)."""
+    kind = geometry.get("type")
+    if kind == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif kind == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return False
+    for rings in polygons:
+        if rings and _in_ring(x, y, rings[0]) and not any(_in_ring(x, y, hole) for hole in rings[1:]):
+            return True
+    return False
+
+
+class STRTree:
+    """
+    Static R-tree packed with Sort-Tile-Recursive bulk loading.
+
+    Usage:
+        >>> tree = STRTree([((0, 0, 1, 1), "a"), ((5, 5, 6, 6), "b")])
+        >>> tree.query((0.5, 0.5, 2, 2))
+        ['a']
+
+    Args:
+        items: (bbox, payload) pairs
+        node_capacity: Maximum children per node
+    """
+
+    def __init__(self, items: Iterable[tuple[BBox, Any]], node_capacity: int = DEFAULT_NODE_CAPACITY):
+        self.node_capacity = max(2, node_capacity)
+        # A node is (bbox, children, is_leaf); leaf children are (bbox, payload)
+        level = [(bbox, payload) for bbox, payload in items]
+        self._size = len(level)
+        self._root = None
+        if not level:
+            return
+        is_leaf = True
+        while True:
+            level = [
+                (self._union(group), group, is_leaf)
+                for group in self._pack(level)
+            ]
+            is_leaf = False
+            if len(level) == 1:
+                self._root = level[0]
+                return
+
+    def __len__(self) -> int:
+        return self._size
+
+    def query(self, bbox: BBox) -> list[Any]:
+        """Payloads whose bounding box intersects `bbox`."""
+        if self._root is None:
+            return []
+        min_x, min_y, max_x, max_y = bbox
+        found = []
+        stack = [self._root]
+        while stack:
+            _, children, is_leaf = stack.pop()
+            for child in children:
+                b = child[0]
+                if b[0] <= max_x and min_x <= b[2] and b[1] <= max_y and min_y <= b[3]:
+                    if is_leaf:
+                        found.append(child[1])
+                    else:
+                        stack.append(child)
+        return found
+
+    def query_point(self, x: float, y: float) -> list[Any]:
+        """Payloads whose bounding box contains (x, y)."""
+        return self.query((x, y, x, y))
+
+    def _pack(self, entries: list[tuple]) -> list[list[tuple]]:
+        """STR: sort by x-center into vertical slices, then by y-center into nodes."""
+        capacity = self.node_capacity
+        node_count = math.ceil(len(entries) / capacity)
+        slice_count = math.ceil(math.sqrt(node_count))
+        slice_size = slice_count * capacity
+
+        by_x = sorted(entries, key=lambda e: e[0][0] + e[0][2])
+        groups = []
+        for start in range(0, len(by_x), slice_size):
+            vertical = sorted(by_x[start:start + slice_size], key=lambda e: e[0][1] + e[0][3])
+            groups.extend(vertical[i:i + capacity] for i in range(0, len(vertical), capacity))
+        return groups
+
+    @staticmethod
+    def _union(entries: list[tuple]) -> BBox:
+        return (
+            min(e[0][0] for e in entries),
+            min(e[0][1] for e in entries),
+            max(e[0][2] for e in entries),
+            max(e[0][3] for e in entries),
+        )
+
+
+def first_value(mapping: dict[str, Any], *keys: str) -> Any:
+    """Value of the first key present (not None); fixtures differ in field names."""
+    for key in keys:
+        value = mapping.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _severity(value: Any) -> Optional[str]:
+    return value.upper() if isinstance(value, str) else value
+
+
+def sector_features(burn: Optional[dict[str, Any]]) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+    """(feature, geometry) pairs for burn-severity sectors."""
+    pairs = []
+    for sector in (burn or {}).get("sectors", []):
+        geometry = sector.get("geometry")
+        if not isinstance(geometry, dict) or geometry_bbox(geometry) is None:
+            continue
+        pairs.append(({
+            "layer": "sector",
+            "id": first_value(sector, "id", "sector_id"),
+            "name": sector.get("name"),
+            "severity": _severity(sector.get("severity")),
+            "acres": sector.get("acres"),
+            "dnbr_mean": sector.get("dnbr_mean"),
+            "bbox": list(geometry_bbox(geometry)),
+        }, geometry))
+    return pairs
+
+
+def damage_point_features(trail_data: Optional[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Point features for every trail's damage points."""
+    features = []
+    for trail in (trail_data or {}).get("trails", []):
+        for point in trail.get("damage_points", []):
+            coords = first_value(point, "coords", "coordinates")
+            if not coords:
+                continue
+            features.append({
+                "layer": "damage_point",
+                "id": first_value(point, "damage_id", "point_id"),
+                "trail_id": trail.get("trail_id"),
+                "type": point.get("type"),
+                "severity": point.get("severity"),
+                "estimated_cost": first_value(point, "estimated_cost", "estimated_repair_cost"),
+                "coords": list(coords[:2]),
+            })
+    return features
+
+
+def plot_features(timber: Any) -> list[dict[str, Any]]:
+    """Point features for timber cruise plots."""
+    plots = timber if isinstance(timber, list) else (timber or {}).get("plots", [])
+    features = []
+    for plot in plots:
+        coords = first_value(plot, "coords", "coordinates")
+        if not coords:
+            continue
+        features.append({
+            "layer": "plot",
+            "id": plot.get("plot_id"),
+            "name": plot.get("name"),
+            "sector": plot.get("sector"),
+            "coords": list(coords[:2]),
+        })
+    return features
+
+
+class FireSpatialIndex:
+    """
+    R-tree over one fire's sectors, damage points and plots.
+
+    Usage:
+        >>> index = FireSpatialIndex.from_documents(burn, trail_data, timber)
+        >>> index.sectors_at(-122.05, 43.77)
+        >>> index.query_bbox((-122.1, 43.7, -122.0, 43.8), layers=["damage_point"], sector_severity="HIGH")
+
+    Args:
+        sectors: (feature, geometry) pairs from sector_features()
+        points: Point features from damage_point_features() / plot_features()
+        node_capacity: STRTree node capacity
+    """
+
+    def __init__(
+        self,
+        sectors: list[tuple[dict[str, Any], dict[str, Any]]],
+        points: list[dict[str, Any]],
+        node_capacity: int = DEFAULT_NODE_CAPACITY,
+    ):
+        self.sectors = STRTree(
+            ((tuple(feature["bbox"]), (feature, geometry)) for feature, geometry in sectors),
+            node_capacity,
+        )
+        self.points = STRTree(
+            ((tuple(f["coords"]) * 2, f) for f in points),
+            node_capacity,
+        )
+
+    @classmethod
+    def from_documents(cls, burn: Any, trail_data: Any, timber: Any) -> "FireSpatialIndex":
+        return cls(sector_features(burn), damage_point_features(trail_data) + plot_features(timber))
+
+    def sectors_at(self, lon: float, lat: float) -> list[dict[str, Any]]:
+        """Sectors whose polygon contains the point."""
+        return [
+            feature
+            for feature, geometry in self.sectors.query_point(lon, lat)
+            if point_in_geometry(lon, lat, geometry)
+        ]
+
+    def query_bbox(
+        self,
+        bbox: BBox,
+        layers: Optional[Iterable[str]] = None,
+        sector_severity: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Features intersecting `bbox`.
+
+        Args:
+            bbox: (min_lon, min_lat, max_lon, max_lat)
+            layers: Subset of LAYERS (default: all)
+            sector_severity: Keep only sectors of this severity, and points
+                lying inside a sector of this severity
+        """
+        layers = set(layers or LAYERS)
+        severity = _severity(sector_severity)
+        features = []
+        if "sector" in layers:
+            features.extend(
+                feature
+                for feature, _ in self.sectors.query(bbox)
+                if severity is None or feature["severity"] == severity
+            )
+        for feature in self.points.query(bbox):
+            if feature["layer"] not in layers:
+                continue
+            if severity is not None and not any(
+                s["severity"] == severity for s in self.sectors_at(*feature["coords"])
+            ):
+                continue
+            features.append(feature)
+        return features
@@ -0,0 +1,32 @@
+"""
+Pytest configuration for MCP Fixtures Server tests.
+
+Puts services/mcp-fixtures on the path, where the server imports its
+modules from (fixture_registry, projection, spatial_index).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SERVICE_DIR = Path(__file__).parents[1]
+if str(SERVICE_DIR) not in sys.path:
+    sys.path.insert(0, str(SERVICE_DIR))
+
+# Repository fixtures (data/fixtures)
+FIXTURES_DIR = Path(__file__).parents[3] / "data" / "fixtures"
+
+
+@pytest.fixture
+def write_fire(tmp_path):
+    """Write a fire directory of fixture documents under tmp_path."""
+    def write(fire_id: str, **documents) -> Path:
+        directory = tmp_path / fire_id
+        directory.mkdir(exist_ok=True)
+        for name, data in documents.items():
+            path = directory / f"{name.replace('_', '-')}.json"
+            path.write_text(data if isinstance(data, str) else json.dumps(data))
+        return directory
+    return write
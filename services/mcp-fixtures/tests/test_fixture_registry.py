@@ -0,0 +1,138 @@
+"""
+Tests for the MCP fixtures registry.
+
+Verifies:
+- Alias resolution (spellings, initials, optional year, document names)
+- LRU eviction bounded by loaded file bytes
+- Hot reload swaps valid edits and keeps the old snapshot on bad JSON
+- Structures derived from a snapshot live and die with it
+"""
+
+import json
+
+from fixture_registry import BURN_SEVERITY, FixtureRegistry, fire_aliases
+
+
+def burn(fire_id: str, name: str, padding: int = 0) -> dict:
+    return {"fire_id": fire_id, "fire_name": name, "sectors": [], "notes": "x" * padding}
+
+
+class TestAliases:
+    """Tests for resolve()."""
+
+    def test_spellings_and_initials(self):
+        assert fire_aliases("cedar-creek") == {"cedar-creek", "cedar_creek", "cedar creek", "cedarcreek", "cc"}
+        assert fire_aliases("Bootleg Fire") == {"bootleg"}
+
+    def test_resolve_directory_variants(self, tmp_path, write_fire):
+        write_fire("cedar-creek", burn_severity=burn("cedar-creek-2022", "Cedar Creek Fire"))
+        registry = FixtureRegistry(tmp_path)
+
+        for spelling in ["cedar-creek", "Cedar Creek", "CEDAR_CREEK", "cc", "cedar-creek-2022", "cc2022"]:
+            assert registry.resolve(spelling) == "cedar-creek", spelling
+        assert registry.resolve("bootleg") is None
+        assert registry.resolve("") is None
+
+    def test_shared_initials_are_ambiguous(self, tmp_path, write_fire):
+        write_fire("cedar-creek", burn_severity=burn("cedar-creek", "Cedar Creek"))
+        write_fire("coal-canyon", burn_severity=burn("coal-canyon", "Coal Canyon"))
+        registry = FixtureRegistry(tmp_path)
+
+        assert registry.resolve("cc") is None
+        assert registry.resolve("coal canyon") == "coal-canyon"
+
+    def test_learns_names_from_documents(self, tmp_path, write_fire):
+        """Names a document uses for itself resolve once the fire is loaded."""
+        write_fire("fire-042", burn_severity=burn("or-042", "Mosquito Fire"))
+        registry = FixtureRegistry(tmp_path)
+        assert registry.resolve("mosquito") is None
+
+        registry.fire_snapshot("fire-042")
+        assert registry.resolve("mosquito") == "fire-042"
+        assert registry.resolve("OR-042") == "fire-042"
+
+
+class TestLruEviction:
+    """Tests for the max_bytes budget."""
+
+    def test_evicts_least_recently_used_by_bytes(self, tmp_path, write_fire):
+        for fire_id in ["a-fire", "b-fire", "c-fire"]:
+            write_fire(fire_id, burn_severity=burn(fire_id, fire_id, padding=1000))
+        registry = FixtureRegistry(tmp_path, max_bytes=2500)
+
+        registry.fire_snapshot("a-fire")
+        registry.fire_snapshot("b-fire")
+        registry.fire_snapshot("a-fire")  # b-fire is now least recently used
+        registry.fire_snapshot("c-fire")
+
+        stats = registry.stats()
+        assert stats["loaded_fires"] == 2
+        assert stats["evictions"] == 1
+        assert stats["loaded_bytes"] <= 2500
+
+        registry.fire_snapshot("a-fire")
+        assert registry.stats()["loads"] == 3
+        registry.fire_snapshot("b-fire")
+        assert registry.stats()["loads"] == 4
+
+    def test_keeps_a_fire_larger_than_the_budget(self, tmp_path, write_fire):
+        write_fire("big-fire", burn_severity=burn("big-fire", "Big", padding=5000))
+        registry = FixtureRegistry(tmp_path, max_bytes=100)
+
+        assert registry.fire_snapshot("big-fire").document(BURN_SEVERITY)["fire_name"] == "Big"
+        assert registry.stats()["loaded_fires"] == 1
+
+
+class TestReload:
+    """Tests for check_for_updates()."""
+
+    def test_bad_json_keeps_previous_snapshot(self, tmp_path, write_fire):
+        directory = write_fire("cedar-creek", burn_severity=burn("cedar-creek", "Cedar Creek"))
+        registry = FixtureRegistry(tmp_path)
+        before = registry.fire_snapshot("cedar-creek")
+
+        (directory / BURN_SEVERITY).write_text('{"fire_id": "cedar-creek", "sectors": [')
+        assert registry.check_for_updates() == []
+        assert registry.check_for_updates() == []  # Reported once
+
+        assert registry.fire_snapshot("cedar-creek") is before
+        assert registry.stats()["reload_failures"] == 1
+
+        (directory / BURN_SEVERITY).write_text(json.dumps(burn("cedar-creek", "Cedar Creek Fire (edited)")))
+        assert registry.check_for_updates() == ["cedar-creek"]
+        after = registry.fire_snapshot("cedar-creek")
+        assert after.generation > before.generation
+        assert after.document(BURN_SEVERITY)["fire_name"] == "Cedar Creek Fire (edited)"
+        assert before.document(BURN_SEVERITY)["fire_name"] == "Cedar Creek"
+
+    def test_invalid_shape_rejected(self, tmp_path, write_fire):
+        """Valid JSON missing the item list is rejected like bad JSON."""
+        directory = write_fire("cedar-creek", burn_severity=burn("cedar-creek", "Cedar Creek"))
+        registry = FixtureRegistry(tmp_path)
+        before = registry.fire_snapshot("cedar-creek")
+
+        (directory / BURN_SEVERITY).write_text(json.dumps({"fire_id": "cedar-creek", "sectors": "none yet"}))
+        assert registry.check_for_updates() == []
+        assert registry.fire_snapshot("cedar-creek") is before
+
+
+class TestDerived:
+    """Tests for FireSnapshot.derived()."""
+
+    def test_built_once_per_snapshot(self, tmp_path, write_fire):
+        directory = write_fire("cedar-creek", burn_severity=burn("cedar-creek", "Cedar Creek"))
+        registry = FixtureRegistry(tmp_path)
+        builds = []
+
+        def build(snapshot):
+            builds.append(snapshot.generation)
+            return object()
+
+        snapshot = registry.fire_snapshot("cedar-creek")
+        assert snapshot.derived("index", build) is snapshot.derived("index", build)
+        assert len(builds) == 1
+
+        (directory / BURN_SEVERITY).write_text(json.dumps(burn("cedar-creek", "Cedar Creek", padding=10)))
+        registry.check_for_updates()
+        registry.fire_snapshot("cedar-creek").derived("index", build)
+        assert len(builds) == 2
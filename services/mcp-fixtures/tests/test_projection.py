@@ -0,0 +1,72 @@
+"""
+Tests for field projection and pagination of list tool results.
+
+Verifies fields / limit / cursor / summary_only and rejection of invalid
+arguments.
+"""
+
+import pytest
+
+from projection import shape_items
+
+
+def result(count: int = 5) -> dict:
+    return {
+        "fire_id": "cedar-creek",
+        "summary": {"total": count},
+        "trails": [{"trail_id": f"t{i}", "name": f"Trail {i}", "miles": i} for i in range(count)],
+    }
+
+
+def shape(**arguments) -> dict:
+    return shape_items(result(), "trails", arguments, id_fields=("trail_id",))
+
+
+class TestProjection:
+    """Tests for `fields`."""
+
+    def test_no_arguments_unchanged(self):
+        assert shape() == result()
+
+    def test_fields_keep_id(self):
+        trails = shape(fields=["miles"])["trails"]
+        assert trails[0] == {"trail_id": "t0", "miles": 0}
+
+    def test_wildcard_keeps_all(self):
+        assert shape(fields=["*"])["trails"] == result()["trails"]
+
+    @pytest.mark.parametrize("fields", ["miles", ["miles", 1], {"miles": True}])
+    def test_invalid_fields(self, fields):
+        """fields must be a list of strings; a bare string isn't split into characters."""
+        assert shape(fields=fields) == {"error": f"Invalid fields: {fields}"}
+
+    def test_summary_only(self):
+        shaped = shape(summary_only=True)
+        assert "trails" not in shaped
+        assert shaped["total"] == 5
+        assert shaped["summary"] == {"total": 5}
+
+
+class TestPagination:
+    """Tests for `limit` and `cursor`."""
+
+    def test_pages_until_exhausted(self):
+        first = shape(limit=2)
+        assert [t["trail_id"] for t in first["trails"]] == ["t0", "t1"]
+        assert first["total"] == 5
+
+        ids = [t["trail_id"] for t in first["trails"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = shape(limit=2, cursor=cursor)
+            ids += [t["trail_id"] for t in page["trails"]]
+            cursor = page.get("next_cursor")
+        assert ids == [f"t{i}" for i in range(5)]
+
+    @pytest.mark.parametrize("limit", [0, -1, "2", 1.5, True, False])
+    def test_invalid_limit(self, limit):
+        assert shape(limit=limit) == {"error": f"Invalid limit: {limit}"}
+
+    @pytest.mark.parametrize("cursor", ["abc", "-1", [2]])
+    def test_invalid_cursor(self, cursor):
+        assert "error" in shape(cursor=cursor)
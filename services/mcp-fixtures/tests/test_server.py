@@ -0,0 +1,42 @@
+"""
+Tests for the MCP fixtures server tool results, against data/fixtures.
+
+Verifies fire ID normalization and the normalized sector fields of
+mtbs_classify and sector_at_point across fixture spellings.
+"""
+
+import json
+
+import pytest
+
+try:
+    import server
+except (ImportError, AttributeError) as e:  # mcp not installed, or without the 1.x Server API
+    pytest.skip(f"MCP server unavailable: {e}", allow_module_level=True)
+
+
+def call(tool: str, **arguments) -> dict:
+    return json.loads(server.encode_tool_result(tool, arguments))
+
+
+class TestMtbsClassify:
+    """Tests for mtbs_classify."""
+
+    @pytest.mark.parametrize("fire_id", ["cedar-creek", "bootleg"])
+    def test_every_sector_has_an_id(self, fire_id):
+        """Sector IDs are served whether the fixture spells them id or sector_id."""
+        sectors = call("mtbs_classify", fire_id=fire_id)["sectors"]
+        assert sectors
+        assert all(sector["id"] for sector in sectors)
+
+    def test_ids_match_spatial_features(self):
+        sectors = call("mtbs_classify", fire_id="bootleg", fields=["name"])["sectors"]
+        features = call("query_bbox", fire_id="bootleg", bbox=[-180, -90, 180, 90], layers=["sector"])["features"]
+        assert {s["id"] for s in sectors} == {f["id"] for f in features}
+
+    def test_fire_id_aliases(self):
+        assert call("mtbs_classify", fire_id="Cedar Creek 2022")["fire_name"] == call("mtbs_classify", fire_id="cc")["fire_name"]
+        assert "error" in call("mtbs_classify", fire_id="no-such-fire")
+
+    def test_limit_true_rejected(self):
+        assert call("mtbs_classify", fire_id="cedar-creek", limit=True) == {"error": "Invalid limit: True"}
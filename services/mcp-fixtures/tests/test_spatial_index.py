@@ -0,0 +1,81 @@
+"""
+Tests for the fixtures server spatial index.
+
+Verifies the STR-packed R-tree against brute force, point-in-polygon
+sector lookup, and normalization of fixture field spellings.
+"""
+
+import random
+
+import pytest
+
+from spatial_index import FireSpatialIndex, STRTree, bbox_intersects
+
+
+def square(lon: float, lat: float, size: float = 0.01) -> dict:
+    """GeoJSON polygon of a square with its lower left corner at (lon, lat)."""
+    ring = [[lon, lat], [lon + size, lat], [lon + size, lat + size], [lon, lat + size], [lon, lat]]
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
+def random_box(rng: random.Random, max_size: float) -> tuple[float, float, float, float]:
+    x, y = rng.uniform(-10, 10), rng.uniform(-10, 10)
+    return (x, y, x + rng.uniform(0, max_size), y + rng.uniform(0, max_size))
+
+
+class TestSTRTree:
+    """Tests for STRTree queries."""
+
+    @pytest.mark.parametrize("count, node_capacity", [(0, 16), (1, 16), (500, 4), (2000, 16)])
+    def test_query_matches_brute_force(self, count, node_capacity):
+        rng = random.Random(count)
+        items = [(random_box(rng, 1.0), i) for i in range(count)]
+        tree = STRTree(items, node_capacity)
+        assert len(tree) == count
+
+        for _ in range(200):
+            query = random_box(rng, 5.0)
+            expected = {i for box, i in items if bbox_intersects(box, query)}
+            assert set(tree.query(query)) == expected
+
+    def test_query_point_on_edge(self):
+        tree = STRTree([((0, 0, 1, 1), "a"), ((1, 1, 2, 2), "b")])
+        assert sorted(tree.query_point(1, 1)) == ["a", "b"]
+        assert tree.query_point(3, 3) == []
+
+
+class TestFireSpatialIndex:
+    """Tests for FireSpatialIndex over fixture documents."""
+
+    def index(self) -> FireSpatialIndex:
+        burn = {"sectors": [
+            {"id": "A", "severity": "high", "geometry": square(0, 0)},
+            {"sector_id": "B", "severity": "LOW", "geometry": square(0.01, 0)},
+        ]}
+        trails = {"trails": [{"trail_id": "T1", "damage_points": [
+            {"damage_id": "D1", "coords": [0.005, 0.005], "estimated_repair_cost": 100},
+            {"point_id": "D2", "coordinates": [0.015, 0.005]},
+        ]}]}
+        timber = [{"plot_id": "P1", "coords": [0.5, 0.5]}]
+        return FireSpatialIndex.from_documents(burn, trails, timber)
+
+    def test_field_spellings_normalized(self):
+        features = {f["id"]: f for f in self.index().query_bbox((-1, -1, 1, 1))}
+        assert set(features) == {"A", "B", "D1", "D2", "P1"}
+        assert features["A"]["severity"] == "HIGH"
+        assert features["D1"]["estimated_cost"] == 100
+        assert features["D2"]["coords"] == [0.015, 0.005]
+
+    def test_sectors_at_point(self):
+        index = self.index()
+        assert [s["id"] for s in index.sectors_at(0.005, 0.005)] == ["A"]
+        assert [s["id"] for s in index.sectors_at(0.015, 0.005)] == ["B"]
+        assert index.sectors_at(0.005, 0.5) == []
+
+    def test_severity_filter_applies_to_points(self):
+        features = self.index().query_bbox((-1, -1, 1, 1), sector_severity="high")
+        assert sorted(f["id"] for f in features) == ["A", "D1"]
+
+    def test_layers(self):
+        features = self.index().query_bbox((-1, -1, 1, 1), layers=["plot"])
+        assert [f["id"] for f in features] == ["P1"]